@@ -22,6 +22,7 @@ client_1 = SdkClient(
 # JPYC clients
 jpyc_0 = JPYC(
     client=client_0,
+    deploy_to_localhost=True,
 )
 jpyc_1 = JPYC(
     client=client_1,
@@ -27,9 +27,9 @@ def main() -> None:
 
     # 2. Sign a typed message
     domain = {
-        "name": jpyc_0.contract.functions.name().call(),
+        "name": jpyc_0.name(),
         "version": "1",
-        "chainId": jpyc_0.client.w3.eth.chain_id,
+        "chainId": jpyc_0.client.get_chain_id(),
         "verifyingContract": jpyc_0.contract.address,
     }
     types = {
@@ -1,14 +1,56 @@
 from importlib.metadata import version
 
+from .async_client import AsyncSdkClient
+from .async_event_indexer import AsyncEventIndexer
+from .async_event_scanner import AsyncEventScanner
+from .async_jpyc import AsyncJPYC
+from .async_receipt_tracker import AsyncReceiptTracker
+from .async_relayer import AsyncRelayer
+from .async_sender_pool import AsyncSenderPool
+from .async_transaction_pipeline import AsyncTransactionPipeline
 from .client import SdkClient
+from .event_indexer import EventIndexer
+from .event_scanner import EventScanner
 from .jpyc import JPYC
+from .receipt_tracker import ReceiptTracker
+from .relayer import Relayer
+from .sender_pool import SenderPool
+from .transaction_pipeline import TransactionPipeline
 
 __version__ = version("jpyc-core-sdk")
 __all__ = [
+    # async_client
+    "AsyncSdkClient",
+    # async_event_indexer
+    "AsyncEventIndexer",
+    # async_event_scanner
+    "AsyncEventScanner",
+    # async_jpyc
+    "AsyncJPYC",
+    # async_receipt_tracker
+    "AsyncReceiptTracker",
+    # async_relayer
+    "AsyncRelayer",
+    # async_sender_pool
+    "AsyncSenderPool",
+    # async_transaction_pipeline
+    "AsyncTransactionPipeline",
     # client
     "SdkClient",
+    # event_indexer
+    "EventIndexer",
+    # event_scanner
+    "EventScanner",
     # jpyc
     "JPYC",
+    # receipt_tracker
+    "ReceiptTracker",
+    # relayer
+    "Relayer",
+    # sender_pool
+    "SenderPool",
+    # transaction_pipeline
+    "TransactionPipeline",
     # utils
     "utils",
 ]
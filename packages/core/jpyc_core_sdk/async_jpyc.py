@@ -0,0 +1,853 @@
+import asyncio
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from typing import Any, Literal, cast
+
+from eth_account.signers.local import LocalAccount
+from eth_typing import ChecksumAddress as EthChecksumAddress
+from hexbytes import HexBytes
+from pydantic import NonNegativeInt, validate_call
+from web3.contract.async_contract import AsyncContractFunction
+
+from .async_client import AsyncSdkClient
+from .interfaces import IAsyncJPYC, IAsyncTransactionPipeline
+from .utils.addresses import (
+    get_proxy_address,
+)
+from .utils.artifacts import load_artifacts
+from .utils.bulk_signing import BulkSigner
+from .utils.caches import ReadCache
+from .utils.chains import SUPPORTED_CHAINS
+from .utils.constants import (
+    DEFAULT_SIGNING_CHUNK_SIZE,
+    SIGN_MIDDLEWARE,
+    TIMED_FUNCTIONS,
+)
+from .utils.contracts import CONTRACT_FACTORY
+from .utils.currencies import (
+    remove_decimals,
+    restore_decimals,
+)
+from .utils.errors import (
+    AccountNotInitialized,
+    NetworkNotSupported,
+    PreflightCheckFailed,
+    TransactionFailed,
+    TransactionSimulationFailed,
+)
+from .utils.events import build_authorization_filter, decode_authorization_log
+from .utils.metadata import TokenMetadata, async_fetch_token_metadata
+from .utils.preflight import PreflightValidator
+from .utils.signatures import Signature, TypedDataSigner
+from .utils.snapshots import Snapshot
+from .utils.types import AsyncTransactionArgs, ContractVersion
+from .utils.validators import Bytes32, ChecksumAddress, Uint8, Uint256
+
+
+class AsyncJPYC(IAsyncJPYC):
+    """Implementation of IAsyncJPYC."""
+
+    def __init__(
+        self,
+        client: AsyncSdkClient,
+        contract_version: ContractVersion = "2",
+        contract_address: EthChecksumAddress | None = None,
+        transaction_pipeline: IAsyncTransactionPipeline | None = None,
+        read_cache: ReadCache | None = None,
+        preflight_validator: PreflightValidator | None = None,
+    ) -> None:
+        """Constructor that initializes JPYC client for asyncio.
+
+        Notes:
+            - If `contract_address` is supplied,\
+            this configures contract instance with that address.
+            - This constructor performs no network I/O.\
+            Please use `deploy` method to deploy contracts to localhost network.
+            - If `transaction_pipeline` is supplied, transactions are sent\
+            through it instead of web3's `call` & `transact` methods.
+            - View functions are called at the latest block, unless pinned to\
+            a block by `at_block` or `snapshot` methods.
+            - If `read_cache` is supplied, results of view functions are cached\
+            (reads at the latest block are pinned to the latest block number\
+            observed by the cache), and invalidated after mutations.
+            - If `preflight_validator` is supplied, signed authorizations & permits\
+            are validated offline before simulating transactions, and kept\
+            pending until receipts of their transactions are recorded.
+
+        Args:
+            client (AsyncSdkClient): Configured SDK client for asyncio
+            contract_version (ContractVersion): Contract version
+            contract_address (EthChecksumAddress, optional): Contract address
+            transaction_pipeline (IAsyncTransactionPipeline, optional):\
+                Transaction pipeline for asyncio
+            read_cache (ReadCache, optional): Cache of results of view functions
+            preflight_validator (PreflightValidator, optional): Offline validator\
+            of signed authorizations & permits
+        """
+        address = (
+            contract_address
+            if contract_address is not None
+            else get_proxy_address(contract_version=contract_version)
+        )
+        contract = CONTRACT_FACTORY.get_async_contract(
+            w3=client.w3,
+            contract_address=address,
+            contract_version=contract_version,
+        )
+
+        self.client = client
+        """IAsyncSdkClient: Configured SDK client for asyncio"""
+        self.contract = contract
+        """AsyncContract: Configured contract instance"""
+        self.contract_version = contract_version
+        """ContractVersion: Contract version"""
+        self.transaction_pipeline = transaction_pipeline
+        """IAsyncTransactionPipeline | None: Transaction pipeline for asyncio"""
+        self.read_cache = read_cache
+        """ReadCache | None: Cache of results of view functions"""
+        self.preflight_validator = preflight_validator
+        """PreflightValidator | None: Offline validator of signed authorizations"""
+        # context-local, so that snapshots never leak across threads & tasks
+        self.__snapshot: ContextVar[Snapshot | None] = ContextVar(
+            f"snapshot_{id(self)}", default=None
+        )
+        # immutable, so that fetched only once
+        self.__metadata: TokenMetadata | None = None
+        self.__typed_data_signer: TypedDataSigner | None = None
+        self.__metadata_lock = asyncio.Lock()
+
+    @classmethod
+    async def deploy(
+        cls,
+        client: AsyncSdkClient,
+        contract_version: ContractVersion = "2",
+    ) -> "AsyncJPYC":
+        """Deploy & initialize contracts to localhost network.
+
+        Note:
+            This method is mainly for development purposes.
+
+        Args:
+            client (AsyncSdkClient): Configured SDK client for asyncio
+            contract_version (ContractVersion): Contract version
+
+        Returns:
+            AsyncJPYC: JPYC client configured with the deployed contracts
+
+        Raises:
+            AccountNotInitialized: If account is not initialized
+            NetworkNotSupported: If `client` is not configured to use localhost network
+        """
+        if await client.get_chain_id() != SUPPORTED_CHAINS["localhost"]["devnet"]["id"]:
+            raise NetworkNotSupported("localhost", "devnet")
+        owner_address = client.get_account_address()
+
+        artifacts = load_artifacts(contract_version=contract_version)
+        deployer = client.w3.eth.contract(
+            abi=artifacts.abi,
+            bytecode=artifacts.bytecode,
+        )
+        tx_hash = await deployer.constructor().transact()
+        receipt = await client.w3.eth.wait_for_transaction_receipt(tx_hash)
+
+        jpyc = cls(
+            client=client,
+            contract_version=contract_version,
+            contract_address=receipt["contractAddress"],
+        )
+        await jpyc.contract.functions.initialize(
+            "JPY Coin",
+            "JPYC",
+            "Yen",
+            18,
+            owner_address,
+            owner_address,
+            owner_address,
+            owner_address,
+            owner_address,
+        ).transact()
+
+        return jpyc
+
+    ##################
+    # Helper methods #
+    ##################
+
+    def __account_initialized(self) -> None:
+        """Checks if account is initialized.
+
+        Note:
+            An account must be set to web3 instance to send transactions.
+
+        Raises:
+            AccountNotInitialized: If account is not initialized
+        """
+        if SIGN_MIDDLEWARE not in self.client.w3.middleware_onion:
+            raise AccountNotInitialized()
+
+    @staticmethod
+    async def __simulate_transaction(
+        contract_func: AsyncContractFunction,
+        func_args: dict[str, object],
+    ) -> None:
+        """Simulates a transaction locally.
+
+        Note:
+            This method should be called before sending actual transactions.
+
+        Args:
+            contract_func (AsyncContractFunction): Contract function
+            func_args (dict[str, object]): Arguments of contract function
+
+        Raises:
+            TransactionSimulationFailed: If transaction simulation fails
+        """
+        try:
+            await contract_func(**func_args).call()
+        except Exception as e:
+            raise TransactionSimulationFailed(str(e))
+
+    @staticmethod
+    async def __send_transaction(
+        contract_func: AsyncContractFunction,
+        func_args: dict[str, object],
+    ) -> Any:
+        """Sends a transaction to blockchain.
+
+        Args:
+            contract_func (AsyncContractFunction): Contract function
+            func_args (dict[str, object]): Arguments of contract function
+
+        Returns:
+            Any: Response from the contract function
+
+        Raises:
+            TransactionFailed: If transaction fails
+        """
+        try:
+            return await contract_func(**func_args).transact()
+        except Exception as e:
+            raise TransactionFailed(str(e))
+
+    async def __preflight_check(
+        self,
+        validator: PreflightValidator,
+        func_name: str,
+        func_args: dict[str, object],
+    ) -> None:
+        """Helper method to check arguments of a transaction with the validator.
+
+        Note:
+            The latest block is fetched only if the block timestamp observed \
+            by the validator is outdated, and nonces of permits are fetched \
+            only if unknown (or once again if the signature does not match, \
+            since permits could be used outside of the SDK).
+
+        Args:
+            validator (PreflightValidator): Pre-flight validator
+            func_name (str): Name of contract function
+            func_args (dict[str, object]): Arguments of contract function
+
+        Raises:
+            PreflightCheckFailed: If pre-flight checks fail
+        """
+        if func_name in TIMED_FUNCTIONS and validator.is_block_timestamp_outdated():
+            block = await self.client.w3.eth.get_block("latest")
+            validator.set_block_timestamp(block["timestamp"])
+        owner = (
+            cast(ChecksumAddress, func_args["owner"]) if func_name == "permit" else None
+        )
+        if owner is not None and validator.get_permit_nonce(owner) is None:
+            await self.__fetch_permit_nonce(validator, owner)
+
+        # senders of transaction pipelines are unknown in advance
+        caller = (
+            self.client.account.address
+            if self.transaction_pipeline is None and self.client.account is not None
+            else None
+        )
+        try:
+            validator.check(func_name, func_args, caller=caller)
+        except PreflightCheckFailed:
+            if owner is None:
+                raise
+            # cached nonces lag behind permits used outside of the SDK
+            await self.__fetch_permit_nonce(validator, owner)
+            validator.check(func_name, func_args, caller=caller)
+
+    async def __fetch_permit_nonce(
+        self, validator: PreflightValidator, owner: ChecksumAddress
+    ) -> None:
+        """Helper method to feed the validator with the nonce of a permit owner.
+
+        Args:
+            validator (PreflightValidator): Pre-flight validator
+            owner (ChecksumAddress): Owner address
+        """
+        nonce = await self.contract.functions.nonces(owner).call()
+        validator.set_permit_nonce(owner, nonce)
+
+    async def __transact(
+        self, contract_func: AsyncContractFunction, func_args: dict[str, object]
+    ) -> Any:
+        """Helper method to prepare & send a transaction in one method.
+
+        Args:
+            contract_func (AsyncContractFunction): Contract function
+            func_args (dict[str, object]): Arguments of contract function
+
+        Returns:
+            Any: Response from the contract function
+
+        Raises:
+            AccountNotInitialized: If account is not initialized
+            PreflightCheckFailed: If pre-flight checks fail
+            TransactionSimulationFailed: If transaction simulation fails
+            TransactionFailed: If transaction fails
+        """
+
+        # bad signatures, expired or used authorizations are rejected offline
+        if self.preflight_validator is not None:
+            await self.__preflight_check(
+                self.preflight_validator, contract_func.fn_name, func_args
+            )
+
+        # transaction pipelines check accounts of their own (e.g., sender pools)
+        if self.transaction_pipeline is not None:
+            tx_hash = await self.transaction_pipeline.transact(
+                contract_func,
+                func_args,
+            )
+        else:
+            self.__account_initialized()
+
+            await self.__simulate_transaction(
+                contract_func,
+                func_args,
+            )
+            tx_hash = await self.__send_transaction(
+                contract_func,
+                func_args,
+            )
+
+        if self.preflight_validator is not None:
+            # nonces are marked used only once mined (i.e., by receipts)
+            self.preflight_validator.record(tx_hash, contract_func.fn_name, func_args)
+        # cached results could be outdated by the transaction
+        if self.read_cache is not None:
+            self.read_cache.invalidate(
+                await self.client.get_chain_id(), self.contract.address
+            )
+
+        return tx_hash
+
+    async def __call(self, func_name: str, *args: Any) -> Any:
+        """Helper method to call a view function (pinned & cached if configured).
+
+        Args:
+            func_name (str): Name of contract function
+            *args (Any): Arguments of the call
+
+        Returns:
+            Any: Result
+        """
+        snapshot = self.__snapshot.get()
+        if snapshot is not None:
+            return await snapshot.async_call(
+                func_name,
+                args,
+                lambda: self.__cached_call(func_name, args, snapshot.block_number),
+            )
+        if self.read_cache is None:
+            return await getattr(self.contract.functions, func_name)(*args).call()
+
+        return await self.__cached_call(
+            func_name,
+            args,
+            await self.__get_latest_block_number(self.read_cache),
+        )
+
+    async def __cached_call(
+        self, func_name: str, args: tuple[Any, ...], block_number: int
+    ) -> Any:
+        """Helper method to call a view function at a block via the read cache.
+
+        Args:
+            func_name (str): Name of contract function
+            args (tuple[Any, ...]): Arguments of the call
+            block_number (int): Block number
+
+        Returns:
+            Any: Result
+        """
+        contract_func = getattr(self.contract.functions, func_name)
+        if self.read_cache is None:
+            return await contract_func(*args).call(block_identifier=block_number)
+
+        return await self.read_cache.async_get_or_call(
+            (
+                await self.client.get_chain_id(),
+                self.contract.address,
+                func_name,
+                args,
+                block_number,
+            ),
+            lambda: contract_func(*args).call(block_identifier=block_number),
+        )
+
+    async def __get_latest_block_number(self, read_cache: ReadCache) -> int:
+        """Helper method to get the latest block number observed by the read cache.
+
+        Args:
+            read_cache (ReadCache): Read cache
+
+        Returns:
+            int: Latest block number (fetched if outdated)
+        """
+        chain_id = await self.client.get_chain_id()
+        block_number = read_cache.get_head(chain_id)
+        if block_number is None:
+            block_number = await self.client.w3.eth.block_number
+            read_cache.set_head(chain_id, block_number)
+
+        return block_number
+
+    #############
+    # Snapshots #
+    #############
+
+    @contextmanager
+    @validate_call
+    def at_block(self, block_number: NonNegativeInt) -> Iterator[Snapshot]:
+        snapshot = Snapshot(block_number=block_number)
+        token = self.__snapshot.set(snapshot)
+        try:
+            yield snapshot
+        finally:
+            self.__snapshot.reset(token)
+
+    @asynccontextmanager
+    async def snapshot(self) -> AsyncIterator[Snapshot]:
+        with self.at_block(await self.client.w3.eth.block_number) as snapshot:
+            yield snapshot
+
+    ############
+    # Metadata #
+    ############
+
+    async def metadata(self) -> TokenMetadata:
+        if self.__metadata is None:
+            async with self.__metadata_lock:
+                if self.__metadata is None:
+                    self.__metadata = await async_fetch_token_metadata(
+                        w3=self.client.w3,
+                        contract_address=self.contract.address,
+                        contract_version=self.contract_version,
+                    )
+
+        return self.__metadata
+
+    async def name(self) -> str:
+        return (await self.metadata()).name
+
+    async def symbol(self) -> str:
+        return (await self.metadata()).symbol
+
+    async def decimals(self) -> int:
+        return (await self.metadata()).decimals
+
+    async def currency(self) -> str:
+        return (await self.metadata()).currency
+
+    async def domain_separator(self) -> bytes:
+        return (await self.metadata()).domain_separator
+
+    ##############
+    # Signatures #
+    ##############
+
+    async def typed_data_signer(self) -> TypedDataSigner:
+        if self.__typed_data_signer is None:
+            self.__typed_data_signer = TypedDataSigner(await self.metadata())
+
+        return self.__typed_data_signer
+
+    def __signing_account(self) -> LocalAccount:
+        """Helper method to get the account of the client to sign messages with.
+
+        Returns:
+            LocalAccount: Account of the client
+
+        Raises:
+            AccountNotInitialized: If account is not initialized
+        """
+        if self.client.account is None:
+            raise AccountNotInitialized()
+
+        return self.client.account
+
+    @validate_call
+    async def sign_permit(
+        self,
+        spender: ChecksumAddress,
+        value: Uint256,
+        deadline: Uint256,
+        nonce: Uint256 | None = None,
+    ) -> Signature:
+        account = self.__signing_account()
+        if nonce is None:
+            nonce = await self.nonces(owner=account.address)
+
+        return (await self.typed_data_signer()).sign_permit(
+            account=account,
+            spender=spender,
+            value=remove_decimals(value),
+            nonce=nonce,
+            deadline=deadline,
+        )
+
+    @validate_call
+    async def sign_transfer_with_authorization(
+        self,
+        to: ChecksumAddress,
+        value: Uint256,
+        valid_after: Uint256,
+        valid_before: Uint256,
+        nonce: Bytes32,
+    ) -> Signature:
+        account = self.__signing_account()
+
+        return (await self.typed_data_signer()).sign_transfer_with_authorization(
+            account=account,
+            to=to,
+            value=remove_decimals(value),
+            valid_after=valid_after,
+            valid_before=valid_before,
+            nonce=nonce,
+        )
+
+    @validate_call
+    async def sign_receive_with_authorization(
+        self,
+        to: ChecksumAddress,
+        value: Uint256,
+        valid_after: Uint256,
+        valid_before: Uint256,
+        nonce: Bytes32,
+    ) -> Signature:
+        account = self.__signing_account()
+
+        return (await self.typed_data_signer()).sign_receive_with_authorization(
+            account=account,
+            to=to,
+            value=remove_decimals(value),
+            valid_after=valid_after,
+            valid_before=valid_before,
+            nonce=nonce,
+        )
+
+    @validate_call
+    async def sign_cancel_authorization(self, nonce: Bytes32) -> Signature:
+        account = self.__signing_account()
+
+        return (await self.typed_data_signer()).sign_cancel_authorization(
+            account=account,
+            nonce=nonce,
+        )
+
+    async def bulk_signer(
+        self,
+        max_workers: int | None = None,
+        chunk_size: int = DEFAULT_SIGNING_CHUNK_SIZE,
+    ) -> BulkSigner:
+        account = self.__signing_account()
+
+        return BulkSigner(
+            metadata=await self.metadata(),
+            private_key=bytes(account.key),
+            max_workers=max_workers,
+            chunk_size=chunk_size,
+        )
+
+    ##################
+    # View functions #
+    ##################
+
+    @validate_call
+    async def is_minter(self, account: ChecksumAddress) -> bool:
+        return await self.__call("isMinter", account)
+
+    @restore_decimals
+    @validate_call
+    async def minter_allowance(self, minter: ChecksumAddress) -> Uint256:
+        return await self.__call("minterAllowance", minter)
+
+    @restore_decimals
+    async def total_supply(self) -> Uint256:
+        return await self.__call("totalSupply")
+
+    @restore_decimals
+    @validate_call
+    async def balance_of(self, account: ChecksumAddress) -> Uint256:
+        return await self.__call("balanceOf", account)
+
+    @restore_decimals
+    @validate_call
+    async def allowance(
+        self, owner: ChecksumAddress, spender: ChecksumAddress
+    ) -> Uint256:
+        return await self.__call("allowance", owner, spender)
+
+    @validate_call
+    async def nonces(self, owner: ChecksumAddress) -> Uint256:
+        nonce = await self.__call("nonces", owner)
+        # nonces of permits are observed unless pinned to a block
+        if self.preflight_validator is not None and self.__snapshot.get() is None:
+            self.preflight_validator.set_permit_nonce(owner, nonce)
+
+        return nonce
+
+    @validate_call
+    async def authorization_state(
+        self, authorizer: ChecksumAddress, nonce: Bytes32, use_cache: bool = True
+    ) -> bool:
+        # used nonces never become unused (unless pinned to a block)
+        validator = self.preflight_validator
+        if validator is None or self.__snapshot.get() is not None:
+            return await self.__call("authorizationState", authorizer, HexBytes(nonce))
+        if use_cache and validator.is_authorization_used(authorizer, nonce):
+            return True
+
+        used = await self.__call("authorizationState", authorizer, HexBytes(nonce))
+        if used:
+            validator.mark_authorization_used(authorizer, nonce)
+
+        return used
+
+    ##########
+    # Events #
+    ##########
+
+    @validate_call
+    async def get_used_authorizations(
+        self,
+        from_block: NonNegativeInt,
+        to_block: NonNegativeInt | Literal["latest", "safe", "finalized"] = "latest",
+    ) -> list[tuple[ChecksumAddress, Bytes32]]:
+        logs = await self.client.w3.eth.get_logs(
+            build_authorization_filter(self.contract.address, from_block, to_block)
+        )
+        used: list[tuple[ChecksumAddress, Bytes32]] = [
+            decode_authorization_log(log) for log in logs
+        ]
+        if self.preflight_validator is not None:
+            for authorizer, nonce in used:
+                self.preflight_validator.mark_authorization_used(authorizer, nonce)
+
+        return used
+
+    ######################
+    # Mutation functions #
+    ######################
+
+    @validate_call
+    async def configure_minter(
+        self, minter: ChecksumAddress, minter_allowed_amount: Uint256
+    ) -> Bytes32:
+        tx_args: AsyncTransactionArgs = {
+            "contract_func": self.contract.functions.configureMinter,
+            "func_args": {
+                "minter": minter,
+                "minterAllowedAmount": remove_decimals(minter_allowed_amount),
+            },
+        }
+
+        return await self.__transact(**tx_args)
+
+    @validate_call
+    async def mint(self, to: ChecksumAddress, amount: Uint256) -> Bytes32:
+        tx_args: AsyncTransactionArgs = {
+            "contract_func": self.contract.functions.mint,
+            "func_args": {
+                "_to": to,
+                "_amount": remove_decimals(amount),
+            },
+        }
+
+        return await self.__transact(**tx_args)
+
+    @validate_call
+    async def transfer(self, to: ChecksumAddress, value: Uint256) -> Bytes32:
+        tx_args: AsyncTransactionArgs = {
+            "contract_func": self.contract.functions.transfer,
+            "func_args": {
+                "to": to,
+                "value": remove_decimals(value),
+            },
+        }
+
+        return await self.__transact(**tx_args)
+
+    @validate_call
+    async def transfer_from(
+        self, from_: ChecksumAddress, to: ChecksumAddress, value: Uint256
+    ) -> Bytes32:
+        tx_args: AsyncTransactionArgs = {
+            "contract_func": self.contract.functions.transferFrom,
+            "func_args": {
+                "from": from_,
+                "to": to,
+                "value": remove_decimals(value),
+            },
+        }
+
+        return await self.__transact(**tx_args)
+
+    @validate_call
+    async def transfer_with_authorization(
+        self,
+        from_: ChecksumAddress,
+        to: ChecksumAddress,
+        value: Uint256,
+        valid_after: Uint256,
+        valid_before: Uint256,
+        nonce: Bytes32,
+        v: Uint8,
+        r: Bytes32,
+        s: Bytes32,
+    ) -> Bytes32:
+        tx_args: AsyncTransactionArgs = {
+            "contract_func": self.contract.functions.transferWithAuthorization,
+            "func_args": {
+                "from": from_,
+                "to": to,
+                "value": remove_decimals(value),
+                "validAfter": valid_after,
+                "validBefore": valid_before,
+                "nonce": nonce,
+                "v": v,
+                "r": r,
+                "s": s,
+            },
+        }
+
+        return await self.__transact(**tx_args)
+
+    @validate_call
+    async def receive_with_authorization(
+        self,
+        from_: ChecksumAddress,
+        to: ChecksumAddress,
+        value: Uint256,
+        valid_after: Uint256,
+        valid_before: Uint256,
+        nonce: Bytes32,
+        v: Uint8,
+        r: Bytes32,
+        s: Bytes32,
+    ) -> Bytes32:
+        tx_args: AsyncTransactionArgs = {
+            "contract_func": self.contract.functions.receiveWithAuthorization,
+            "func_args": {
+                "from": from_,
+                "to": to,
+                "value": remove_decimals(value),
+                "validAfter": valid_after,
+                "validBefore": valid_before,
+                "nonce": nonce,
+                "v": v,
+                "r": r,
+                "s": s,
+            },
+        }
+
+        return await self.__transact(**tx_args)
+
+    @validate_call
+    async def cancel_authorization(
+        self,
+        authorizer: ChecksumAddress,
+        nonce: Bytes32,
+        v: Uint8,
+        r: Bytes32,
+        s: Bytes32,
+    ) -> Bytes32:
+        tx_args: AsyncTransactionArgs = {
+            "contract_func": self.contract.functions.cancelAuthorization,
+            "func_args": {
+                "authorizer": authorizer,
+                "nonce": nonce,
+                "v": v,
+                "r": r,
+                "s": s,
+            },
+        }
+
+        return await self.__transact(**tx_args)
+
+    @validate_call
+    async def approve(self, spender: ChecksumAddress, value: Uint256) -> Bytes32:
+        tx_args: AsyncTransactionArgs = {
+            "contract_func": self.contract.functions.approve,
+            "func_args": {
+                "spender": spender,
+                "value": remove_decimals(value),
+            },
+        }
+
+        return await self.__transact(**tx_args)
+
+    @validate_call
+    async def increase_allowance(
+        self, spender: ChecksumAddress, increment: Uint256
+    ) -> Bytes32:
+        tx_args: AsyncTransactionArgs = {
+            "contract_func": self.contract.functions.increaseAllowance,
+            "func_args": {
+                "spender": spender,
+                "increment": remove_decimals(increment),
+            },
+        }
+
+        return await self.__transact(**tx_args)
+
+    @validate_call
+    async def decrease_allowance(
+        self, spender: ChecksumAddress, decrement: Uint256
+    ) -> Bytes32:
+        tx_args: AsyncTransactionArgs = {
+            "contract_func": self.contract.functions.decreaseAllowance,
+            "func_args": {
+                "spender": spender,
+                "decrement": remove_decimals(decrement),
+            },
+        }
+
+        return await self.__transact(**tx_args)
+
+    @validate_call
+    async def permit(
+        self,
+        owner: ChecksumAddress,
+        spender: ChecksumAddress,
+        value: Uint256,
+        deadline: Uint256,
+        v: Uint8,
+        r: Bytes32,
+        s: Bytes32,
+    ) -> Bytes32:
+        tx_args: AsyncTransactionArgs = {
+            "contract_func": self.contract.functions.permit,
+            "func_args": {
+                "owner": owner,
+                "spender": spender,
+                "value": remove_decimals(value),
+                "deadline": deadline,
+                "v": v,
+                "r": r,
+                "s": s,
+            },
+        }
+
+        return await self.__transact(**tx_args)
@@ -0,0 +1,195 @@
+import asyncio
+from collections.abc import Callable, Sequence
+
+from hexbytes import HexBytes
+from web3.types import TxReceipt
+
+from .async_client import AsyncSdkClient
+from .utils.constants import DEFAULT_BATCH_SIZE, DEFAULT_POLL_INTERVAL
+from .utils.errors import TransactionFailed
+from .utils.receipts import (
+    async_batch_get_receipts,
+    async_get_revert_reason,
+    is_reverted,
+)
+
+
+class AsyncReceiptTracker:
+    """Tracker that waits for receipts of many transactions concurrently in asyncio.
+
+    Note:
+        Receipts of every outstanding transaction are polled over a single \
+        JSON-RPC batch request per new block (instead of polling each \
+        transaction independently), by a background task that runs only \
+        while any transaction is outstanding. \
+        Futures of reverted transactions are resolved with `TransactionFailed` \
+        errors, whose messages contain revert reasons decoded by replaying \
+        the transactions. \
+        A tracker must be used within a single event loop.
+    """
+
+    def __init__(
+        self,
+        client: AsyncSdkClient,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> None:
+        """Constructor that initializes receipt tracker for asyncio.
+
+        Args:
+            client (AsyncSdkClient): Configured SDK client for asyncio
+            poll_interval (float): Interval (in seconds) to poll new blocks
+            batch_size (int): Maximum number of requests per batch request
+        """
+        self.__task: asyncio.Task[None] | None = None
+        self.__futures: dict[HexBytes, asyncio.Future[TxReceipt]] = {}
+        self.__unpolled: set[HexBytes] = set()
+        self.__last_block_number: int | None = None
+
+        self.client = client
+        """AsyncSdkClient: Configured SDK client for asyncio"""
+        self.poll_interval = poll_interval
+        """float: Interval (in seconds) to poll new blocks"""
+        self.batch_size = batch_size
+        """int: Maximum number of requests per batch request"""
+
+    async def __run(self) -> None:
+        """Poll receipts until no transaction is outstanding."""
+        while self.__futures:
+            try:
+                await self.poll()
+            except Exception:
+                # transient RPC errors are retried on the next poll
+                pass
+
+            await asyncio.sleep(self.poll_interval)
+
+        self.__task = None
+
+    async def __resolve(
+        self, future: asyncio.Future[TxReceipt], receipt: TxReceipt
+    ) -> None:
+        """Resolve the future of a transaction with its receipt.
+
+        Args:
+            future (asyncio.Future[TxReceipt]): Future of the transaction
+            receipt (TxReceipt): Transaction receipt
+        """
+        if future.done():
+            return
+
+        if is_reverted(receipt):
+            reason = await async_get_revert_reason(self.client.w3, receipt)
+            if not future.done():
+                future.set_exception(TransactionFailed(reason))
+        else:
+            future.set_result(receipt)
+
+    def track(
+        self,
+        tx_hash: HexBytes,
+        callback: Callable[[asyncio.Future[TxReceipt]], object] | None = None,
+    ) -> asyncio.Future[TxReceipt]:
+        """Start tracking a transaction.
+
+        Note:
+            This method must be called within a running event loop.
+
+        Args:
+            tx_hash (HexBytes): Transaction hash
+            callback (Callable[[asyncio.Future[TxReceipt]], object], optional): \
+            Callback invoked with the future once it is resolved
+
+        Returns:
+            asyncio.Future[TxReceipt]: Future resolved with the receipt, \
+            or with `TransactionFailed` if the transaction is reverted
+        """
+        tx_hash = HexBytes(tx_hash)
+        future = self.__futures.get(tx_hash)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self.__futures[tx_hash] = future
+            self.__unpolled.add(tx_hash)
+        # tasks of closed event loops are done (i.e., cancelled)
+        if self.__task is None or self.__task.done():
+            self.__task = asyncio.create_task(self.__run())
+
+        if callback is not None:
+            future.add_done_callback(callback)
+
+        return future
+
+    async def poll(self) -> int:
+        """Poll receipts of outstanding transactions if a new block is produced.
+
+        Note:
+            Transactions tracked since the last poll are polled immediately \
+            regardless of new blocks. This method is called by the background \
+            task, but could also be called manually.
+
+        Returns:
+            int: Number of resolved transactions
+        """
+        block_number = await self.client.w3.eth.block_number
+        if self.__last_block_number == block_number:
+            tx_hashes = list(self.__unpolled)
+        else:
+            tx_hashes = list(self.__futures)
+        if not tx_hashes:
+            return 0
+
+        receipts = await async_batch_get_receipts(
+            self.client.w3, tx_hashes, self.batch_size
+        )
+        # the state is updated only if the batch succeeds, so that it is retried
+        self.__last_block_number = block_number
+        self.__unpolled.difference_update(tx_hashes)
+
+        resolved = 0
+        for tx_hash, receipt in zip(tx_hashes, receipts, strict=True):
+            if receipt is None:
+                continue
+            future = self.__futures.pop(tx_hash, None)
+            if future is not None:
+                await self.__resolve(future, receipt)
+                resolved += 1
+
+        return resolved
+
+    async def wait(
+        self, tx_hashes: Sequence[HexBytes], timeout: float | None = None
+    ) -> list[TxReceipt]:
+        """Wait for receipts of transactions.
+
+        Args:
+            tx_hashes (Sequence[HexBytes]): Transaction hashes
+            timeout (float, optional): Timeout (in seconds)
+
+        Returns:
+            list[TxReceipt]: Receipts in the order of `tx_hashes`
+
+        Raises:
+            TimeoutError: If any receipt is not available within `timeout`
+            TransactionFailed: If any transaction is reverted
+        """
+        futures = [self.track(tx_hash) for tx_hash in tx_hashes]
+        if not futures:
+            return []
+
+        _, pending = await asyncio.wait(futures, timeout=timeout)
+        if pending:
+            raise TimeoutError(f"{len(pending)} receipt(s) are not yet available.")
+
+        return [future.result() for future in futures]
+
+    def stop(self) -> None:
+        """Stop polling & cancel futures of outstanding transactions."""
+        if self.__task is not None:
+            self.__task.cancel()
+            self.__task = None
+
+        futures = list(self.__futures.values())
+        self.__futures.clear()
+        self.__unpolled.clear()
+        for future in futures:
+            future.cancel()
@@ -0,0 +1,276 @@
+import asyncio
+import time
+
+from hexbytes import HexBytes
+from web3.types import TxReceipt
+
+from .async_jpyc import AsyncJPYC
+from .async_receipt_tracker import AsyncReceiptTracker
+from .async_sender_pool import AsyncSenderPool
+from .utils.constants import (
+    DEFAULT_RELAY_QUEUE_SIZE,
+    DEFAULT_RELAY_WORKERS,
+    RELAY_LATENCY_WINDOW,
+)
+from .utils.errors import RelayRequestRejected
+from .utils.relaying import LatencyMetrics, RelayQueue, RelayRequest, StageStats
+from .utils.types import RelayStage
+
+
+class AsyncRelayer:
+    """Relayer that submits signed authorizations concurrently in asyncio.
+
+    Notes:
+        - Requests are validated on ingestion (by the pre-flight validator of \
+        `jpyc` if configured), deduplicated by authorizers & nonces, \
+        & submitted by worker tasks in the order of `valid_before` \
+        (i.e., earliest deadline first).
+        - Transactions are sent through the transaction pipeline of `jpyc`, \
+        whose nonce managers let workers send transactions concurrently. \
+        Sender pools scale the throughput further with the number of senders.
+        - Latencies are measured per stage: `validate` (ingestion checks), \
+        `queue` (waiting for workers), `submit` (simulating, signing & sending), \
+        `confirm` (waiting for receipts, if `receipt_tracker` is supplied) \
+        & `total` (from enqueued until sent).
+        - `ReceiveWithAuthorization` could be relayed only if its payee \
+        sends the transaction (i.e., payees must be the senders).
+        - A relayer must be used within a single event loop.
+    """
+
+    def __init__(
+        self,
+        jpyc: AsyncJPYC,
+        max_workers: int = DEFAULT_RELAY_WORKERS,
+        max_queue_size: int = DEFAULT_RELAY_QUEUE_SIZE,
+        receipt_tracker: AsyncReceiptTracker | None = None,
+        window: int = RELAY_LATENCY_WINDOW,
+    ) -> None:
+        """Constructor that initializes relayer for asyncio.
+
+        Args:
+            jpyc (AsyncJPYC): JPYC client for asyncio configured with \
+            a transaction pipeline
+            max_workers (int): Number of requests submitted concurrently
+            max_queue_size (int): Maximum number of queued requests
+            receipt_tracker (AsyncReceiptTracker, optional): Tracker to wait for \
+            receipts of sent transactions with
+            window (int): Number of the latest latency samples kept per stage
+
+        Raises:
+            ValueError: If `jpyc` is not configured with a transaction pipeline
+        """
+        if jpyc.transaction_pipeline is None:
+            raise ValueError("Relayer requires a transaction pipeline to send with.")
+
+        # released once per queued request (& per worker to stop)
+        self.__available = asyncio.Semaphore(0)
+        self.__stopped = False
+        self.__tasks: list[asyncio.Task[None]] = []
+        self.__futures: dict[tuple[str, bytes], asyncio.Future[HexBytes]] = {}
+
+        self.jpyc = jpyc
+        """AsyncJPYC: JPYC client for asyncio configured with a transaction pipeline"""
+        self.max_workers = max_workers
+        """int: Number of requests submitted concurrently"""
+        self.receipt_tracker = receipt_tracker
+        """AsyncReceiptTracker | None: Tracker to wait for receipts with"""
+        self.queue = RelayQueue(maxsize=max_queue_size)
+        """RelayQueue: Queue of requests to relay"""
+        self.metrics = LatencyMetrics(window=window)
+        """LatencyMetrics: Latencies of relaying stages"""
+
+    def __get_timestamp(self) -> float:
+        """Get the current Unix time to check deadlines against.
+
+        Returns:
+            float: Latest block timestamp (if observed by the validator), \
+            or the local clock otherwise
+        """
+        if self.jpyc.preflight_validator is not None:
+            return self.jpyc.preflight_validator.get_block_timestamp()
+
+        return time.time()
+
+    async def __run(self) -> None:
+        """Relay queued requests until stopped."""
+        while True:
+            await self.__available.acquire()
+            # queued requests are left to `stop` method
+            if self.__stopped:
+                return
+            entry = self.queue.pop()
+            if entry is not None:
+                await self.__relay(*entry)
+
+    async def __send(self, request: RelayRequest) -> HexBytes:
+        """Send a transaction of a request.
+
+        Args:
+            request (RelayRequest): Request to relay
+
+        Returns:
+            HexBytes: Transaction hash
+        """
+        send = (
+            self.jpyc.transfer_with_authorization
+            if request.kind == "transfer"
+            else self.jpyc.receive_with_authorization
+        )
+
+        return HexBytes(
+            await send(
+                from_=request.from_,
+                to=request.to,
+                value=request.value,
+                valid_after=request.valid_after,
+                valid_before=request.valid_before,
+                nonce=request.nonce,
+                v=request.v,
+                r=request.r,
+                s=request.s,
+            )
+        )
+
+    async def __relay(self, request: RelayRequest, enqueued_at: float) -> None:
+        """Submit a dequeued request & resolve its future.
+
+        Args:
+            request (RelayRequest): Request to relay
+            enqueued_at (float): `time.perf_counter` when enqueued
+        """
+        dequeued_at = time.perf_counter()
+        self.metrics.observe("queue", dequeued_at - enqueued_at)
+        future = self.__futures.pop(request.key, None)
+        # cancelled by callers in the meantime
+        if future is None or future.done():
+            self.queue.discard(request.key)
+            return
+
+        try:
+            if self.__get_timestamp() >= request.valid_before:
+                raise RelayRequestRejected("authorization is expired")
+            tx_hash = await self.__send(request)
+        except Exception as e:
+            # so that fixed requests can be retried
+            self.queue.discard(request.key)
+            if not future.done():
+                future.set_exception(e)
+            return
+
+        sent_at = time.perf_counter()
+        self.metrics.observe("submit", sent_at - dequeued_at)
+        self.metrics.observe("total", sent_at - enqueued_at)
+        if not future.done():
+            future.set_result(tx_hash)
+        if self.receipt_tracker is not None:
+            self.receipt_tracker.track(
+                tx_hash,
+                callback=lambda receipt: self.__confirm(tx_hash, receipt, sent_at),
+            )
+
+    def __confirm(
+        self, tx_hash: HexBytes, receipt: asyncio.Future[TxReceipt], sent_at: float
+    ) -> None:
+        """Record the confirmation of a sent transaction.
+
+        Args:
+            tx_hash (HexBytes): Transaction hash
+            receipt (asyncio.Future[TxReceipt]): Resolved future of the receipt
+            sent_at (float): `time.perf_counter` when sent
+        """
+        if receipt.cancelled():
+            return
+
+        self.metrics.observe("confirm", time.perf_counter() - sent_at)
+        validator = self.jpyc.preflight_validator
+        if validator is not None:
+            if receipt.exception() is None:
+                validator.record_receipt(receipt.result())
+            else:
+                # reverted, so that the authorization is no longer pending
+                validator.discard(tx_hash)
+        # so that senders with fewer pending transactions are preferred
+        if isinstance(self.jpyc.transaction_pipeline, AsyncSenderPool):
+            self.jpyc.transaction_pipeline.confirm(tx_hash)
+
+    def submit(self, request: RelayRequest) -> asyncio.Future[HexBytes]:
+        """Ingest a request to relay.
+
+        Note:
+            This method must be called within a running event loop.
+
+        Args:
+            request (RelayRequest): Request to relay
+
+        Returns:
+            asyncio.Future[HexBytes]: Future resolved with the transaction hash \
+            once sent
+
+        Raises:
+            PreflightCheckFailed: If pre-flight checks fail (if configured)
+            RelayRequestRejected: If the request is expired, duplicated, \
+            or the queue is full
+        """
+        started_at = time.perf_counter()
+        now = self.__get_timestamp()
+        if now >= request.valid_before:
+            raise RelayRequestRejected("authorization is expired")
+        if self.jpyc.preflight_validator is not None:
+            self.jpyc.preflight_validator.check(
+                request.func_name, request.to_func_args()
+            )
+        self.queue.prune(now)
+
+        future: asyncio.Future[HexBytes] = asyncio.get_running_loop().create_future()
+        self.queue.put(request)
+        self.__futures[request.key] = future
+        self.metrics.observe("validate", time.perf_counter() - started_at)
+        self.__available.release()
+
+        return future
+
+    def start(self) -> None:
+        """Start worker tasks (no-op if already started).
+
+        Note:
+            This method must be called within a running event loop.
+        """
+        if self.__tasks:
+            return
+
+        self.__stopped = False
+        self.__available = asyncio.Semaphore(len(self.queue))
+        self.__tasks = [
+            asyncio.create_task(self.__run()) for _ in range(self.max_workers)
+        ]
+
+    async def stop(self, wait: bool = True) -> None:
+        """Stop worker tasks & cancel futures of queued requests.
+
+        Args:
+            wait (bool): Whether to wait for requests being submitted
+        """
+        self.__stopped = True
+        tasks = self.__tasks
+        self.__tasks = []
+        for task in tasks:
+            if wait:
+                self.__available.release()
+            else:
+                task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        while (entry := self.queue.pop()) is not None:
+            request, _ = entry
+            future = self.__futures.pop(request.key, None)
+            self.queue.discard(request.key)
+            if future is not None:
+                future.cancel()
+
+    def get_stats(self) -> dict[RelayStage, StageStats]:
+        """Get latency statistics of relaying stages.
+
+        Returns:
+            dict[RelayStage, StageStats]: Latency statistics by stage
+        """
+        return self.metrics.get_stats()
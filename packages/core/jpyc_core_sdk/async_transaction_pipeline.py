@@ -0,0 +1,242 @@
+from typing import Any
+
+from eth_account.signers.local import LocalAccount
+from hexbytes import HexBytes
+from web3 import Web3
+from web3.contract.async_contract import AsyncContractFunction
+from web3.exceptions import TransactionNotFound
+
+from .async_client import AsyncSdkClient
+from .interfaces import IAsyncTransactionPipeline
+from .utils.calls import decode_error_message
+from .utils.constants import MAX_NONCE_RETRIES
+from .utils.endpoints import is_failover_error
+from .utils.errors import (
+    AccountNotInitialized,
+    TransactionFailed,
+    TransactionSimulationFailed,
+)
+from .utils.fees import FeeManager
+from .utils.nonces import NonceManager, is_known_transaction_error, is_nonce_error
+from .utils.senders import Sender
+from .utils.types import FeeParams
+from .utils.validators import ChecksumAddress
+
+
+class AsyncTransactionPipeline(IAsyncTransactionPipeline):
+    """Lean pipeline that simulates, signs & sends transactions for asyncio.
+
+    Note:
+        Sending a transaction through web3.py (i.e., `call` followed by \
+        `transact`) takes around five round trips (`eth_call`, \
+        `eth_estimateGas`, `eth_getTransactionCount`, fee lookups & \
+        `eth_sendTransaction`). This pipeline takes two instead: \
+        a single `eth_estimateGas`, whose failure serves as the simulation \
+        verdict, and `eth_sendRawTransaction` of a locally signed transaction. \
+        Nonces are reserved by the nonce manager attached to the account of \
+        `client`, & fees are served by a fee manager. \
+        Nonces of transactions rejected by the network are released, \
+        and stale nonces (e.g., `nonce too low`) are resynchronized & retried. \
+        Transactions already in the mempool (e.g., `already known`) are \
+        regarded as sent, and those whose requests fail ambiguously \
+        (e.g., timeouts) are looked up by their hashes before their nonces \
+        are released, so that no transaction is ever sent twice.
+    """
+
+    def __init__(
+        self,
+        client: AsyncSdkClient,
+        fee_manager: FeeManager | None = None,
+    ) -> None:
+        """Constructor that initializes transaction pipeline for asyncio.
+
+        Args:
+            client (AsyncSdkClient): Configured SDK client for asyncio
+            fee_manager (FeeManager, optional): Fee manager to share among pipelines
+        """
+        self.client = client
+        """AsyncSdkClient: Configured SDK client for asyncio"""
+        self.fee_manager = fee_manager if fee_manager is not None else FeeManager()
+        """FeeManager: Fee manager"""
+        self.__rpc_endpoints = list(client.rpc_endpoints)
+
+    async def __get_fees(self) -> FeeParams:
+        """Get fee parameters of the configured network.
+
+        Note:
+            Cached fees are discarded once RPC endpoints of the client change \
+            (e.g., by `set_*_provider` methods).
+
+        Returns:
+            FeeParams: Fee parameters of transactions
+        """
+        chain_id = await self.client.get_chain_id()
+        if self.client.rpc_endpoints != self.__rpc_endpoints:
+            self.fee_manager.invalidate(chain_id)
+            self.__rpc_endpoints = list(self.client.rpc_endpoints)
+
+        return await self.fee_manager.async_get_fees(self.client.w3, chain_id)
+
+    async def __build_transaction(
+        self,
+        address: ChecksumAddress,
+        contract_func: AsyncContractFunction,
+        func_args: dict[str, object],
+    ) -> dict[str, Any]:
+        """Build a transaction, estimating its gas as the simulation.
+
+        Note:
+            Since every other field is supplied locally, \
+            `eth_estimateGas` is the only RPC made while building.
+
+        Args:
+            address (ChecksumAddress): Address of sender
+            contract_func (AsyncContractFunction): Contract function
+            func_args (dict[str, object]): Arguments of contract function
+
+        Returns:
+            dict[str, Any]: Transaction without nonce
+
+        Raises:
+            TransactionSimulationFailed: If transaction simulation fails
+        """
+        try:
+            return dict(
+                await contract_func(**func_args).build_transaction(
+                    {  # type: ignore[arg-type]
+                        "from": address,
+                        "chainId": await self.client.get_chain_id(),
+                        **await self.__get_fees(),
+                    }
+                )
+            )
+        except Exception as e:
+            raise TransactionSimulationFailed(decode_error_message(e))
+
+    async def __is_broadcast(self, tx_hash: HexBytes) -> bool | None:
+        """Checks if a transaction whose request failed ambiguously is broadcast.
+
+        Args:
+            tx_hash (HexBytes): Transaction hash
+
+        Returns:
+            bool | None: True if found, false if not found, or None if unknown
+        """
+        try:
+            await self.client.w3.eth.get_transaction(tx_hash)
+        except TransactionNotFound:
+            return False
+        except Exception:
+            return None
+
+        return True
+
+    async def __send_transaction(
+        self,
+        account: LocalAccount,
+        nonce_manager: NonceManager,
+        transaction: dict[str, Any],
+        retries: int = MAX_NONCE_RETRIES,
+    ) -> HexBytes:
+        """Sign a transaction with a reserved nonce & send it.
+
+        Args:
+            account (LocalAccount): Account instance
+            nonce_manager (NonceManager): Nonce manager of `account`
+            transaction (dict[str, Any]): Transaction without nonce
+            retries (int): Remaining number of retries with a stale nonce
+
+        Returns:
+            HexBytes: Transaction hash
+
+        Raises:
+            TransactionFailed: If transaction fails
+        """
+        nonce = await nonce_manager.async_reserve(self.client.w3)
+        try:
+            signed = account.sign_transaction({**transaction, "nonce": nonce})
+        except Exception as e:
+            nonce_manager.release(nonce)
+            raise TransactionFailed(str(e))
+        tx_hash = HexBytes(Web3.keccak(signed.raw_transaction))
+
+        try:
+            sent = await self.client.w3.eth.send_raw_transaction(signed.raw_transaction)
+        except Exception as e:
+            # i.e., this very transaction is already in the mempool
+            if is_known_transaction_error(e):
+                nonce_manager.commit(nonce)
+                return tx_hash
+            if is_failover_error(e):
+                broadcast = await self.__is_broadcast(tx_hash)
+                # kept consumed unless surely not broadcast
+                if broadcast is False:
+                    nonce_manager.release(nonce)
+                else:
+                    nonce_manager.commit(nonce)
+                if broadcast:
+                    return tx_hash
+                raise TransactionFailed(str(e))
+            if not is_nonce_error(e):
+                nonce_manager.release(nonce)
+                raise TransactionFailed(str(e))
+
+            # i.e., the nonce is already consumed on the network
+            nonce_manager.commit(nonce)
+            await nonce_manager.async_resync(self.client.w3)
+            if retries <= 0:
+                raise TransactionFailed(str(e))
+        else:
+            nonce_manager.commit(nonce)
+            return sent
+
+        return await self.__send_transaction(
+            account=account,
+            nonce_manager=nonce_manager,
+            transaction=transaction,
+            retries=retries - 1,
+        )
+
+    async def transact_as(
+        self,
+        sender: Sender,
+        contract_func: AsyncContractFunction,
+        func_args: dict[str, object],
+    ) -> HexBytes:
+        """Simulate, sign & send a transaction from the specified sender.
+
+        Args:
+            sender (Sender): Sender of the transaction
+            contract_func (AsyncContractFunction): Contract function
+            func_args (dict[str, object]): Arguments of contract function
+
+        Returns:
+            HexBytes: Transaction hash
+
+        Raises:
+            TransactionSimulationFailed: If transaction simulation fails
+            TransactionFailed: If transaction fails
+        """
+        return await self.__send_transaction(
+            account=sender.account,
+            nonce_manager=sender.nonce_manager,
+            transaction=await self.__build_transaction(
+                address=sender.account.address,
+                contract_func=contract_func,
+                func_args=func_args,
+            ),
+        )
+
+    async def transact(
+        self, contract_func: AsyncContractFunction, func_args: dict[str, object]
+    ) -> HexBytes:
+        account = self.client.account
+        nonce_manager = self.client.nonce_manager
+        if account is None or nonce_manager is None:
+            raise AccountNotInitialized()
+
+        return await self.transact_as(
+            sender=Sender(account=account, nonce_manager=nonce_manager),
+            contract_func=contract_func,
+            func_args=func_args,
+        )
@@ -1,6 +1,6 @@
 from eth_account.signers.local import LocalAccount
 from pydantic import validate_call
-from web3 import Account, HTTPProvider, Web3
+from web3 import Account, Web3
 from web3._utils.empty import empty
 from web3.middleware import (
     ExtraDataToPOAMiddleware,
@@ -8,12 +8,20 @@ from web3.middleware import (
 )
 
 from .interfaces import ISdkClient
-from .utils.chains import get_default_rpc_endpoint
+from .utils.chains import (
+    get_chain_id,
+    get_default_rpc_endpoint,
+    get_default_rpc_endpoints,
+    is_supported_network,
+)
 from .utils.constants import (
     POA_MIDDLEWARE,
     SIGN_MIDDLEWARE,
 )
-from .utils.errors import AccountNotInitialized
+from .utils.errors import AccountNotInitialized, ChainIdMismatch
+from .utils.nonces import NonceManager
+from .utils.providers import FailoverHTTPProvider
+from .utils.sessions import SESSION_POOL, SessionPool
 from .utils.types import ChainName
 from .utils.validators import (
     Bytes32,
@@ -25,13 +33,14 @@ from .utils.validators import (
 class SdkClient(ISdkClient):
     """SDK client."""
 
-    @validate_call
+    @validate_call(config={"arbitrary_types_allowed": True})
     def __init__(
         self,
         chain_name: ChainName | None = None,
         network_name: str | None = None,
         rpc_endpoint: RpcEndpoint | None = None,
         private_key: Bytes32 | None = None,
+        session_pool: SessionPool | None = None,
     ) -> None:
         """Constructor that initializes SDK client.
 
@@ -40,12 +49,17 @@ class SdkClient(ISdkClient):
               or `rpc_endpoint` parameter are required.
             - This constructor prioritizes `rpc_endpoint` parameter over\
             `chain_name` & `network_name` parameters when configuring `rpc_endpoint`.
+            - If `chain_name` & `network_name` parameters specify one of the\
+            supported networks, chain id is resolved without any RPC \
+            (verified once on demand if `rpc_endpoint` is supplied as well).
 
         Args:
             chain_name (str, optional): Chain name
             network_name (str, optional): Network name
             rpc_endpoint (RpcEndpoint, optional): RPC endpoint
             private_key (Bytes32, optional): private key of EOA
+            session_pool (SessionPool, optional): Pool of HTTP sessions \
+            (defaults to the process-wide `SESSION_POOL`)
 
         Raises:
             InvalidBytes32: If the supplied `private_key` is not in a valid form
@@ -53,39 +67,77 @@ class SdkClient(ISdkClient):
             NetworkNotSupported: If the specified network is not supported by the SDK
             ValidationError: If pydantic validation fails
         """
+        chain_id = (
+            get_chain_id(chain_name, network_name)
+            if is_supported_network(chain_name, network_name)
+            else None
+        )
+        verifies_chain_id = rpc_endpoint is not None and chain_id is not None
         rpc_endpoint = (
             rpc_endpoint
             if rpc_endpoint is not None
             else get_default_rpc_endpoint(chain_name, network_name)
         )
         account = Account.from_key(private_key) if private_key is not None else None
+        session_pool = session_pool if session_pool is not None else SESSION_POOL
         w3 = self.__configure_w3(
-            rpc_endpoint=rpc_endpoint,
+            rpc_endpoints=[rpc_endpoint],
+            session_pool=session_pool,
             account=account,
         )
 
         self.w3 = w3
         """Web3: Configured web3 instance"""
         self.rpc_endpoint = rpc_endpoint
-        """str: RPC endpoint"""
+        """str: RPC endpoint (the most preferred one if failover is configured)"""
+        self.rpc_endpoints = [rpc_endpoint]
+        """list[str]: RPC endpoints (to fail over among if multiple)"""
+        self.hedge_percentile: float | None = None
+        """float | None: Latency percentile after which read requests are hedged"""
         self.account = account
         """LocalAccount | None: Account instance"""
+        self.nonce_manager = (
+            NonceManager(account.address) if account is not None else None
+        )
+        """NonceManager | None: Nonce manager of account"""
+        self.session_pool = session_pool
+        """SessionPool: Pool of HTTP sessions"""
+        self.__chain_id = chain_id
+        self.__verifies_chain_id = verifies_chain_id
 
     @staticmethod
     def __configure_w3(
-        rpc_endpoint: RpcEndpoint,
+        rpc_endpoints: list[str],
+        session_pool: SessionPool,
         account: LocalAccount | None = None,
+        hedge_percentile: float | None = None,
     ) -> Web3:
         """Configure a web3 instance.
 
+        Note:
+            Providers share HTTP sessions of `session_pool`, \
+            so that connections survive reconfigurations (e.g., `set_account`). \
+            Multiple RPC endpoints are configured with a failover provider.
+
         Args:
-            rpc_endpoint (RpcEndpoint): RPC endpoint
+            rpc_endpoints (list[str]): RPC endpoints
+            session_pool (SessionPool): Pool of HTTP sessions
             account (LocalAccount, optional): Account instance
+            hedge_percentile (float, optional): Latency percentile \
+            after which read requests are hedged (failover providers only)
 
         Returns:
             Web3: Configured web3 instance
         """
-        w3 = Web3(HTTPProvider(rpc_endpoint))
+        w3 = Web3(
+            session_pool.http_provider(rpc_endpoints[0])
+            if len(rpc_endpoints) == 1
+            else FailoverHTTPProvider(
+                rpc_endpoints,
+                session_pool=session_pool,
+                hedge_percentile=hedge_percentile,
+            )
+        )
         w3.middleware_onion.inject(
             ExtraDataToPOAMiddleware,
             name=POA_MIDDLEWARE,
@@ -105,16 +157,73 @@ class SdkClient(ISdkClient):
 
     @validate_call
     def set_default_provider(self, chain_name: ChainName, network_name: str) -> Web3:
+        rpc_endpoint = get_default_rpc_endpoint(chain_name, network_name)
         self.w3 = self.__configure_w3(
-            rpc_endpoint=get_default_rpc_endpoint(chain_name, network_name),
+            rpc_endpoints=[rpc_endpoint],
+            session_pool=self.session_pool,
             account=self.account,
         )
+        self.rpc_endpoint = rpc_endpoint
+        self.rpc_endpoints = [rpc_endpoint]
+        self.hedge_percentile = None
+        self.__chain_id = get_chain_id(chain_name, network_name)
+        self.__verifies_chain_id = False
+        if self.nonce_manager is not None:
+            self.nonce_manager.reset()
 
         return self.w3
 
     @validate_call
     def set_custom_provider(self, rpc_endpoint: RpcEndpoint) -> Web3:
-        self.w3 = self.__configure_w3(rpc_endpoint=rpc_endpoint, account=self.account)
+        self.w3 = self.__configure_w3(
+            rpc_endpoints=[rpc_endpoint],
+            session_pool=self.session_pool,
+            account=self.account,
+        )
+        self.rpc_endpoint = rpc_endpoint
+        self.rpc_endpoints = [rpc_endpoint]
+        self.hedge_percentile = None
+        self.__chain_id = None
+        self.__verifies_chain_id = False
+        if self.nonce_manager is not None:
+            self.nonce_manager.reset()
+
+        return self.w3
+
+    @validate_call
+    def set_failover_provider(
+        self,
+        chain_name: ChainName | None = None,
+        network_name: str | None = None,
+        rpc_endpoints: list[RpcEndpoint] | None = None,
+        hedge_percentile: float | None = None,
+    ) -> Web3:
+        defaults = (
+            get_default_rpc_endpoints(chain_name, network_name)
+            if chain_name is not None or network_name is not None
+            else []
+        )
+        endpoints = list(dict.fromkeys([*defaults, *(rpc_endpoints or [])]))
+        if len(endpoints) == 0:
+            raise ValueError("At least one RPC endpoint is required.")
+
+        self.w3 = self.__configure_w3(
+            rpc_endpoints=endpoints,
+            session_pool=self.session_pool,
+            account=self.account,
+            hedge_percentile=hedge_percentile,
+        )
+        self.rpc_endpoint = endpoints[0]
+        self.rpc_endpoints = endpoints
+        self.hedge_percentile = hedge_percentile
+        self.__chain_id = (
+            get_chain_id(chain_name, network_name)
+            if is_supported_network(chain_name, network_name)
+            else None
+        )
+        self.__verifies_chain_id = bool(rpc_endpoints) and self.__chain_id is not None
+        if self.nonce_manager is not None:
+            self.nonce_manager.reset()
 
         return self.w3
 
@@ -122,17 +231,35 @@ class SdkClient(ISdkClient):
     def set_account(self, private_key: Bytes32 | None) -> LocalAccount | None:
         if private_key is None:
             self.account = None
+            self.nonce_manager = None
             self.w3 = self.__configure_w3(
-                rpc_endpoint=self.rpc_endpoint,
+                rpc_endpoints=self.rpc_endpoints,
+                session_pool=self.session_pool,
+                hedge_percentile=self.hedge_percentile,
             )
         else:
             self.account = Account.from_key(private_key)
+            self.nonce_manager = NonceManager(self.account.address)
             self.w3 = self.__configure_w3(
-                rpc_endpoint=self.rpc_endpoint, account=self.account
+                rpc_endpoints=self.rpc_endpoints,
+                session_pool=self.session_pool,
+                account=self.account,
+                hedge_percentile=self.hedge_percentile,
             )
 
         return self.account
 
+    def get_chain_id(self) -> int:
+        if self.__chain_id is None:
+            self.__chain_id = self.w3.eth.chain_id
+        elif self.__verifies_chain_id:
+            chain_id = self.w3.eth.chain_id
+            if chain_id != self.__chain_id:
+                raise ChainIdMismatch(expected=self.__chain_id, actual=chain_id)
+            self.__verifies_chain_id = False
+
+        return self.__chain_id
+
     def get_account_address(self) -> ChecksumAddress:
         if self.account is None:
             raise AccountNotInitialized()
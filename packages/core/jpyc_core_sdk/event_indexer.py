@@ -0,0 +1,199 @@
+from collections.abc import Sequence
+
+from eth_typing import ChecksumAddress
+from web3 import Web3
+from web3.types import EventData
+
+from .event_scanner import EventScanner
+from .jpyc import JPYC
+from .utils.chains import get_confirmation_depth
+from .utils.constants import DEFAULT_STORE_BATCH_SIZE, INDEXED_EVENTS
+from .utils.event_store import EventStore, StoredEvent
+from .utils.events import BlockRangeSizer
+from .utils.reorgs import batch_get_block_hashes, find_common_ancestor
+
+
+class EventIndexer:
+    """Indexer that syncs events of JPYC contracts into an event store.
+
+    Notes:
+        - Syncs resume from the sync cursors of the store (i.e., only blocks \
+        after the last synced block are scanned on restart).
+        - Events are written in batches along with the cursors, at boundaries \
+        of blocks (i.e., interrupted syncs never skip or duplicate events).
+        - Hashes of synced blocks within the confirmation depth are verified \
+        against the canonical chain on every sync, & events after the last \
+        canonical block are rolled back & replayed on reorgs (i.e., no full \
+        rebuilds are required).
+    """
+
+    def __init__(
+        self,
+        jpyc: JPYC,
+        store: EventStore,
+        event_names: Sequence[str] = INDEXED_EVENTS,
+        batch_size: int = DEFAULT_STORE_BATCH_SIZE,
+        sizer: BlockRangeSizer | None = None,
+        confirmation_depth: int | None = None,
+    ) -> None:
+        """Constructor that initializes event indexer.
+
+        Args:
+            jpyc (JPYC): Configured JPYC client
+            store (EventStore): Store to persist events in
+            event_names (Sequence[str]): Names of events to index
+            batch_size (int): Number of events written per transaction
+            sizer (BlockRangeSizer, optional): Sizer of block ranges to share
+            confirmation_depth (int, optional): Number of blocks after which \
+            synced blocks are regarded as safe from reorganizations \
+            (the confirmation depth of the network if None)
+
+        Raises:
+            ValueError: If any of `event_names` is not defined in the ABI
+        """
+        self.jpyc = jpyc
+        """JPYC: Configured JPYC client"""
+        self.store = store
+        """EventStore: Store to persist events in"""
+        self.batch_size = batch_size
+        """int: Number of events written per transaction"""
+        self.scanner = EventScanner(jpyc=jpyc, event_names=event_names, sizer=sizer)
+        """EventScanner: Scanner of events to index"""
+        self.confirmation_depth = confirmation_depth
+        """int | None: Number of blocks after which synced blocks are regarded \
+        as safe from reorganizations"""
+
+    def __rollback_orphaned(
+        self, chain_id: int, address: ChecksumAddress, cursor: int, depth: int
+    ) -> int:
+        """Roll back events of orphaned blocks (if any).
+
+        Args:
+            chain_id (int): Chain ID
+            address (ChecksumAddress): Contract address
+            cursor (int): Last synced block
+            depth (int): Confirmation depth
+
+        Returns:
+            int: Last synced block after rolled back
+        """
+        confirmed_block = cursor - depth
+        stored_hashes = self.store.get_block_hashes(
+            chain_id, address, confirmed_block + 1
+        )
+        if not stored_hashes:
+            return cursor
+
+        canonical_hashes = batch_get_block_hashes(
+            self.jpyc.client.w3, sorted(stored_hashes)
+        )
+        ancestor = find_common_ancestor(
+            stored_hashes, canonical_hashes, confirmed_block
+        )
+        if ancestor is None:
+            return cursor
+
+        self.store.rollback(chain_id, address, ancestor)
+
+        return ancestor
+
+    def sync(self, from_block: int = 0, to_block: int | None = None) -> int:
+        """Sync events up to a block.
+
+        Note:
+            Orphaned events (if any) are rolled back before syncing.
+
+        Args:
+            from_block (int): First block to scan if never synced before
+            to_block (int, optional): Last block to sync \
+            (the latest block if None, or clamped to the latest block)
+
+        Returns:
+            int: Number of synced events
+        """
+        chain_id = self.jpyc.client.get_chain_id()
+        address = self.jpyc.contract.address
+        depth = (
+            self.confirmation_depth
+            if self.confirmation_depth is not None
+            else get_confirmation_depth(chain_id)
+        )
+        # scanned up to the latest block at most (i.e., never beyond the head)
+        if to_block is not None:
+            to_block = min(to_block, self.jpyc.client.w3.eth.block_number)
+        # fetched before logs, so that reorgs during syncs are detected next time
+        head = self.jpyc.client.w3.eth.get_block(
+            "latest" if to_block is None else to_block
+        )
+        to_block = head["number"]
+        cursor = self.store.get_cursor(chain_id, address)
+        if cursor is not None:
+            from_block = self.__rollback_orphaned(chain_id, address, cursor, depth) + 1
+        if from_block > to_block:
+            return 0
+
+        count = 0
+        batch: list[EventData] = []
+        for event in self.scanner.scan(from_block, to_block):
+            # flushed once all events of previous blocks are buffered
+            if len(batch) >= self.batch_size and (
+                event["blockNumber"] > batch[-1]["blockNumber"]
+            ):
+                # synced up to the block of the last buffered event (hashed as
+                # well, so that reorgs of flushed blocks are detected)
+                self.store.save(
+                    chain_id,
+                    address,
+                    batch,
+                    batch[-1]["blockNumber"],
+                    Web3.to_hex(batch[-1]["blockHash"]),
+                )
+                count += len(batch)
+                batch = []
+            batch.append(event)
+        self.store.save(chain_id, address, batch, to_block, Web3.to_hex(head["hash"]))
+        self.store.prune_blocks(chain_id, address, to_block - depth)
+
+        return count + len(batch)
+
+    def get_events(
+        self,
+        address: str | None = None,
+        event_names: Sequence[str] | None = None,
+        from_block: int | None = None,
+        to_block: int | None = None,
+        limit: int | None = None,
+    ) -> list[StoredEvent]:
+        """Get synced events of the contract.
+
+        Args:
+            address (str, optional): Sender or recipient of events
+            event_names (Sequence[str], optional): Names of events \
+            (every event if None)
+            from_block (int, optional): First block of the range (inclusive)
+            to_block (int, optional): Last block of the range (inclusive)
+            limit (int, optional): Maximum number of events
+
+        Returns:
+            list[StoredEvent]: Events in the order of blocks & log indexes
+        """
+        return self.store.get_events(
+            self.jpyc.client.get_chain_id(),
+            self.jpyc.contract.address,
+            address=address,
+            event_names=event_names,
+            from_block=from_block,
+            to_block=to_block,
+            limit=limit,
+        )
+
+    def get_transfers(self, address: str) -> list[StoredEvent]:
+        """Get synced transfers from or to an address.
+
+        Args:
+            address (str): Sender or recipient of transfers
+
+        Returns:
+            list[StoredEvent]: Transfers in the order of blocks & log indexes
+        """
+        return self.get_events(address=address, event_names=["Transfer"])
@@ -0,0 +1,132 @@
+from collections import deque
+from collections.abc import Iterator, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from web3.types import EventData, LogReceipt
+
+from .jpyc import JPYC
+from .utils.constants import DEFAULT_LOG_WORKERS
+from .utils.events import (
+    BlockRangeSizer,
+    EventDecoder,
+    build_event_filter,
+    is_range_error,
+)
+
+
+class EventScanner:
+    """Scanner that streams decoded events of JPYC contracts over `eth_getLogs`.
+
+    Notes:
+        - Block ranges are sized adaptively: they grow on successes, and \
+        shrink on too large requests (i.e., timeouts or too many results), \
+        which are split into halves & retried.
+        - Ranges are fetched concurrently by worker threads, while at most \
+        twice as many ranges as workers are in flight, & events are yielded \
+        in the order of blocks (i.e., memory is bounded for arbitrarily long \
+        histories).
+    """
+
+    def __init__(
+        self,
+        jpyc: JPYC,
+        event_names: Sequence[str] | None = None,
+        max_workers: int = DEFAULT_LOG_WORKERS,
+        sizer: BlockRangeSizer | None = None,
+    ) -> None:
+        """Constructor that initializes event scanner.
+
+        Args:
+            jpyc (JPYC): Configured JPYC client
+            event_names (Sequence[str], optional): Names of events to scan \
+            (every event of the ABI if None)
+            max_workers (int): Number of ranges fetched concurrently
+            sizer (BlockRangeSizer, optional): Sizer of block ranges to share
+
+        Raises:
+            ValueError: If any of `event_names` is not defined in the ABI
+        """
+        self.jpyc = jpyc
+        """JPYC: Configured JPYC client"""
+        self.decoder = EventDecoder(jpyc.contract, event_names)
+        """EventDecoder: Decoder of events to scan"""
+        self.max_workers = max_workers
+        """int: Number of ranges fetched concurrently"""
+        self.sizer = sizer if sizer is not None else BlockRangeSizer()
+        """BlockRangeSizer: Sizer of block ranges"""
+
+    def get_logs(self, from_block: int, to_block: int) -> list[LogReceipt]:
+        """Get logs of the events in a range of blocks.
+
+        Note:
+            Too large ranges are split into halves recursively.
+
+        Args:
+            from_block (int): First block of the range (inclusive)
+            to_block (int): Last block of the range (inclusive)
+
+        Returns:
+            list[LogReceipt]: Logs in the order of blocks
+        """
+        size = to_block - from_block + 1
+        try:
+            logs = self.jpyc.client.w3.eth.get_logs(
+                build_event_filter(
+                    self.jpyc.contract.address,
+                    self.decoder.get_topics(),
+                    from_block,
+                    to_block,
+                )
+            )
+        except Exception as e:
+            if size == 1 or not is_range_error(e):
+                raise
+            self.sizer.record_failure(size)
+            middle = (from_block + to_block) // 2
+
+            return self.get_logs(from_block, middle) + self.get_logs(
+                middle + 1, to_block
+            )
+
+        self.sizer.record_success(size)
+
+        return list(logs)
+
+    def scan(self, from_block: int, to_block: int | None = None) -> Iterator[EventData]:
+        """Scan events in a range of blocks.
+
+        Args:
+            from_block (int): First block of the range (inclusive)
+            to_block (int, optional): Last block of the range (inclusive) \
+            (the latest block when started if None)
+
+        Yields:
+            EventData: Decoded events in the order of blocks
+        """
+        if to_block is None:
+            to_block = self.jpyc.client.w3.eth.block_number
+        next_block = from_block
+        pending: deque[Future[list[LogReceipt]]] = deque()
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            try:
+                while True:
+                    while (
+                        len(pending) < self.max_workers * 2 and next_block <= to_block
+                    ):
+                        end_block = min(
+                            next_block + self.sizer.get_chunk_size() - 1, to_block
+                        )
+                        pending.append(
+                            executor.submit(self.get_logs, next_block, end_block)
+                        )
+                        next_block = end_block + 1
+                    if not pending:
+                        break
+
+                    for log in pending.popleft().result():
+                        yield self.decoder.decode(log)
+            finally:
+                # e.g., when the caller stops consuming events halfway
+                for future in pending:
+                    future.cancel()
@@ -1,9 +1,21 @@
+from .async_client import IAsyncSdkClient
+from .async_jpyc import IAsyncJPYC
+from .async_transaction_pipeline import IAsyncTransactionPipeline
 from .client import ISdkClient
 from .jpyc import IJPYC
+from .transaction_pipeline import ITransactionPipeline
 
 __all__ = [
+    # async_client
+    "IAsyncSdkClient",
+    # async_jpyc
+    "IAsyncJPYC",
+    # async_transaction_pipeline
+    "IAsyncTransactionPipeline",
     # client
     "ISdkClient",
     # jpyc
     "IJPYC",
+    # transaction_pipeline
+    "ITransactionPipeline",
 ]
@@ -0,0 +1,731 @@
+from abc import ABC, abstractmethod
+from contextlib import AbstractAsyncContextManager, AbstractContextManager
+from typing import Literal
+
+from ..utils.bulk_signing import BulkSigner
+from ..utils.constants import DEFAULT_SIGNING_CHUNK_SIZE
+from ..utils.metadata import TokenMetadata
+from ..utils.signatures import Signature, TypedDataSigner
+from ..utils.snapshots import Snapshot
+from ..utils.validators import (
+    Bytes32,
+    ChecksumAddress,
+    Uint8,
+    Uint256,
+)
+
+
+class IAsyncJPYC(ABC):
+    """Interface of JPYC contracts for asyncio."""
+
+    #############
+    # Snapshots #
+    #############
+
+    @abstractmethod
+    def at_block(self, block_number: int) -> AbstractContextManager[Snapshot]:
+        """Pin every read within the context to a block.
+
+        Notes:
+            - View functions called within the context (including ones in \
+            tasks created within it) are called at `block_number`, \
+            so that their results are consistent with each other.
+            - Results are memoized within the context, and identical calls \
+            in batches are deduplicated.
+            - Contexts are local to threads & asyncio tasks.
+
+        Args:
+            block_number (int): Block number
+
+        Returns:
+            AbstractContextManager[Snapshot]: Context of the snapshot
+
+        Raises:
+            ValidationError: If pydantic validation fails
+        """
+        pass
+
+    @abstractmethod
+    def snapshot(self) -> AbstractAsyncContextManager[Snapshot]:
+        """Pin every read within the context to the latest block.
+
+        Note:
+            This is a shorthand for `at_block` with the latest block number, \
+            to be used as `async with jpyc.snapshot():`.
+
+        Returns:
+            AbstractAsyncContextManager[Snapshot]: Context of the snapshot
+        """
+        pass
+
+    ############
+    # Metadata #
+    ############
+
+    @abstractmethod
+    async def metadata(self) -> TokenMetadata:
+        """Get immutable metadata of the contracts.
+
+        Note:
+            Metadata (i.e., `name`, `symbol`, `decimals`, `currency`, \
+            `_domainSeparatorV4` & typehashes) is fetched once \
+            in a single batch request, and cached afterwards.
+
+        Returns:
+            TokenMetadata: Token metadata
+
+        Raises:
+            CallFailed: If any of the calls fails
+        """
+        pass
+
+    @abstractmethod
+    async def name(self) -> str:
+        """Get (cached) token name, which is also the name of the EIP-712 domain.
+
+        Returns:
+            str: Token name
+        """
+        pass
+
+    @abstractmethod
+    async def symbol(self) -> str:
+        """Get (cached) token symbol.
+
+        Returns:
+            str: Token symbol
+        """
+        pass
+
+    @abstractmethod
+    async def decimals(self) -> int:
+        """Get (cached) token decimals.
+
+        Returns:
+            int: Token decimals
+        """
+        pass
+
+    @abstractmethod
+    async def currency(self) -> str:
+        """Get (cached) currency the token is pegged to.
+
+        Returns:
+            str: Currency
+        """
+        pass
+
+    @abstractmethod
+    async def domain_separator(self) -> bytes:
+        """Get (cached) EIP-712 domain separator.
+
+        Returns:
+            bytes: Domain separator
+        """
+        pass
+
+    ##############
+    # Signatures #
+    ##############
+
+    @abstractmethod
+    async def typed_data_signer(self) -> TypedDataSigner:
+        """Get a (cached) offline signer of EIP-712 typed messages.
+
+        Returns:
+            TypedDataSigner: Signer with the domain separator & typehashes
+
+        Raises:
+            CallFailed: If fetching metadata fails
+        """
+        pass
+
+    @abstractmethod
+    async def sign_permit(
+        self,
+        spender: ChecksumAddress,
+        value: Uint256,
+        deadline: Uint256,
+        nonce: Uint256 | None = None,
+    ) -> Signature:
+        """Sign a `Permit` message by the account of the client (i.e., owner).
+
+        Note:
+            Unless `nonce` is supplied, it is fetched by `nonces` function.
+
+        Args:
+            spender (ChecksumAddress): Spender address
+            value (Uint256): Amount of allowance
+            deadline (Uint256): Unix time when transaction becomes invalid
+            nonce (Uint256, optional): Nonce of the owner
+
+        Returns:
+            Signature: v, r & s to supply to `permit` function
+
+        Raises:
+            AccountNotInitialized: If account is not initialized
+            InvalidChecksumAddress: If supplied `spender` is not in a valid form
+            InvalidUint256: If supplied `value`, `deadline` or `nonce`\
+                            is not in a valid form
+        """
+        pass
+
+    @abstractmethod
+    async def sign_transfer_with_authorization(
+        self,
+        to: ChecksumAddress,
+        value: Uint256,
+        valid_after: Uint256,
+        valid_before: Uint256,
+        nonce: Bytes32,
+    ) -> Signature:
+        """Sign a `TransferWithAuthorization` message by the account of the client.
+
+        Args:
+            to (ChecksumAddress): Payee address
+            value (Uint256): Amount to transfer
+            valid_after (Uint256): Unix time when transaction becomes valid
+            valid_before (Uint256): Unix time when transaction becomes invalid
+            nonce (Bytes32): Unique nonce
+
+        Returns:
+            Signature: v, r & s to supply to `transfer_with_authorization` function
+
+        Raises:
+            AccountNotInitialized: If account is not initialized
+            InvalidBytes32: If supplied `nonce` is not in a valid form
+            InvalidChecksumAddress: If supplied `to` is not in a valid form
+            InvalidUint256: If supplied `value`, `valid_after` or `valid_before`\
+                            is not in a valid form
+        """
+        pass
+
+    @abstractmethod
+    async def sign_receive_with_authorization(
+        self,
+        to: ChecksumAddress,
+        value: Uint256,
+        valid_after: Uint256,
+        valid_before: Uint256,
+        nonce: Bytes32,
+    ) -> Signature:
+        """Sign a `ReceiveWithAuthorization` message by the account of the client.
+
+        Args:
+            to (ChecksumAddress): Payee address
+            value (Uint256): Amount to transfer
+            valid_after (Uint256): Unix time when transaction becomes valid
+            valid_before (Uint256): Unix time when transaction becomes invalid
+            nonce (Bytes32): Unique nonce
+
+        Returns:
+            Signature: v, r & s to supply to `receive_with_authorization` function
+
+        Raises:
+            AccountNotInitialized: If account is not initialized
+            InvalidBytes32: If supplied `nonce` is not in a valid form
+            InvalidChecksumAddress: If supplied `to` is not in a valid form
+            InvalidUint256: If supplied `value`, `valid_after` or `valid_before`\
+                            is not in a valid form
+        """
+        pass
+
+    @abstractmethod
+    async def sign_cancel_authorization(self, nonce: Bytes32) -> Signature:
+        """Sign a `CancelAuthorization` message by the account of the client.
+
+        Args:
+            nonce (Bytes32): Nonce of the authorization
+
+        Returns:
+            Signature: v, r & s to supply to `cancel_authorization` function
+
+        Raises:
+            AccountNotInitialized: If account is not initialized
+            InvalidBytes32: If supplied `nonce` is not in a valid form
+        """
+        pass
+
+    @abstractmethod
+    async def bulk_signer(
+        self,
+        max_workers: int | None = None,
+        chunk_size: int = DEFAULT_SIGNING_CHUNK_SIZE,
+    ) -> BulkSigner:
+        """Get a signer of authorizations in bulk by the account of the client.
+
+        Note:
+            Messages are signed across a process pool, and values of messages \
+            are in JPYC (i.e., decimals are removed by worker processes, \
+            as other signing methods do).
+
+        Args:
+            max_workers (int, optional): Number of worker processes \
+            (number of CPUs if None)
+            chunk_size (int): Number of messages signed per task
+
+        Returns:
+            BulkSigner: Bulk signer
+
+        Raises:
+            AccountNotInitialized: If account is not initialized
+            CallFailed: If fetching metadata fails
+        """
+        pass
+
+    ##################
+    # View functions #
+    ##################
+
+    @abstractmethod
+    async def is_minter(self, account: ChecksumAddress) -> bool:
+        """Call `isMinter` function.
+
+        Args:
+            account (ChecksumAddress): Account address
+
+        Returns:
+            bool: True if `account` is a minter, false otherwise
+
+        Raises:
+            InvalidChecksumAddress: If supplied `account` is not in a valid form
+        """
+        pass
+
+    @abstractmethod
+    async def minter_allowance(self, minter: ChecksumAddress) -> Uint256:
+        """Call `minterAllowance` function.
+
+        Args:
+            minter (ChecksumAddress): Minter address
+
+        Returns:
+            Uint256: Minter allowance
+
+        Raises:
+            InvalidChecksumAddress: If supplied `minter` is not in a valid form
+        """
+        pass
+
+    @abstractmethod
+    async def total_supply(self) -> Uint256:
+        """Call `totalSupply` function.
+
+        Returns:
+            Uint256: Total supply of tokens
+        """
+        pass
+
+    @abstractmethod
+    async def balance_of(self, account: ChecksumAddress) -> Uint256:
+        """Call `balanceOf` function.
+
+        Args:
+            account (ChecksumAddress): Account address
+
+        Returns:
+            Uint256: Account balance
+
+        Raises:
+            InvalidChecksumAddress: If supplied `account` is not in a valid form
+        """
+        pass
+
+    @abstractmethod
+    async def allowance(
+        self, owner: ChecksumAddress, spender: ChecksumAddress
+    ) -> Uint256:
+        """Call `allowance` function.
+
+        Args:
+            owner (ChecksumAddress): Owner address
+            spender (ChecksumAddress): Spender address
+
+        Returns:
+            Uint256: Allowance of spender over owner's tokens
+
+        Raises:
+            InvalidChecksumAddress: If supplied `owner` or `spender`\
+                                    is not in a valid form
+        """
+        pass
+
+    @abstractmethod
+    async def nonces(self, owner: ChecksumAddress) -> Uint256:
+        """Call `nonces` function.
+
+        Args:
+            owner (ChecksumAddress): Owner address
+
+        Returns:
+            Uint256: Nonce for EIP2612's `permit`.
+
+        Raises:
+            InvalidChecksumAddress: If supplied `owner` is not in a valid form
+        """
+        pass
+
+    @abstractmethod
+    async def authorization_state(
+        self, authorizer: ChecksumAddress, nonce: Bytes32, use_cache: bool
+    ) -> bool:
+        """Call `authorizationState` function.
+
+        Note:
+            If a pre-flight validator is configured, nonces observed used on\
+            chain (by successful receipts, events or previous calls) are\
+            answered without RPC unless `use_cache` is False, and nonces found\
+            used are recorded to it. Cached answers are optimistic (i.e., could\
+            be outdated by chain reorganizations until rolled back).
+
+        Args:
+            authorizer (ChecksumAddress): Authorizer address
+            nonce (Bytes32): Nonce of the authorization
+            use_cache (bool): Whether to answer nonces known to be used without RPC
+
+        Returns:
+            bool: True if the nonce is used (or canceled), false otherwise
+
+        Raises:
+            InvalidBytes32: If supplied `nonce` is not in a valid form
+            InvalidChecksumAddress: If supplied `authorizer` is not in a valid form
+        """
+        pass
+
+    ##########
+    # Events #
+    ##########
+
+    @abstractmethod
+    async def get_used_authorizations(
+        self,
+        from_block: int,
+        to_block: int | Literal["latest", "safe", "finalized"],
+    ) -> list[tuple[ChecksumAddress, Bytes32]]:
+        """Get authorizations used (or canceled) in a range of blocks.
+
+        Note:
+            `AuthorizationUsed` & `AuthorizationCanceled` events are fetched\
+            by a single `eth_getLogs` request, and if a pre-flight validator is\
+            configured, fed to it (so that replays are rejected without RPC).
+
+        Args:
+            from_block (int): First block of the range (inclusive)
+            to_block (int | Literal["latest", "safe", "finalized"]):\
+                Last block of the range (inclusive)
+
+        Returns:
+            list[tuple[ChecksumAddress, Bytes32]]: Pairs of authorizer address\
+                                                   & nonce (in the order of logs)
+
+        Raises:
+            ValidationError: If `from_block` or `to_block` is not in a valid form
+        """
+        pass
+
+    ######################
+    # Mutation functions #
+    ######################
+
+    @abstractmethod
+    async def configure_minter(
+        self, minter: ChecksumAddress, minter_allowed_amount: Uint256
+    ) -> Bytes32:
+        """Call `configureMinter` function.
+
+        Args:
+            minter (ChecksumAddress): Minter address
+            minter_allowed_amount (Uint256): Minter allowance
+
+        Returns:
+            Bytes32: Transaction hash
+
+        Raises:
+            AccountNotInitialized: If account is not initialized
+            InvalidChecksumAddress: If supplied `minter` is not in a valid form
+            InvalidUint256: If supplied `minter_allowed_amount` is not in a valid form
+            TransactionFailed: If transaction fails
+            TransactionSimulationFailed: If transaction simulation fails
+        """
+        pass
+
+    @abstractmethod
+    async def mint(self, to: ChecksumAddress, amount: Uint256) -> Bytes32:
+        """Call `mint` function.
+
+        Args:
+            to (ChecksumAddress): Receiver address
+            amount (Uint256): Amount of tokens to mint
+
+        Returns:
+            Bytes32: Transaction hash
+
+        Raises:
+            AccountNotInitialized: If account is not initialized
+            InvalidChecksumAddress: If supplied `to` is not in a valid form
+            InvalidUint256: If supplied `amount` is not in a valid form
+            TransactionFailed: If transaction fails
+            TransactionSimulationFailed: If transaction simulation fails
+        """
+        pass
+
+    @abstractmethod
+    async def transfer(self, to: ChecksumAddress, value: Uint256) -> Bytes32:
+        """Call `transfer` function.
+
+        Args:
+            to (ChecksumAddress): Receiver address
+            value (Uint256): Amount of tokens to transfer
+
+        Returns:
+            Bytes32: Transaction hash
+
+        Raises:
+            AccountNotInitialized: If account is not initialized
+            InvalidChecksumAddress: If supplied `to` is not in a valid form
+            InvalidUint256: If supplied `value` is not in a valid form
+            TransactionFailed: If transaction fails
+            TransactionSimulationFailed: If transaction simulation fails
+        """
+        pass
+
+    @abstractmethod
+    async def transfer_from(
+        self, from_: ChecksumAddress, to: ChecksumAddress, value: Uint256
+    ) -> Bytes32:
+        """Call `transferFrom` function.
+
+        Args:
+            from_ (ChecksumAddress): Owner address
+            to (ChecksumAddress): Receiver address
+            value (Uint256): Amount of tokens to transfer
+
+        Returns:
+            Bytes32: Transaction hash
+
+        Raises:
+            AccountNotInitialized: If account is not initialized
+            InvalidChecksumAddress: If supplied `from_` or `to` is not in a valid form
+            InvalidUint256: If supplied `value` is not in a valid form
+            TransactionFailed: If transaction fails
+            TransactionSimulationFailed: If transaction simulation fails
+        """
+        pass
+
+    @abstractmethod
+    async def transfer_with_authorization(
+        self,
+        from_: ChecksumAddress,
+        to: ChecksumAddress,
+        value: Uint256,
+        valid_after: Uint256,
+        valid_before: Uint256,
+        nonce: Bytes32,
+        v: Uint8,
+        r: Bytes32,
+        s: Bytes32,
+    ) -> Bytes32:
+        """Call `transferWithAuthorization` function.
+
+        Args:
+            from_ (ChecksumAddress): Owner address
+            to (ChecksumAddress): Receiver allowance
+            value (Uint256): Amount of tokens to transfer
+            valid_after (Uint256): Unix time when transaction becomes valid
+            valid_before (Uint256): Unix time when transaction becomes invalid
+            nonce (Bytes32): Unique nonce
+            v (Uint8): v of ECDSA
+            r (Bytes32): r of ECDSA
+            s (Bytes32): s of ECDSA
+
+        Returns:
+            Bytes32: Transaction hash
+
+        Raises:
+            AccountNotInitialized: If account is not initialized
+            InvalidBytes32: If supplied `nonce` or `r` or `s` is not in a valid form
+            InvalidChecksumAddress: If supplied `from_` or `to` is not in a valid form
+            InvalidUint256: If supplied `value` or `valid_after` or `valid_before`\
+                            is not in a valid form
+            InvalidUint8: If supplied `v` is not in a valid form
+            PreflightCheckFailed: If pre-flight checks fail (if configured)
+            TransactionFailed: If transaction fails
+            TransactionSimulationFailed: If transaction simulation fails
+        """
+        pass
+
+    @abstractmethod
+    async def receive_with_authorization(
+        self,
+        from_: ChecksumAddress,
+        to: ChecksumAddress,
+        value: Uint256,
+        valid_after: Uint256,
+        valid_before: Uint256,
+        nonce: Bytes32,
+        v: Uint8,
+        r: Bytes32,
+        s: Bytes32,
+    ) -> Bytes32:
+        """Call `receiveWithAuthorization` function.
+
+        Args:
+            from_ (ChecksumAddress): Owner address
+            to (ChecksumAddress): Receiver allowance
+            value (Uint256): Amount of tokens to transfer
+            valid_after (Uint256): Unix time when transaction becomes valid
+            valid_before (Uint256): Unix time when transaction becomes invalid
+            nonce (Bytes32): Unique nonce
+            v (Uint8): v of ECDSA
+            r (Bytes32): r of ECDSA
+            s (Bytes32): s of ECDSA
+
+        Returns:
+            Bytes32: Transaction hash
+
+        Raises:
+            AccountNotInitialized: If account is not initialized
+            InvalidBytes32: If supplied `nonce` or `r` or `s` is not in a valid form
+            InvalidChecksumAddress: If supplied `from_` or `to` is not in a valid form
+            InvalidUint256: If supplied `value` or `valid_after` or `valid_before`\
+                            is not in a valid form
+            InvalidUint8: If supplied `v` is not in a valid form
+            PreflightCheckFailed: If pre-flight checks fail (if configured)
+            TransactionFailed: If transaction fails
+            TransactionSimulationFailed: If transaction simulation fails
+        """
+        pass
+
+    @abstractmethod
+    async def cancel_authorization(
+        self,
+        authorizer: ChecksumAddress,
+        nonce: Bytes32,
+        v: Uint8,
+        r: Bytes32,
+        s: Bytes32,
+    ) -> Bytes32:
+        """Call `cancelAuthorization` function.
+
+        Args:
+            authorizer (ChecksumAddress): Owner address
+            nonce (Bytes32): Unique nonce
+            v (Uint8): v of ECDSA
+            r (Bytes32): r of ECDSA
+            s (Bytes32): s of ECDSA
+
+        Returns:
+            Bytes32: Transaction hash
+
+        Raises:
+            AccountNotInitialized: If account is not initialized
+            InvalidBytes32: If supplied `nonce` or `r` or `s` is not in a valid form
+            InvalidChecksumAddress: If supplied `authorizer` is not in a valid form
+            InvalidUint8: If supplied `v` is not in a valid form
+            PreflightCheckFailed: If pre-flight checks fail (if configured)
+            TransactionFailed: If transaction fails
+            TransactionSimulationFailed: If transaction simulation fails
+        """
+        pass
+
+    @abstractmethod
+    async def approve(self, spender: ChecksumAddress, value: Uint256) -> Bytes32:
+        """Call `approve` function.
+
+        Args:
+            spender (ChecksumAddress): Spender address
+            value (Uint256): Amount of allowance
+
+        Returns:
+            Bytes32: Transaction hash
+
+        Raises:
+            AccountNotInitialized: If account is not initialized
+            InvalidChecksumAddress: If supplied `spender` is not in a valid form
+            InvalidUint256: If supplied `value` is not in a valid form
+            TransactionFailed: If transaction fails
+            TransactionSimulationFailed: If transaction simulation fails
+        """
+        pass
+
+    @abstractmethod
+    async def increase_allowance(
+        self, spender: ChecksumAddress, increment: Uint256
+    ) -> Bytes32:
+        """Call `increaseAllowance` function.
+
+        Args:
+            spender (ChecksumAddress): Spender address
+            increment (Uint256): Amount of allowance to increase
+
+        Returns:
+            Bytes32: Transaction hash
+
+        Raises:
+            AccountNotInitialized: If account is not initialized
+            InvalidChecksumAddress: If supplied `spender` is not in a valid form
+            InvalidUint256: If supplied `increment` is not in a valid form
+            TransactionFailed: If transaction fails
+            TransactionSimulationFailed: If transaction simulation fails
+        """
+        pass
+
+    @abstractmethod
+    async def decrease_allowance(
+        self, spender: ChecksumAddress, decrement: Uint256
+    ) -> Bytes32:
+        """Call `decreaseAllowance` function.
+
+        Args:
+            spender (ChecksumAddress): Spender address
+            decrement (Uint256): Amount of allowance to decrease
+
+        Returns:
+            Bytes32: Transaction hash
+
+        Raises:
+            AccountNotInitialized: If account is not initialized
+            InvalidChecksumAddress: If supplied `spender` is not in a valid form
+            InvalidUint256: If supplied `decrement` is not in a valid form
+            TransactionFailed: If transaction fails
+            TransactionSimulationFailed: If transaction simulation fails
+        """
+        pass
+
+    @abstractmethod
+    async def permit(
+        self,
+        owner: ChecksumAddress,
+        spender: ChecksumAddress,
+        value: Uint256,
+        deadline: Uint256,
+        v: Uint8,
+        r: Bytes32,
+        s: Bytes32,
+    ) -> Bytes32:
+        """Call `permit` function.
+
+        Args:
+            owner (ChecksumAddress): Owner address
+            spender (ChecksumAddress): Spender address
+            value (Uint256): Amount of allowance
+            deadline (Uint256): Unix time when transaction becomes invalid
+            v (Uint8): v of ECDSA
+            r (Bytes32): r of ECDSA
+            s (Bytes32): s of ECDSA
+
+        Returns:
+            Bytes32: Transaction hash
+
+        Raises:
+            AccountNotInitialized: If account is not initialized
+            InvalidBytes32: If supplied `r` or `s` is not in a valid form
+            InvalidChecksumAddress: If supplied `owner` or `spender`\
+                                    is not in a valid form
+            InvalidUint256: If supplied `value` or `deadline` is not in a valid form
+            InvalidUint8: If supplied `v` is not in a valid form
+            PreflightCheckFailed: If pre-flight checks fail (if configured)
+            TransactionFailed: If transaction fails
+            TransactionSimulationFailed: If transaction simulation fails
+        """
+        pass
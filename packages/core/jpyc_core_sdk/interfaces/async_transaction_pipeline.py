@@ -0,0 +1,28 @@
+from abc import ABC, abstractmethod
+
+from hexbytes import HexBytes
+from web3.contract.async_contract import AsyncContractFunction
+
+
+class IAsyncTransactionPipeline(ABC):
+    """Interface of transaction pipeline for asyncio."""
+
+    @abstractmethod
+    async def transact(
+        self, contract_func: AsyncContractFunction, func_args: dict[str, object]
+    ) -> HexBytes:
+        """Simulate, sign & send a transaction.
+
+        Args:
+            contract_func (AsyncContractFunction): Contract function
+            func_args (dict[str, object]): Arguments of contract function
+
+        Returns:
+            HexBytes: Transaction hash
+
+        Raises:
+            AccountNotInitialized: If account is not initialized
+            TransactionSimulationFailed: If transaction simulation fails
+            TransactionFailed: If transaction fails
+        """
+        pass
@@ -46,13 +46,52 @@ class ISdkClient(ABC):
         """
         pass
 
+    @abstractmethod
+    def set_failover_provider(
+        self,
+        chain_name: ChainName | None = None,
+        network_name: str | None = None,
+        rpc_endpoints: list[RpcEndpoint] | None = None,
+        hedge_percentile: float | None = None,
+    ) -> Web3:
+        """Set provider that fails over among multiple RPC endpoints.
+
+        Notes:
+            - Default RPC endpoints of the specified network (if any) \
+            are followed by the supplied `rpc_endpoints`.
+            - Requests are routed to the healthy endpoint with the lowest latency, \
+            and fail over to the others on timeouts, connection errors, 5xx & 429.
+            - If `hedge_percentile` is set, read requests unanswered within \
+            the percentile of latencies of the preferred endpoint are duplicated \
+            to the next one, and the first answer is taken (never mutations).
+            - Failover is kept on reconfigurations of accounts.
+
+        Args:
+            chain_name (str, optional): Chain name
+            network_name (str, optional): Network name
+            rpc_endpoints (list[RpcEndpoint], optional): Custom RPC endpoints
+            hedge_percentile (float, optional): Latency percentile \
+            (in the range of (0, 100]) after which read requests are hedged
+
+        Returns:
+            Web3: Configured web3 instance
+
+        Raises:
+            InvalidRpcEndpoint: If any of `rpc_endpoints` is not in a valid form
+            NetworkNotSupported: If the specified network is not supported by the SDK
+            ValueError: If no RPC endpoint is specified, \
+            or `hedge_percentile` is out of range
+        """
+        pass
+
     @abstractmethod
     def set_account(self, private_key: Bytes32 | None) -> LocalAccount | None:
         """Set account with a private key.
 
         Notes:
-            If `private_key` parameter is set to `None`, \
+            - If `private_key` parameter is set to `None`, \
             this method removes `account` from the configured web3 instance.
+            - A new nonce manager is attached to the configured account.
 
         Args:
             private_key (Bytes32, optional): Private key of account
@@ -65,6 +104,24 @@ class ISdkClient(ABC):
         """
         pass
 
+    @abstractmethod
+    def get_chain_id(self) -> int:
+        """Get chain id of the configured network.
+
+        Notes:
+            - Chain id is resolved from the supported networks without any RPC \
+            if known, otherwise fetched once from the provider & cached.
+            - If custom RPC endpoints are configured along with a supported \
+            network, chain id is verified once with `eth_chainId` on the first call.
+
+        Returns:
+            int: Chain id
+
+        Raises:
+            ChainIdMismatch: If the RPC endpoint serves another chain
+        """
+        pass
+
     @abstractmethod
     def get_account_address(self) -> ChecksumAddress:
         """Get address of the configured account.
@@ -1,5 +1,13 @@
 from abc import ABC, abstractmethod
-
+from contextlib import AbstractContextManager
+from typing import Literal
+
+from ..utils.bulk_signing import BulkSigner
+from ..utils.constants import DEFAULT_SIGNING_CHUNK_SIZE
+from ..utils.errors import CallFailed
+from ..utils.metadata import TokenMetadata
+from ..utils.signatures import Signature, TypedDataSigner
+from ..utils.snapshots import Snapshot
 from ..utils.validators import (
     Bytes32,
     ChecksumAddress,
@@ -11,6 +19,260 @@ from ..utils.validators import (
 class IJPYC(ABC):
     """Interface of JPYC contracts."""
 
+    #############
+    # Snapshots #
+    #############
+
+    @abstractmethod
+    def at_block(self, block_number: int) -> AbstractContextManager[Snapshot]:
+        """Pin every read within the context to a block.
+
+        Notes:
+            - View functions called within the context (including ones in \
+            batches & multicalls) are called at `block_number`, \
+            so that their results are consistent with each other.
+            - Results are memoized within the context, and identical calls \
+            in batches are deduplicated.
+            - Contexts are local to threads & asyncio tasks.
+
+        Args:
+            block_number (int): Block number
+
+        Returns:
+            AbstractContextManager[Snapshot]: Context of the snapshot
+
+        Raises:
+            ValidationError: If pydantic validation fails
+        """
+        pass
+
+    @abstractmethod
+    def snapshot(self) -> AbstractContextManager[Snapshot]:
+        """Pin every read within the context to the latest block.
+
+        Note:
+            This is a shorthand for `at_block` with the latest block number.
+
+        Returns:
+            AbstractContextManager[Snapshot]: Context of the snapshot
+        """
+        pass
+
+    ############
+    # Metadata #
+    ############
+
+    @abstractmethod
+    def metadata(self) -> TokenMetadata:
+        """Get immutable metadata of the contracts.
+
+        Note:
+            Metadata (i.e., `name`, `symbol`, `decimals`, `currency`, \
+            `_domainSeparatorV4` & typehashes) is fetched once \
+            in a single batch request, and cached afterwards.
+
+        Returns:
+            TokenMetadata: Token metadata
+
+        Raises:
+            CallFailed: If any of the calls fails
+        """
+        pass
+
+    @abstractmethod
+    def name(self) -> str:
+        """Get (cached) token name, which is also the name of the EIP-712 domain.
+
+        Returns:
+            str: Token name
+        """
+        pass
+
+    @abstractmethod
+    def symbol(self) -> str:
+        """Get (cached) token symbol.
+
+        Returns:
+            str: Token symbol
+        """
+        pass
+
+    @abstractmethod
+    def decimals(self) -> int:
+        """Get (cached) token decimals.
+
+        Returns:
+            int: Token decimals
+        """
+        pass
+
+    @abstractmethod
+    def currency(self) -> str:
+        """Get (cached) currency the token is pegged to.
+
+        Returns:
+            str: Currency
+        """
+        pass
+
+    @abstractmethod
+    def domain_separator(self) -> bytes:
+        """Get (cached) EIP-712 domain separator.
+
+        Returns:
+            bytes: Domain separator
+        """
+        pass
+
+    ##############
+    # Signatures #
+    ##############
+
+    @abstractmethod
+    def typed_data_signer(self) -> TypedDataSigner:
+        """Get a (cached) offline signer of EIP-712 typed messages.
+
+        Returns:
+            TypedDataSigner: Signer with the domain separator & typehashes
+
+        Raises:
+            CallFailed: If fetching metadata fails
+        """
+        pass
+
+    @abstractmethod
+    def sign_permit(
+        self,
+        spender: ChecksumAddress,
+        value: Uint256,
+        deadline: Uint256,
+        nonce: Uint256 | None = None,
+    ) -> Signature:
+        """Sign a `Permit` message by the account of the client (i.e., owner).
+
+        Note:
+            Unless `nonce` is supplied, it is fetched by `nonces` function.
+
+        Args:
+            spender (ChecksumAddress): Spender address
+            value (Uint256): Amount of allowance
+            deadline (Uint256): Unix time when transaction becomes invalid
+            nonce (Uint256, optional): Nonce of the owner
+
+        Returns:
+            Signature: v, r & s to supply to `permit` function
+
+        Raises:
+            AccountNotInitialized: If account is not initialized
+            InvalidChecksumAddress: If supplied `spender` is not in a valid form
+            InvalidUint256: If supplied `value`, `deadline` or `nonce`\
+                            is not in a valid form
+        """
+        pass
+
+    @abstractmethod
+    def sign_transfer_with_authorization(
+        self,
+        to: ChecksumAddress,
+        value: Uint256,
+        valid_after: Uint256,
+        valid_before: Uint256,
+        nonce: Bytes32,
+    ) -> Signature:
+        """Sign a `TransferWithAuthorization` message by the account of the client.
+
+        Args:
+            to (ChecksumAddress): Payee address
+            value (Uint256): Amount to transfer
+            valid_after (Uint256): Unix time when transaction becomes valid
+            valid_before (Uint256): Unix time when transaction becomes invalid
+            nonce (Bytes32): Unique nonce
+
+        Returns:
+            Signature: v, r & s to supply to `transfer_with_authorization` function
+
+        Raises:
+            AccountNotInitialized: If account is not initialized
+            InvalidBytes32: If supplied `nonce` is not in a valid form
+            InvalidChecksumAddress: If supplied `to` is not in a valid form
+            InvalidUint256: If supplied `value`, `valid_after` or `valid_before`\
+                            is not in a valid form
+        """
+        pass
+
+    @abstractmethod
+    def sign_receive_with_authorization(
+        self,
+        to: ChecksumAddress,
+        value: Uint256,
+        valid_after: Uint256,
+        valid_before: Uint256,
+        nonce: Bytes32,
+    ) -> Signature:
+        """Sign a `ReceiveWithAuthorization` message by the account of the client.
+
+        Args:
+            to (ChecksumAddress): Payee address
+            value (Uint256): Amount to transfer
+            valid_after (Uint256): Unix time when transaction becomes valid
+            valid_before (Uint256): Unix time when transaction becomes invalid
+            nonce (Bytes32): Unique nonce
+
+        Returns:
+            Signature: v, r & s to supply to `receive_with_authorization` function
+
+        Raises:
+            AccountNotInitialized: If account is not initialized
+            InvalidBytes32: If supplied `nonce` is not in a valid form
+            InvalidChecksumAddress: If supplied `to` is not in a valid form
+            InvalidUint256: If supplied `value`, `valid_after` or `valid_before`\
+                            is not in a valid form
+        """
+        pass
+
+    @abstractmethod
+    def sign_cancel_authorization(self, nonce: Bytes32) -> Signature:
+        """Sign a `CancelAuthorization` message by the account of the client.
+
+        Args:
+            nonce (Bytes32): Nonce of the authorization
+
+        Returns:
+            Signature: v, r & s to supply to `cancel_authorization` function
+
+        Raises:
+            AccountNotInitialized: If account is not initialized
+            InvalidBytes32: If supplied `nonce` is not in a valid form
+        """
+        pass
+
+    @abstractmethod
+    def bulk_signer(
+        self,
+        max_workers: int | None = None,
+        chunk_size: int = DEFAULT_SIGNING_CHUNK_SIZE,
+    ) -> BulkSigner:
+        """Get a signer of authorizations in bulk by the account of the client.
+
+        Note:
+            Messages are signed across a process pool, and values of messages \
+            are in JPYC (i.e., decimals are removed by worker processes, \
+            as other signing methods do).
+
+        Args:
+            max_workers (int, optional): Number of worker processes \
+            (number of CPUs if None)
+            chunk_size (int): Number of messages signed per task
+
+        Returns:
+            BulkSigner: Bulk signer
+
+        Raises:
+            AccountNotInitialized: If account is not initialized
+            CallFailed: If fetching metadata fails
+        """
+        pass
+
     ##################
     # View functions #
     ##################
@@ -101,6 +363,302 @@ class IJPYC(ABC):
         """
         pass
 
+    @abstractmethod
+    def authorization_state(
+        self, authorizer: ChecksumAddress, nonce: Bytes32, use_cache: bool
+    ) -> bool:
+        """Call `authorizationState` function.
+
+        Note:
+            If a pre-flight validator is configured, nonces observed used on\
+            chain (by successful receipts, events or previous calls) are\
+            answered without RPC unless `use_cache` is False, and nonces found\
+            used are recorded to it. Cached answers are optimistic (i.e., could\
+            be outdated by chain reorganizations until rolled back).
+
+        Args:
+            authorizer (ChecksumAddress): Authorizer address
+            nonce (Bytes32): Nonce of the authorization
+            use_cache (bool): Whether to answer nonces known to be used without RPC
+
+        Returns:
+            bool: True if the nonce is used (or canceled), false otherwise
+
+        Raises:
+            InvalidBytes32: If supplied `nonce` is not in a valid form
+            InvalidChecksumAddress: If supplied `authorizer` is not in a valid form
+        """
+        pass
+
+    ########################
+    # Batch view functions #
+    ########################
+
+    @abstractmethod
+    def batch_is_minter(
+        self, accounts: list[ChecksumAddress], batch_size: int
+    ) -> list[bool | CallFailed]:
+        """Call `isMinter` function for many accounts over JSON-RPC batch requests.
+
+        Args:
+            accounts (list[ChecksumAddress]): Account addresses
+            batch_size (int): Maximum number of calls per batch request
+
+        Returns:
+            list[bool | CallFailed]: Results in the order of `accounts`,\
+                                     `CallFailed` for each failed call
+
+        Raises:
+            InvalidChecksumAddress: If any of `accounts` is not in a valid form
+            ValidationError: If `batch_size` is not a positive integer
+        """
+        pass
+
+    @abstractmethod
+    def batch_minter_allowance(
+        self, minters: list[ChecksumAddress], batch_size: int
+    ) -> list[Uint256 | CallFailed]:
+        """Call `minterAllowance` function for many minters over JSON-RPC batch\
+        requests.
+
+        Args:
+            minters (list[ChecksumAddress]): Minter addresses
+            batch_size (int): Maximum number of calls per batch request
+
+        Returns:
+            list[Uint256 | CallFailed]: Minter allowances in the order of `minters`,\
+                                        `CallFailed` for each failed call
+
+        Raises:
+            InvalidChecksumAddress: If any of `minters` is not in a valid form
+            ValidationError: If `batch_size` is not a positive integer
+        """
+        pass
+
+    @abstractmethod
+    def batch_balance_of(
+        self, accounts: list[ChecksumAddress], batch_size: int
+    ) -> list[Uint256 | CallFailed]:
+        """Call `balanceOf` function for many accounts over JSON-RPC batch requests.
+
+        Args:
+            accounts (list[ChecksumAddress]): Account addresses
+            batch_size (int): Maximum number of calls per batch request
+
+        Returns:
+            list[Uint256 | CallFailed]: Balances in the order of `accounts`,\
+                                        `CallFailed` for each failed call
+
+        Raises:
+            InvalidChecksumAddress: If any of `accounts` is not in a valid form
+            ValidationError: If `batch_size` is not a positive integer
+        """
+        pass
+
+    @abstractmethod
+    def batch_allowance(
+        self,
+        owners_and_spenders: list[tuple[ChecksumAddress, ChecksumAddress]],
+        batch_size: int,
+    ) -> list[Uint256 | CallFailed]:
+        """Call `allowance` function for many pairs over JSON-RPC batch requests.
+
+        Args:
+            owners_and_spenders (list[tuple[ChecksumAddress, ChecksumAddress]]):\
+                Pairs of owner & spender addresses
+            batch_size (int): Maximum number of calls per batch request
+
+        Returns:
+            list[Uint256 | CallFailed]: Allowances in the order of\
+                                        `owners_and_spenders`,\
+                                        `CallFailed` for each failed call
+
+        Raises:
+            InvalidChecksumAddress: If any of `owners_and_spenders`\
+                                    is not in a valid form
+            ValidationError: If `batch_size` is not a positive integer
+        """
+        pass
+
+    @abstractmethod
+    def batch_nonces(
+        self, owners: list[ChecksumAddress], batch_size: int
+    ) -> list[Uint256 | CallFailed]:
+        """Call `nonces` function for many owners over JSON-RPC batch requests.
+
+        Args:
+            owners (list[ChecksumAddress]): Owner addresses
+            batch_size (int): Maximum number of calls per batch request
+
+        Returns:
+            list[Uint256 | CallFailed]: Nonces in the order of `owners`,\
+                                        `CallFailed` for each failed call
+
+        Raises:
+            InvalidChecksumAddress: If any of `owners` is not in a valid form
+            ValidationError: If `batch_size` is not a positive integer
+        """
+        pass
+
+    @abstractmethod
+    def batch_authorization_state(
+        self,
+        authorizers_and_nonces: list[tuple[ChecksumAddress, Bytes32]],
+        batch_size: int,
+        use_cache: bool,
+    ) -> list[bool | CallFailed]:
+        """Call `authorizationState` function for many pairs over JSON-RPC batch\
+        requests.
+
+        Note:
+            If a pre-flight validator is configured, nonces observed used on\
+            chain (by successful receipts, events or previous calls) are\
+            answered without RPC unless `use_cache` is False, and nonces found\
+            used are recorded to it. Cached answers are optimistic (i.e., could\
+            be outdated by chain reorganizations until rolled back).
+
+        Args:
+            authorizers_and_nonces (list[tuple[ChecksumAddress, Bytes32]]):\
+                Pairs of authorizer address & nonce
+            batch_size (int): Maximum number of calls per batch request
+            use_cache (bool): Whether to answer nonces known to be used without RPC
+
+        Returns:
+            list[bool | CallFailed]: True if the nonce is used, false otherwise\
+                                     (in the order of `authorizers_and_nonces`),\
+                                     `CallFailed` for each failed call
+
+        Raises:
+            InvalidBytes32: If any of nonces is not in a valid form
+            InvalidChecksumAddress: If any of authorizers is not in a valid form
+            ValidationError: If `batch_size` is not a positive integer
+        """
+        pass
+
+    ############################
+    # Multicall view functions #
+    ############################
+
+    @abstractmethod
+    def multicall_balance_of(
+        self, accounts: list[ChecksumAddress]
+    ) -> list[Uint256 | CallFailed]:
+        """Call `balanceOf` function for many accounts via Multicall3.
+
+        Args:
+            accounts (list[ChecksumAddress]): Account addresses
+
+        Returns:
+            list[Uint256 | CallFailed]: Balances in the order of `accounts`,\
+                                        `CallFailed` for each failed call
+
+        Raises:
+            InvalidChecksumAddress: If any of `accounts` is not in a valid form
+        """
+        pass
+
+    @abstractmethod
+    def multicall_allowance(
+        self, owners_and_spenders: list[tuple[ChecksumAddress, ChecksumAddress]]
+    ) -> list[Uint256 | CallFailed]:
+        """Call `allowance` function for many pairs via Multicall3.
+
+        Args:
+            owners_and_spenders (list[tuple[ChecksumAddress, ChecksumAddress]]):\
+                Pairs of owner & spender addresses
+
+        Returns:
+            list[Uint256 | CallFailed]: Allowances in the order of\
+                                        `owners_and_spenders`,\
+                                        `CallFailed` for each failed call
+
+        Raises:
+            InvalidChecksumAddress: If any of `owners_and_spenders`\
+                                    is not in a valid form
+        """
+        pass
+
+    @abstractmethod
+    def multicall_is_blocklisted(
+        self, accounts: list[ChecksumAddress]
+    ) -> list[bool | CallFailed]:
+        """Call `isBlocklisted` function for many accounts via Multicall3.
+
+        Args:
+            accounts (list[ChecksumAddress]): Account addresses
+
+        Returns:
+            list[bool | CallFailed]: True if blocklisted, false otherwise\
+                                     (in the order of `accounts`),\
+                                     `CallFailed` for each failed call
+
+        Raises:
+            InvalidChecksumAddress: If any of `accounts` is not in a valid form
+        """
+        pass
+
+    @abstractmethod
+    def multicall_authorization_state(
+        self,
+        authorizers_and_nonces: list[tuple[ChecksumAddress, Bytes32]],
+        use_cache: bool,
+    ) -> list[bool | CallFailed]:
+        """Call `authorizationState` function for many pairs via Multicall3.
+
+        Note:
+            If a pre-flight validator is configured, nonces observed used on\
+            chain (by successful receipts, events or previous calls) are\
+            answered without RPC unless `use_cache` is False, and nonces found\
+            used are recorded to it. Cached answers are optimistic (i.e., could\
+            be outdated by chain reorganizations until rolled back).
+
+        Args:
+            authorizers_and_nonces (list[tuple[ChecksumAddress, Bytes32]]):\
+                Pairs of authorizer address & nonce
+            use_cache (bool): Whether to answer nonces known to be used without RPC
+
+        Returns:
+            list[bool | CallFailed]: True if the nonce is used, false otherwise\
+                                     (in the order of `authorizers_and_nonces`),\
+                                     `CallFailed` for each failed call
+
+        Raises:
+            InvalidBytes32: If any of nonces is not in a valid form
+            InvalidChecksumAddress: If any of authorizers is not in a valid form
+        """
+        pass
+
+    ##########
+    # Events #
+    ##########
+
+    @abstractmethod
+    def get_used_authorizations(
+        self,
+        from_block: int,
+        to_block: int | Literal["latest", "safe", "finalized"],
+    ) -> list[tuple[ChecksumAddress, Bytes32]]:
+        """Get authorizations used (or canceled) in a range of blocks.
+
+        Note:
+            `AuthorizationUsed` & `AuthorizationCanceled` events are fetched\
+            by a single `eth_getLogs` request, and if a pre-flight validator is\
+            configured, fed to it (so that replays are rejected without RPC).
+
+        Args:
+            from_block (int): First block of the range (inclusive)
+            to_block (int | Literal["latest", "safe", "finalized"]):\
+                Last block of the range (inclusive)
+
+        Returns:
+            list[tuple[ChecksumAddress, Bytes32]]: Pairs of authorizer address\
+                                                   & nonce (in the order of logs)
+
+        Raises:
+            ValidationError: If `from_block` or `to_block` is not in a valid form
+        """
+        pass
+
     ######################
     # Mutation functions #
     ######################
@@ -226,6 +784,7 @@ class IJPYC(ABC):
             InvalidUint256: If supplied `value` or `valid_after` or `valid_before`\
                             is not in a valid form
             InvalidUint8: If supplied `v` is not in a valid form
+            PreflightCheckFailed: If pre-flight checks fail (if configured)
             TransactionFailed: If transaction fails
             TransactionSimulationFailed: If transaction simulation fails
         """
@@ -267,6 +826,7 @@ class IJPYC(ABC):
             InvalidUint256: If supplied `value` or `valid_after` or `valid_before`\
                             is not in a valid form
             InvalidUint8: If supplied `v` is not in a valid form
+            PreflightCheckFailed: If pre-flight checks fail (if configured)
             TransactionFailed: If transaction fails
             TransactionSimulationFailed: If transaction simulation fails
         """
@@ -298,6 +858,7 @@ class IJPYC(ABC):
             InvalidBytes32: If supplied `nonce` or `r` or `s` is not in a valid form
             InvalidChecksumAddress: If supplied `authorizer` is not in a valid form
             InvalidUint8: If supplied `v` is not in a valid form
+            PreflightCheckFailed: If pre-flight checks fail (if configured)
             TransactionFailed: If transaction fails
             TransactionSimulationFailed: If transaction simulation fails
         """
@@ -399,6 +960,7 @@ class IJPYC(ABC):
                                     is not in a valid form
             InvalidUint256: If supplied `value` or `deadline` is not in a valid form
             InvalidUint8: If supplied `v` is not in a valid form
+            PreflightCheckFailed: If pre-flight checks fail (if configured)
             TransactionFailed: If transaction fails
             TransactionSimulationFailed: If transaction simulation fails
         """
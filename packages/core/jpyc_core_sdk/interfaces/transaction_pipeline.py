@@ -0,0 +1,28 @@
+from abc import ABC, abstractmethod
+
+from hexbytes import HexBytes
+from web3.contract.contract import ContractFunction
+
+
+class ITransactionPipeline(ABC):
+    """Interface of transaction pipeline."""
+
+    @abstractmethod
+    def transact(
+        self, contract_func: ContractFunction, func_args: dict[str, object]
+    ) -> HexBytes:
+        """Simulate, sign & send a transaction.
+
+        Args:
+            contract_func (ContractFunction): Contract function
+            func_args (dict[str, object]): Arguments of contract function
+
+        Returns:
+            HexBytes: Transaction hash
+
+        Raises:
+            AccountNotInitialized: If account is not initialized
+            TransactionSimulationFailed: If transaction simulation fails
+            TransactionFailed: If transaction fails
+        """
+        pass
@@ -1,29 +1,51 @@
-from typing import Any
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from threading import Lock
+from typing import Any, Literal, cast
 
+from eth_account.signers.local import LocalAccount
 from eth_typing import ChecksumAddress as EthChecksumAddress
-from pydantic import validate_call
+from hexbytes import HexBytes
+from pydantic import NonNegativeInt, PositiveInt, validate_call
 from web3.contract.contract import Contract, ContractFunction
 
 from .client import SdkClient
-from .interfaces import IJPYC
+from .interfaces import IJPYC, ITransactionPipeline
 from .utils.addresses import (
+    MULTICALL3_ADDRESS,
     get_proxy_address,
 )
-from .utils.artifacts import (
-    get_artifacts,
-    resolve_artifacts_file_path,
-)
+from .utils.artifacts import load_artifacts
+from .utils.bulk_signing import BulkSigner
+from .utils.caches import ReadCache
+from .utils.calls import batch_call, get_view_function
 from .utils.chains import SUPPORTED_CHAINS
-from .utils.constants import SIGN_MIDDLEWARE
+from .utils.constants import (
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_SIGNING_CHUNK_SIZE,
+    SIGN_MIDDLEWARE,
+    TIMED_FUNCTIONS,
+)
+from .utils.contracts import CONTRACT_FACTORY
 from .utils.currencies import (
     remove_decimals,
     restore_decimals,
+    restore_decimals_in_batch,
 )
 from .utils.errors import (
     AccountNotInitialized,
+    CallFailed,
+    PreflightCheckFailed,
     TransactionFailed,
     TransactionSimulationFailed,
 )
+from .utils.events import build_authorization_filter, decode_authorization_log
+from .utils.metadata import TokenMetadata, fetch_token_metadata
+from .utils.multicall import Call, aggregate3, deploy_multicall3
+from .utils.preflight import PreflightValidator
+from .utils.signatures import Signature, TypedDataSigner
+from .utils.snapshots import Snapshot
 from .utils.types import ContractVersion, TransactionArgs
 from .utils.validators import Bytes32, ChecksumAddress, Uint8, Uint256
 
@@ -36,31 +58,59 @@ class JPYC(IJPYC):
         client: SdkClient,
         contract_version: ContractVersion = "2",
         contract_address: EthChecksumAddress | None = None,
+        deploy_to_localhost: bool = False,
+        multicall_address: EthChecksumAddress | None = None,
+        transaction_pipeline: ITransactionPipeline | None = None,
+        read_cache: ReadCache | None = None,
+        preflight_validator: PreflightValidator | None = None,
     ) -> None:
         """Constructor that initializes JPYC client.
 
         Notes:
-            - If `client` parameter is configured to use localhost network,\
+            - If `deploy_to_localhost` parameter is set to `True` and `client`\
+            parameter is configured to use localhost network,\
             this deploys JPYC contracts to localhost network, initializes it,\
             and sets its address to `address` attribute.
             - If `contract_address` is supplied,\
             this configures contract instance with that address.
+            - If `deploy_to_localhost` parameter is set to `True` and\
+            `multicall_address` is not supplied on localhost network,\
+            this also deploys Multicall3 contract for multicall view functions.\
+            Otherwise, Multicall3 at the canonical address is used by default.
+            - If `transaction_pipeline` is supplied, transactions are sent\
+            through it instead of web3's `call` & `transact` methods.
+            - Unless deploying contracts, this constructor performs no network I/O\
+            as long as chain id of `client` is resolvable without RPC.
+            - View functions are called at the latest block, unless pinned to\
+            a block by `at_block` or `snapshot` methods.
+            - If `read_cache` is supplied, results of view functions are cached\
+            (reads at the latest block are pinned to the latest block number\
+            observed by the cache), and invalidated after mutations.
+            - If `preflight_validator` is supplied, signed authorizations & permits\
+            are validated offline before simulating transactions, and kept\
+            pending until receipts of their transactions are recorded.
 
         Args:
             client (SdkClient): Configured SDK client
             contract_version (ContractVersion): Contract version
             contract_address (EthChecksumAddress, optional): Contract address
+            deploy_to_localhost (bool): Whether to deploy contracts to localhost
+            multicall_address (EthChecksumAddress, optional): Multicall3 address
+            transaction_pipeline (ITransactionPipeline, optional): Transaction pipeline
+            read_cache (ReadCache, optional): Cache of results of view functions
+            preflight_validator (PreflightValidator, optional): Offline validator\
+            of signed authorizations & permits
         """
-        if (
-            client.w3.eth.chain_id == SUPPORTED_CHAINS["localhost"]["devnet"]["id"]
-            and contract_address is None
-        ):
+        chain_id = client.get_chain_id()
+        is_localhost = chain_id == SUPPORTED_CHAINS["localhost"]["devnet"]["id"]
+        if deploy_to_localhost and contract_address is None and is_localhost:
             address = self.__deploy_contract(
                 client=client,
                 contract_version=contract_version,
             )
             contract = self.__get_contract(
                 client=client,
+                chain_id=chain_id,
                 contract_address=address,
                 contract_version=contract_version,
             )
@@ -76,14 +126,42 @@ class JPYC(IJPYC):
             )
             contract = self.__get_contract(
                 client=client,
+                chain_id=chain_id,
                 contract_address=address,
                 contract_version=contract_version,
             )
 
+        if deploy_to_localhost and multicall_address is None and is_localhost:
+            multicall = deploy_multicall3(w3=client.w3)
+        else:
+            multicall = (
+                multicall_address
+                if multicall_address is not None
+                else MULTICALL3_ADDRESS
+            )
+
         self.client = client
         """ISdkClient: Configured SDK client"""
         self.contract = contract
         """Contract: Configured contract instance"""
+        self.contract_version = contract_version
+        """ContractVersion: Contract version"""
+        self.multicall_address = multicall
+        """ChecksumAddress: Multicall3 address"""
+        self.transaction_pipeline = transaction_pipeline
+        """ITransactionPipeline | None: Transaction pipeline"""
+        self.read_cache = read_cache
+        """ReadCache | None: Cache of results of view functions"""
+        self.preflight_validator = preflight_validator
+        """PreflightValidator | None: Offline validator of signed authorizations"""
+        # context-local, so that snapshots never leak across threads & tasks
+        self.__snapshot: ContextVar[Snapshot | None] = ContextVar(
+            f"snapshot_{id(self)}", default=None
+        )
+        # immutable, so that fetched only once
+        self.__metadata: TokenMetadata | None = None
+        self.__typed_data_signer: TypedDataSigner | None = None
+        self.__metadata_lock = Lock()
 
     ##################
     # Helper methods #
@@ -107,10 +185,10 @@ class JPYC(IJPYC):
         Returns:
             ChecksumAddress: Address of the deployed contracts
         """
-        file_path = resolve_artifacts_file_path(contract_version=contract_version)
+        artifacts = load_artifacts(contract_version=contract_version)
         contract = client.w3.eth.contract(
-            abi=get_artifacts(file_path, "abi"),
-            bytecode=get_artifacts(file_path, "bytecode"),
+            abi=artifacts.abi,
+            bytecode=artifacts.bytecode,
         )
         tx_hash = contract.constructor().transact()
 
@@ -119,27 +197,30 @@ class JPYC(IJPYC):
     @staticmethod
     def __get_contract(
         client: SdkClient,
+        chain_id: int,
         contract_address: ChecksumAddress,
         contract_version: ContractVersion = "2",
     ) -> Contract:
         """Get contract instance from the configured network.
 
+        Note:
+            Contract instances are shared among JPYC instances \
+            targeting the same web3 instance, chain, address & version.
+
         Args:
             client (SdkClient): Configured SDK client
+            chain_id (int): Chain id of the configured network
             contract_address (ChecksumAddress): Contract address
             contract_version (ContractVersion): Contract version
 
         Returns:
-            Contract: Address of the deployed contracts
+            Contract: Configured contract instance
         """
-        return client.w3.eth.contract(  # type: ignore[call-overload]
-            address=contract_address,
-            abi=get_artifacts(
-                file_path=resolve_artifacts_file_path(
-                    contract_version=contract_version
-                ),
-                artifact_type="abi",
-            ),
+        return CONTRACT_FACTORY.get_contract(
+            w3=client.w3,
+            chain_id=chain_id,
+            contract_address=contract_address,
+            contract_version=contract_version,
         )
 
     @staticmethod
@@ -222,6 +303,64 @@ class JPYC(IJPYC):
         except Exception as e:
             raise TransactionFailed(str(e))
 
+    def __preflight_check(
+        self,
+        validator: PreflightValidator,
+        func_name: str,
+        func_args: dict[str, object],
+    ) -> None:
+        """Helper method to check arguments of a transaction with the validator.
+
+        Note:
+            The latest block is fetched only if the block timestamp observed \
+            by the validator is outdated, and nonces of permits are fetched \
+            only if unknown (or once again if the signature does not match, \
+            since permits could be used outside of the SDK).
+
+        Args:
+            validator (PreflightValidator): Pre-flight validator
+            func_name (str): Name of contract function
+            func_args (dict[str, object]): Arguments of contract function
+
+        Raises:
+            PreflightCheckFailed: If pre-flight checks fail
+        """
+        if func_name in TIMED_FUNCTIONS and validator.is_block_timestamp_outdated():
+            block = self.client.w3.eth.get_block("latest")
+            validator.set_block_timestamp(block["timestamp"])
+        owner = (
+            cast(ChecksumAddress, func_args["owner"]) if func_name == "permit" else None
+        )
+        if owner is not None and validator.get_permit_nonce(owner) is None:
+            self.__fetch_permit_nonce(validator, owner)
+
+        # senders of transaction pipelines are unknown in advance
+        caller = (
+            self.client.account.address
+            if self.transaction_pipeline is None and self.client.account is not None
+            else None
+        )
+        try:
+            validator.check(func_name, func_args, caller=caller)
+        except PreflightCheckFailed:
+            if owner is None:
+                raise
+            # cached nonces lag behind permits used outside of the SDK
+            self.__fetch_permit_nonce(validator, owner)
+            validator.check(func_name, func_args, caller=caller)
+
+    def __fetch_permit_nonce(
+        self, validator: PreflightValidator, owner: ChecksumAddress
+    ) -> None:
+        """Helper method to feed the validator with the nonce of a permit owner.
+
+        Args:
+            validator (PreflightValidator): Pre-flight validator
+            owner (ChecksumAddress): Owner address
+        """
+        nonce = self.contract.functions.nonces(owner).call()
+        validator.set_permit_nonce(owner, nonce)
+
     def __transact(
         self, contract_func: ContractFunction, func_args: dict[str, object]
     ) -> Any:
@@ -236,18 +375,410 @@ class JPYC(IJPYC):
 
         Raises:
             AccountNotInitialized: If account is not initialized
+            PreflightCheckFailed: If pre-flight checks fail
             TransactionSimulationFailed: If transaction simulation fails
             TransactionFailed: If transaction fails
         """
 
-        self.__account_initialized()
-        self.__simulate_transaction(
-            contract_func,
-            func_args,
+        # bad signatures, expired or used authorizations are rejected offline
+        if self.preflight_validator is not None:
+            self.__preflight_check(
+                self.preflight_validator, contract_func.fn_name, func_args
+            )
+
+        # transaction pipelines check accounts of their own (e.g., sender pools)
+        if self.transaction_pipeline is not None:
+            tx_hash = self.transaction_pipeline.transact(
+                contract_func,
+                func_args,
+            )
+        else:
+            self.__account_initialized()
+
+            self.__simulate_transaction(
+                contract_func,
+                func_args,
+            )
+            tx_hash = self.__send_transaction(
+                contract_func,
+                func_args,
+            )
+
+        if self.preflight_validator is not None:
+            # nonces are marked used only once mined (i.e., by receipts)
+            self.preflight_validator.record(tx_hash, contract_func.fn_name, func_args)
+        # cached results could be outdated by the transaction
+        if self.read_cache is not None:
+            self.read_cache.invalidate(
+                self.client.get_chain_id(), self.contract.address
+            )
+
+        return tx_hash
+
+    def __batch_call(
+        self,
+        func_name: str,
+        args_list: list[tuple[Any, ...]],
+        batch_size: int,
+    ) -> list[Any]:
+        """Helper method to call a view function many times in batches.
+
+        Args:
+            func_name (str): Name of contract function
+            args_list (list[tuple[Any, ...]]): Arguments of each call
+            batch_size (int): Maximum number of calls per batch request
+
+        Returns:
+            list[Any]: Results in the order of `args_list`,\
+                       `CallFailed` for each failed call
+        """
+        function = get_view_function(self.contract_version, func_name)
+        snapshot = self.__snapshot.get()
+        if snapshot is None:
+            return batch_call(
+                w3=self.client.w3,
+                contract_address=self.contract.address,
+                function=function,
+                args_list=args_list,
+                batch_size=batch_size,
+            )
+
+        return snapshot.call_many(
+            func_name,
+            args_list,
+            lambda unique_args_list: batch_call(
+                w3=self.client.w3,
+                contract_address=self.contract.address,
+                function=function,
+                args_list=unique_args_list,
+                batch_size=batch_size,
+                block_identifier=snapshot.block_number,
+            ),
+        )
+
+    def __multicall(
+        self,
+        func_name: str,
+        args_list: list[tuple[Any, ...]],
+    ) -> list[Any]:
+        """Helper method to call a view function many times via Multicall3.
+
+        Args:
+            func_name (str): Name of contract function
+            args_list (list[tuple[Any, ...]]): Arguments of each call
+
+        Returns:
+            list[Any]: Results in the order of `args_list`,\
+                       `CallFailed` for each failed call
+        """
+        function = get_view_function(self.contract_version, func_name)
+        snapshot = self.__snapshot.get()
+        if snapshot is None:
+            return aggregate3(
+                w3=self.client.w3,
+                calls=[
+                    Call(self.contract.address, function, args) for args in args_list
+                ],
+                multicall_address=self.multicall_address,
+            )
+
+        return snapshot.call_many(
+            func_name,
+            args_list,
+            lambda unique_args_list: aggregate3(
+                w3=self.client.w3,
+                calls=[
+                    Call(self.contract.address, function, args)
+                    for args in unique_args_list
+                ],
+                multicall_address=self.multicall_address,
+                block_identifier=snapshot.block_number,
+            ),
+        )
+
+    def __authorization_states(
+        self,
+        authorizers_and_nonces: list[tuple[ChecksumAddress, Bytes32]],
+        call_many: Callable[[list[tuple[Any, ...]]], list[Any]],
+        use_cache: bool,
+    ) -> list[Any]:
+        """Helper method to call `authorizationState` function for many pairs.
+
+        Note:
+            Used nonces never become unused, so that nonces observed used on \
+            chain by the pre-flight validator (if configured) are never called \
+            (unless bypassed), and nonces found used are recorded to the \
+            validator (unless pinned to a block).
+
+        Args:
+            authorizers_and_nonces (list[tuple[ChecksumAddress, Bytes32]]): \
+            Pairs of authorizer address & nonce
+            call_many (Callable[[list[tuple[Any, ...]]], list[Any]]): \
+            Function to call `authorizationState` with each of arguments
+            use_cache (bool): Whether to answer nonces known to be used \
+            without RPC
+
+        Returns:
+            list[Any]: Results in the order of `authorizers_and_nonces`,\
+                       `CallFailed` for each failed call
+        """
+        validator = self.preflight_validator
+        if validator is None or self.__snapshot.get() is not None:
+            return call_many(
+                [
+                    (authorizer, HexBytes(nonce))
+                    for authorizer, nonce in authorizers_and_nonces
+                ]
+            )
+
+        results: list[Any] = [True] * len(authorizers_and_nonces)
+        unknown = [
+            i
+            for i, (authorizer, nonce) in enumerate(authorizers_and_nonces)
+            if not use_cache or not validator.is_authorization_used(authorizer, nonce)
+        ]
+        if not unknown:
+            return results
+
+        unknown_results = call_many(
+            [
+                (authorizers_and_nonces[i][0], HexBytes(authorizers_and_nonces[i][1]))
+                for i in unknown
+            ]
+        )
+        for i, result in zip(unknown, unknown_results, strict=True):
+            results[i] = result
+            if result is True:
+                validator.mark_authorization_used(*authorizers_and_nonces[i])
+
+        return results
+
+    def __call(self, func_name: str, *args: Any) -> Any:
+        """Helper method to call a view function (pinned & cached if configured).
+
+        Args:
+            func_name (str): Name of contract function
+            *args (Any): Arguments of the call
+
+        Returns:
+            Any: Result
+        """
+        snapshot = self.__snapshot.get()
+        if snapshot is not None:
+            return snapshot.call(
+                func_name,
+                args,
+                lambda: self.__cached_call(func_name, args, snapshot.block_number),
+            )
+        if self.read_cache is None:
+            return getattr(self.contract.functions, func_name)(*args).call()
+
+        return self.__cached_call(
+            func_name,
+            args,
+            self.__get_latest_block_number(self.read_cache),
+        )
+
+    def __cached_call(
+        self, func_name: str, args: tuple[Any, ...], block_number: int
+    ) -> Any:
+        """Helper method to call a view function at a block via the read cache.
+
+        Args:
+            func_name (str): Name of contract function
+            args (tuple[Any, ...]): Arguments of the call
+            block_number (int): Block number
+
+        Returns:
+            Any: Result
+        """
+        contract_func = getattr(self.contract.functions, func_name)
+        if self.read_cache is None:
+            return contract_func(*args).call(block_identifier=block_number)
+
+        return self.read_cache.get_or_call(
+            (
+                self.client.get_chain_id(),
+                self.contract.address,
+                func_name,
+                args,
+                block_number,
+            ),
+            lambda: contract_func(*args).call(block_identifier=block_number),
+        )
+
+    def __get_latest_block_number(self, read_cache: ReadCache) -> int:
+        """Helper method to get the latest block number observed by the read cache.
+
+        Args:
+            read_cache (ReadCache): Read cache
+
+        Returns:
+            int: Latest block number (fetched if outdated)
+        """
+        chain_id = self.client.get_chain_id()
+        block_number = read_cache.get_head(chain_id)
+        if block_number is None:
+            block_number = self.client.w3.eth.block_number
+            read_cache.set_head(chain_id, block_number)
+
+        return block_number
+
+    #############
+    # Snapshots #
+    #############
+
+    @contextmanager
+    @validate_call
+    def at_block(self, block_number: NonNegativeInt) -> Iterator[Snapshot]:
+        snapshot = Snapshot(block_number=block_number)
+        token = self.__snapshot.set(snapshot)
+        try:
+            yield snapshot
+        finally:
+            self.__snapshot.reset(token)
+
+    @contextmanager
+    def snapshot(self) -> Iterator[Snapshot]:
+        with self.at_block(self.client.w3.eth.block_number) as snapshot:
+            yield snapshot
+
+    ############
+    # Metadata #
+    ############
+
+    def metadata(self) -> TokenMetadata:
+        if self.__metadata is None:
+            with self.__metadata_lock:
+                if self.__metadata is None:
+                    self.__metadata = fetch_token_metadata(
+                        w3=self.client.w3,
+                        contract_address=self.contract.address,
+                        contract_version=self.contract_version,
+                    )
+
+        return self.__metadata
+
+    def name(self) -> str:
+        return self.metadata().name
+
+    def symbol(self) -> str:
+        return self.metadata().symbol
+
+    def decimals(self) -> int:
+        return self.metadata().decimals
+
+    def currency(self) -> str:
+        return self.metadata().currency
+
+    def domain_separator(self) -> bytes:
+        return self.metadata().domain_separator
+
+    ##############
+    # Signatures #
+    ##############
+
+    def typed_data_signer(self) -> TypedDataSigner:
+        if self.__typed_data_signer is None:
+            self.__typed_data_signer = TypedDataSigner(self.metadata())
+
+        return self.__typed_data_signer
+
+    def __signing_account(self) -> LocalAccount:
+        """Helper method to get the account of the client to sign messages with.
+
+        Returns:
+            LocalAccount: Account of the client
+
+        Raises:
+            AccountNotInitialized: If account is not initialized
+        """
+        if self.client.account is None:
+            raise AccountNotInitialized()
+
+        return self.client.account
+
+    @validate_call
+    def sign_permit(
+        self,
+        spender: ChecksumAddress,
+        value: Uint256,
+        deadline: Uint256,
+        nonce: Uint256 | None = None,
+    ) -> Signature:
+        account = self.__signing_account()
+        if nonce is None:
+            nonce = self.nonces(owner=account.address)
+
+        return self.typed_data_signer().sign_permit(
+            account=account,
+            spender=spender,
+            value=remove_decimals(value),
+            nonce=nonce,
+            deadline=deadline,
+        )
+
+    @validate_call
+    def sign_transfer_with_authorization(
+        self,
+        to: ChecksumAddress,
+        value: Uint256,
+        valid_after: Uint256,
+        valid_before: Uint256,
+        nonce: Bytes32,
+    ) -> Signature:
+        account = self.__signing_account()
+
+        return self.typed_data_signer().sign_transfer_with_authorization(
+            account=account,
+            to=to,
+            value=remove_decimals(value),
+            valid_after=valid_after,
+            valid_before=valid_before,
+            nonce=nonce,
+        )
+
+    @validate_call
+    def sign_receive_with_authorization(
+        self,
+        to: ChecksumAddress,
+        value: Uint256,
+        valid_after: Uint256,
+        valid_before: Uint256,
+        nonce: Bytes32,
+    ) -> Signature:
+        account = self.__signing_account()
+
+        return self.typed_data_signer().sign_receive_with_authorization(
+            account=account,
+            to=to,
+            value=remove_decimals(value),
+            valid_after=valid_after,
+            valid_before=valid_before,
+            nonce=nonce,
+        )
+
+    @validate_call
+    def sign_cancel_authorization(self, nonce: Bytes32) -> Signature:
+        account = self.__signing_account()
+
+        return self.typed_data_signer().sign_cancel_authorization(
+            account=account,
+            nonce=nonce,
         )
-        return self.__send_transaction(
-            contract_func,
-            func_args,
+
+    def bulk_signer(
+        self,
+        max_workers: int | None = None,
+        chunk_size: int = DEFAULT_SIGNING_CHUNK_SIZE,
+    ) -> BulkSigner:
+        account = self.__signing_account()
+
+        return BulkSigner(
+            metadata=self.metadata(),
+            private_key=bytes(account.key),
+            max_workers=max_workers,
+            chunk_size=chunk_size,
         )
 
     ##################
@@ -256,30 +787,176 @@ class JPYC(IJPYC):
 
     @validate_call
     def is_minter(self, account: ChecksumAddress) -> bool:
-        return self.contract.functions.isMinter(account).call()
+        return self.__call("isMinter", account)
 
     @restore_decimals
     @validate_call
     def minter_allowance(self, minter: ChecksumAddress) -> Uint256:
-        return self.contract.functions.minterAllowance(minter).call()
+        return self.__call("minterAllowance", minter)
 
     @restore_decimals
     def total_supply(self) -> Uint256:
-        return self.contract.functions.totalSupply().call()
+        return self.__call("totalSupply")
 
     @restore_decimals
     @validate_call
     def balance_of(self, account: ChecksumAddress) -> Uint256:
-        return self.contract.functions.balanceOf(account).call()
+        return self.__call("balanceOf", account)
 
     @restore_decimals
     @validate_call
     def allowance(self, owner: ChecksumAddress, spender: ChecksumAddress) -> Uint256:
-        return self.contract.functions.allowance(owner, spender).call()
+        return self.__call("allowance", owner, spender)
 
     @validate_call
     def nonces(self, owner: ChecksumAddress) -> Uint256:
-        return self.contract.functions.nonces(owner).call()
+        nonce = self.__call("nonces", owner)
+        # nonces of permits are observed unless pinned to a block
+        if self.preflight_validator is not None and self.__snapshot.get() is None:
+            self.preflight_validator.set_permit_nonce(owner, nonce)
+
+        return nonce
+
+    @validate_call
+    def authorization_state(
+        self, authorizer: ChecksumAddress, nonce: Bytes32, use_cache: bool = True
+    ) -> bool:
+        return self.__authorization_states(
+            [(authorizer, nonce)],
+            lambda args_list: [self.__call("authorizationState", *args_list[0])],
+            use_cache,
+        )[0]
+
+    ########################
+    # Batch view functions #
+    ########################
+
+    @validate_call
+    def batch_is_minter(
+        self,
+        accounts: list[ChecksumAddress],
+        batch_size: PositiveInt = DEFAULT_BATCH_SIZE,
+    ) -> list[bool | CallFailed]:
+        return self.__batch_call(
+            "isMinter", [(account,) for account in accounts], batch_size
+        )
+
+    @validate_call
+    def batch_minter_allowance(
+        self,
+        minters: list[ChecksumAddress],
+        batch_size: PositiveInt = DEFAULT_BATCH_SIZE,
+    ) -> list[Uint256 | CallFailed]:
+        return restore_decimals_in_batch(
+            self.__batch_call(
+                "minterAllowance", [(minter,) for minter in minters], batch_size
+            )
+        )
+
+    @validate_call
+    def batch_balance_of(
+        self,
+        accounts: list[ChecksumAddress],
+        batch_size: PositiveInt = DEFAULT_BATCH_SIZE,
+    ) -> list[Uint256 | CallFailed]:
+        return restore_decimals_in_batch(
+            self.__batch_call(
+                "balanceOf", [(account,) for account in accounts], batch_size
+            )
+        )
+
+    @validate_call
+    def batch_allowance(
+        self,
+        owners_and_spenders: list[tuple[ChecksumAddress, ChecksumAddress]],
+        batch_size: PositiveInt = DEFAULT_BATCH_SIZE,
+    ) -> list[Uint256 | CallFailed]:
+        return restore_decimals_in_batch(
+            self.__batch_call("allowance", owners_and_spenders, batch_size)
+        )
+
+    @validate_call
+    def batch_nonces(
+        self,
+        owners: list[ChecksumAddress],
+        batch_size: PositiveInt = DEFAULT_BATCH_SIZE,
+    ) -> list[Uint256 | CallFailed]:
+        return self.__batch_call("nonces", [(owner,) for owner in owners], batch_size)
+
+    @validate_call
+    def batch_authorization_state(
+        self,
+        authorizers_and_nonces: list[tuple[ChecksumAddress, Bytes32]],
+        batch_size: PositiveInt = DEFAULT_BATCH_SIZE,
+        use_cache: bool = True,
+    ) -> list[bool | CallFailed]:
+        return self.__authorization_states(
+            authorizers_and_nonces,
+            lambda args_list: self.__batch_call(
+                "authorizationState", args_list, batch_size
+            ),
+            use_cache,
+        )
+
+    ############################
+    # Multicall view functions #
+    ############################
+
+    @validate_call
+    def multicall_balance_of(
+        self, accounts: list[ChecksumAddress]
+    ) -> list[Uint256 | CallFailed]:
+        return restore_decimals_in_batch(
+            self.__multicall("balanceOf", [(account,) for account in accounts])
+        )
+
+    @validate_call
+    def multicall_allowance(
+        self, owners_and_spenders: list[tuple[ChecksumAddress, ChecksumAddress]]
+    ) -> list[Uint256 | CallFailed]:
+        return restore_decimals_in_batch(
+            self.__multicall("allowance", owners_and_spenders)
+        )
+
+    @validate_call
+    def multicall_is_blocklisted(
+        self, accounts: list[ChecksumAddress]
+    ) -> list[bool | CallFailed]:
+        return self.__multicall("isBlocklisted", [(account,) for account in accounts])
+
+    @validate_call
+    def multicall_authorization_state(
+        self,
+        authorizers_and_nonces: list[tuple[ChecksumAddress, Bytes32]],
+        use_cache: bool = True,
+    ) -> list[bool | CallFailed]:
+        return self.__authorization_states(
+            authorizers_and_nonces,
+            lambda args_list: self.__multicall("authorizationState", args_list),
+            use_cache,
+        )
+
+    ##########
+    # Events #
+    ##########
+
+    @validate_call
+    def get_used_authorizations(
+        self,
+        from_block: NonNegativeInt,
+        to_block: NonNegativeInt | Literal["latest", "safe", "finalized"] = "latest",
+    ) -> list[tuple[ChecksumAddress, Bytes32]]:
+        logs = self.client.w3.eth.get_logs(
+            build_authorization_filter(self.contract.address, from_block, to_block)
+        )
+        used: list[tuple[ChecksumAddress, Bytes32]] = [
+            decode_authorization_log(log) for log in logs
+        ]
+        if self.preflight_validator is not None:
+            for authorizer, nonce in used:
+                self.preflight_validator.mark_authorization_used(authorizer, nonce)
+
+        return used
 
     ######################
     # Mutation functions #
@@ -0,0 +1,203 @@
+from collections.abc import Callable, Sequence
+from concurrent.futures import Future, InvalidStateError, wait
+from threading import Event, Lock, Thread, current_thread
+
+from hexbytes import HexBytes
+from web3.types import TxReceipt
+
+from .client import SdkClient
+from .utils.constants import DEFAULT_BATCH_SIZE, DEFAULT_POLL_INTERVAL
+from .utils.errors import TransactionFailed
+from .utils.receipts import batch_get_receipts, get_revert_reason, is_reverted
+
+
+class ReceiptTracker:
+    """Tracker that waits for receipts of many transactions concurrently.
+
+    Note:
+        Receipts of every outstanding transaction are polled over a single \
+        JSON-RPC batch request per new block (instead of polling each \
+        transaction independently), by a background thread that runs only \
+        while any transaction is outstanding. \
+        Futures of reverted transactions are resolved with `TransactionFailed` \
+        errors, whose messages contain revert reasons decoded by replaying \
+        the transactions.
+    """
+
+    def __init__(
+        self,
+        client: SdkClient,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> None:
+        """Constructor that initializes receipt tracker.
+
+        Args:
+            client (SdkClient): Configured SDK client
+            poll_interval (float): Interval (in seconds) to poll new blocks
+            batch_size (int): Maximum number of requests per batch request
+        """
+        self.__lock = Lock()
+        self.__stopped = Event()
+        self.__thread: Thread | None = None
+        self.__futures: dict[HexBytes, Future[TxReceipt]] = {}
+        self.__unpolled: set[HexBytes] = set()
+        self.__last_block_number: int | None = None
+
+        self.client = client
+        """SdkClient: Configured SDK client"""
+        self.poll_interval = poll_interval
+        """float: Interval (in seconds) to poll new blocks"""
+        self.batch_size = batch_size
+        """int: Maximum number of requests per batch request"""
+
+    def __run(self, stopped: Event) -> None:
+        """Poll receipts until no transaction is outstanding (or stopped).
+
+        Args:
+            stopped (Event): Event set when the tracker is stopped
+        """
+        while not stopped.is_set():
+            with self.__lock:
+                # exits atomically, so that `track` starts a new thread if needed
+                if not self.__futures:
+                    if self.__thread is current_thread():
+                        self.__thread = None
+                    return
+
+            try:
+                self.poll()
+            except Exception:
+                # transient RPC errors are retried on the next poll
+                pass
+
+            stopped.wait(self.poll_interval)
+
+    def __resolve(self, future: Future[TxReceipt], receipt: TxReceipt) -> None:
+        """Resolve the future of a transaction with its receipt.
+
+        Args:
+            future (Future[TxReceipt]): Future of the transaction
+            receipt (TxReceipt): Transaction receipt
+        """
+        if future.done():
+            return
+
+        try:
+            if is_reverted(receipt):
+                future.set_exception(
+                    TransactionFailed(get_revert_reason(self.client.w3, receipt))
+                )
+            else:
+                future.set_result(receipt)
+        except InvalidStateError:
+            # cancelled in the meantime
+            pass
+
+    def track(
+        self,
+        tx_hash: HexBytes,
+        callback: Callable[[Future[TxReceipt]], object] | None = None,
+    ) -> Future[TxReceipt]:
+        """Start tracking a transaction.
+
+        Args:
+            tx_hash (HexBytes): Transaction hash
+            callback (Callable[[Future[TxReceipt]], object], optional): Callback \
+            invoked with the future once it is resolved
+
+        Returns:
+            Future[TxReceipt]: Future resolved with the receipt, \
+            or with `TransactionFailed` if the transaction is reverted
+        """
+        tx_hash = HexBytes(tx_hash)
+        with self.__lock:
+            future = self.__futures.get(tx_hash)
+            if future is None:
+                future = Future()
+                self.__futures[tx_hash] = future
+                self.__unpolled.add(tx_hash)
+            if self.__thread is None:
+                self.__stopped = Event()
+                self.__thread = Thread(
+                    target=self.__run, args=(self.__stopped,), daemon=True
+                )
+                self.__thread.start()
+
+        if callback is not None:
+            future.add_done_callback(callback)
+
+        return future
+
+    def poll(self) -> int:
+        """Poll receipts of outstanding transactions if a new block is produced.
+
+        Note:
+            Transactions tracked since the last poll are polled immediately \
+            regardless of new blocks. This method is called by the background \
+            thread, but could also be called manually.
+
+        Returns:
+            int: Number of resolved transactions
+        """
+        block_number = self.client.w3.eth.block_number
+        with self.__lock:
+            if self.__last_block_number == block_number:
+                tx_hashes = list(self.__unpolled)
+            else:
+                tx_hashes = list(self.__futures)
+            if not tx_hashes:
+                return 0
+
+        receipts = batch_get_receipts(self.client.w3, tx_hashes, self.batch_size)
+        # the state is updated only if the batch succeeds, so that it is retried
+        with self.__lock:
+            self.__last_block_number = block_number
+            self.__unpolled.difference_update(tx_hashes)
+
+        resolved = 0
+        for tx_hash, receipt in zip(tx_hashes, receipts, strict=True):
+            if receipt is None:
+                continue
+            with self.__lock:
+                future = self.__futures.pop(tx_hash, None)
+            if future is not None:
+                self.__resolve(future, receipt)
+                resolved += 1
+
+        return resolved
+
+    def wait(
+        self, tx_hashes: Sequence[HexBytes], timeout: float | None = None
+    ) -> list[TxReceipt]:
+        """Wait for receipts of transactions.
+
+        Args:
+            tx_hashes (Sequence[HexBytes]): Transaction hashes
+            timeout (float, optional): Timeout (in seconds)
+
+        Returns:
+            list[TxReceipt]: Receipts in the order of `tx_hashes`
+
+        Raises:
+            TimeoutError: If any receipt is not available within `timeout`
+            TransactionFailed: If any transaction is reverted
+        """
+        futures = [self.track(tx_hash) for tx_hash in tx_hashes]
+        _, not_done = wait(futures, timeout=timeout)
+        if not_done:
+            raise TimeoutError(f"{len(not_done)} receipt(s) are not yet available.")
+
+        return [future.result() for future in futures]
+
+    def stop(self) -> None:
+        """Stop polling & cancel futures of outstanding transactions."""
+        with self.__lock:
+            self.__stopped.set()
+            self.__thread = None
+            futures = list(self.__futures.values())
+            self.__futures.clear()
+            self.__unpolled.clear()
+
+        for future in futures:
+            future.cancel()
@@ -0,0 +1,282 @@
+import time
+from concurrent.futures import Future
+from threading import Condition, Event, Lock, Thread
+
+from hexbytes import HexBytes
+from web3.types import TxReceipt
+
+from .jpyc import JPYC
+from .receipt_tracker import ReceiptTracker
+from .sender_pool import SenderPool
+from .utils.constants import (
+    DEFAULT_RELAY_QUEUE_SIZE,
+    DEFAULT_RELAY_WORKERS,
+    RELAY_LATENCY_WINDOW,
+)
+from .utils.errors import RelayRequestRejected
+from .utils.relaying import LatencyMetrics, RelayQueue, RelayRequest, StageStats
+from .utils.types import RelayStage
+
+
+class Relayer:
+    """Relayer that submits signed authorizations of gasless transfers concurrently.
+
+    Notes:
+        - Requests are validated on ingestion (by the pre-flight validator of \
+        `jpyc` if configured), deduplicated by authorizers & nonces, \
+        & submitted by worker threads in the order of `valid_before` \
+        (i.e., earliest deadline first).
+        - Transactions are sent through the transaction pipeline of `jpyc`, \
+        whose nonce managers let workers send transactions concurrently. \
+        Sender pools scale the throughput further with the number of senders.
+        - Latencies are measured per stage: `validate` (ingestion checks), \
+        `queue` (waiting for workers), `submit` (simulating, signing & sending), \
+        `confirm` (waiting for receipts, if `receipt_tracker` is supplied) \
+        & `total` (from enqueued until sent).
+        - `ReceiveWithAuthorization` could be relayed only if its payee \
+        sends the transaction (i.e., payees must be the senders).
+    """
+
+    def __init__(
+        self,
+        jpyc: JPYC,
+        max_workers: int = DEFAULT_RELAY_WORKERS,
+        max_queue_size: int = DEFAULT_RELAY_QUEUE_SIZE,
+        receipt_tracker: ReceiptTracker | None = None,
+        window: int = RELAY_LATENCY_WINDOW,
+    ) -> None:
+        """Constructor that initializes relayer.
+
+        Args:
+            jpyc (JPYC): JPYC client configured with a transaction pipeline
+            max_workers (int): Number of requests submitted concurrently
+            max_queue_size (int): Maximum number of queued requests
+            receipt_tracker (ReceiptTracker, optional): Tracker to wait for \
+            receipts of sent transactions with
+            window (int): Number of the latest latency samples kept per stage
+
+        Raises:
+            ValueError: If `jpyc` is not configured with a transaction pipeline
+        """
+        if jpyc.transaction_pipeline is None:
+            raise ValueError("Relayer requires a transaction pipeline to send with.")
+
+        self.__lock = Lock()
+        self.__available = Condition()
+        self.__stopped = Event()
+        self.__threads: list[Thread] = []
+        self.__futures: dict[tuple[str, bytes], Future[HexBytes]] = {}
+
+        self.jpyc = jpyc
+        """JPYC: JPYC client configured with a transaction pipeline"""
+        self.max_workers = max_workers
+        """int: Number of requests submitted concurrently"""
+        self.receipt_tracker = receipt_tracker
+        """ReceiptTracker | None: Tracker to wait for receipts with"""
+        self.queue = RelayQueue(maxsize=max_queue_size)
+        """RelayQueue: Queue of requests to relay"""
+        self.metrics = LatencyMetrics(window=window)
+        """LatencyMetrics: Latencies of relaying stages"""
+
+    def __get_timestamp(self) -> float:
+        """Get the current Unix time to check deadlines against.
+
+        Returns:
+            float: Latest block timestamp (if observed by the validator), \
+            or the local clock otherwise
+        """
+        if self.jpyc.preflight_validator is not None:
+            return self.jpyc.preflight_validator.get_block_timestamp()
+
+        return time.time()
+
+    def __run(self, stopped: Event) -> None:
+        """Relay queued requests until stopped.
+
+        Args:
+            stopped (Event): Event set when the relayer is stopped
+        """
+        while True:
+            with self.__available:
+                while True:
+                    # queued requests are left to `stop` method
+                    if stopped.is_set():
+                        return
+                    entry = self.queue.pop()
+                    if entry is not None:
+                        break
+                    self.__available.wait()
+
+            self.__relay(*entry)
+
+    def __send(self, request: RelayRequest) -> HexBytes:
+        """Send a transaction of a request.
+
+        Args:
+            request (RelayRequest): Request to relay
+
+        Returns:
+            HexBytes: Transaction hash
+        """
+        send = (
+            self.jpyc.transfer_with_authorization
+            if request.kind == "transfer"
+            else self.jpyc.receive_with_authorization
+        )
+
+        return HexBytes(
+            send(
+                from_=request.from_,
+                to=request.to,
+                value=request.value,
+                valid_after=request.valid_after,
+                valid_before=request.valid_before,
+                nonce=request.nonce,
+                v=request.v,
+                r=request.r,
+                s=request.s,
+            )
+        )
+
+    def __relay(self, request: RelayRequest, enqueued_at: float) -> None:
+        """Submit a dequeued request & resolve its future.
+
+        Args:
+            request (RelayRequest): Request to relay
+            enqueued_at (float): `time.perf_counter` when enqueued
+        """
+        dequeued_at = time.perf_counter()
+        self.metrics.observe("queue", dequeued_at - enqueued_at)
+        with self.__lock:
+            future = self.__futures.pop(request.key, None)
+        # cancelled by callers in the meantime
+        if future is None or not future.set_running_or_notify_cancel():
+            self.queue.discard(request.key)
+            return
+
+        try:
+            if self.__get_timestamp() >= request.valid_before:
+                raise RelayRequestRejected("authorization is expired")
+            tx_hash = self.__send(request)
+        except Exception as e:
+            # so that fixed requests can be retried
+            self.queue.discard(request.key)
+            future.set_exception(e)
+            return
+
+        sent_at = time.perf_counter()
+        self.metrics.observe("submit", sent_at - dequeued_at)
+        self.metrics.observe("total", sent_at - enqueued_at)
+        future.set_result(tx_hash)
+        if self.receipt_tracker is not None:
+            self.receipt_tracker.track(
+                tx_hash,
+                callback=lambda receipt: self.__confirm(tx_hash, receipt, sent_at),
+            )
+
+    def __confirm(
+        self, tx_hash: HexBytes, receipt: Future[TxReceipt], sent_at: float
+    ) -> None:
+        """Record the confirmation of a sent transaction.
+
+        Args:
+            tx_hash (HexBytes): Transaction hash
+            receipt (Future[TxReceipt]): Resolved future of the receipt
+            sent_at (float): `time.perf_counter` when sent
+        """
+        if receipt.cancelled():
+            return
+
+        self.metrics.observe("confirm", time.perf_counter() - sent_at)
+        validator = self.jpyc.preflight_validator
+        if validator is not None:
+            if receipt.exception() is None:
+                validator.record_receipt(receipt.result())
+            else:
+                # reverted, so that the authorization is no longer pending
+                validator.discard(tx_hash)
+        # so that senders with fewer pending transactions are preferred
+        if isinstance(self.jpyc.transaction_pipeline, SenderPool):
+            self.jpyc.transaction_pipeline.confirm(tx_hash)
+
+    def submit(self, request: RelayRequest) -> Future[HexBytes]:
+        """Ingest a request to relay.
+
+        Args:
+            request (RelayRequest): Request to relay
+
+        Returns:
+            Future[HexBytes]: Future resolved with the transaction hash once sent
+
+        Raises:
+            PreflightCheckFailed: If pre-flight checks fail (if configured)
+            RelayRequestRejected: If the request is expired, duplicated, \
+            or the queue is full
+        """
+        started_at = time.perf_counter()
+        now = self.__get_timestamp()
+        if now >= request.valid_before:
+            raise RelayRequestRejected("authorization is expired")
+        if self.jpyc.preflight_validator is not None:
+            self.jpyc.preflight_validator.check(
+                request.func_name, request.to_func_args()
+            )
+        self.queue.prune(now)
+
+        future: Future[HexBytes] = Future()
+        with self.__lock:
+            self.queue.put(request)
+            self.__futures[request.key] = future
+        self.metrics.observe("validate", time.perf_counter() - started_at)
+
+        with self.__available:
+            self.__available.notify()
+
+        return future
+
+    def start(self) -> None:
+        """Start worker threads (no-op if already started)."""
+        with self.__lock:
+            if self.__threads:
+                return
+
+            self.__stopped = Event()
+            self.__threads = [
+                Thread(target=self.__run, args=(self.__stopped,), daemon=True)
+                for _ in range(self.max_workers)
+            ]
+            for thread in self.__threads:
+                thread.start()
+
+    def stop(self, wait: bool = True) -> None:
+        """Stop worker threads & cancel futures of queued requests.
+
+        Args:
+            wait (bool): Whether to wait for requests being submitted
+        """
+        with self.__lock:
+            self.__stopped.set()
+            threads = self.__threads
+            self.__threads = []
+
+        with self.__available:
+            self.__available.notify_all()
+        if wait:
+            for thread in threads:
+                thread.join()
+
+        while (entry := self.queue.pop()) is not None:
+            request, _ = entry
+            with self.__lock:
+                future = self.__futures.pop(request.key, None)
+            self.queue.discard(request.key)
+            if future is not None:
+                future.cancel()
+
+    def get_stats(self) -> dict[RelayStage, StageStats]:
+        """Get latency statistics of relaying stages.
+
+        Returns:
+            dict[RelayStage, StageStats]: Latency statistics by stage
+        """
+        return self.metrics.get_stats()
@@ -0,0 +1,105 @@
+from eth_account.signers.local import LocalAccount
+from hexbytes import HexBytes
+from pydantic import validate_call
+from web3 import Account
+from web3.contract.contract import ContractFunction
+
+from .client import SdkClient
+from .interfaces import ITransactionPipeline
+from .transaction_pipeline import TransactionPipeline
+from .utils.fees import FeeManager
+from .utils.nonces import NonceManager
+from .utils.senders import Sender, SenderScheduler
+from .utils.types import SchedulingStrategy
+from .utils.validators import Bytes32, ChecksumAddress
+
+
+class SenderPool(ITransactionPipeline):
+    """Pool of senders that sends transactions in parallel across multiple accounts.
+
+    Note:
+        Each account has its own nonce stream, so that transactions of \
+        different accounts never contend for nonces, and their throughput \
+        scales with the number of (funded) accounts. \
+        Transactions are simulated, signed & sent through a single \
+        transaction pipeline sharing `client` & a fee manager.
+    """
+
+    @validate_call(config={"arbitrary_types_allowed": True})
+    def __init__(
+        self,
+        client: SdkClient,
+        private_keys: list[Bytes32],
+        strategy: SchedulingStrategy = "round_robin",
+        fee_manager: FeeManager | None = None,
+    ) -> None:
+        """Constructor that initializes sender pool.
+
+        Note:
+            `client` does not have to be configured with an account.
+
+        Args:
+            client (SdkClient): Configured SDK client
+            private_keys (list[Bytes32]): Private keys of senders
+            strategy (SchedulingStrategy): Scheduling strategy
+            fee_manager (FeeManager, optional): Fee manager to share among pipelines
+
+        Raises:
+            InvalidBytes32: If any of the supplied `private_keys` is not in a valid form
+            ValueError: If `private_keys` is empty
+            ValidationError: If pydantic validation fails
+        """
+        accounts: list[LocalAccount] = [Account.from_key(key) for key in private_keys]
+
+        self.client = client
+        """SdkClient: Configured SDK client"""
+        self.transaction_pipeline = TransactionPipeline(
+            client=client,
+            fee_manager=fee_manager,
+        )
+        """TransactionPipeline: Transaction pipeline shared among senders"""
+        self.scheduler = SenderScheduler(
+            senders=[
+                Sender(account=account, nonce_manager=NonceManager(account.address))
+                for account in accounts
+            ],
+            strategy=strategy,
+        )
+        """SenderScheduler: Scheduler of senders"""
+
+    def get_addresses(self) -> list[ChecksumAddress]:
+        """Get addresses of senders.
+
+        Returns:
+            list[ChecksumAddress]: Addresses of senders
+        """
+        return [sender.account.address for sender in self.scheduler.senders]
+
+    def confirm(self, tx_hash: HexBytes) -> None:
+        """Mark a sent transaction as confirmed.
+
+        Args:
+            tx_hash (HexBytes): Transaction hash
+        """
+        self.scheduler.confirm(tx_hash)
+
+    def reset(self) -> None:
+        """Discard local nonce states of senders (e.g., after provider changes)."""
+        for sender in self.scheduler.senders:
+            sender.nonce_manager.reset()
+
+    def transact(
+        self, contract_func: ContractFunction, func_args: dict[str, object]
+    ) -> HexBytes:
+        sender = self.scheduler.acquire()
+        tx_hash = None
+        try:
+            tx_hash = self.transaction_pipeline.transact_as(
+                sender=sender,
+                contract_func=contract_func,
+                func_args=func_args,
+            )
+
+            return tx_hash
+        finally:
+            self.scheduler.release(sender, tx_hash)
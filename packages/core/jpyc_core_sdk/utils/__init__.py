@@ -1,39 +1,213 @@
-from .addresses import get_proxy_address
+from .addresses import MULTICALL3_ADDRESS, get_proxy_address
 from .artifacts import (
+    ARTIFACTS_REGISTRY,
+    Artifacts,
+    ArtifactsRegistry,
     get_artifacts,
+    load_artifacts,
+    load_multicall3_artifacts,
     resolve_artifacts_file_path,
+    resolve_multicall3_artifacts_file_path,
+)
+from .bulk_signing import (
+    AuthorizationMessage,
+    BulkSigner,
+    SigningStats,
+    init_signing_worker,
+    sign_authorizations,
+)
+from .caches import ReadCache
+from .calls import (
+    ViewFunction,
+    batch_call,
+    decode_error_message,
+    decode_revert_reason,
+    get_view_function,
 )
 from .chains import (
     SUPPORTED_CHAINS,
     enumerate_supported_networks,
+    get_chain_id,
+    get_confirmation_depth,
     get_default_rpc_endpoint,
+    get_default_rpc_endpoints,
 )
 from .constants import (
+    AUTHORIZATION_CANCELED_TOPIC,
+    AUTHORIZATION_FIELD_TYPES,
+    AUTHORIZATION_USED_TOPIC,
+    CANCEL_AUTHORIZATION_FIELD_TYPES,
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_BLOCK_TIMESTAMP_TTL,
+    DEFAULT_ENDPOINT_COOLDOWN,
+    DEFAULT_FEE_TTL,
+    DEFAULT_FINALITY_DEPTH,
+    DEFAULT_HEAD_TTL,
+    DEFAULT_HEDGE_DELAY,
+    DEFAULT_HTTP_TIMEOUT,
+    DEFAULT_KEEP_ALIVE,
+    DEFAULT_LOG_CHUNK_SIZE,
+    DEFAULT_LOG_WORKERS,
+    DEFAULT_MULTICALL_CALLDATA_SIZE,
+    DEFAULT_MULTICALL_GAS_LIMIT,
+    DEFAULT_PENDING_TTL,
+    DEFAULT_POLL_INTERVAL,
+    DEFAULT_POOL_SIZE,
+    DEFAULT_READ_CACHE_SIZE,
+    DEFAULT_RELAY_QUEUE_SIZE,
+    DEFAULT_RELAY_WORKERS,
+    DEFAULT_SIGNING_CHUNK_SIZE,
+    DEFAULT_STORE_BATCH_SIZE,
+    EIP712_PREFIX,
+    EVENT_PARTY_ARGS,
+    FAILOVER_STATUS_CODES,
+    HEDGED_METHODS,
+    INDEXED_EVENTS,
+    KNOWN_TRANSACTION_MESSAGES,
+    LATENCY_SMOOTHING,
+    LATENCY_WINDOW,
+    LOG_CHUNK_GROWTH,
+    LOG_CHUNK_SHRINK,
+    LOG_RANGE_ERROR_MESSAGES,
+    MAX_ENDPOINT_COOLDOWN,
+    MAX_LOG_CHUNK_SIZE,
+    MAX_NONCE_RETRIES,
+    MAX_RATE_LIMIT,
+    MIN_LATENCY_SAMPLES,
+    MIN_LOG_CHUNK_SIZE,
+    MIN_RATE_LIMIT,
+    MULTICALL_GAS_PER_CALL,
+    NONCE_ERROR_MESSAGES,
+    PENDING_FUNCTIONS,
+    PERMIT_FIELD_TYPES,
     POA_MIDDLEWARE,
+    RATE_LIMIT_DECREASE,
+    RATE_LIMIT_INCREASE,
+    RATE_LIMIT_WINDOW,
+    RELAY_LATENCY_WINDOW,
+    SECP256K1N_HALF,
     SIGN_MIDDLEWARE,
+    TIMED_FUNCTIONS,
+    TOKEN_METADATA_FUNCTIONS,
     UINT8_MAX,
     UINT256_MAX,
     UINT_MIN,
 )
+from .contracts import (
+    CONTRACT_FACTORY,
+    ContractFactory,
+)
 from .currencies import (
     remove_decimals,
     restore_decimals,
+    restore_decimals_in_batch,
+)
+from .endpoints import (
+    ENDPOINT_MONITOR,
+    EndpointMonitor,
+    EndpointStats,
+    is_failover_error,
 )
 from .errors import (
     AccountNotInitialized,
+    CallFailed,
+    ChainIdMismatch,
     InvalidBytes32,
     InvalidChecksumAddress,
     InvalidUint8,
     InvalidUint256,
     NetworkNotSupported,
+    PreflightCheckFailed,
+    RelayRequestRejected,
     TransactionFailed,
     TransactionSimulationFailed,
 )
+from .event_store import EventStore, StoredEvent, to_json_value
+from .events import (
+    BlockRangeSizer,
+    EventDecoder,
+    build_authorization_filter,
+    build_event_filter,
+    decode_authorization_log,
+    is_range_error,
+)
+from .fees import FeeManager
+from .metadata import (
+    TokenMetadata,
+    async_fetch_token_metadata,
+    build_metadata_requests,
+    decode_metadata_responses,
+    fetch_token_metadata,
+)
+from .multicall import (
+    Call,
+    aggregate3,
+    deploy_multicall3,
+)
+from .nonces import NonceManager, is_known_transaction_error, is_nonce_error
+from .preflight import PreflightValidator, get_used_authorization, recover_signer
+from .providers import (
+    AsyncFailoverHTTPProvider,
+    FailoverHTTPProvider,
+    is_hedgeable,
+    is_resent_duplicate,
+    resolve_resent_transaction,
+    validate_hedge_percentile,
+)
+from .rate_limits import (
+    RATE_LIMITER,
+    RateLimit,
+    RateLimiter,
+    get_retry_after,
+    is_throttled,
+    parse_retry_after,
+)
+from .receipts import (
+    async_batch_get_receipts,
+    async_get_revert_reason,
+    batch_get_receipts,
+    format_receipt_response,
+    get_revert_reason,
+    is_reverted,
+)
+from .relaying import (
+    LatencyMetrics,
+    RelayQueue,
+    RelayRequest,
+    StageStats,
+    get_percentile,
+)
+from .reorgs import (
+    async_batch_get_block_hashes,
+    batch_get_block_hashes,
+    build_block_requests,
+    find_common_ancestor,
+    format_block_hash_responses,
+)
+from .senders import Sender, SenderScheduler
+from .sessions import SESSION_POOL, SessionPool
+from .signatures import (
+    Signature,
+    TypedDataSigner,
+    hash_struct,
+    sign_hash,
+    to_bytes32_hex,
+)
+from .snapshots import Snapshot
 from .types import (
     ArtifactType,
+    AsyncTransactionArgs,
+    AuthorizationKind,
+    CacheInfo,
+    CallKey,
     ChainMetadata,
     ChainName,
     ContractVersion,
+    FeeParams,
+    ReadCacheInfo,
+    ReadCacheKey,
+    RelayStage,
+    SchedulingStrategy,
 )
 from .validators import (
     Bytes32,
@@ -46,36 +220,214 @@ from .validators import (
 __all__ = [
     # addresses
     "get_proxy_address",
+    "MULTICALL3_ADDRESS",
     # artifacts
+    "ARTIFACTS_REGISTRY",
+    "Artifacts",
+    "ArtifactsRegistry",
     "get_artifacts",
+    "load_artifacts",
+    "load_multicall3_artifacts",
     "resolve_artifacts_file_path",
+    "resolve_multicall3_artifacts_file_path",
+    # bulk_signing
+    "AuthorizationMessage",
+    "BulkSigner",
+    "SigningStats",
+    "init_signing_worker",
+    "sign_authorizations",
+    # caches
+    "ReadCache",
+    # calls
+    "batch_call",
+    "decode_error_message",
+    "decode_revert_reason",
+    "get_view_function",
+    "ViewFunction",
     # chains
     "enumerate_supported_networks",
+    "get_chain_id",
+    "get_confirmation_depth",
     "get_default_rpc_endpoint",
+    "get_default_rpc_endpoints",
     "SUPPORTED_CHAINS",
     # constants
+    "AUTHORIZATION_CANCELED_TOPIC",
+    "AUTHORIZATION_FIELD_TYPES",
+    "AUTHORIZATION_USED_TOPIC",
+    "CANCEL_AUTHORIZATION_FIELD_TYPES",
+    "DEFAULT_BATCH_SIZE",
+    "DEFAULT_BLOCK_TIMESTAMP_TTL",
+    "DEFAULT_ENDPOINT_COOLDOWN",
+    "DEFAULT_FEE_TTL",
+    "DEFAULT_FINALITY_DEPTH",
+    "DEFAULT_HEAD_TTL",
+    "DEFAULT_HEDGE_DELAY",
+    "DEFAULT_HTTP_TIMEOUT",
+    "DEFAULT_KEEP_ALIVE",
+    "DEFAULT_LOG_CHUNK_SIZE",
+    "DEFAULT_LOG_WORKERS",
+    "DEFAULT_MULTICALL_CALLDATA_SIZE",
+    "DEFAULT_MULTICALL_GAS_LIMIT",
+    "DEFAULT_PENDING_TTL",
+    "DEFAULT_POLL_INTERVAL",
+    "DEFAULT_POOL_SIZE",
+    "DEFAULT_READ_CACHE_SIZE",
+    "DEFAULT_RELAY_QUEUE_SIZE",
+    "DEFAULT_RELAY_WORKERS",
+    "DEFAULT_SIGNING_CHUNK_SIZE",
+    "DEFAULT_STORE_BATCH_SIZE",
+    "EIP712_PREFIX",
+    "EVENT_PARTY_ARGS",
+    "FAILOVER_STATUS_CODES",
+    "HEDGED_METHODS",
+    "INDEXED_EVENTS",
+    "KNOWN_TRANSACTION_MESSAGES",
+    "LATENCY_SMOOTHING",
+    "LATENCY_WINDOW",
+    "LOG_CHUNK_GROWTH",
+    "LOG_CHUNK_SHRINK",
+    "LOG_RANGE_ERROR_MESSAGES",
+    "MAX_ENDPOINT_COOLDOWN",
+    "MAX_LOG_CHUNK_SIZE",
+    "MAX_NONCE_RETRIES",
+    "MAX_RATE_LIMIT",
+    "MIN_LATENCY_SAMPLES",
+    "MIN_LOG_CHUNK_SIZE",
+    "MIN_RATE_LIMIT",
+    "MULTICALL_GAS_PER_CALL",
+    "NONCE_ERROR_MESSAGES",
+    "PENDING_FUNCTIONS",
+    "PERMIT_FIELD_TYPES",
     "POA_MIDDLEWARE",
+    "RATE_LIMIT_DECREASE",
+    "RATE_LIMIT_INCREASE",
+    "RATE_LIMIT_WINDOW",
+    "RELAY_LATENCY_WINDOW",
+    "SECP256K1N_HALF",
     "SIGN_MIDDLEWARE",
+    "TIMED_FUNCTIONS",
+    "TOKEN_METADATA_FUNCTIONS",
     "UINT_MIN",
     "UINT256_MAX",
     "UINT8_MAX",
+    # contracts
+    "CONTRACT_FACTORY",
+    "ContractFactory",
     # currencies
     "remove_decimals",
     "restore_decimals",
+    "restore_decimals_in_batch",
+    # endpoints
+    "ENDPOINT_MONITOR",
+    "EndpointMonitor",
+    "EndpointStats",
+    "is_failover_error",
     # errors
     "AccountNotInitialized",
+    "CallFailed",
+    "ChainIdMismatch",
     "InvalidBytes32",
     "InvalidChecksumAddress",
     "InvalidUint8",
     "InvalidUint256",
     "NetworkNotSupported",
+    "PreflightCheckFailed",
+    "RelayRequestRejected",
     "TransactionFailed",
     "TransactionSimulationFailed",
+    # event_store
+    "EventStore",
+    "StoredEvent",
+    "to_json_value",
+    # events
+    "BlockRangeSizer",
+    "EventDecoder",
+    "build_authorization_filter",
+    "build_event_filter",
+    "decode_authorization_log",
+    "is_range_error",
+    # fees
+    "FeeManager",
+    # metadata
+    "TokenMetadata",
+    "async_fetch_token_metadata",
+    "build_metadata_requests",
+    "decode_metadata_responses",
+    "fetch_token_metadata",
+    # multicall
+    "aggregate3",
+    "Call",
+    "deploy_multicall3",
+    # nonces
+    "is_known_transaction_error",
+    "is_nonce_error",
+    "NonceManager",
+    # preflight
+    "get_used_authorization",
+    "PreflightValidator",
+    "recover_signer",
+    # providers
+    "AsyncFailoverHTTPProvider",
+    "FailoverHTTPProvider",
+    "is_hedgeable",
+    "is_resent_duplicate",
+    "resolve_resent_transaction",
+    "validate_hedge_percentile",
+    # rate_limits
+    "get_retry_after",
+    "is_throttled",
+    "parse_retry_after",
+    "RATE_LIMITER",
+    "RateLimit",
+    "RateLimiter",
+    # receipts
+    "async_batch_get_receipts",
+    "async_get_revert_reason",
+    "batch_get_receipts",
+    "format_receipt_response",
+    "get_revert_reason",
+    "is_reverted",
+    # relaying
+    "get_percentile",
+    "LatencyMetrics",
+    "RelayQueue",
+    "RelayRequest",
+    "StageStats",
+    # reorgs
+    "async_batch_get_block_hashes",
+    "batch_get_block_hashes",
+    "build_block_requests",
+    "find_common_ancestor",
+    "format_block_hash_responses",
+    # senders
+    "Sender",
+    "SenderScheduler",
+    # sessions
+    "SESSION_POOL",
+    "SessionPool",
+    # signatures
+    "Signature",
+    "TypedDataSigner",
+    "hash_struct",
+    "sign_hash",
+    "to_bytes32_hex",
+    # snapshots
+    "Snapshot",
     # types
     "ArtifactType",
+    "AuthorizationKind",
+    "AsyncTransactionArgs",
+    "CacheInfo",
+    "CallKey",
     "ChainMetadata",
     "ChainName",
     "ContractVersion",
+    "FeeParams",
+    "ReadCacheInfo",
+    "ReadCacheKey",
+    "RelayStage",
+    "SchedulingStrategy",
     # validators
     "Bytes32",
     "ChecksumAddress",
@@ -67,3 +67,7 @@ V2_PROXY_ADDRESS: Final[ChecksumAddress] = calc_checksum_address(
     "0x431D5dfF03120AFA4bDf332c61A6e1766eF37BDB"
 )
 """ChecksumAddress: JPYCv2 address."""
+MULTICALL3_ADDRESS: Final[ChecksumAddress] = calc_checksum_address(
+    "0xcA11bde05977b3631167028862bE2a173976CA11"
+)
+"""ChecksumAddress: Multicall3 address (identical across the supported chains)."""
@@ -1,8 +1,12 @@
 import json
+from collections.abc import Mapping
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from threading import Lock
+from types import MappingProxyType
+from typing import Any, Final
 
-from .types import ArtifactType, ContractVersion
+from .types import ArtifactType, CacheInfo, ContractVersion
 
 
 def resolve_artifacts_file_path(contract_version: ContractVersion) -> Path:
@@ -21,9 +25,171 @@ def resolve_artifacts_file_path(contract_version: ContractVersion) -> Path:
     return path.absolute()
 
 
+def resolve_multicall3_artifacts_file_path() -> Path:
+    """Resolve the path of Multicall3 artifacts file.
+
+    Returns:
+        Path: Absolute path of artifacts file
+    """
+    path = Path(__file__).parent.parent.joinpath("artifacts", "multicall3.json")
+
+    return path.absolute()
+
+
+def freeze(value: Any) -> Any:
+    """Recursively convert parsed JSON into an immutable view.
+
+    Note:
+        Dicts are converted into read-only mappings and lists into tuples, \
+        so that cached artifacts can be safely shared across threads & instances.
+
+    Args:
+        value (Any): Parsed JSON value
+
+    Returns:
+        Any: Immutable view of the value
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({k: freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(freeze(v) for v in value)
+
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """Recursively convert an immutable view back into plain JSON values.
+
+    Args:
+        value (Any): Immutable view of parsed JSON
+
+    Returns:
+        Any: Deep copy of the value made of dicts & lists
+    """
+    if isinstance(value, Mapping):
+        return {k: thaw(v) for k, v in value.items()}
+    if isinstance(value, tuple):
+        return [thaw(v) for v in value]
+
+    return value
+
+
+@dataclass(frozen=True)
+class Artifacts:
+    """Pre-parsed & immutable contract artifacts.
+
+    Attributes:
+        abi (tuple[Mapping[str, Any], ...]): ABI of contracts
+        bytecode (str): Bytecode of contracts
+    """
+
+    abi: tuple[Mapping[str, Any], ...]
+    bytecode: str
+
+
+class ArtifactsRegistry:
+    """Thread-safe registry that parses each artifacts file exactly once."""
+
+    def __init__(self) -> None:
+        self.__lock = Lock()
+        self.__artifacts: dict[Path, Artifacts] = {}
+        self.__hits = 0
+        self.__misses = 0
+
+    def load(self, file_path: Path) -> Artifacts:
+        """Load artifacts from the specified file path.
+
+        Note:
+            The file is read & parsed on the first call only. \
+            Subsequent calls return the same immutable `Artifacts` instance.
+
+        Args:
+            file_path (Path): absolute path of artifacts file
+
+        Returns:
+            Artifacts: Pre-parsed artifacts
+        """
+        with self.__lock:
+            artifacts = self.__artifacts.get(file_path)
+            if artifacts is not None:
+                self.__hits += 1
+                return artifacts
+
+            self.__misses += 1
+            with open(file_path) as f:
+                parsed = json.load(f)
+            artifacts = Artifacts(
+                abi=freeze(parsed["abi"]),
+                bytecode=parsed["bytecode"],
+            )
+            self.__artifacts[file_path] = artifacts
+
+            return artifacts
+
+    def get(self, contract_version: ContractVersion) -> Artifacts:
+        """Get artifacts of the specified contract version.
+
+        Args:
+            contract_version (ContractVersion): Contract version
+
+        Returns:
+            Artifacts: Pre-parsed artifacts
+        """
+        return self.load(resolve_artifacts_file_path(contract_version=contract_version))
+
+    def cache_info(self) -> CacheInfo:
+        """Get statistics of the registry.
+
+        Returns:
+            CacheInfo: Numbers of hits, misses & cached artifacts files
+        """
+        with self.__lock:
+            return CacheInfo(
+                hits=self.__hits,
+                misses=self.__misses,
+                currsize=len(self.__artifacts),
+            )
+
+    def cache_clear(self) -> None:
+        """Clear cached artifacts & statistics."""
+        with self.__lock:
+            self.__artifacts.clear()
+            self.__hits = 0
+            self.__misses = 0
+
+
+ARTIFACTS_REGISTRY: Final[ArtifactsRegistry] = ArtifactsRegistry()
+"""ArtifactsRegistry: Process-wide registry of contract artifacts."""
+
+
+def load_artifacts(contract_version: ContractVersion) -> Artifacts:
+    """Load artifacts of the specified contract version from the registry.
+
+    Args:
+        contract_version (ContractVersion): Contract version
+
+    Returns:
+        Artifacts: Pre-parsed artifacts
+    """
+    return ARTIFACTS_REGISTRY.get(contract_version=contract_version)
+
+
+def load_multicall3_artifacts() -> Artifacts:
+    """Load artifacts of Multicall3 contract from the registry.
+
+    Returns:
+        Artifacts: Pre-parsed artifacts
+    """
+    return ARTIFACTS_REGISTRY.load(resolve_multicall3_artifacts_file_path())
+
+
 def get_artifacts(file_path: Path, artifact_type: ArtifactType) -> Any:
     """Get contract artifacts from the specified file path.
 
+    Note:
+        Artifacts are returned as plain (i.e., mutable & JSON-serializable) \
+        copies of the registry's cache.
+
     Args:
         file_path (Path): absolute path of artifacts file
         artifact_type (ArtifactType): type of artifacts
@@ -31,5 +197,4 @@ def get_artifacts(file_path: Path, artifact_type: ArtifactType) -> Any:
     Returns:
         Any: Artifacts of contracts
     """
-    with open(file_path) as f:
-        return json.load(f)[artifact_type]
+    return thaw(getattr(ARTIFACTS_REGISTRY.load(file_path), artifact_type))
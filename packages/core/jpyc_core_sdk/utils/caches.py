@@ -0,0 +1,239 @@
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from threading import Lock
+from typing import Any
+
+from .chains import get_confirmation_depth
+from .constants import DEFAULT_HEAD_TTL, DEFAULT_READ_CACHE_SIZE
+from .types import ReadCacheInfo, ReadCacheKey
+
+
+class ReadCache:
+    """Thread-safe, finality-aware LRU cache of results of view functions.
+
+    Note:
+        Results are keyed by (chain id, contract address, function name, args, \
+        block number). Results at finalized blocks (i.e., at least \
+        `finality_depth` blocks, or the confirmation depth of each chain, \
+        behind the latest block) are cached permanently \
+        (until evicted as least recently used), while the others expire \
+        once a new block is observed, since they could be reorganized \
+        or, for the latest block, outdated. The latest block number of each \
+        chain is reused for `head_ttl` seconds, so that reads at the latest \
+        block cost a single `eth_blockNumber` per `head_ttl` at most.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = DEFAULT_READ_CACHE_SIZE,
+        finality_depth: int | None = None,
+        head_ttl: float = DEFAULT_HEAD_TTL,
+    ) -> None:
+        """Constructor that initializes read cache.
+
+        Args:
+            maxsize (int): Maximum number of cached results
+            finality_depth (int, optional): Number of blocks after which blocks \
+            are finalized (the confirmation depth of each chain if None)
+            head_ttl (float): Time (in seconds) to reuse the latest block number
+        """
+        self.__lock = Lock()
+        self.__results: OrderedDict[ReadCacheKey, Any] = OrderedDict()
+        # keys of results at blocks not yet finalized
+        self.__volatile: set[ReadCacheKey] = set()
+        self.__heads: dict[int, tuple[int, float]] = {}
+        self.__hits = 0
+        self.__misses = 0
+        self.__evictions = 0
+
+        self.maxsize = maxsize
+        """int: Maximum number of cached results"""
+        self.finality_depth = finality_depth
+        """int | None: Number of blocks after which blocks are finalized"""
+        self.head_ttl = head_ttl
+        """float: Time (in seconds) to reuse the latest block number"""
+
+    def get_head(self, chain_id: int) -> int | None:
+        """Get the latest block number of a chain if observed within `head_ttl`.
+
+        Args:
+            chain_id (int): Chain id
+
+        Returns:
+            int | None: Latest block number (None if unknown or outdated)
+        """
+        with self.__lock:
+            head = self.__heads.get(chain_id)
+
+        if head is None or time.monotonic() - head[1] > self.head_ttl:
+            return None
+        return head[0]
+
+    def set_head(self, chain_id: int, block_number: int) -> None:
+        """Observe the latest block number of a chain (e.g., on new block headers).
+
+        Note:
+            Results at blocks not finalized even by the new block expire.
+
+        Args:
+            chain_id (int): Chain id
+            block_number (int): Latest block number
+        """
+        with self.__lock:
+            head = self.__heads.get(chain_id)
+            self.__heads[chain_id] = (
+                max(block_number, head[0]) if head is not None else block_number,
+                time.monotonic(),
+            )
+            if head is None or block_number <= head[0]:
+                return
+
+            for key in [key for key in self.__volatile if key[0] == chain_id]:
+                self.__volatile.discard(key)
+                # results at blocks finalized in the meantime are kept
+                if not self.__is_finalized(chain_id, key[4]):
+                    self.__results.pop(key, None)
+
+    def __is_finalized(self, chain_id: int, block_number: int) -> bool:
+        """Checks if a block is finalized (must be called with the lock held).
+
+        Args:
+            chain_id (int): Chain id
+            block_number (int): Block number
+
+        Returns:
+            bool: True if finalized, false otherwise (or if the chain is unknown)
+        """
+        head = self.__heads.get(chain_id)
+        depth = (
+            self.finality_depth
+            if self.finality_depth is not None
+            else get_confirmation_depth(chain_id)
+        )
+
+        return head is not None and block_number <= head[0] - depth
+
+    def get(self, key: ReadCacheKey) -> tuple[bool, Any]:
+        """Get a cached result.
+
+        Args:
+            key (ReadCacheKey): Cache key
+
+        Returns:
+            tuple[bool, Any]: Whether the result is cached, & the result if any
+        """
+        with self.__lock:
+            if key in self.__results:
+                self.__results.move_to_end(key)
+                self.__hits += 1
+                return True, self.__results[key]
+            self.__misses += 1
+
+        return False, None
+
+    def put(self, key: ReadCacheKey, result: Any) -> None:
+        """Cache a result.
+
+        Args:
+            key (ReadCacheKey): Cache key
+            result (Any): Result
+        """
+        with self.__lock:
+            self.__results[key] = result
+            self.__results.move_to_end(key)
+            if not self.__is_finalized(key[0], key[4]):
+                self.__volatile.add(key)
+            while len(self.__results) > self.maxsize:
+                evicted, _ = self.__results.popitem(last=False)
+                self.__volatile.discard(evicted)
+                self.__evictions += 1
+
+    def get_or_call(self, key: ReadCacheKey, call: Callable[[], Any]) -> Any:
+        """Get a cached result, or call a view function & cache its result.
+
+        Args:
+            key (ReadCacheKey): Cache key
+            call (Callable[[], Any]): Function to call the view function
+
+        Returns:
+            Any: Result
+        """
+        cached, result = self.get(key)
+        if not cached:
+            result = call()
+            self.put(key, result)
+
+        return result
+
+    async def async_get_or_call(
+        self, key: ReadCacheKey, call: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Get a cached result, or call a view function & cache its result.
+
+        Args:
+            key (ReadCacheKey): Cache key
+            call (Callable[[], Awaitable[Any]]): Function to call the view function
+
+        Returns:
+            Any: Result
+        """
+        cached, result = self.get(key)
+        if not cached:
+            result = await call()
+            self.put(key, result)
+
+        return result
+
+    def invalidate(
+        self, chain_id: int | None = None, contract_address: str | None = None
+    ) -> int:
+        """Invalidate cached results at blocks not yet finalized.
+
+        Note:
+            This is meant to be called after mutations (e.g., own transactions), \
+            whose effects are never reflected in finalized blocks.
+
+        Args:
+            chain_id (int, optional): Chain id (all chains if None)
+            contract_address (str, optional): Contract address (all contracts if None)
+
+        Returns:
+            int: Number of invalidated results
+        """
+        with self.__lock:
+            invalidated = [
+                key
+                for key in self.__volatile
+                if (chain_id is None or key[0] == chain_id)
+                and (contract_address is None or key[1] == contract_address)
+            ]
+            for key in invalidated:
+                self.__volatile.discard(key)
+                self.__results.pop(key, None)
+
+        return len(invalidated)
+
+    def cache_info(self) -> ReadCacheInfo:
+        """Get statistics of the cache.
+
+        Returns:
+            ReadCacheInfo: Numbers of hits, misses, cached results & evictions
+        """
+        with self.__lock:
+            return ReadCacheInfo(
+                hits=self.__hits,
+                misses=self.__misses,
+                currsize=len(self.__results),
+                evictions=self.__evictions,
+            )
+
+    def cache_clear(self) -> None:
+        """Clear cached results, latest block numbers & statistics."""
+        with self.__lock:
+            self.__results.clear()
+            self.__volatile.clear()
+            self.__heads.clear()
+            self.__hits = 0
+            self.__misses = 0
+            self.__evictions = 0
@@ -0,0 +1,246 @@
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from functools import cache
+from typing import Any, Final
+
+from eth_abi import decode as abi_decode
+from eth_abi import encode as abi_encode
+from eth_typing import HexStr
+from eth_utils.abi import (
+    function_abi_to_4byte_selector,
+    get_abi_input_types,
+    get_abi_output_types,
+)
+from hexbytes import HexBytes
+from web3 import Web3
+from web3.exceptions import ContractLogicError
+from web3.types import BlockIdentifier, RPCEndpoint, RPCResponse
+
+from .artifacts import load_artifacts
+from .constants import DEFAULT_BATCH_SIZE
+from .errors import CallFailed
+from .types import ContractVersion
+from .validators import ChecksumAddress
+
+ERROR_SELECTOR: Final[bytes] = bytes.fromhex("08c379a0")
+"""bytes: Selector of `Error(string)`."""
+PANIC_SELECTOR: Final[bytes] = bytes.fromhex("4e487b71")
+"""bytes: Selector of `Panic(uint256)`."""
+
+
+@dataclass(frozen=True)
+class ViewFunction:
+    """Pre-computed ABI codec of a view function.
+
+    Attributes:
+        name (str): Function name
+        selector (bytes): 4-byte function selector
+        input_types (tuple[str, ...]): ABI types of inputs
+        output_types (tuple[str, ...]): ABI types of outputs
+    """
+
+    name: str
+    selector: bytes
+    input_types: tuple[str, ...]
+    output_types: tuple[str, ...]
+
+    @classmethod
+    def from_abi(cls, abi: Sequence[Mapping[str, Any]], name: str) -> "ViewFunction":
+        """Build a codec from the ABI.
+
+        Args:
+            abi (Sequence[Mapping[str, Any]]): ABI of contracts
+            name (str): Function name
+
+        Returns:
+            ViewFunction: Codec of the function
+
+        Raises:
+            ValueError: If the function is not found in the ABI
+        """
+        for element in abi:
+            if element.get("type") == "function" and element.get("name") == name:
+                return cls(
+                    name=name,
+                    selector=function_abi_to_4byte_selector(element),  # type: ignore[arg-type]
+                    input_types=tuple(get_abi_input_types(element)),  # type: ignore[arg-type]
+                    output_types=tuple(get_abi_output_types(element)),  # type: ignore[arg-type]
+                )
+
+        raise ValueError(f"Function '{name}' is not found in the ABI.")
+
+    def encode(self, args: Sequence[Any]) -> HexStr:
+        """Encode calldata.
+
+        Args:
+            args (Sequence[Any]): Arguments of the function
+
+        Returns:
+            HexStr: Calldata
+        """
+        return HexStr(f"0x{(self.selector + abi_encode(self.input_types, args)).hex()}")
+
+    def decode(self, data: bytes) -> Any:
+        """Decode return data.
+
+        Args:
+            data (bytes): Return data
+
+        Returns:
+            Any: Decoded value (or tuple of values if the function has many outputs)
+        """
+        values = abi_decode(self.output_types, data)
+
+        return values[0] if len(values) == 1 else values
+
+
+@cache
+def get_view_function(contract_version: ContractVersion, name: str) -> ViewFunction:
+    """Get a cached codec of the specified view function.
+
+    Args:
+        contract_version (ContractVersion): Contract version
+        name (str): Function name
+
+    Returns:
+        ViewFunction: Codec of the function
+    """
+    return ViewFunction.from_abi(
+        abi=load_artifacts(contract_version=contract_version).abi,
+        name=name,
+    )
+
+
+def to_block_param(block_identifier: BlockIdentifier) -> Any:
+    """Convert a block identifier into a JSON-RPC parameter.
+
+    Args:
+        block_identifier (BlockIdentifier): Block number, hash or tag
+
+    Returns:
+        Any: JSON-RPC parameter
+    """
+    if isinstance(block_identifier, int):
+        return hex(block_identifier)
+    if isinstance(block_identifier, bytes):
+        return HexBytes(block_identifier).to_0x_hex()
+
+    return block_identifier
+
+
+def decode_revert_reason(data: bytes) -> str:
+    """Decode revert data into a human-readable reason.
+
+    Args:
+        data (bytes): Revert data
+
+    Returns:
+        str: Reason of `Error(string)` or `Panic(uint256)`, raw data otherwise
+    """
+    try:
+        if data[:4] == ERROR_SELECTOR:
+            return str(abi_decode(["string"], data[4:])[0])
+        if data[:4] == PANIC_SELECTOR:
+            return f"Panic({hex(abi_decode(['uint256'], data[4:])[0])})"
+    except Exception:
+        pass
+
+    return HexBytes(data).to_0x_hex() if data else "execution reverted"
+
+
+def decode_error_message(error: Exception) -> str:
+    """Decode an error raised by `eth_call` or `eth_estimateGas`.
+
+    Args:
+        error (Exception): Raised error
+
+    Returns:
+        str: Error message including the decoded revert reason if any
+    """
+    if isinstance(error, ContractLogicError):
+        return error.message or str(error)
+
+    data = getattr(error, "data", None)
+    if isinstance(data, str) and data.startswith("0x") and len(data) >= 10:
+        return decode_revert_reason(HexBytes(data))
+
+    return str(error)
+
+
+def decode_response(function: ViewFunction, response: RPCResponse) -> Any:
+    """Decode a JSON-RPC response of `eth_call`.
+
+    Args:
+        function (ViewFunction): Codec of the function
+        response (RPCResponse): JSON-RPC response
+
+    Returns:
+        Any: Decoded value, or `CallFailed` if the call failed
+    """
+    if "error" in response:
+        return CallFailed(str(response["error"]))
+    try:
+        return function.decode(HexBytes(response["result"]))
+    except Exception as e:
+        return CallFailed(str(e))
+
+
+def batch_call(
+    w3: Web3,
+    contract_address: ChecksumAddress,
+    function: ViewFunction,
+    args_list: Sequence[Sequence[Any]],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    block_identifier: BlockIdentifier = "latest",
+) -> list[Any]:
+    """Call a view function many times over JSON-RPC batch requests.
+
+    Note:
+        Failures never abort the whole call; each failed item is returned \
+        as a `CallFailed` instance in place of its result. \
+        If an endpoint rejects a batch as a whole, every item of the batch fails.
+
+    Args:
+        w3 (Web3): Configured web3 instance
+        contract_address (ChecksumAddress): Contract address
+        function (ViewFunction): Codec of the function
+        args_list (Sequence[Sequence[Any]]): Arguments of each call
+        batch_size (int): Maximum number of calls per batch request
+        block_identifier (BlockIdentifier): Block to call the function at
+
+    Returns:
+        list[Any]: Decoded values (or `CallFailed`) in the order of `args_list`
+    """
+    block_param = to_block_param(block_identifier)
+    results: list[Any] = []
+
+    for start in range(0, len(args_list), batch_size):
+        chunk = args_list[start : start + batch_size]
+        requests = [
+            (
+                RPCEndpoint("eth_call"),
+                [{"to": contract_address, "data": function.encode(args)}, block_param],
+            )
+            for args in chunk
+        ]
+
+        try:
+            responses = w3.provider.make_batch_request(requests)  # type: ignore[attr-defined]
+        except Exception as e:
+            results.extend(CallFailed(str(e)) for _ in chunk)
+            continue
+
+        if not isinstance(responses, list):
+            error = CallFailed(str(responses.get("error", responses)))
+            results.extend(error for _ in chunk)
+            continue
+
+        results.extend(
+            decode_response(function, response) for response in responses[: len(chunk)]
+        )
+        results.extend(
+            CallFailed("Missing response in batch.")
+            for _ in range(len(chunk) - len(responses))
+        )
+
+    return results
@@ -1,5 +1,6 @@
 from typing import Final
 
+from .constants import DEFAULT_FINALITY_DEPTH
 from .errors import NetworkNotSupported
 from .types import ChainMetadata, ChainName
 from .validators import RpcEndpoint
@@ -13,62 +14,109 @@ SUPPORTED_CHAINS: Final[ChainMetadata] = {
         "mainnet": {
             "id": 1,
             "name": "Ethereum Mainnet",
-            "rpc_endpoints": ["https://ethereum-rpc.publicnode.com"],
+            "rpc_endpoints": [
+                "https://ethereum-rpc.publicnode.com",
+                "https://eth.drpc.org",
+                "https://1rpc.io/eth",
+            ],
+            "confirmation_depth": 64,
         },
         "sepolia": {
             "id": 11155111,
             "name": "Ethereum Sepolia Testnet",
-            "rpc_endpoints": ["https://ethereum-sepolia-rpc.publicnode.com"],
+            "rpc_endpoints": [
+                "https://ethereum-sepolia-rpc.publicnode.com",
+                "https://sepolia.drpc.org",
+                "https://1rpc.io/sepolia",
+            ],
+            "confirmation_depth": 64,
         },
     },
     "polygon": {
         "mainnet": {
             "id": 137,
             "name": "Polygon Mainnet",
-            "rpc_endpoints": ["https://polygon-rpc.com"],
+            "rpc_endpoints": [
+                "https://polygon-rpc.com",
+                "https://polygon-bor-rpc.publicnode.com",
+                "https://polygon.drpc.org",
+            ],
+            "confirmation_depth": 128,
         },
         "amoy": {
             "id": 80002,
             "name": "Polygon Amoy Testnet",
-            "rpc_endpoints": ["https://rpc-amoy.polygon.technology"],
+            "rpc_endpoints": [
+                "https://rpc-amoy.polygon.technology",
+                "https://polygon-amoy-bor-rpc.publicnode.com",
+                "https://polygon-amoy.drpc.org",
+            ],
+            "confirmation_depth": 128,
         },
     },
     "gnosis": {
         "mainnet": {
             "id": 100,
             "name": "Gnosis Chain",
-            "rpc_endpoints": ["https://rpc.gnosischain.com"],
+            "rpc_endpoints": [
+                "https://rpc.gnosischain.com",
+                "https://gnosis-rpc.publicnode.com",
+                "https://gnosis.drpc.org",
+            ],
+            "confirmation_depth": 32,
         },
         "chiado": {
             "id": 10200,
             "name": "Gnosis Chiado Testnet",
-            "rpc_endpoints": ["https://rpc.chiadochain.net"],
+            "rpc_endpoints": [
+                "https://rpc.chiadochain.net",
+                "https://gnosis-chiado-rpc.publicnode.com",
+            ],
+            "confirmation_depth": 32,
         },
     },
     "avalanche": {
         "mainnet": {
             "id": 43114,
             "name": "Avalanche C-Chain",
-            "rpc_endpoints": ["https://api.avax.network/ext/bc/C/rpc"],
+            "rpc_endpoints": [
+                "https://api.avax.network/ext/bc/C/rpc",
+                "https://avalanche-c-chain-rpc.publicnode.com",
+                "https://avalanche.drpc.org",
+            ],
+            "confirmation_depth": 1,
         },
         "fuji": {
             "id": 43113,
             "name": "Avalanche Fuji Testnet",
-            "rpc_endpoints": ["https://api.avax-test.network/ext/bc/C/rpc"],
+            "rpc_endpoints": [
+                "https://api.avax-test.network/ext/bc/C/rpc",
+                "https://avalanche-fuji-c-chain-rpc.publicnode.com",
+            ],
+            "confirmation_depth": 1,
         },
     },
     "astar": {
         "mainnet": {
             "id": 592,
             "name": "Astar Network",
-            "rpc_endpoints": ["https://astar.public.blastapi.io"],
+            "rpc_endpoints": [
+                "https://astar.public.blastapi.io",
+                "https://evm.astar.network",
+                "https://astar.api.onfinality.io/public",
+            ],
+            "confirmation_depth": 16,
         },
     },
     "shiden": {
         "mainnet": {
             "id": 336,
             "name": "Shiden Network",
-            "rpc_endpoints": ["https://shiden.public.blastapi.io"],
+            "rpc_endpoints": [
+                "https://shiden.public.blastapi.io",
+                "https://evm.shiden.astar.network",
+            ],
+            "confirmation_depth": 16,
         },
     },
     "localhost": {
@@ -76,6 +124,7 @@ SUPPORTED_CHAINS: Final[ChainMetadata] = {
             "id": 31337,
             "name": "Localhost Network",
             "rpc_endpoints": ["http://127.0.0.1:8545/"],
+            "confirmation_depth": 64,
         },
     },
 }
@@ -134,3 +183,65 @@ def get_default_rpc_endpoint(
         raise NetworkNotSupported(chain_name, network_name)  # type: ignore[arg-type]
 
     return SUPPORTED_CHAINS[chain_name][network_name]["rpc_endpoints"][0]  # type: ignore[index]
+
+
+def get_default_rpc_endpoints(
+    chain_name: ChainName | None, network_name: str | None
+) -> list[RpcEndpoint]:
+    """Get all the default RPC endpoints for the specified network.
+
+    Args:
+        chain_name (ChainName, optional): Chain name
+        network_name (str, optional): Network name
+
+    Returns:
+        list[RpcEndpoint]: RPC endpoints (in order of preference)
+
+    Raises:
+        NetworkNotSupported: If the specified network is not supported by the SDK
+    """
+    if not is_supported_network(chain_name, network_name):
+        raise NetworkNotSupported(chain_name, network_name)  # type: ignore[arg-type]
+
+    return list(SUPPORTED_CHAINS[chain_name][network_name]["rpc_endpoints"])  # type: ignore[index]
+
+
+def get_chain_id(chain_name: ChainName | None, network_name: str | None) -> int:
+    """Get the chain id of the specified network.
+
+    Args:
+        chain_name (ChainName, optional): Chain name
+        network_name (str, optional): Network name
+
+    Returns:
+        int: Chain id
+
+    Raises:
+        NetworkNotSupported: If the specified network is not supported by the SDK
+    """
+    if not is_supported_network(chain_name, network_name):
+        raise NetworkNotSupported(chain_name, network_name)  # type: ignore[arg-type]
+
+    return SUPPORTED_CHAINS[chain_name][network_name]["id"]  # type: ignore[index]
+
+
+def get_confirmation_depth(chain_id: int) -> int:
+    """Get the confirmation depth of the specified chain.
+
+    Note:
+        Blocks deeper than the confirmation depth (i.e., number of blocks \
+        behind the latest block) are regarded as safe from reorganizations.
+
+    Args:
+        chain_id (int): Chain id
+
+    Returns:
+        int: Confirmation depth of the network (or the default finality depth \
+        if not supported by the SDK)
+    """
+    for networks in SUPPORTED_CHAINS.values():
+        for network in networks.values():
+            if network["id"] == chain_id:
+                return network["confirmation_depth"]
+
+    return DEFAULT_FINALITY_DEPTH
@@ -21,3 +21,253 @@ POA_MIDDLEWARE: Final[str] = "poa_middleware"
 """str: Name of POA compatibility middleware."""
 SIGN_MIDDLEWARE: Final[str] = "sign_middleware"
 """str: Name of auto-signature middleware."""
+
+############
+# Metadata #
+############
+
+TOKEN_METADATA_FUNCTIONS: Final[tuple[str, ...]] = (
+    "name",
+    "symbol",
+    "decimals",
+    "currency",
+    "_domainSeparatorV4",
+    "PERMIT_TYPEHASH",
+    "TRANSFER_WITH_AUTHORIZATION_TYPEHASH",
+    "RECEIVE_WITH_AUTHORIZATION_TYPEHASH",
+    "CANCEL_AUTHORIZATION_TYPEHASH",
+)
+"""tuple[str, ...]: View functions returning immutable metadata (in field order)."""
+
+##############
+# Signatures #
+##############
+
+EIP712_PREFIX: Final[bytes] = b"\x19\x01"
+"""bytes: Prefix of EIP-712 digests (i.e., followed by the domain separator)."""
+PERMIT_FIELD_TYPES: Final[tuple[str, ...]] = (
+    "address",
+    "address",
+    "uint256",
+    "uint256",
+    "uint256",
+)
+"""tuple[str, ...]: ABI types of fields of `Permit` messages."""
+AUTHORIZATION_FIELD_TYPES: Final[tuple[str, ...]] = (
+    "address",
+    "address",
+    "uint256",
+    "uint256",
+    "uint256",
+    "bytes32",
+)
+"""tuple[str, ...]: ABI types of fields of `Transfer/ReceiveWithAuthorization`."""
+CANCEL_AUTHORIZATION_FIELD_TYPES: Final[tuple[str, ...]] = ("address", "bytes32")
+"""tuple[str, ...]: ABI types of fields of `CancelAuthorization` messages."""
+SECP256K1N_HALF: Final[int] = (
+    0x7FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF5D576E7357A4501DDFE92F46681B20A0
+)
+"""int: Upper bound of `s` values of signatures accepted by `ecrecover` of JPYC."""
+DEFAULT_SIGNING_CHUNK_SIZE: Final[int] = 1000
+"""int: Default number of messages signed per task of bulk signing."""
+
+############
+# Batching #
+############
+
+DEFAULT_BATCH_SIZE: Final[int] = 100
+"""int: Default number of calls packed into a single JSON-RPC batch request."""
+DEFAULT_MULTICALL_CALLDATA_SIZE: Final[int] = 65_536
+"""int: Default maximum calldata size (in bytes) of a single `aggregate3` call."""
+DEFAULT_MULTICALL_GAS_LIMIT: Final[int] = 10_000_000
+"""int: Default gas budget of a single `aggregate3` call."""
+MULTICALL_GAS_PER_CALL: Final[int] = 25_000
+"""int: Estimated gas consumed by each view call in `aggregate3` call."""
+
+################
+# Transactions #
+################
+
+DEFAULT_FEE_TTL: Final[float] = 10.0
+"""float: Default time-to-live (in seconds) of cached fee parameters."""
+NONCE_ERROR_MESSAGES: Final[tuple[str, ...]] = (
+    "nonce too low",
+    "replacement transaction underpriced",
+)
+"""tuple[str, ...]: Error messages (in lowercase) that indicate stale nonces."""
+KNOWN_TRANSACTION_MESSAGES: Final[tuple[str, ...]] = (
+    "already known",
+    "known transaction",
+    "already imported",
+)
+"""tuple[str, ...]: Error messages (in lowercase) that indicate the same \
+transaction is already in the mempool."""
+MAX_NONCE_RETRIES: Final[int] = 1
+"""int: Maximum number of retries of a transaction with a stale nonce."""
+DEFAULT_POLL_INTERVAL: Final[float] = 1.0
+"""float: Default interval (in seconds) to poll new blocks for receipts."""
+DEFAULT_BLOCK_TIMESTAMP_TTL: Final[float] = 60.0
+"""float: Default time-to-live (in seconds) of block timestamps observed by \
+pre-flight validators (i.e., after which they are fetched again)."""
+DEFAULT_PENDING_TTL: Final[float] = 300.0
+"""float: Default time-to-live (in seconds) of pending transactions recorded by \
+pre-flight validators (i.e., after which they are regarded as dropped)."""
+PENDING_FUNCTIONS: Final[tuple[str, ...]] = (
+    "transferWithAuthorization",
+    "receiveWithAuthorization",
+    "cancelAuthorization",
+    "permit",
+)
+"""tuple[str, ...]: Names of contract functions whose transactions consume \
+nonces of authorizations or permits."""
+TIMED_FUNCTIONS: Final[tuple[str, ...]] = (
+    "transferWithAuthorization",
+    "receiveWithAuthorization",
+    "permit",
+)
+"""tuple[str, ...]: Names of contract functions whose arguments are checked \
+against block timestamps (i.e., time windows or deadlines)."""
+
+############
+# Sessions #
+############
+
+DEFAULT_POOL_SIZE: Final[int] = 20
+"""int: Default maximum number of connections per RPC endpoint."""
+DEFAULT_KEEP_ALIVE: Final[float] = 30.0
+"""float: Default time (in seconds) to keep idle connections alive."""
+DEFAULT_HTTP_TIMEOUT: Final[float] = 30.0
+"""float: Default timeout (in seconds) of HTTP requests."""
+
+#############
+# Endpoints #
+#############
+
+DEFAULT_ENDPOINT_COOLDOWN: Final[float] = 5.0
+"""float: Default time (in seconds) to avoid an endpoint after its first failure."""
+MAX_ENDPOINT_COOLDOWN: Final[float] = 300.0
+"""float: Maximum time (in seconds) to avoid an endpoint after consecutive failures."""
+LATENCY_SMOOTHING: Final[float] = 0.2
+"""float: Weight of the latest sample in moving averages of latencies."""
+FAILOVER_STATUS_CODES: Final[frozenset[int]] = frozenset({408, 429})
+"""frozenset[int]: HTTP status codes (besides 5xx) to fail over on."""
+LATENCY_WINDOW: Final[int] = 100
+"""int: Number of the latest latency samples kept per endpoint."""
+MIN_LATENCY_SAMPLES: Final[int] = 10
+"""int: Minimum number of latency samples to estimate latency percentiles."""
+DEFAULT_HEDGE_DELAY: Final[float] = 0.5
+"""float: Default time (in seconds) to hedge read requests until enough samples."""
+HEDGED_METHODS: Final[frozenset[str]] = frozenset(
+    {
+        "eth_blockNumber",
+        "eth_call",
+        "eth_chainId",
+        "eth_estimateGas",
+        "eth_feeHistory",
+        "eth_gasPrice",
+        "eth_getBalance",
+        "eth_getBlockByHash",
+        "eth_getBlockByNumber",
+        "eth_getCode",
+        "eth_getLogs",
+        "eth_getStorageAt",
+        "eth_getTransactionByHash",
+        "eth_getTransactionReceipt",
+        "eth_maxPriorityFeePerGas",
+    }
+)
+"""frozenset[str]: Read-only JSON-RPC methods eligible for hedging (never mutations)."""
+
+###############
+# Rate Limits #
+###############
+
+RATE_LIMIT_WINDOW: Final[float] = 1.0
+"""float: Time window (in seconds) to measure request rates & burst sizes."""
+RATE_LIMIT_INCREASE: Final[float] = 1.0
+"""float: Additive increase (in requests/second per second) of rate limits."""
+RATE_LIMIT_DECREASE: Final[float] = 0.5
+"""float: Multiplicative decrease of rate limits on throttled requests."""
+MIN_RATE_LIMIT: Final[float] = 1.0
+"""float: Minimum rate limit (in requests/second) of an endpoint."""
+MAX_RATE_LIMIT: Final[float] = 1000.0
+"""float: Maximum rate limit (in requests/second) of an endpoint."""
+
+###########
+# Caching #
+###########
+
+DEFAULT_READ_CACHE_SIZE: Final[int] = 4096
+"""int: Default maximum number of cached results of view functions."""
+DEFAULT_FINALITY_DEPTH: Final[int] = 64
+"""int: Default number of blocks after which blocks are regarded as finalized."""
+DEFAULT_HEAD_TTL: Final[float] = 1.0
+"""float: Default time (in seconds) to reuse the latest block number."""
+
+##########
+# Events #
+##########
+
+AUTHORIZATION_USED_TOPIC: Final[str] = (
+    "0x98de503528ee59b575ef0c0a2576a82497bfc029a5685b209e9ec333479b10a5"
+)
+"""str: Topic of `AuthorizationUsed(address,bytes32)` events."""
+AUTHORIZATION_CANCELED_TOPIC: Final[str] = (
+    "0x1cdd46ff242716cdaa72d159d339a485b3438398348d68f09d7c8c0a59353d81"
+)
+"""str: Topic of `AuthorizationCanceled(address,bytes32)` events."""
+DEFAULT_LOG_CHUNK_SIZE: Final[int] = 2000
+"""int: Default number of blocks per `eth_getLogs` request to start scanning with."""
+MIN_LOG_CHUNK_SIZE: Final[int] = 1
+"""int: Minimum number of blocks per `eth_getLogs` request."""
+MAX_LOG_CHUNK_SIZE: Final[int] = 100_000
+"""int: Maximum number of blocks per `eth_getLogs` request."""
+LOG_CHUNK_GROWTH: Final[float] = 2.0
+"""float: Multiplicative increase of block ranges on successful requests."""
+LOG_CHUNK_SHRINK: Final[float] = 0.5
+"""float: Multiplicative decrease of block ranges on too large requests."""
+DEFAULT_LOG_WORKERS: Final[int] = 4
+"""int: Default number of block ranges fetched concurrently."""
+LOG_RANGE_ERROR_MESSAGES: Final[tuple[str, ...]] = (
+    "too many results",
+    "query returned more than",
+    "block range",
+    "range too large",
+    "range is too large",
+    "limit exceeded",
+    "response size",
+    "timeout",
+    "timed out",
+)
+"""tuple[str, ...]: Error messages (in lowercase) that indicate too large ranges."""
+INDEXED_EVENTS: Final[tuple[str, ...]] = (
+    "Transfer",
+    "Mint",
+    "Burn",
+    "Approval",
+    "AuthorizationUsed",
+)
+"""tuple[str, ...]: Names of events persisted by event indexers by default."""
+EVENT_PARTY_ARGS: Final[dict[str, tuple[str | None, str | None, str | None]]] = {
+    "Transfer": ("from", "to", "value"),
+    "Mint": ("minter", "to", "amount"),
+    "Burn": ("burner", None, "amount"),
+    "Approval": ("owner", "spender", "value"),
+    "AuthorizationUsed": ("authorizer", None, None),
+    "AuthorizationCanceled": ("authorizer", None, None),
+}
+"""dict[str, tuple[str | None, str | None, str | None]]: Names of arguments \
+stored as senders, recipients & amounts of events."""
+DEFAULT_STORE_BATCH_SIZE: Final[int] = 1000
+"""int: Default number of events written to event stores per transaction."""
+
+############
+# Relaying #
+############
+
+DEFAULT_RELAY_WORKERS: Final[int] = 8
+"""int: Default number of requests relayed concurrently."""
+DEFAULT_RELAY_QUEUE_SIZE: Final[int] = 10_000
+"""int: Default maximum number of requests queued for relaying."""
+RELAY_LATENCY_WINDOW: Final[int] = 1000
+"""int: Number of the latest latency samples kept per relaying stage."""
@@ -0,0 +1,195 @@
+from collections import OrderedDict
+from collections.abc import Callable
+from threading import Lock
+from typing import Final
+from weakref import ReferenceType, WeakKeyDictionary, ref
+
+from web3 import AsyncWeb3, Web3
+from web3.contract.async_contract import AsyncContract
+from web3.contract.contract import Contract
+
+from .artifacts import load_artifacts
+from .types import CacheInfo, ContractVersion
+from .validators import ChecksumAddress
+
+type ContractCacheKey = tuple[int | None, ChecksumAddress, ContractVersion]
+"""A type that contains (chain id, address, version)."""
+
+type ContractCache = OrderedDict[ContractCacheKey, Contract | AsyncContract]
+"""A type of LRU cache of contract instances bound to a web3 instance."""
+
+
+class ContractFactory:
+    """Thread-safe factory that reuses contract instances.
+
+    Notes:
+        - Building a web3 `Contract` processes the whole ABI and generates \
+        function & event classes, which takes several milliseconds. \
+        Since contract instances are bound to a web3 instance, \
+        cached entries are scoped to each web3 instance as well \
+        (i.e., JPYC instances sharing the same `SdkClient` share contracts).
+        - Cached entries are held in an LRU cache per web3 instance, \
+        which is owned by the web3 instance itself & referred to weakly \
+        by the factory. Cached contracts are bound to their web3 instances, \
+        so that they keep working as long as they are used, \
+        while the cache never keeps web3 instances alive \
+        (i.e., it is garbage-collected along with the web3 instance).
+    """
+
+    def __init__(self, maxsize: int = 256) -> None:
+        """Constructor that initializes contract factory.
+
+        Args:
+            maxsize (int): Maximum number of cached contract instances \
+            per web3 instance
+        """
+        self.__lock = Lock()
+        self.__contracts: WeakKeyDictionary[
+            Web3 | AsyncWeb3, ReferenceType[ContractCache]
+        ] = WeakKeyDictionary()
+        self.__attribute = f"_contract_cache_{id(self)}"
+        self.__maxsize = maxsize
+        self.__hits = 0
+        self.__misses = 0
+
+    def get_contract(
+        self,
+        w3: Web3,
+        chain_id: int,
+        contract_address: ChecksumAddress,
+        contract_version: ContractVersion = "2",
+    ) -> Contract:
+        """Get a contract instance, building it on the first call only.
+
+        Args:
+            w3 (Web3): Configured web3 instance
+            chain_id (int): Chain id of the configured network
+            contract_address (ChecksumAddress): Contract address
+            contract_version (ContractVersion): Contract version
+
+        Returns:
+            Contract: Configured contract instance
+        """
+        contract = self.__get_or_build(
+            w3=w3,
+            key=(chain_id, contract_address, contract_version),
+            build=lambda: w3.eth.contract(  # type: ignore[call-overload]
+                address=contract_address,
+                abi=load_artifacts(contract_version=contract_version).abi,
+            ),
+        )
+
+        return contract  # type: ignore[return-value]
+
+    def get_async_contract(
+        self,
+        w3: AsyncWeb3,
+        contract_address: ChecksumAddress,
+        contract_version: ContractVersion = "2",
+        chain_id: int | None = None,
+    ) -> AsyncContract:
+        """Get an async contract instance, building it on the first call only.
+
+        Args:
+            w3 (AsyncWeb3): Configured web3 instance
+            contract_address (ChecksumAddress): Contract address
+            contract_version (ContractVersion): Contract version
+            chain_id (int, optional): Chain id of the configured network
+
+        Returns:
+            AsyncContract: Configured contract instance
+        """
+        contract = self.__get_or_build(
+            w3=w3,
+            key=(chain_id, contract_address, contract_version),
+            build=lambda: w3.eth.contract(  # type: ignore[call-overload]
+                address=contract_address,
+                abi=load_artifacts(contract_version=contract_version).abi,
+            ),
+        )
+
+        return contract  # type: ignore[return-value]
+
+    def __get_or_build(
+        self,
+        w3: Web3 | AsyncWeb3,
+        key: ContractCacheKey,
+        build: Callable[[], Contract | AsyncContract],
+    ) -> Contract | AsyncContract:
+        """Get a cached contract instance or build & cache a new one.
+
+        Args:
+            w3 (Web3 | AsyncWeb3): Web3 instance to scope the cache to
+            key (ContractCacheKey): Cache key
+            build (Callable[[], Contract | AsyncContract]): Builder of contract
+
+        Returns:
+            Contract | AsyncContract: Configured contract instance
+        """
+        with self.__lock:
+            contracts = self.__get_cache(w3)
+            contract = None if contracts is None else contracts.get(key)
+            if contracts is not None and contract is not None:
+                contracts.move_to_end(key)
+                self.__hits += 1
+                return contract
+            self.__misses += 1
+
+        contract = build()
+
+        with self.__lock:
+            contracts = self.__get_cache(w3)
+            if contracts is None:
+                contracts = OrderedDict()
+                # owned by the web3 instance, so that collected along with it
+                setattr(w3, self.__attribute, contracts)
+                self.__contracts[w3] = ref(contracts)
+            contract = contracts.setdefault(key, contract)
+            while len(contracts) > self.__maxsize:
+                contracts.popitem(last=False)
+
+        return contract
+
+    def __get_cache(self, w3: Web3 | AsyncWeb3) -> ContractCache | None:
+        """Get the cache of contract instances bound to a web3 instance.
+
+        Args:
+            w3 (Web3 | AsyncWeb3): Web3 instance
+
+        Returns:
+            ContractCache | None: Cache of contract instances if any
+        """
+        contracts_ref = self.__contracts.get(w3)
+
+        return None if contracts_ref is None else contracts_ref()
+
+    def cache_info(self) -> CacheInfo:
+        """Get statistics of the factory.
+
+        Returns:
+            CacheInfo: Numbers of hits, misses & cached contract instances
+        """
+        with self.__lock:
+            return CacheInfo(
+                hits=self.__hits,
+                misses=self.__misses,
+                currsize=sum(
+                    len(contracts)
+                    for contracts_ref in self.__contracts.values()
+                    if (contracts := contracts_ref()) is not None
+                ),
+            )
+
+    def cache_clear(self) -> None:
+        """Clear cached contract instances & statistics."""
+        with self.__lock:
+            for w3 in list(self.__contracts.keys()):
+                if hasattr(w3, self.__attribute):
+                    delattr(w3, self.__attribute)
+            self.__contracts.clear()
+            self.__hits = 0
+            self.__misses = 0
+
+
+CONTRACT_FACTORY: Final[ContractFactory] = ContractFactory()
+"""ContractFactory: Process-wide factory of contract instances."""
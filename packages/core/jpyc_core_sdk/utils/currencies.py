@@ -1,4 +1,6 @@
 from decimal import Decimal
+from inspect import iscoroutinefunction
+from typing import Any
 
 from web3 import Web3
 
@@ -20,8 +22,31 @@ def remove_decimals(value: Uint256 | Decimal) -> Uint256:
 def restore_decimals(func):  # type: ignore[no-untyped-def]
     """Decorator to restore decimals."""
 
+    if iscoroutinefunction(func):
+
+        async def async_wrapper(*args, **kwargs):  # type: ignore[no-untyped-def]
+            result = await func(*args, **kwargs)
+            return Web3.from_wei(result, "ether")
+
+        return async_wrapper
+
     def wrapper(*args, **kwargs):  # type: ignore[no-untyped-def]
         result = func(*args, **kwargs)
         return Web3.from_wei(result, "ether")
 
     return wrapper
+
+
+def restore_decimals_in_batch(results: list[Any]) -> list[Any]:
+    """Restore decimals of the successful results in a batch.
+
+    Args:
+        results (list[Any]): Values in wei, or exceptions of failed items
+
+    Returns:
+        list[Any]: Values in ether, or exceptions of failed items
+    """
+    return [
+        result if isinstance(result, Exception) else Web3.from_wei(result, "ether")
+        for result in results
+    ]
@@ -0,0 +1,218 @@
+import math
+import time
+from collections import deque
+from collections.abc import Sequence
+from dataclasses import dataclass, replace
+from threading import Lock
+from typing import Final
+
+import requests
+from aiohttp import ClientConnectionError, ClientResponseError
+from web3.exceptions import TimeExhausted
+
+from .constants import (
+    DEFAULT_ENDPOINT_COOLDOWN,
+    FAILOVER_STATUS_CODES,
+    LATENCY_SMOOTHING,
+    LATENCY_WINDOW,
+    MAX_ENDPOINT_COOLDOWN,
+    MIN_LATENCY_SAMPLES,
+)
+
+
+def is_failover_error(error: Exception) -> bool:
+    """Checks if the given error is caused by an endpoint (rather than a request).
+
+    Args:
+        error (Exception): Error raised when making an HTTP request
+
+    Returns:
+        bool: True if on timeouts, connection errors, 5xx or 429, false otherwise
+    """
+    status: int | None = None
+    if isinstance(error, requests.HTTPError) and error.response is not None:
+        status = error.response.status_code
+    elif isinstance(error, ClientResponseError):
+        status = error.status
+    if status is not None:
+        return status >= 500 or status in FAILOVER_STATUS_CODES
+
+    return isinstance(
+        error,
+        (
+            requests.ConnectionError,
+            requests.Timeout,
+            ClientConnectionError,
+            TimeoutError,
+            TimeExhausted,
+        ),
+    )
+
+
+@dataclass(frozen=True)
+class EndpointStats:
+    """Statistics of an RPC endpoint.
+
+    Attributes:
+        latency (float, optional): Moving average of latencies (in seconds)
+        successes (int): Number of successful requests
+        failures (int): Number of consecutive failed requests
+        unhealthy_until (float): Monotonic time until which the endpoint is avoided
+    """
+
+    latency: float | None = None
+    successes: int = 0
+    failures: int = 0
+    unhealthy_until: float = 0.0
+
+
+class EndpointMonitor:
+    """Thread-safe monitor of latencies & health of RPC endpoints.
+
+    Note:
+        Endpoints are regarded as unhealthy for a cooldown period after failures, \
+        doubling on consecutive failures (i.e., circuit breakers). \
+        Endpoints never measured are ranked first, so that they are explored.
+    """
+
+    def __init__(
+        self,
+        cooldown: float = DEFAULT_ENDPOINT_COOLDOWN,
+        max_cooldown: float = MAX_ENDPOINT_COOLDOWN,
+        smoothing: float = LATENCY_SMOOTHING,
+        window: int = LATENCY_WINDOW,
+    ) -> None:
+        """Constructor that initializes endpoint monitor.
+
+        Args:
+            cooldown (float): Time (in seconds) to avoid an endpoint after its failure
+            max_cooldown (float): Maximum time (in seconds) to avoid an endpoint
+            smoothing (float): Weight of the latest sample in moving averages
+            window (int): Number of the latest latency samples kept per endpoint
+        """
+        self.__lock = Lock()
+        self.__stats: dict[str, EndpointStats] = {}
+        self.__samples: dict[str, deque[float]] = {}
+
+        self.cooldown = cooldown
+        """float: Time (in seconds) to avoid an endpoint after its failure"""
+        self.max_cooldown = max_cooldown
+        """float: Maximum time (in seconds) to avoid an endpoint"""
+        self.smoothing = smoothing
+        """float: Weight of the latest sample in moving averages"""
+        self.window = window
+        """int: Number of the latest latency samples kept per endpoint"""
+
+    def get_stats(self, endpoint: str) -> EndpointStats:
+        """Get statistics of an endpoint.
+
+        Args:
+            endpoint (str): RPC endpoint
+
+        Returns:
+            EndpointStats: Statistics of the endpoint
+        """
+        with self.__lock:
+            return self.__stats.get(endpoint, EndpointStats())
+
+    def record_success(self, endpoint: str, latency: float) -> None:
+        """Record a successful request.
+
+        Args:
+            endpoint (str): RPC endpoint
+            latency (float): Latency (in seconds)
+        """
+        with self.__lock:
+            stats = self.__stats.get(endpoint, EndpointStats())
+            self.__stats[endpoint] = EndpointStats(
+                latency=(
+                    latency
+                    if stats.latency is None
+                    else self.smoothing * latency + (1 - self.smoothing) * stats.latency
+                ),
+                successes=stats.successes + 1,
+            )
+            samples = self.__samples.setdefault(endpoint, deque(maxlen=self.window))
+            samples.append(latency)
+
+    def record_failure(self, endpoint: str) -> None:
+        """Record a failed request.
+
+        Args:
+            endpoint (str): RPC endpoint
+        """
+        with self.__lock:
+            stats = self.__stats.get(endpoint, EndpointStats())
+            cooldown = min(self.cooldown * 2**stats.failures, self.max_cooldown)
+            self.__stats[endpoint] = replace(
+                stats,
+                failures=stats.failures + 1,
+                unhealthy_until=time.monotonic() + cooldown,
+            )
+
+    def get_latency_percentile(self, endpoint: str, percentile: float) -> float | None:
+        """Get a percentile of the latest latencies of an endpoint.
+
+        Args:
+            endpoint (str): RPC endpoint
+            percentile (float): Percentile (in the range of (0, 100])
+
+        Returns:
+            float | None: Latency (in seconds) at the percentile \
+            (None if fewer than `MIN_LATENCY_SAMPLES` samples are recorded)
+        """
+        with self.__lock:
+            samples = sorted(self.__samples.get(endpoint, ()))
+        if len(samples) < MIN_LATENCY_SAMPLES:
+            return None
+
+        # nearest-rank method
+        rank = max(math.ceil(percentile / 100 * len(samples)), 1)
+        return samples[rank - 1]
+
+    def is_healthy(self, endpoint: str) -> bool:
+        """Checks if an endpoint is healthy.
+
+        Args:
+            endpoint (str): RPC endpoint
+
+        Returns:
+            bool: True if not in a cooldown period, false otherwise
+        """
+        return self.get_stats(endpoint).unhealthy_until <= time.monotonic()
+
+    def rank(self, endpoints: Sequence[str]) -> list[str]:
+        """Rank endpoints in order of preference.
+
+        Note:
+            Healthy endpoints come first in ascending order of latencies, \
+            followed by unhealthy ones in order of their recovery.
+
+        Args:
+            endpoints (Sequence[str]): RPC endpoints
+
+        Returns:
+            list[str]: Ranked RPC endpoints
+        """
+        now = time.monotonic()
+        with self.__lock:
+            stats = {e: self.__stats.get(e, EndpointStats()) for e in endpoints}
+
+        return sorted(
+            dict.fromkeys(endpoints),
+            key=lambda e: (
+                (0, stats[e].latency or 0.0)
+                if stats[e].unhealthy_until <= now
+                else (1, stats[e].unhealthy_until)
+            ),
+        )
+
+    def reset(self) -> None:
+        """Discard statistics of all endpoints."""
+        with self.__lock:
+            self.__stats.clear()
+            self.__samples.clear()
+
+
+ENDPOINT_MONITOR: Final[EndpointMonitor] = EndpointMonitor()
+"""EndpointMonitor: Process-wide endpoint monitor shared by providers by default."""
@@ -49,6 +49,24 @@ class AccountNotInitialized(JpycSdkError):
         )
 
 
+class ChainIdMismatch(JpycSdkError):
+    """Raised when the RPC endpoint serves a chain other than the specified network.
+
+    Attributes:
+        expected (int): Chain id of the specified network
+        actual (int): Chain id returned by the RPC endpoint
+    """
+
+    code = 102
+
+    def __init__(self, expected: int, actual: int) -> None:
+        super().__init__(
+            code=ChainIdMismatch.code,
+            message=f"RPC endpoint serves chain id {actual}, "
+            f"but the specified network has chain id {expected}.",
+        )
+
+
 #####################
 # Validation Errors #
 #####################
@@ -149,3 +167,56 @@ class TransactionFailed(JpycSdkError):
             code=TransactionFailed.code,
             message=f"Transaction failed: {message_}",
         )
+
+
+class PreflightCheckFailed(JpycSdkError):
+    """Raised when a transaction is rejected by pre-flight checks (offline).
+
+    Attributes:
+        message (str): Error message
+    """
+
+    code = 302
+
+    def __init__(self, message_: str) -> None:
+        super().__init__(
+            code=PreflightCheckFailed.code,
+            message=f"Rejected a transaction by pre-flight checks: {message_}",
+        )
+
+
+class RelayRequestRejected(JpycSdkError):
+    """Raised when a relay request is rejected (e.g., duplicated or expired).
+
+    Attributes:
+        message (str): Error message
+    """
+
+    code = 303
+
+    def __init__(self, message_: str) -> None:
+        super().__init__(
+            code=RelayRequestRejected.code,
+            message=f"Rejected a relay request: {message_}",
+        )
+
+
+###############
+# Call Errors #
+###############
+
+
+class CallFailed(JpycSdkError):
+    """Raised (or returned per item in batches) when a view call fails.
+
+    Attributes:
+        message (str): Error message
+    """
+
+    code = 400
+
+    def __init__(self, message_: str) -> None:
+        super().__init__(
+            code=CallFailed.code,
+            message=f"Failed to call a view function: {message_}",
+        )
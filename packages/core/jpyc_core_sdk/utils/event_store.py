@@ -0,0 +1,362 @@
+import json
+import os
+import sqlite3
+from collections.abc import Iterable, Sequence
+from threading import Lock
+from typing import Any, NamedTuple
+
+from eth_typing import ChecksumAddress
+from web3 import Web3
+from web3.types import EventData
+
+from .constants import EVENT_PARTY_ARGS
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    chain_id INTEGER NOT NULL,
+    contract TEXT NOT NULL,
+    block_number INTEGER NOT NULL,
+    log_index INTEGER NOT NULL,
+    block_hash TEXT NOT NULL,
+    transaction_hash TEXT NOT NULL,
+    event TEXT NOT NULL,
+    from_address TEXT,
+    to_address TEXT,
+    value TEXT,
+    args TEXT NOT NULL,
+    PRIMARY KEY (chain_id, contract, block_number, log_index)
+);
+CREATE INDEX IF NOT EXISTS events_from_address
+    ON events (chain_id, contract, from_address, block_number);
+CREATE INDEX IF NOT EXISTS events_to_address
+    ON events (chain_id, contract, to_address, block_number);
+CREATE TABLE IF NOT EXISTS cursors (
+    chain_id INTEGER NOT NULL,
+    contract TEXT NOT NULL,
+    block_number INTEGER NOT NULL,
+    PRIMARY KEY (chain_id, contract)
+);
+CREATE TABLE IF NOT EXISTS blocks (
+    chain_id INTEGER NOT NULL,
+    contract TEXT NOT NULL,
+    block_number INTEGER NOT NULL,
+    block_hash TEXT NOT NULL,
+    PRIMARY KEY (chain_id, contract, block_number)
+);
+"""
+"""str: Schema of event stores."""
+
+
+class StoredEvent(NamedTuple):
+    """Event persisted in an event store.
+
+    Note:
+        `from_`, `to` & `value` are the sender, recipient & amount \
+        of the event (e.g., `minter`, `to` & `amount` of `Mint` events), \
+        if applicable.
+    """
+
+    event: str
+    block_number: int
+    log_index: int
+    block_hash: str
+    transaction_hash: str
+    from_: ChecksumAddress | None
+    to: ChecksumAddress | None
+    value: int | None
+    args: dict[str, Any]
+
+
+def to_json_value(value: Any) -> Any:
+    """Convert an argument of an event into a JSON-serializable value.
+
+    Args:
+        value (Any): Argument of an event
+
+    Returns:
+        Any: Hex strings for bytes, the given value otherwise
+    """
+    if isinstance(value, bytes):
+        return Web3.to_hex(value)
+
+    return value
+
+
+class EventStore:
+    """Thread-safe, on-disk store of decoded events backed by SQLite.
+
+    Notes:
+        - Events are keyed by chains, contract addresses, blocks & log indexes \
+        (i.e., writing the same events twice is idempotent), & indexed by \
+        senders & recipients.
+        - Sync cursors (i.e., the last synced block) are written in the same \
+        transactions as events, so that syncs could resume from them safely.
+        - Amounts are stored as decimal strings, since they may exceed \
+        the range of SQLite integers.
+        - Hashes of blocks (of events & sync cursors) are stored as well, \
+        so that orphaned events could be detected & rolled back on reorgs.
+    """
+
+    def __init__(self, path: str | os.PathLike[str] = ":memory:") -> None:
+        """Constructor that initializes event store.
+
+        Args:
+            path (str | os.PathLike[str]): Path of the database file \
+            (in-memory if ":memory:")
+        """
+        self.__lock = Lock()
+        self.__connection = sqlite3.connect(path, check_same_thread=False)
+        with self.__lock, self.__connection:
+            self.__connection.execute("PRAGMA journal_mode=WAL")
+            self.__connection.executescript(SCHEMA)
+
+        self.path = path
+        """str | os.PathLike[str]: Path of the database file"""
+
+    def get_cursor(
+        self, chain_id: int, contract_address: ChecksumAddress
+    ) -> int | None:
+        """Get the last synced block.
+
+        Args:
+            chain_id (int): Chain ID
+            contract_address (ChecksumAddress): Contract address
+
+        Returns:
+            int | None: Last synced block (if synced)
+        """
+        with self.__lock:
+            row = self.__connection.execute(
+                "SELECT block_number FROM cursors WHERE chain_id = ? AND contract = ?",
+                (chain_id, contract_address),
+            ).fetchone()
+
+        return None if row is None else row[0]
+
+    def save(
+        self,
+        chain_id: int,
+        contract_address: ChecksumAddress,
+        events: Iterable[EventData],
+        synced_block: int,
+        block_hash: str | None = None,
+    ) -> None:
+        """Write events & advance the sync cursor atomically.
+
+        Args:
+            chain_id (int): Chain ID
+            contract_address (ChecksumAddress): Contract address
+            events (Iterable[EventData]): Decoded events
+            synced_block (int): Last block whose events are all written
+            block_hash (str, optional): Hash of `synced_block` to track
+        """
+        rows = []
+        for event in events:
+            from_arg, to_arg, value_arg = EVENT_PARTY_ARGS.get(
+                event["event"], (None, None, None)
+            )
+            args = event["args"]
+            rows.append(
+                (
+                    chain_id,
+                    contract_address,
+                    event["blockNumber"],
+                    event["logIndex"],
+                    Web3.to_hex(event["blockHash"]),
+                    Web3.to_hex(event["transactionHash"]),
+                    event["event"],
+                    None if from_arg is None else args[from_arg],
+                    None if to_arg is None else args[to_arg],
+                    None if value_arg is None else str(args[value_arg]),
+                    json.dumps(
+                        {name: to_json_value(value) for name, value in args.items()}
+                    ),
+                )
+            )
+
+        with self.__lock, self.__connection:
+            self.__connection.executemany(
+                f"INSERT OR REPLACE INTO events VALUES ({', '.join('?' * 11)})",
+                rows,
+            )
+            self.__connection.execute(
+                "INSERT OR REPLACE INTO cursors VALUES (?, ?, ?)",
+                (chain_id, contract_address, synced_block),
+            )
+            if block_hash is not None:
+                self.__connection.execute(
+                    "INSERT OR REPLACE INTO blocks VALUES (?, ?, ?, ?)",
+                    (chain_id, contract_address, synced_block, block_hash),
+                )
+
+    def get_block_hashes(
+        self, chain_id: int, contract_address: ChecksumAddress, from_block: int
+    ) -> dict[int, str]:
+        """Get stored hashes of synced blocks (i.e., of events & sync cursors).
+
+        Args:
+            chain_id (int): Chain ID
+            contract_address (ChecksumAddress): Contract address
+            from_block (int): First block of the range (inclusive)
+
+        Returns:
+            dict[int, str]: Block hashes by block number
+        """
+        with self.__lock:
+            rows = self.__connection.execute(
+                """
+                SELECT block_number, block_hash FROM events
+                WHERE chain_id = ? AND contract = ? AND block_number >= ?
+                UNION
+                SELECT block_number, block_hash FROM blocks
+                WHERE chain_id = ? AND contract = ? AND block_number >= ?
+                """,
+                (chain_id, contract_address, from_block) * 2,
+            ).fetchall()
+
+        return dict(rows)
+
+    def rollback(
+        self, chain_id: int, contract_address: ChecksumAddress, block_number: int
+    ) -> int:
+        """Delete events after a block & rewind the sync cursor to it atomically.
+
+        Args:
+            chain_id (int): Chain ID
+            contract_address (ChecksumAddress): Contract address
+            block_number (int): Last block to keep
+
+        Returns:
+            int: Number of deleted events
+        """
+        params = (chain_id, contract_address, block_number)
+        with self.__lock, self.__connection:
+            deleted = self.__connection.execute(
+                """
+                DELETE FROM events
+                WHERE chain_id = ? AND contract = ? AND block_number > ?
+                """,
+                params,
+            ).rowcount
+            self.__connection.execute(
+                """
+                DELETE FROM blocks
+                WHERE chain_id = ? AND contract = ? AND block_number > ?
+                """,
+                params,
+            )
+            self.__connection.execute(
+                """
+                UPDATE cursors SET block_number = ?
+                WHERE chain_id = ? AND contract = ? AND block_number > ?
+                """,
+                (block_number, *params),
+            )
+
+        return deleted
+
+    def prune_blocks(
+        self, chain_id: int, contract_address: ChecksumAddress, before_block: int
+    ) -> None:
+        """Delete hashes of sync cursors before a block (i.e., confirmed ones).
+
+        Args:
+            chain_id (int): Chain ID
+            contract_address (ChecksumAddress): Contract address
+            before_block (int): First block to keep
+        """
+        with self.__lock, self.__connection:
+            self.__connection.execute(
+                """
+                DELETE FROM blocks
+                WHERE chain_id = ? AND contract = ? AND block_number < ?
+                """,
+                (chain_id, contract_address, before_block),
+            )
+
+    def get_events(
+        self,
+        chain_id: int,
+        contract_address: ChecksumAddress,
+        address: str | None = None,
+        event_names: Sequence[str] | None = None,
+        from_block: int | None = None,
+        to_block: int | None = None,
+        limit: int | None = None,
+    ) -> list[StoredEvent]:
+        """Get stored events.
+
+        Args:
+            chain_id (int): Chain ID
+            contract_address (ChecksumAddress): Contract address
+            address (str, optional): Sender or recipient of events
+            event_names (Sequence[str], optional): Names of events \
+            (every event if None)
+            from_block (int, optional): First block of the range (inclusive)
+            to_block (int, optional): Last block of the range (inclusive)
+            limit (int, optional): Maximum number of events
+
+        Returns:
+            list[StoredEvent]: Events in the order of blocks & log indexes
+        """
+        conditions = ["chain_id = ?", "contract = ?"]
+        params: list[Any] = [chain_id, contract_address]
+        if event_names is not None:
+            conditions.append(f"event IN ({', '.join('?' * len(event_names))})")
+            params.extend(event_names)
+        if from_block is not None:
+            conditions.append("block_number >= ?")
+            params.append(from_block)
+        if to_block is not None:
+            conditions.append("block_number <= ?")
+            params.append(to_block)
+        query = f"""
+            SELECT event, block_number, log_index, block_hash, transaction_hash,
+                from_address, to_address, value, args
+            FROM events WHERE {" AND ".join(conditions)}
+        """
+        if address is not None:
+            # so that both indexes are used (instead of scanning with OR)
+            address = Web3.to_checksum_address(address)
+            query = f"""
+                {query} AND from_address = ?
+                UNION {query} AND to_address = ?
+            """
+            params = [*params, address, *params, address]
+        query += " ORDER BY block_number, log_index"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+
+        with self.__lock:
+            rows = self.__connection.execute(query, params).fetchall()
+
+        return [
+            StoredEvent(
+                event=event,
+                block_number=block_number,
+                log_index=log_index,
+                block_hash=block_hash,
+                transaction_hash=transaction_hash,
+                from_=from_address,
+                to=to_address,
+                value=None if value is None else int(value),
+                args=json.loads(args),
+            )
+            for (
+                event,
+                block_number,
+                log_index,
+                block_hash,
+                transaction_hash,
+                from_address,
+                to_address,
+                value,
+                args,
+            ) in rows
+        ]
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self.__lock:
+            self.__connection.close()
@@ -0,0 +1,229 @@
+from collections.abc import Sequence
+from threading import Lock
+from typing import Any
+
+import requests
+from eth_typing import ChecksumAddress, HexStr
+from eth_utils.abi import event_abi_to_log_topic
+from web3 import Web3
+from web3.contract.async_contract import AsyncContract
+from web3.contract.contract import Contract
+from web3.exceptions import TimeExhausted
+from web3.types import BlockIdentifier, EventData, FilterParams, LogReceipt
+
+from .constants import (
+    AUTHORIZATION_CANCELED_TOPIC,
+    AUTHORIZATION_USED_TOPIC,
+    DEFAULT_LOG_CHUNK_SIZE,
+    LOG_CHUNK_GROWTH,
+    LOG_CHUNK_SHRINK,
+    LOG_RANGE_ERROR_MESSAGES,
+    MAX_LOG_CHUNK_SIZE,
+    MIN_LOG_CHUNK_SIZE,
+)
+
+
+def build_event_filter(
+    contract_address: ChecksumAddress,
+    topics: Sequence[HexStr],
+    from_block: BlockIdentifier,
+    to_block: BlockIdentifier = "latest",
+) -> FilterParams:
+    """Build a filter of events by their topics.
+
+    Args:
+        contract_address (ChecksumAddress): Contract address
+        topics (Sequence[HexStr]): Topics of events (i.e., OR condition)
+        from_block (BlockIdentifier): First block of the range (inclusive)
+        to_block (BlockIdentifier): Last block of the range (inclusive)
+
+    Returns:
+        FilterParams: Filter parameters of `eth_getLogs`
+    """
+    return {
+        "address": contract_address,
+        "fromBlock": from_block,
+        "toBlock": to_block,
+        "topics": [list(topics)],
+    }
+
+
+def build_authorization_filter(
+    contract_address: ChecksumAddress,
+    from_block: BlockIdentifier,
+    to_block: BlockIdentifier = "latest",
+) -> FilterParams:
+    """Build a filter of `AuthorizationUsed` & `AuthorizationCanceled` events.
+
+    Args:
+        contract_address (ChecksumAddress): Contract address
+        from_block (BlockIdentifier): First block of the range (inclusive)
+        to_block (BlockIdentifier): Last block of the range (inclusive)
+
+    Returns:
+        FilterParams: Filter parameters of `eth_getLogs`
+    """
+    return build_event_filter(
+        contract_address,
+        [HexStr(AUTHORIZATION_USED_TOPIC), HexStr(AUTHORIZATION_CANCELED_TOPIC)],
+        from_block,
+        to_block,
+    )
+
+
+def decode_authorization_log(log: LogReceipt) -> tuple[ChecksumAddress, str]:
+    """Decode an `AuthorizationUsed` or `AuthorizationCanceled` event.
+
+    Note:
+        Both events index every argument (i.e., no ABI decoding is required).
+
+    Args:
+        log (LogReceipt): Log of the event
+
+    Returns:
+        tuple[ChecksumAddress, str]: Authorizer address & nonce (bytes32)
+    """
+    _, authorizer, nonce = log["topics"]
+
+    return (
+        Web3.to_checksum_address(bytes(authorizer)[-20:]),
+        Web3.to_hex(nonce),
+    )
+
+
+def is_range_error(error: Exception) -> bool:
+    """Checks if the given error is caused by a too large range of `eth_getLogs`.
+
+    Args:
+        error (Exception): Error raised when getting logs
+
+    Returns:
+        bool: True if on timeouts or too many results, false otherwise
+    """
+    if isinstance(error, (requests.Timeout, TimeoutError, TimeExhausted)):
+        return True
+    message = str(error).lower()
+
+    return any(pattern in message for pattern in LOG_RANGE_ERROR_MESSAGES)
+
+
+class BlockRangeSizer:
+    """Thread-safe sizer of block ranges of `eth_getLogs` requests.
+
+    Note:
+        Ranges grow multiplicatively on successes & shrink multiplicatively \
+        on too large requests (i.e., timeouts or too many results), so that \
+        they converge to the largest ranges that endpoints accept, \
+        while adapting to the density of logs across the history.
+    """
+
+    def __init__(
+        self,
+        chunk_size: int = DEFAULT_LOG_CHUNK_SIZE,
+        min_chunk_size: int = MIN_LOG_CHUNK_SIZE,
+        max_chunk_size: int = MAX_LOG_CHUNK_SIZE,
+    ) -> None:
+        """Constructor that initializes block range sizer.
+
+        Args:
+            chunk_size (int): Number of blocks per request to start with
+            min_chunk_size (int): Minimum number of blocks per request
+            max_chunk_size (int): Maximum number of blocks per request
+        """
+        self.__lock = Lock()
+        self.__chunk_size = chunk_size
+
+        self.min_chunk_size = min_chunk_size
+        """int: Minimum number of blocks per request"""
+        self.max_chunk_size = max_chunk_size
+        """int: Maximum number of blocks per request"""
+
+    def get_chunk_size(self) -> int:
+        """Get the current number of blocks per request.
+
+        Returns:
+            int: Number of blocks per request
+        """
+        with self.__lock:
+            return self.__chunk_size
+
+    def record_success(self, size: int) -> None:
+        """Record a successful request.
+
+        Args:
+            size (int): Number of blocks of the request
+        """
+        with self.__lock:
+            self.__chunk_size = min(
+                max(self.__chunk_size, int(size * LOG_CHUNK_GROWTH)),
+                self.max_chunk_size,
+            )
+
+    def record_failure(self, size: int) -> None:
+        """Record a too large request.
+
+        Args:
+            size (int): Number of blocks of the request
+        """
+        with self.__lock:
+            self.__chunk_size = max(
+                min(self.__chunk_size, int(size * LOG_CHUNK_SHRINK)),
+                self.min_chunk_size,
+            )
+
+
+class EventDecoder:
+    """Decoder of logs of JPYC contracts by their topics."""
+
+    def __init__(
+        self,
+        contract: Contract | AsyncContract,
+        event_names: Sequence[str] | None = None,
+    ) -> None:
+        """Constructor that initializes event decoder.
+
+        Args:
+            contract (Contract | AsyncContract): Configured contract instance
+            event_names (Sequence[str], optional): Names of events to decode \
+            (every event of the ABI if None)
+
+        Raises:
+            ValueError: If any of `event_names` is not defined in the ABI
+        """
+        event_abis = {
+            abi["name"]: abi for abi in contract.abi if abi["type"] == "event"
+        }
+        names = list(event_abis) if event_names is None else list(event_names)
+        unknown = set(names) - set(event_abis)
+        if unknown:
+            raise ValueError(f"Unknown events: {sorted(unknown)}")
+
+        self.__events: dict[bytes, Any] = {
+            event_abi_to_log_topic(event_abis[name]): contract.events[name]()
+            for name in names
+        }
+
+        self.event_names = names
+        """list[str]: Names of events to decode"""
+
+    def get_topics(self) -> list[HexStr]:
+        """Get topics of events to decode (i.e., to filter logs with).
+
+        Returns:
+            list[HexStr]: Topics of events
+        """
+        return [HexStr(Web3.to_hex(topic)) for topic in self.__events]
+
+    def decode(self, log: LogReceipt) -> EventData:
+        """Decode a log.
+
+        Args:
+            log (LogReceipt): Log of one of the events
+
+        Returns:
+            EventData: Decoded event
+
+        Raises:
+            KeyError: If the log is not of the events
+        """
+        return self.__events[bytes(log["topics"][0])].process_log(log)
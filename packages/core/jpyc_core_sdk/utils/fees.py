@@ -0,0 +1,126 @@
+from threading import Lock
+from time import monotonic
+
+from web3 import AsyncWeb3, Web3
+
+from .constants import DEFAULT_FEE_TTL
+from .types import FeeParams
+
+
+class FeeManager:
+    """Thread-safe manager that caches fee parameters for a short period.
+
+    Note:
+        Fees are derived in the same way as web3.py does by default \
+        (i.e., `maxFeePerGas = 2 * baseFeePerGas + maxPriorityFeePerGas`), \
+        but fetched once per `ttl` seconds instead of once per transaction. \
+        Networks without EIP-1559 fall back to `gasPrice`. \
+        The internal lock is never held across network I/O. \
+        Fees are cached per chain id, so that a fee manager could be shared \
+        among pipelines of different networks.
+    """
+
+    def __init__(self, ttl: float = DEFAULT_FEE_TTL) -> None:
+        """Constructor that initializes fee manager.
+
+        Args:
+            ttl (float): Time-to-live (in seconds) of cached fee parameters
+        """
+        self.__lock = Lock()
+        self.__ttl = ttl
+        self.__fees: dict[int, tuple[FeeParams, float]] = {}
+
+    def get_fees(self, w3: Web3, chain_id: int) -> FeeParams:
+        """Get fee parameters, fetching them from the network if expired.
+
+        Args:
+            w3 (Web3): Configured web3 instance
+            chain_id (int): Chain id of the configured network
+
+        Returns:
+            FeeParams: Fee parameters of transactions
+        """
+        fees = self.__get_cached_fees(chain_id)
+        if fees is not None:
+            return fees
+
+        block = w3.eth.get_block("latest")
+        if "baseFeePerGas" in block:
+            max_priority_fee = w3.eth.max_priority_fee
+            fees = FeeParams(
+                maxFeePerGas=2 * block["baseFeePerGas"] + max_priority_fee,
+                maxPriorityFeePerGas=max_priority_fee,
+            )
+        else:
+            fees = FeeParams(gasPrice=w3.eth.gas_price)
+
+        return self.__cache_fees(chain_id, fees)
+
+    async def async_get_fees(self, w3: AsyncWeb3, chain_id: int) -> FeeParams:
+        """Get fee parameters in asyncio, fetching them from the network if expired.
+
+        Args:
+            w3 (AsyncWeb3): Configured web3 instance
+            chain_id (int): Chain id of the configured network
+
+        Returns:
+            FeeParams: Fee parameters of transactions
+        """
+        fees = self.__get_cached_fees(chain_id)
+        if fees is not None:
+            return fees
+
+        block = await w3.eth.get_block("latest")
+        if "baseFeePerGas" in block:
+            max_priority_fee = await w3.eth.max_priority_fee
+            fees = FeeParams(
+                maxFeePerGas=2 * block["baseFeePerGas"] + max_priority_fee,
+                maxPriorityFeePerGas=max_priority_fee,
+            )
+        else:
+            fees = FeeParams(gasPrice=await w3.eth.gas_price)
+
+        return self.__cache_fees(chain_id, fees)
+
+    def __get_cached_fees(self, chain_id: int) -> FeeParams | None:
+        """Get cached fee parameters of a chain unless expired.
+
+        Args:
+            chain_id (int): Chain id
+
+        Returns:
+            FeeParams | None: Cached fee parameters
+        """
+        with self.__lock:
+            cached = self.__fees.get(chain_id)
+            if cached is not None and monotonic() - cached[1] < self.__ttl:
+                return cached[0]
+
+            return None
+
+    def __cache_fees(self, chain_id: int, fees: FeeParams) -> FeeParams:
+        """Cache fee parameters of a chain.
+
+        Args:
+            chain_id (int): Chain id
+            fees (FeeParams): Fee parameters of transactions
+
+        Returns:
+            FeeParams: Cached fee parameters
+        """
+        with self.__lock:
+            self.__fees[chain_id] = (fees, monotonic())
+
+        return fees
+
+    def invalidate(self, chain_id: int | None = None) -> None:
+        """Discard cached fee parameters.
+
+        Args:
+            chain_id (int, optional): Chain id to discard fees of (all if None)
+        """
+        with self.__lock:
+            if chain_id is None:
+                self.__fees.clear()
+            else:
+                self.__fees.pop(chain_id, None)
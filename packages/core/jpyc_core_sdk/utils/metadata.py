@@ -0,0 +1,171 @@
+import asyncio
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from web3 import AsyncWeb3, Web3
+from web3.types import RPCEndpoint, RPCResponse
+
+from .calls import decode_response, get_view_function
+from .constants import TOKEN_METADATA_FUNCTIONS
+from .errors import CallFailed
+from .types import ContractVersion
+from .validators import ChecksumAddress
+
+
+@dataclass(frozen=True)
+class TokenMetadata:
+    """Immutable metadata of JPYC contracts.
+
+    Attributes:
+        name (str): Token name (also the name of the EIP-712 domain)
+        symbol (str): Token symbol
+        decimals (int): Token decimals
+        currency (str): Currency the token is pegged to
+        domain_separator (bytes): EIP-712 domain separator
+        permit_typehash (bytes): Typehash of `Permit`
+        transfer_with_authorization_typehash (bytes): \
+        Typehash of `TransferWithAuthorization`
+        receive_with_authorization_typehash (bytes): \
+        Typehash of `ReceiveWithAuthorization`
+        cancel_authorization_typehash (bytes): Typehash of `CancelAuthorization`
+    """
+
+    name: str
+    symbol: str
+    decimals: int
+    currency: str
+    domain_separator: bytes
+    permit_typehash: bytes
+    transfer_with_authorization_typehash: bytes
+    receive_with_authorization_typehash: bytes
+    cancel_authorization_typehash: bytes
+
+
+def build_metadata_requests(
+    contract_address: ChecksumAddress, contract_version: ContractVersion
+) -> list[tuple[RPCEndpoint, Any]]:
+    """Build `eth_call` requests of every metadata function.
+
+    Args:
+        contract_address (ChecksumAddress): Contract address
+        contract_version (ContractVersion): Contract version
+
+    Returns:
+        list[tuple[RPCEndpoint, Any]]: JSON-RPC requests in the order of fields
+    """
+    return [
+        (
+            RPCEndpoint("eth_call"),
+            [
+                {
+                    "to": contract_address,
+                    "data": get_view_function(contract_version, func_name).encode(()),
+                },
+                "latest",
+            ],
+        )
+        for func_name in TOKEN_METADATA_FUNCTIONS
+    ]
+
+
+def decode_metadata_responses(
+    responses: Sequence[RPCResponse] | RPCResponse, contract_version: ContractVersion
+) -> TokenMetadata:
+    """Decode JSON-RPC responses of metadata functions.
+
+    Args:
+        responses (Sequence[RPCResponse] | RPCResponse): JSON-RPC responses \
+        (or a single error response if the batch is rejected as a whole)
+        contract_version (ContractVersion): Contract version
+
+    Returns:
+        TokenMetadata: Token metadata
+
+    Raises:
+        CallFailed: If any of the calls fails
+    """
+    if not isinstance(responses, Sequence):
+        raise CallFailed(str(responses.get("error", responses)))
+    if len(responses) < len(TOKEN_METADATA_FUNCTIONS):
+        raise CallFailed("Missing response in batch.")
+
+    values = []
+    for func_name, response in zip(TOKEN_METADATA_FUNCTIONS, responses, strict=False):
+        value = decode_response(
+            get_view_function(contract_version, func_name), response
+        )
+        if isinstance(value, CallFailed):
+            raise value
+        values.append(value)
+
+    # fields are declared in the order of `TOKEN_METADATA_FUNCTIONS`
+    return TokenMetadata(*values)
+
+
+def fetch_token_metadata(
+    w3: Web3, contract_address: ChecksumAddress, contract_version: ContractVersion
+) -> TokenMetadata:
+    """Fetch immutable metadata of JPYC contracts in a single batch request.
+
+    Note:
+        If the endpoint rejects the batch as a whole (e.g., endpoints \
+        not supporting JSON-RPC batches), each function is called individually.
+
+    Args:
+        w3 (Web3): Configured web3 instance
+        contract_address (ChecksumAddress): Contract address
+        contract_version (ContractVersion): Contract version
+
+    Returns:
+        TokenMetadata: Token metadata
+
+    Raises:
+        CallFailed: If any of the calls fails
+    """
+    requests = build_metadata_requests(contract_address, contract_version)
+    try:
+        responses = w3.provider.make_batch_request(requests)  # type: ignore[attr-defined]
+    except Exception:
+        responses = None
+
+    if not isinstance(responses, Sequence):
+        responses = [
+            w3.provider.make_request(method, params) for method, params in requests
+        ]
+
+    return decode_metadata_responses(responses, contract_version)
+
+
+async def async_fetch_token_metadata(
+    w3: AsyncWeb3, contract_address: ChecksumAddress, contract_version: ContractVersion
+) -> TokenMetadata:
+    """Fetch immutable metadata of JPYC contracts in a single batch request.
+
+    Note:
+        If the endpoint rejects the batch as a whole (e.g., endpoints \
+        not supporting JSON-RPC batches), each function is called concurrently.
+
+    Args:
+        w3 (AsyncWeb3): Configured web3 instance
+        contract_address (ChecksumAddress): Contract address
+        contract_version (ContractVersion): Contract version
+
+    Returns:
+        TokenMetadata: Token metadata
+
+    Raises:
+        CallFailed: If any of the calls fails
+    """
+    requests = build_metadata_requests(contract_address, contract_version)
+    try:
+        responses = await w3.provider.make_batch_request(requests)
+    except Exception:
+        responses = None
+
+    if not isinstance(responses, Sequence):
+        responses = await asyncio.gather(
+            *(w3.provider.make_request(method, params) for method, params in requests)
+        )
+
+    return decode_metadata_responses(responses, contract_version)
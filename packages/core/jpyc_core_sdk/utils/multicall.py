@@ -0,0 +1,183 @@
+from collections.abc import Iterator, Sequence
+from functools import cache
+from typing import Any, NamedTuple
+
+from hexbytes import HexBytes
+from web3 import Web3
+from web3.types import BlockIdentifier
+
+from .addresses import MULTICALL3_ADDRESS
+from .artifacts import load_multicall3_artifacts
+from .calls import ViewFunction, decode_revert_reason
+from .constants import (
+    DEFAULT_MULTICALL_CALLDATA_SIZE,
+    DEFAULT_MULTICALL_GAS_LIMIT,
+    MULTICALL_GAS_PER_CALL,
+)
+from .errors import CallFailed
+from .validators import ChecksumAddress
+
+
+class Call(NamedTuple):
+    """A view call to aggregate.
+
+    Attributes:
+        target (ChecksumAddress): Address of contract to call
+        function (ViewFunction): Codec of the function
+        args (Sequence[Any]): Arguments of the function
+    """
+
+    target: ChecksumAddress
+    function: ViewFunction
+    args: Sequence[Any]
+
+
+@cache
+def get_aggregate3_function() -> ViewFunction:
+    """Get a cached codec of `aggregate3` function of Multicall3.
+
+    Returns:
+        ViewFunction: Codec of `aggregate3` function
+    """
+    return ViewFunction.from_abi(
+        abi=load_multicall3_artifacts().abi,
+        name="aggregate3",
+    )
+
+
+def calc_encoded_size(calldata: bytes) -> int:
+    """Calculate the size of a `Call3` struct in `aggregate3` calldata.
+
+    Args:
+        calldata (bytes): Calldata of the call
+
+    Returns:
+        int: Size in bytes (offset, target, allowFailure, length & padded data)
+    """
+    return 32 * 5 + -(-len(calldata) // 32) * 32
+
+
+def chunk_calls(
+    calldata_list: Sequence[bytes],
+    max_calldata_size: int = DEFAULT_MULTICALL_CALLDATA_SIZE,
+    gas_limit: int = DEFAULT_MULTICALL_GAS_LIMIT,
+) -> Iterator[range]:
+    """Split calls into chunks that fit in a single `aggregate3` call.
+
+    Note:
+        A chunk always contains at least one call, \
+        even if the call alone exceeds the limits.
+
+    Args:
+        calldata_list (Sequence[bytes]): Calldata of each call
+        max_calldata_size (int): Maximum calldata size (in bytes) of each chunk
+        gas_limit (int): Gas budget of each chunk
+
+    Yields:
+        range: Indices of calls in each chunk
+    """
+    max_calls = max(gas_limit // MULTICALL_GAS_PER_CALL, 1)
+    start = 0
+    size = 4 + 32 * 2
+
+    for i, calldata in enumerate(calldata_list):
+        encoded_size = calc_encoded_size(calldata)
+        if i > start and (
+            size + encoded_size > max_calldata_size or i - start >= max_calls
+        ):
+            yield range(start, i)
+            start = i
+            size = 4 + 32 * 2
+        size += encoded_size
+
+    if start < len(calldata_list):
+        yield range(start, len(calldata_list))
+
+
+def aggregate3(
+    w3: Web3,
+    calls: Sequence[Call],
+    multicall_address: ChecksumAddress = MULTICALL3_ADDRESS,
+    max_calldata_size: int = DEFAULT_MULTICALL_CALLDATA_SIZE,
+    gas_limit: int = DEFAULT_MULTICALL_GAS_LIMIT,
+    block_identifier: BlockIdentifier = "latest",
+) -> list[Any]:
+    """Call many view functions via `aggregate3` function of Multicall3.
+
+    Note:
+        Calls are split into chunks by calldata size & gas budget, \
+        and each chunk is sent as a single `eth_call`. \
+        Every call is made with `allowFailure` enabled, \
+        so each failed call is returned as a `CallFailed` instance \
+        in place of its result. If a chunk fails as a whole, \
+        every call of the chunk fails.
+
+    Args:
+        w3 (Web3): Configured web3 instance
+        calls (Sequence[Call]): Calls to aggregate
+        multicall_address (ChecksumAddress): Address of Multicall3 contract
+        max_calldata_size (int): Maximum calldata size (in bytes) of each chunk
+        gas_limit (int): Gas budget of each chunk
+        block_identifier (BlockIdentifier): Block to call the functions at
+
+    Returns:
+        list[Any]: Decoded values (or `CallFailed`) in the order of `calls`
+    """
+    aggregate3_function = get_aggregate3_function()
+    calldata_list = [HexBytes(call.function.encode(call.args)) for call in calls]
+    results: list[Any] = []
+
+    for chunk in chunk_calls(
+        calldata_list=calldata_list,
+        max_calldata_size=max_calldata_size,
+        gas_limit=gas_limit,
+    ):
+        data = aggregate3_function.encode(
+            [[(calls[i].target, True, calldata_list[i]) for i in chunk]]
+        )
+        try:
+            return_data = w3.eth.call(
+                {"to": multicall_address, "data": data},
+                block_identifier,
+            )
+            decoded = aggregate3_function.decode(return_data)
+            if len(decoded) != len(chunk):
+                raise ValueError("Unexpected number of results in aggregate3.")
+        except Exception as e:
+            results.extend(CallFailed(str(e)) for _ in chunk)
+            continue
+
+        for i, (success, result) in zip(chunk, decoded, strict=True):
+            if not success:
+                results.append(CallFailed(decode_revert_reason(result)))
+                continue
+            try:
+                results.append(calls[i].function.decode(result))
+            except Exception as e:
+                results.append(CallFailed(str(e)))
+
+    return results
+
+
+def deploy_multicall3(w3: Web3) -> ChecksumAddress:
+    """Deploy Multicall3 contract to the configured network.
+
+    Note:
+        This helper function is mainly for development purposes. \
+        Please use this function to deploy contracts to localhost network, \
+        where Multicall3 is not deployed at the canonical address.
+
+    Args:
+        w3 (Web3): Configured web3 instance
+
+    Returns:
+        ChecksumAddress: Address of the deployed contract
+    """
+    artifacts = load_multicall3_artifacts()
+    contract = w3.eth.contract(
+        abi=artifacts.abi,
+        bytecode=artifacts.bytecode,
+    )
+    tx_hash = contract.constructor().transact()
+
+    return w3.eth.wait_for_transaction_receipt(tx_hash).contractAddress  # type: ignore[attr-defined]
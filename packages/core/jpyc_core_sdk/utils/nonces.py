@@ -0,0 +1,239 @@
+from bisect import insort
+from threading import Lock
+
+from web3 import AsyncWeb3, Web3
+
+from .constants import KNOWN_TRANSACTION_MESSAGES, NONCE_ERROR_MESSAGES
+from .validators import ChecksumAddress
+
+
+def is_nonce_error(error: Exception | str) -> bool:
+    """Checks if the given error is caused by a stale nonce.
+
+    Args:
+        error (Exception | str): Error (or its message) of sending a transaction
+
+    Returns:
+        bool: True if the nonce is already used (or pending), false otherwise
+    """
+    message = str(error).lower()
+
+    return any(pattern in message for pattern in NONCE_ERROR_MESSAGES)
+
+
+def is_known_transaction_error(error: Exception | str) -> bool:
+    """Checks if the given error is caused by the same transaction already sent.
+
+    Note:
+        Such errors (e.g., `already known`) mean that the signed transaction \
+        is already in the mempool (i.e., it must not be sent with another nonce).
+
+    Args:
+        error (Exception | str): Error (or its message) of sending a transaction
+
+    Returns:
+        bool: True if the transaction is already known, false otherwise
+    """
+    message = str(error).lower()
+
+    return any(pattern in message for pattern in KNOWN_TRANSACTION_MESSAGES)
+
+
+class NonceManager:
+    """Thread-safe & asyncio-safe manager that reserves nonces of an account locally.
+
+    Note:
+        The next nonce is fetched from the network (including pending \
+        transactions) on the first reservation only, and incremented locally \
+        afterwards, so that transactions can be sent back-to-back without \
+        fetching `eth_getTransactionCount` each time. \
+        Nonces of transactions that are never broadcast should be released \
+        to fill the gaps, those of broadcast ones should be committed, \
+        and the state should be resynchronized with the network when a nonce \
+        turns out to be stale. \
+        The internal lock is never held across `await`.
+    """
+
+    def __init__(self, address: ChecksumAddress) -> None:
+        """Constructor that initializes nonce manager.
+
+        Args:
+            address (ChecksumAddress): Account address
+        """
+        self.__lock = Lock()
+        self.__next_nonce: int | None = None
+        self.__released: list[int] = []
+        self.__reserved: set[int] = set()
+
+        self.address = address
+        """ChecksumAddress: Account address"""
+
+    def __take(self) -> int:
+        """Take the lowest released nonce, or the next nonce.
+
+        Note:
+            The lock must be acquired & the state must be synchronized.
+
+        Returns:
+            int: Reserved nonce
+        """
+        if self.__released:
+            nonce = self.__released.pop(0)
+        else:
+            nonce = self.__next_nonce  # type: ignore[assignment]
+            self.__next_nonce = nonce + 1
+        self.__reserved.add(nonce)
+
+        return nonce
+
+    def __sync(self, transaction_count: int) -> int:
+        """Synchronize the state with the transaction count of the network.
+
+        Note:
+            The lock must be acquired. While any reservation is outstanding \
+            (i.e., neither released nor committed), nonces reserved locally \
+            but not yet seen by the network are never handed out again. \
+            Otherwise, the transaction count of the network is taken as is, \
+            so that gaps of dropped or replaced transactions are closed.
+
+        Args:
+            transaction_count (int): Transaction count including pending ones
+
+        Returns:
+            int: Next nonce
+        """
+        if self.__reserved:
+            self.__next_nonce = max(transaction_count, self.__next_nonce or 0)
+        else:
+            self.__next_nonce = transaction_count
+        self.__released = [
+            n for n in self.__released if transaction_count <= n < self.__next_nonce
+        ]
+
+        return self.__next_nonce
+
+    def reserve(self, w3: Web3) -> int:
+        """Reserve the next nonce.
+
+        Args:
+            w3 (Web3): Configured web3 instance
+
+        Returns:
+            int: Reserved nonce
+        """
+        with self.__lock:
+            if self.__next_nonce is None:
+                self.__sync(
+                    w3.eth.get_transaction_count(
+                        self.address,  # type: ignore[arg-type]
+                        "pending",
+                    )
+                )
+
+            return self.__take()
+
+    async def async_reserve(self, w3: AsyncWeb3) -> int:
+        """Reserve the next nonce in asyncio.
+
+        Args:
+            w3 (AsyncWeb3): Configured web3 instance
+
+        Returns:
+            int: Reserved nonce
+        """
+        with self.__lock:
+            if self.__next_nonce is not None:
+                return self.__take()
+
+        transaction_count = await w3.eth.get_transaction_count(
+            self.address,  # type: ignore[arg-type]
+            "pending",
+        )
+
+        with self.__lock:
+            if self.__next_nonce is None:
+                self.__sync(transaction_count)
+
+            return self.__take()
+
+    def release(self, nonce: int) -> None:
+        """Release a reserved nonce that is never broadcast.
+
+        Note:
+            Released nonces are reserved again (in ascending order) \
+            before the next nonce, so that no gap blocks later transactions.
+
+        Args:
+            nonce (int): Reserved nonce
+        """
+        with self.__lock:
+            self.__reserved.discard(nonce)
+            if self.__next_nonce is None or nonce >= self.__next_nonce:
+                return
+            if nonce in self.__released:
+                return
+
+            insort(self.__released, nonce)
+            while self.__released and self.__released[-1] == self.__next_nonce - 1:
+                self.__released.pop()
+                self.__next_nonce -= 1
+
+    def commit(self, nonce: int) -> None:
+        """Mark a reserved nonce as broadcast (or possibly broadcast).
+
+        Args:
+            nonce (int): Reserved nonce
+        """
+        with self.__lock:
+            self.__reserved.discard(nonce)
+
+    def resync(self, w3: Web3) -> int:
+        """Resynchronize with the network (e.g., on `nonce too low` errors).
+
+        Note:
+            If no reservation is outstanding, the next nonce is taken from \
+            the network even if lower than the local one (e.g., after dropped \
+            or replaced transactions).
+
+        Args:
+            w3 (Web3): Configured web3 instance
+
+        Returns:
+            int: Next nonce
+        """
+        transaction_count = w3.eth.get_transaction_count(
+            self.address,  # type: ignore[arg-type]
+            "pending",
+        )
+
+        with self.__lock:
+            return self.__sync(transaction_count)
+
+    async def async_resync(self, w3: AsyncWeb3) -> int:
+        """Resynchronize with the network in asyncio.
+
+        Note:
+            If no reservation is outstanding, the next nonce is taken from \
+            the network even if lower than the local one (e.g., after dropped \
+            or replaced transactions).
+
+        Args:
+            w3 (AsyncWeb3): Configured web3 instance
+
+        Returns:
+            int: Next nonce
+        """
+        transaction_count = await w3.eth.get_transaction_count(
+            self.address,  # type: ignore[arg-type]
+            "pending",
+        )
+
+        with self.__lock:
+            return self.__sync(transaction_count)
+
+    def reset(self) -> None:
+        """Discard the local state so that the next reservation resynchronizes."""
+        with self.__lock:
+            self.__next_nonce = None
+            self.__released = []
+            self.__reserved = set()
@@ -0,0 +1,459 @@
+import time
+from collections.abc import Mapping
+from threading import Lock
+from typing import Any
+
+from eth_keys import keys
+from hexbytes import HexBytes
+from web3.types import TxReceipt
+
+from .constants import (
+    DEFAULT_BLOCK_TIMESTAMP_TTL,
+    DEFAULT_PENDING_TTL,
+    PENDING_FUNCTIONS,
+    SECP256K1N_HALF,
+)
+from .errors import PreflightCheckFailed
+from .signatures import TypedDataSigner
+
+
+def recover_signer(message_hash: bytes, v: int, r: str | bytes, s: str | bytes) -> str:
+    """Recover the signer of a message hash (as `ecrecover` of the contracts).
+
+    Args:
+        message_hash (bytes): Message hash (e.g., EIP-712 digest)
+        v (int): v of ECDSA
+        r (str | bytes): r of ECDSA
+        s (str | bytes): s of ECDSA
+
+    Returns:
+        str: Checksum address of the signer
+
+    Raises:
+        PreflightCheckFailed: If the signature is malformed
+    """
+    r_ = int.from_bytes(HexBytes(r), "big")
+    s_ = int.from_bytes(HexBytes(s), "big")
+    if s_ > SECP256K1N_HALF:
+        raise PreflightCheckFailed("invalid signature 's' value")
+    if v not in (27, 28):
+        raise PreflightCheckFailed("invalid signature 'v' value")
+
+    try:
+        signature = keys.Signature(vrs=(v - 27, r_, s_))
+        public_key = signature.recover_public_key_from_msg_hash(message_hash)
+    except Exception:
+        raise PreflightCheckFailed("invalid signature")
+
+    return public_key.to_checksum_address()
+
+
+def get_used_authorization(
+    func_name: str, func_args: Mapping[str, Any]
+) -> tuple[str, bytes] | None:
+    """Get the authorization used (or canceled) by a contract function.
+
+    Args:
+        func_name (str): Name of contract function
+        func_args (Mapping[str, Any]): Arguments of the function
+
+    Returns:
+        tuple[str, bytes] | None: Authorizer address & nonce \
+        (None for the other functions)
+    """
+    if func_name in ("transferWithAuthorization", "receiveWithAuthorization"):
+        return func_args["from"], bytes(HexBytes(func_args["nonce"]))
+    if func_name == "cancelAuthorization":
+        return func_args["authorizer"], bytes(HexBytes(func_args["nonce"]))
+
+    return None
+
+
+class PreflightValidator:
+    """Thread-safe offline validator of signed authorizations & permits.
+
+    Notes:
+        - Signatures, time windows & nonces are checked as the contracts do, \
+        so that bad requests are rejected without any RPC (i.e., before \
+        simulating transactions).
+        - Time windows are checked against the latest block timestamp \
+        observed (extrapolated by the elapsed time), or the local clock if \
+        none is observed yet. JPYC clients fetch the latest block again \
+        once the observed timestamp gets older than `block_timestamp_ttl`.
+        - Nonces are checked against a local cache, which is fed only by \
+        the chain (i.e., successful receipts, events, `authorizationState` \
+        & `nonces` calls), so that it may lag behind the chain (i.e., unknown \
+        nonces are regarded as unused). JPYC clients fetch nonces of permits \
+        if unknown, and once again if signatures of permits do not match.
+        - Nonces of sent transactions are kept pending until their receipts \
+        are recorded, so that the same authorizations are never sent twice \
+        meanwhile. Pending transactions are discarded on reverts, or \
+        regarded as dropped after `pending_ttl`.
+    """
+
+    def __init__(
+        self,
+        signer: TypedDataSigner,
+        pending_ttl: float = DEFAULT_PENDING_TTL,
+        block_timestamp_ttl: float = DEFAULT_BLOCK_TIMESTAMP_TTL,
+    ) -> None:
+        """Constructor that initializes pre-flight validator.
+
+        Args:
+            signer (TypedDataSigner): Signer with the domain separator & typehashes
+            pending_ttl (float): Time-to-live (in seconds) of pending transactions
+            block_timestamp_ttl (float): Time-to-live (in seconds) \
+            of observed block timestamps
+        """
+        self.__lock = Lock()
+        self.__block_timestamp: tuple[int, float] | None = None
+        self.__used_authorizations: set[tuple[str, bytes]] = set()
+        self.__permit_nonces: dict[str, int] = {}
+        self.__pending: dict[bytes, tuple[str, Mapping[str, Any], float]] = {}
+
+        self.signer = signer
+        """TypedDataSigner: Signer with the domain separator & typehashes"""
+        self.pending_ttl = pending_ttl
+        """float: Time-to-live (in seconds) of pending transactions"""
+        self.block_timestamp_ttl = block_timestamp_ttl
+        """float: Time-to-live (in seconds) of observed block timestamps"""
+
+    ###################
+    # Block timestamp #
+    ###################
+
+    def set_block_timestamp(self, timestamp: int) -> None:
+        """Observe the timestamp of the latest block.
+
+        Args:
+            timestamp (int): Unix time of the latest block
+        """
+        with self.__lock:
+            self.__block_timestamp = (timestamp, time.monotonic())
+
+    def get_block_timestamp(self) -> float:
+        """Estimate the timestamp of the latest block.
+
+        Returns:
+            float: Estimated Unix time of the latest block
+        """
+        with self.__lock:
+            block_timestamp = self.__block_timestamp
+
+        if block_timestamp is None:
+            return time.time()
+
+        timestamp, observed_at = block_timestamp
+        return timestamp + time.monotonic() - observed_at
+
+    def is_block_timestamp_outdated(self) -> bool:
+        """Checks if the block timestamp should be observed (again).
+
+        Returns:
+            bool: True if none is observed within `block_timestamp_ttl`, \
+            false otherwise
+        """
+        with self.__lock:
+            block_timestamp = self.__block_timestamp
+
+        return (
+            block_timestamp is None
+            or time.monotonic() - block_timestamp[1] >= self.block_timestamp_ttl
+        )
+
+    ##########
+    # Nonces #
+    ##########
+
+    def mark_authorization_used(self, authorizer: str, nonce: str | bytes) -> None:
+        """Mark an authorization as used (or canceled) on chain.
+
+        Note:
+            Marked authorizations are trusted by `authorizationState` calls \
+            of JPYC clients (i.e., answered without RPC), so that only ones \
+            observed on chain (e.g., by receipts or events) should be marked.
+
+        Args:
+            authorizer (str): Authorizer address
+            nonce (str | bytes): Nonce of the authorization
+        """
+        with self.__lock:
+            self.__used_authorizations.add((authorizer, bytes(HexBytes(nonce))))
+
+    def is_authorization_used(self, authorizer: str, nonce: str | bytes) -> bool:
+        """Checks if an authorization is known to be used (or canceled).
+
+        Args:
+            authorizer (str): Authorizer address
+            nonce (str | bytes): Nonce of the authorization
+
+        Returns:
+            bool: True if used, false otherwise (or if unknown)
+        """
+        with self.__lock:
+            return (authorizer, bytes(HexBytes(nonce))) in self.__used_authorizations
+
+    def is_authorization_pending(self, authorizer: str, nonce: str | bytes) -> bool:
+        """Checks if an authorization is used (or canceled) by a pending transaction.
+
+        Args:
+            authorizer (str): Authorizer address
+            nonce (str | bytes): Nonce of the authorization
+
+        Returns:
+            bool: True if pending, false otherwise
+        """
+        key = (authorizer, bytes(HexBytes(nonce)))
+        with self.__lock:
+            self.__purge_pending()
+            return any(
+                get_used_authorization(func_name, func_args) == key
+                for func_name, func_args, _ in self.__pending.values()
+            )
+
+    def set_permit_nonce(self, owner: str, nonce: int) -> None:
+        """Observe the nonce of an owner for permits (e.g., by `nonces` function).
+
+        Args:
+            owner (str): Owner address
+            nonce (int): Nonce of the next permit
+        """
+        with self.__lock:
+            self.__permit_nonces[owner] = nonce
+
+    def get_permit_nonce(self, owner: str) -> int | None:
+        """Get the nonce of an owner for permits.
+
+        Args:
+            owner (str): Owner address
+
+        Returns:
+            int | None: Nonce of the next permit (None if unknown)
+        """
+        with self.__lock:
+            return self.__permit_nonces.get(owner)
+
+    ##########
+    # Checks #
+    ##########
+
+    def check_authorization(
+        self,
+        typehash: bytes,
+        from_: str,
+        to: str,
+        value: int,
+        valid_after: int,
+        valid_before: int,
+        nonce: str | bytes,
+        v: int,
+        r: str | bytes,
+        s: str | bytes,
+    ) -> None:
+        """Check a `TransferWithAuthorization` or `ReceiveWithAuthorization`.
+
+        Args:
+            typehash (bytes): Typehash of the message
+            from_ (str): Payer address
+            to (str): Payee address
+            value (int): Amount to transfer (with decimals removed)
+            valid_after (int): Unix time when the authorization becomes valid
+            valid_before (int): Unix time when the authorization expires
+            nonce (str | bytes): Unique nonce
+            v (int): v of ECDSA
+            r (str | bytes): r of ECDSA
+            s (str | bytes): s of ECDSA
+
+        Raises:
+            PreflightCheckFailed: If any of the checks fails
+        """
+        now = self.get_block_timestamp()
+        if now <= valid_after:
+            raise PreflightCheckFailed("authorization is not yet valid")
+        if now >= valid_before:
+            raise PreflightCheckFailed("authorization is expired")
+        if self.is_authorization_used(from_, nonce):
+            raise PreflightCheckFailed("authorization is used or canceled")
+        if self.is_authorization_pending(from_, nonce):
+            raise PreflightCheckFailed("authorization is pending")
+
+        message_hash = self.signer.hash_authorization(
+            typehash, from_, to, value, valid_after, valid_before, nonce
+        )
+        if recover_signer(message_hash, v, r, s) != from_:
+            raise PreflightCheckFailed("invalid signature")
+
+    def check_cancel_authorization(
+        self,
+        authorizer: str,
+        nonce: str | bytes,
+        v: int,
+        r: str | bytes,
+        s: str | bytes,
+    ) -> None:
+        """Check a `CancelAuthorization`.
+
+        Args:
+            authorizer (str): Authorizer address
+            nonce (str | bytes): Nonce of the authorization
+            v (int): v of ECDSA
+            r (str | bytes): r of ECDSA
+            s (str | bytes): s of ECDSA
+
+        Raises:
+            PreflightCheckFailed: If any of the checks fails
+        """
+        if self.is_authorization_used(authorizer, nonce):
+            raise PreflightCheckFailed("authorization is used or canceled")
+        if self.is_authorization_pending(authorizer, nonce):
+            raise PreflightCheckFailed("authorization is pending")
+
+        message_hash = self.signer.hash_cancel_authorization(authorizer, nonce)
+        if recover_signer(message_hash, v, r, s) != authorizer:
+            raise PreflightCheckFailed("invalid signature")
+
+    def check_permit(
+        self,
+        owner: str,
+        spender: str,
+        value: int,
+        deadline: int,
+        v: int,
+        r: str | bytes,
+        s: str | bytes,
+    ) -> None:
+        """Check a `Permit`.
+
+        Note:
+            Signatures are checked only if the nonce of `owner` is known, \
+            since it is signed but not supplied to `permit` function.
+
+        Args:
+            owner (str): Owner address
+            spender (str): Spender address
+            value (int): Amount of allowance (with decimals removed)
+            deadline (int): Unix time when the permit expires
+            v (int): v of ECDSA
+            r (str | bytes): r of ECDSA
+            s (str | bytes): s of ECDSA
+
+        Raises:
+            PreflightCheckFailed: If any of the checks fails
+        """
+        if self.get_block_timestamp() > deadline:
+            raise PreflightCheckFailed("permit is expired")
+
+        nonce = self.get_permit_nonce(owner)
+        if nonce is None:
+            return
+
+        message_hash = self.signer.hash_permit(owner, spender, value, nonce, deadline)
+        if recover_signer(message_hash, v, r, s) != owner:
+            raise PreflightCheckFailed("invalid signature")
+
+    def check(
+        self, func_name: str, func_args: Mapping[str, Any], caller: str | None = None
+    ) -> None:
+        """Check arguments of a contract function (no-op for the others).
+
+        Args:
+            func_name (str): Name of contract function
+            func_args (Mapping[str, Any]): Arguments of the function
+            caller (str, optional): Address of the sender of the transaction \
+            (unchecked if None)
+
+        Raises:
+            PreflightCheckFailed: If any of the checks fails
+        """
+        metadata = self.signer.metadata
+        if func_name in ("transferWithAuthorization", "receiveWithAuthorization"):
+            if func_name == "transferWithAuthorization":
+                typehash = metadata.transfer_with_authorization_typehash
+            elif caller is not None and caller != func_args["to"]:
+                raise PreflightCheckFailed("caller must be the payee")
+            else:
+                typehash = metadata.receive_with_authorization_typehash
+            self.check_authorization(
+                typehash=typehash,
+                from_=func_args["from"],
+                to=func_args["to"],
+                value=func_args["value"],
+                valid_after=func_args["validAfter"],
+                valid_before=func_args["validBefore"],
+                nonce=func_args["nonce"],
+                v=func_args["v"],
+                r=func_args["r"],
+                s=func_args["s"],
+            )
+        elif func_name == "cancelAuthorization":
+            self.check_cancel_authorization(**func_args)
+        elif func_name == "permit":
+            self.check_permit(**func_args)
+
+    ###########
+    # Records #
+    ###########
+
+    def __purge_pending(self) -> None:
+        """Discard pending transactions regarded as dropped (with the lock held)."""
+        now = time.monotonic()
+        for tx_hash in [
+            tx_hash
+            for tx_hash, (_, _, expires_at) in self.__pending.items()
+            if expires_at <= now
+        ]:
+            del self.__pending[tx_hash]
+
+    def record(
+        self, tx_hash: str | bytes, func_name: str, func_args: Mapping[str, Any]
+    ) -> None:
+        """Record a sent transaction as pending until its receipt is recorded.
+
+        Args:
+            tx_hash (str | bytes): Transaction hash
+            func_name (str): Name of contract function
+            func_args (Mapping[str, Any]): Arguments of the function
+        """
+        if func_name not in PENDING_FUNCTIONS:
+            return
+
+        with self.__lock:
+            self.__purge_pending()
+            self.__pending[bytes(HexBytes(tx_hash))] = (
+                func_name,
+                dict(func_args),
+                time.monotonic() + self.pending_ttl,
+            )
+
+    def record_receipt(self, receipt: TxReceipt) -> None:
+        """Record nonces consumed by a mined transaction (if recorded as pending).
+
+        Note:
+            Nonces are marked used only if the transaction succeeded.
+
+        Args:
+            receipt (TxReceipt): Transaction receipt
+        """
+        with self.__lock:
+            pending = self.__pending.pop(bytes(receipt["transactionHash"]), None)
+        if pending is None or receipt.get("status") == 0:
+            return
+
+        func_name, func_args, _ = pending
+        authorization = get_used_authorization(func_name, func_args)
+        if authorization is not None:
+            self.mark_authorization_used(*authorization)
+        elif func_name == "permit":
+            with self.__lock:
+                nonce = self.__permit_nonces.get(func_args["owner"])
+                if nonce is not None:
+                    self.__permit_nonces[func_args["owner"]] = nonce + 1
+
+    def discard(self, tx_hash: str | bytes) -> None:
+        """Discard a pending transaction (e.g., reverted or dropped).
+
+        Args:
+            tx_hash (str | bytes): Transaction hash
+        """
+        with self.__lock:
+            self.__pending.pop(bytes(HexBytes(tx_hash)), None)
@@ -0,0 +1,576 @@
+import asyncio
+import time
+from collections.abc import Awaitable, Callable, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from threading import Lock
+from typing import Any, TypeVar
+
+from web3 import AsyncHTTPProvider, HTTPProvider, Web3
+from web3.types import RPCEndpoint, RPCResponse
+
+from .constants import DEFAULT_HEDGE_DELAY, HEDGED_METHODS
+from .endpoints import ENDPOINT_MONITOR, EndpointMonitor, is_failover_error
+from .nonces import is_known_transaction_error, is_nonce_error
+from .sessions import SESSION_POOL, SessionPool
+
+T = TypeVar("T")
+
+
+def resolve_resent_transaction(
+    tx_hash: str, response: RPCResponse, found: RPCResponse
+) -> RPCResponse:
+    """Resolve the response of `eth_sendRawTransaction` resent to another endpoint.
+
+    Note:
+        A transaction whose request failed ambiguously (e.g., timed out) \
+        could have been broadcast anyway, in which case resending it results in \
+        errors (e.g., `already known` or `nonce too low`). Such errors are turned into \
+        the transaction hash if the transaction is found, so that callers never \
+        send the same payment again with another nonce.
+
+    Args:
+        tx_hash (str): Transaction hash
+        response (RPCResponse): Response of the resent request
+        found (RPCResponse): Response of `eth_getTransactionByHash`
+
+    Returns:
+        RPCResponse: Resolved response
+    """
+    if found.get("result") is None:
+        return response
+
+    return {"jsonrpc": "2.0", "id": response.get("id"), "result": tx_hash}
+
+
+def is_resent_duplicate(method: RPCEndpoint, response: RPCResponse) -> bool:
+    """Checks if a resent request might have been a duplicate transaction.
+
+    Args:
+        method (RPCEndpoint): JSON-RPC method
+        response (RPCResponse): Response of the resent request
+
+    Returns:
+        bool: True if `eth_sendRawTransaction` failed with a nonce error \
+        (or as an already known transaction)
+    """
+    return (
+        method == "eth_sendRawTransaction"
+        and "error" in response
+        and (
+            is_nonce_error(str(response["error"]))
+            or is_known_transaction_error(str(response["error"]))
+        )
+    )
+
+
+def is_hedgeable(methods: Sequence[RPCEndpoint]) -> bool:
+    """Checks if requests could be hedged (i.e., sent to multiple endpoints at once).
+
+    Args:
+        methods (Sequence[RPCEndpoint]): JSON-RPC methods of the requests
+
+    Returns:
+        bool: True if every method is read-only, false otherwise (e.g., mutations)
+    """
+    return len(methods) > 0 and all(method in HEDGED_METHODS for method in methods)
+
+
+def validate_hedge_percentile(hedge_percentile: float | None) -> None:
+    """Validate a latency percentile after which requests are hedged.
+
+    Args:
+        hedge_percentile (float, optional): Latency percentile
+
+    Raises:
+        ValueError: If `hedge_percentile` is not in the range of (0, 100]
+    """
+    if hedge_percentile is not None and not 0 < hedge_percentile <= 100:
+        raise ValueError("Hedge percentile must be in the range of (0, 100].")
+
+
+class FailoverHTTPProvider(HTTPProvider):
+    """HTTP provider that routes requests across multiple RPC endpoints.
+
+    Note:
+        Each request is routed to the healthy endpoint with the lowest latency, \
+        and fails over to the next one on timeouts, connection errors, \
+        5xx & 429 (i.e., never surfaced to callers unless every endpoint fails). \
+        Latencies & health of endpoints are shared among providers via \
+        an endpoint monitor, and HTTP sessions via a session pool. \
+        If hedging is enabled, read requests unanswered within a percentile of \
+        latencies of the preferred endpoint are duplicated to the next one, \
+        and the first answer is taken (mutations are never hedged).
+    """
+
+    def __init__(
+        self,
+        endpoints: Sequence[str],
+        session_pool: SessionPool = SESSION_POOL,
+        monitor: EndpointMonitor = ENDPOINT_MONITOR,
+        hedge_percentile: float | None = None,
+    ) -> None:
+        """Constructor that initializes failover HTTP provider.
+
+        Args:
+            endpoints (Sequence[str]): RPC endpoints (in order of preference)
+            session_pool (SessionPool): Pool of HTTP sessions
+            monitor (EndpointMonitor): Monitor of endpoints
+            hedge_percentile (float, optional): Latency percentile \
+            after which read requests are hedged (disabled if None)
+
+        Raises:
+            ValueError: If `endpoints` is empty or `hedge_percentile` is invalid
+        """
+        if len(endpoints) == 0:
+            raise ValueError("At least one endpoint is required.")
+        validate_hedge_percentile(hedge_percentile)
+
+        super().__init__(endpoints[0])
+        self._request_session_manager = session_pool
+        self.__providers: dict[str, HTTPProvider] = {}
+        self.__executor: ThreadPoolExecutor | None = None
+        self.__executor_lock = Lock()
+        self.__max_workers = session_pool.pool_size
+        for endpoint in dict.fromkeys(endpoints):
+            # failover takes the place of retries
+            self.__providers[endpoint] = session_pool.http_provider(
+                endpoint, retry=False
+            )
+
+        self.endpoints = list(self.__providers)
+        """list[str]: RPC endpoints"""
+        self.monitor = monitor
+        """EndpointMonitor: Monitor of endpoints"""
+        self.hedge_percentile = hedge_percentile
+        """float | None: Latency percentile after which read requests are hedged"""
+
+    def __attempt(
+        self, endpoint: str, send: Callable[[HTTPProvider, bool], T], resent: bool
+    ) -> T:
+        """Send a request to an endpoint & record its latency or failure.
+
+        Args:
+            endpoint (str): RPC endpoint
+            send (Callable[[HTTPProvider, bool], T]): Function to send the request \
+            with a provider (& whether the request is resent)
+            resent (bool): Whether the request is resent
+
+        Returns:
+            T: Response
+        """
+        start = time.perf_counter()
+        try:
+            response = send(self.__providers[endpoint], resent)
+        except Exception as e:
+            if is_failover_error(e):
+                self.monitor.record_failure(endpoint)
+            raise
+
+        self.monitor.record_success(endpoint, time.perf_counter() - start)
+        return response
+
+    def __route(
+        self,
+        send: Callable[[HTTPProvider, bool], T],
+        endpoints: Sequence[str] | None = None,
+    ) -> T:
+        """Send a request to endpoints in order of preference until it succeeds.
+
+        Args:
+            send (Callable[[HTTPProvider, bool], T]): Function to send the request \
+            with a provider (& whether the request is resent)
+            endpoints (Sequence[str], optional): Endpoints to try \
+            (defaults to all endpoints in order of preference)
+
+        Returns:
+            T: Response
+
+        Raises:
+            Exception: Error of the last endpoint if every endpoint fails
+        """
+        last_error: Exception | None = None
+        for endpoint in (
+            endpoints if endpoints is not None else self.monitor.rank(self.endpoints)
+        ):
+            try:
+                return self.__attempt(endpoint, send, last_error is not None)
+            except Exception as e:
+                if not is_failover_error(e):
+                    raise
+                last_error = e
+
+        raise last_error  # type: ignore[misc]
+
+    def __get_executor(self) -> ThreadPoolExecutor:
+        """Get the executor of hedged requests (created on first use).
+
+        Returns:
+            ThreadPoolExecutor: Executor
+        """
+        with self.__executor_lock:
+            if self.__executor is None:
+                self.__executor = ThreadPoolExecutor(
+                    max_workers=self.__max_workers,
+                    thread_name_prefix="jpyc-hedge",
+                )
+
+            return self.__executor
+
+    def __hedge(self, send: Callable[[HTTPProvider, bool], T]) -> T:
+        """Send a read request, hedging it to the second preferred endpoint.
+
+        Note:
+            The hedged request is sent if the preferred endpoint does not answer \
+            within the latency percentile (or fails). Requests still in flight \
+            once answered are cancelled, or their responses are discarded \
+            if already sent (since `requests` cannot abort them).
+
+        Args:
+            send (Callable[[HTTPProvider, bool], T]): Function to send the request \
+            with a provider (& whether the request is resent)
+
+        Returns:
+            T: Response
+
+        Raises:
+            Exception: Error of the last endpoint if every endpoint fails
+        """
+        ranked = self.monitor.rank(self.endpoints)
+        if self.hedge_percentile is None or len(ranked) < 2:
+            return self.__route(send, ranked)
+
+        delay = self.monitor.get_latency_percentile(ranked[0], self.hedge_percentile)
+        executor = self.__get_executor()
+        pending: set[Future[T]] = {
+            executor.submit(self.__attempt, ranked[0], send, False)
+        }
+        hedged = False
+        last_error: Exception | None = None
+        try:
+            while pending:
+                done, pending = wait(
+                    pending,
+                    timeout=None if hedged else delay or DEFAULT_HEDGE_DELAY,
+                    return_when=FIRST_COMPLETED,
+                )
+                for future in done:
+                    error = future.exception()
+                    if error is None:
+                        return future.result()
+                    if not isinstance(error, Exception) or not is_failover_error(error):
+                        raise error
+                    last_error = error
+
+                if not hedged:
+                    hedged = True
+                    pending.add(executor.submit(self.__attempt, ranked[1], send, False))
+        finally:
+            for future in pending:
+                future.cancel()
+
+        if len(ranked) == 2:
+            raise last_error  # type: ignore[misc]
+        return self.__route(send, ranked[2:])
+
+    def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        def send(provider: HTTPProvider, resent: bool) -> RPCResponse:
+            response = provider.make_request(method, params)
+            if not resent or not is_resent_duplicate(method, response):
+                return response
+
+            tx_hash = Web3.keccak(hexstr=params[0]).to_0x_hex()
+            found = provider.make_request(
+                RPCEndpoint("eth_getTransactionByHash"), [tx_hash]
+            )
+            return resolve_resent_transaction(tx_hash, response, found)
+
+        if is_hedgeable([method]):
+            return self.__hedge(send)
+        return self.__route(send)
+
+    def make_batch_request(
+        self, batch_requests: list[tuple[RPCEndpoint, Any]]
+    ) -> list[RPCResponse] | RPCResponse:
+        def send(provider: HTTPProvider, _: bool) -> list[RPCResponse] | RPCResponse:
+            return provider.make_batch_request(batch_requests)
+
+        if is_hedgeable([method for method, _ in batch_requests]):
+            return self.__hedge(send)
+        return self.__route(send)
+
+    def __probe(self, endpoint: str) -> bool:
+        """Probe an endpoint with `eth_blockNumber`.
+
+        Args:
+            endpoint (str): RPC endpoint
+
+        Returns:
+            bool: True if healthy, false otherwise
+        """
+        start = time.perf_counter()
+        try:
+            response = self.__providers[endpoint].make_request(
+                RPCEndpoint("eth_blockNumber"), []
+            )
+            healthy = "error" not in response
+        except Exception:
+            healthy = False
+
+        if not healthy:
+            self.monitor.record_failure(endpoint)
+            return False
+
+        self.monitor.record_success(endpoint, time.perf_counter() - start)
+        return True
+
+    def check_health(self) -> dict[str, bool]:
+        """Probe every endpoint concurrently to measure its latency & health.
+
+        Returns:
+            dict[str, bool]: Health of each endpoint
+        """
+        with ThreadPoolExecutor(max_workers=len(self.endpoints)) as executor:
+            return dict(
+                zip(
+                    self.endpoints,
+                    executor.map(self.__probe, self.endpoints),
+                    strict=True,
+                )
+            )
+
+
+class AsyncFailoverHTTPProvider(AsyncHTTPProvider):
+    """Asyncio HTTP provider that routes requests across multiple RPC endpoints.
+
+    Note:
+        Each request is routed to the healthy endpoint with the lowest latency, \
+        and fails over to the next one on timeouts, connection errors, \
+        5xx & 429 (i.e., never surfaced to callers unless every endpoint fails). \
+        Latencies & health of endpoints are shared among providers via \
+        an endpoint monitor, and HTTP sessions via a session pool. \
+        If hedging is enabled, read requests unanswered within a percentile of \
+        latencies of the preferred endpoint are duplicated to the next one, \
+        and the first answer is taken (mutations are never hedged).
+    """
+
+    def __init__(
+        self,
+        endpoints: Sequence[str],
+        session_pool: SessionPool = SESSION_POOL,
+        monitor: EndpointMonitor = ENDPOINT_MONITOR,
+        hedge_percentile: float | None = None,
+    ) -> None:
+        """Constructor that initializes failover HTTP provider for asyncio.
+
+        Args:
+            endpoints (Sequence[str]): RPC endpoints (in order of preference)
+            session_pool (SessionPool): Pool of HTTP sessions
+            monitor (EndpointMonitor): Monitor of endpoints
+            hedge_percentile (float, optional): Latency percentile \
+            after which read requests are hedged (disabled if None)
+
+        Raises:
+            ValueError: If `endpoints` is empty or `hedge_percentile` is invalid
+        """
+        if len(endpoints) == 0:
+            raise ValueError("At least one endpoint is required.")
+        validate_hedge_percentile(hedge_percentile)
+
+        super().__init__(endpoints[0])
+        self._request_session_manager = session_pool
+        self.__providers: dict[str, AsyncHTTPProvider] = {}
+        for endpoint in dict.fromkeys(endpoints):
+            # failover takes the place of retries
+            self.__providers[endpoint] = session_pool.async_http_provider(
+                endpoint, retry=False
+            )
+
+        self.endpoints = list(self.__providers)
+        """list[str]: RPC endpoints"""
+        self.monitor = monitor
+        """EndpointMonitor: Monitor of endpoints"""
+        self.hedge_percentile = hedge_percentile
+        """float | None: Latency percentile after which read requests are hedged"""
+
+    async def __attempt(
+        self,
+        endpoint: str,
+        send: Callable[[AsyncHTTPProvider, bool], Awaitable[T]],
+        resent: bool,
+    ) -> T:
+        """Send a request to an endpoint & record its latency or failure.
+
+        Args:
+            endpoint (str): RPC endpoint
+            send (Callable[[AsyncHTTPProvider, bool], Awaitable[T]]): Function to \
+            send the request with a provider (& whether the request is resent)
+            resent (bool): Whether the request is resent
+
+        Returns:
+            T: Response
+        """
+        start = time.perf_counter()
+        try:
+            response = await send(self.__providers[endpoint], resent)
+        except Exception as e:
+            if is_failover_error(e):
+                self.monitor.record_failure(endpoint)
+            raise
+
+        self.monitor.record_success(endpoint, time.perf_counter() - start)
+        return response
+
+    async def __route(
+        self,
+        send: Callable[[AsyncHTTPProvider, bool], Awaitable[T]],
+        endpoints: Sequence[str] | None = None,
+    ) -> T:
+        """Send a request to endpoints in order of preference until it succeeds.
+
+        Args:
+            send (Callable[[AsyncHTTPProvider, bool], Awaitable[T]]): Function to \
+            send the request with a provider (& whether the request is resent)
+            endpoints (Sequence[str], optional): Endpoints to try \
+            (defaults to all endpoints in order of preference)
+
+        Returns:
+            T: Response
+
+        Raises:
+            Exception: Error of the last endpoint if every endpoint fails
+        """
+        last_error: Exception | None = None
+        for endpoint in (
+            endpoints if endpoints is not None else self.monitor.rank(self.endpoints)
+        ):
+            try:
+                return await self.__attempt(endpoint, send, last_error is not None)
+            except Exception as e:
+                if not is_failover_error(e):
+                    raise
+                last_error = e
+
+        raise last_error  # type: ignore[misc]
+
+    async def __hedge(
+        self, send: Callable[[AsyncHTTPProvider, bool], Awaitable[T]]
+    ) -> T:
+        """Send a read request, hedging it to the second preferred endpoint.
+
+        Note:
+            The hedged request is sent if the preferred endpoint does not answer \
+            within the latency percentile (or fails). Requests still in flight \
+            once answered are cancelled.
+
+        Args:
+            send (Callable[[AsyncHTTPProvider, bool], Awaitable[T]]): Function to \
+            send the request with a provider (& whether the request is resent)
+
+        Returns:
+            T: Response
+
+        Raises:
+            Exception: Error of the last endpoint if every endpoint fails
+        """
+        ranked = self.monitor.rank(self.endpoints)
+        if self.hedge_percentile is None or len(ranked) < 2:
+            return await self.__route(send, ranked)
+
+        delay = self.monitor.get_latency_percentile(ranked[0], self.hedge_percentile)
+        pending: set[asyncio.Task[T]] = {
+            asyncio.create_task(self.__attempt(ranked[0], send, False))
+        }
+        hedged = False
+        last_error: Exception | None = None
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending,
+                    timeout=None if hedged else delay or DEFAULT_HEDGE_DELAY,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                for task in done:
+                    error = task.exception()
+                    if error is None:
+                        return task.result()
+                    if not isinstance(error, Exception) or not is_failover_error(error):
+                        raise error
+                    last_error = error
+
+                if not hedged:
+                    hedged = True
+                    pending.add(
+                        asyncio.create_task(self.__attempt(ranked[1], send, False))
+                    )
+        finally:
+            for task in pending:
+                task.cancel()
+
+        if len(ranked) == 2:
+            raise last_error  # type: ignore[misc]
+        return await self.__route(send, ranked[2:])
+
+    async def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        async def send(provider: AsyncHTTPProvider, resent: bool) -> RPCResponse:
+            response = await provider.make_request(method, params)
+            if not resent or not is_resent_duplicate(method, response):
+                return response
+
+            tx_hash = Web3.keccak(hexstr=params[0]).to_0x_hex()
+            found = await provider.make_request(
+                RPCEndpoint("eth_getTransactionByHash"), [tx_hash]
+            )
+            return resolve_resent_transaction(tx_hash, response, found)
+
+        if is_hedgeable([method]):
+            return await self.__hedge(send)
+        return await self.__route(send)
+
+    async def make_batch_request(
+        self, batch_requests: list[tuple[RPCEndpoint, Any]]
+    ) -> list[RPCResponse] | RPCResponse:
+        async def send(
+            provider: AsyncHTTPProvider, _: bool
+        ) -> list[RPCResponse] | RPCResponse:
+            return await provider.make_batch_request(batch_requests)
+
+        if is_hedgeable([method for method, _ in batch_requests]):
+            return await self.__hedge(send)
+        return await self.__route(send)
+
+    async def __probe(self, endpoint: str) -> bool:
+        """Probe an endpoint with `eth_blockNumber`.
+
+        Args:
+            endpoint (str): RPC endpoint
+
+        Returns:
+            bool: True if healthy, false otherwise
+        """
+        start = time.perf_counter()
+        try:
+            response = await self.__providers[endpoint].make_request(
+                RPCEndpoint("eth_blockNumber"), []
+            )
+            healthy = "error" not in response
+        except Exception:
+            healthy = False
+
+        if not healthy:
+            self.monitor.record_failure(endpoint)
+            return False
+
+        self.monitor.record_success(endpoint, time.perf_counter() - start)
+        return True
+
+    async def check_health(self) -> dict[str, bool]:
+        """Probe every endpoint concurrently to measure its latency & health.
+
+        Returns:
+            dict[str, bool]: Health of each endpoint
+        """
+        results = await asyncio.gather(
+            *(self.__probe(endpoint) for endpoint in self.endpoints)
+        )
+
+        return dict(zip(self.endpoints, results, strict=True))
@@ -0,0 +1,261 @@
+import asyncio
+import time
+from collections import deque
+from dataclasses import dataclass, replace
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from threading import Lock
+from typing import Final
+
+import requests
+from aiohttp import ClientResponseError
+
+from .constants import (
+    MAX_RATE_LIMIT,
+    MIN_RATE_LIMIT,
+    RATE_LIMIT_DECREASE,
+    RATE_LIMIT_INCREASE,
+    RATE_LIMIT_WINDOW,
+)
+
+
+def is_throttled(error: Exception) -> bool:
+    """Checks if the given error is caused by rate limiting (i.e., 429).
+
+    Args:
+        error (Exception): Error raised when making an HTTP request
+
+    Returns:
+        bool: True if throttled, false otherwise
+    """
+    if isinstance(error, requests.HTTPError) and error.response is not None:
+        return error.response.status_code == 429
+    if isinstance(error, ClientResponseError):
+        return error.status == 429
+
+    return False
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse the value of a `Retry-After` header.
+
+    Args:
+        value (str, optional): Either delay (in seconds) or HTTP date
+
+    Returns:
+        float | None: Delay (in seconds) if parsable, None otherwise
+    """
+    if value is None:
+        return None
+
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    return max((retry_at - datetime.now(UTC)).total_seconds(), 0.0)
+
+
+def get_retry_after(error: Exception) -> float | None:
+    """Get the delay requested by the `Retry-After` header of a throttled request.
+
+    Args:
+        error (Exception): Error raised when making an HTTP request
+
+    Returns:
+        float | None: Delay (in seconds) if requested, None otherwise
+    """
+    if isinstance(error, requests.HTTPError) and error.response is not None:
+        return parse_retry_after(error.response.headers.get("Retry-After"))
+    if isinstance(error, ClientResponseError) and error.headers is not None:
+        return parse_retry_after(error.headers.get("Retry-After"))
+
+    return None
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """Rate limit of an RPC endpoint.
+
+    Attributes:
+        rate (float, optional): Sustainable rate (in requests/second) \
+        learned from throttled requests (None if never throttled)
+        tokens (float): Tokens left in the bucket (negative if reserved ahead)
+        updated_at (float): Monotonic time when `tokens` were last refilled
+        throttles (int): Number of throttled requests
+        decreased_at (float): Monotonic time when `rate` was last decreased
+    """
+
+    rate: float | None = None
+    tokens: float = 0.0
+    updated_at: float = 0.0
+    throttles: int = 0
+    decreased_at: float = 0.0
+
+
+class RateLimiter:
+    """Thread-safe adaptive rate limiter of RPC endpoints.
+
+    Note:
+        Requests to each endpoint are paced by a token bucket whose rate is \
+        learned by AIMD (additive increase, multiplicative decrease). \
+        Endpoints are unlimited until they throttle requests (i.e., 429), \
+        on which the rate is set to a fraction of the recently observed rate \
+        (at most once per window), and requests are held off until \
+        the delay requested by `Retry-After` headers. The rate then grows \
+        additively on every successful request to probe for more throughput.
+    """
+
+    def __init__(
+        self,
+        increase: float = RATE_LIMIT_INCREASE,
+        decrease: float = RATE_LIMIT_DECREASE,
+        min_rate: float = MIN_RATE_LIMIT,
+        max_rate: float = MAX_RATE_LIMIT,
+        window: float = RATE_LIMIT_WINDOW,
+    ) -> None:
+        """Constructor that initializes rate limiter.
+
+        Args:
+            increase (float): Additive increase (in requests/second per second)
+            decrease (float): Multiplicative decrease on throttled requests
+            min_rate (float): Minimum rate (in requests/second)
+            max_rate (float): Maximum rate (in requests/second)
+            window (float): Time window (in seconds) to measure request rates \
+            & burst sizes
+        """
+        self.__lock = Lock()
+        self.__limits: dict[str, RateLimit] = {}
+        self.__requested_at: dict[str, deque[float]] = {}
+
+        self.increase = increase
+        """float: Additive increase (in requests/second per second)"""
+        self.decrease = decrease
+        """float: Multiplicative decrease on throttled requests"""
+        self.min_rate = min_rate
+        """float: Minimum rate (in requests/second)"""
+        self.max_rate = max_rate
+        """float: Maximum rate (in requests/second)"""
+        self.window = window
+        """float: Time window (in seconds) to measure request rates & burst sizes"""
+
+    def get_rate_limit(self, endpoint: str) -> RateLimit:
+        """Get the rate limit of an endpoint.
+
+        Args:
+            endpoint (str): RPC endpoint
+
+        Returns:
+            RateLimit: Rate limit of the endpoint
+        """
+        with self.__lock:
+            return self.__limits.get(endpoint, RateLimit())
+
+    def reserve(self, endpoint: str) -> float:
+        """Reserve a token to send a request to an endpoint.
+
+        Note:
+            Tokens are reserved ahead (i.e., the bucket goes negative), \
+            so that concurrent callers are paced in order of reservations.
+
+        Args:
+            endpoint (str): RPC endpoint
+
+        Returns:
+            float: Delay (in seconds) to wait before sending the request
+        """
+        now = time.monotonic()
+        with self.__lock:
+            requested_at = self.__requested_at.setdefault(endpoint, deque())
+            requested_at.append(now)
+            while requested_at[0] < now - self.window:
+                requested_at.popleft()
+
+            limit = self.__limits.get(endpoint, RateLimit())
+            if limit.rate is None:
+                return 0.0
+
+            capacity = max(limit.rate * self.window, 1.0)
+            tokens = min(limit.tokens + (now - limit.updated_at) * limit.rate, capacity)
+            self.__limits[endpoint] = replace(limit, tokens=tokens - 1, updated_at=now)
+
+        return max(1 - tokens, 0.0) / limit.rate
+
+    def wait(self, endpoint: str) -> None:
+        """Block until a request could be sent to an endpoint.
+
+        Args:
+            endpoint (str): RPC endpoint
+        """
+        delay = self.reserve(endpoint)
+        if delay > 0:
+            time.sleep(delay)
+
+    async def async_wait(self, endpoint: str) -> None:
+        """Wait until a request could be sent to an endpoint (in asyncio).
+
+        Args:
+            endpoint (str): RPC endpoint
+        """
+        delay = self.reserve(endpoint)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def record_success(self, endpoint: str) -> None:
+        """Record a successful request (i.e., additive increase).
+
+        Args:
+            endpoint (str): RPC endpoint
+        """
+        with self.__lock:
+            limit = self.__limits.get(endpoint)
+            if limit is None or limit.rate is None:
+                return
+
+            # grows by `increase` per second when sent at the rate
+            rate = min(limit.rate + self.increase / limit.rate, self.max_rate)
+            self.__limits[endpoint] = replace(limit, rate=rate)
+
+    def record_throttle(self, endpoint: str, retry_after: float | None = None) -> None:
+        """Record a throttled request (i.e., multiplicative decrease).
+
+        Args:
+            endpoint (str): RPC endpoint
+            retry_after (float, optional): Delay (in seconds) requested by the endpoint
+        """
+        now = time.monotonic()
+        with self.__lock:
+            limit = self.__limits.get(endpoint, RateLimit())
+            rate = limit.rate
+            decreased_at = limit.decreased_at
+            # requests in flight when throttled decrease the rate only once
+            if rate is None or now - decreased_at >= self.window:
+                observed = len(self.__requested_at.get(endpoint, ())) / self.window
+                base = rate if rate is not None else observed
+                rate = max(base * self.decrease, self.min_rate)
+                decreased_at = now
+
+            self.__limits[endpoint] = replace(
+                limit,
+                rate=rate,
+                # held off until `Retry-After` (tokens are refilled afterwards)
+                tokens=0.0,
+                updated_at=max(now + (retry_after or 0.0), limit.updated_at),
+                throttles=limit.throttles + 1,
+                decreased_at=decreased_at,
+            )
+
+    def reset(self) -> None:
+        """Discard rate limits of all endpoints."""
+        with self.__lock:
+            self.__limits.clear()
+            self.__requested_at.clear()
+
+
+RATE_LIMITER: Final[RateLimiter] = RateLimiter()
+"""RateLimiter: Process-wide rate limiter shared by session pools by default."""
@@ -0,0 +1,204 @@
+from collections.abc import Sequence
+from typing import Any
+
+from hexbytes import HexBytes
+from web3 import AsyncWeb3, Web3
+from web3._utils.method_formatters import receipt_formatter
+from web3.types import RPCEndpoint, RPCResponse, TxParams, TxReceipt
+
+from .calls import decode_error_message
+from .constants import DEFAULT_BATCH_SIZE
+
+
+def is_reverted(receipt: TxReceipt) -> bool:
+    """Checks if a transaction is reverted.
+
+    Args:
+        receipt (TxReceipt): Transaction receipt
+
+    Returns:
+        bool: True if reverted, false otherwise
+    """
+    return receipt.get("status") == 0
+
+
+def format_receipt_response(response: RPCResponse) -> TxReceipt | None:
+    """Format a JSON-RPC response of `eth_getTransactionReceipt`.
+
+    Args:
+        response (RPCResponse): JSON-RPC response
+
+    Returns:
+        TxReceipt | None: Transaction receipt, or `None` if not yet available
+    """
+    result = response.get("result")
+    if "error" in response or result is None:
+        return None
+
+    return receipt_formatter(result)
+
+
+def build_receipt_requests(
+    tx_hashes: Sequence[HexBytes],
+) -> list[tuple[RPCEndpoint, Any]]:
+    """Build JSON-RPC requests of `eth_getTransactionReceipt`.
+
+    Args:
+        tx_hashes (Sequence[HexBytes]): Transaction hashes
+
+    Returns:
+        list[tuple[RPCEndpoint, Any]]: JSON-RPC requests
+    """
+    return [
+        (RPCEndpoint("eth_getTransactionReceipt"), [HexBytes(tx_hash).to_0x_hex()])
+        for tx_hash in tx_hashes
+    ]
+
+
+def format_receipt_responses(
+    responses: list[RPCResponse] | RPCResponse, size: int
+) -> list[TxReceipt | None]:
+    """Format JSON-RPC responses of a batch request.
+
+    Args:
+        responses (list[RPCResponse] | RPCResponse): JSON-RPC responses
+        size (int): Number of requests in the batch
+
+    Returns:
+        list[TxReceipt | None]: Transaction receipts (or `None`) in order
+
+    Raises:
+        ValueError: If the batch is rejected as a whole
+    """
+    if not isinstance(responses, list):
+        raise ValueError(str(responses.get("error", responses)))
+
+    receipts = [format_receipt_response(response) for response in responses[:size]]
+
+    return receipts + [None] * (size - len(receipts))
+
+
+def batch_get_receipts(
+    w3: Web3,
+    tx_hashes: Sequence[HexBytes],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> list[TxReceipt | None]:
+    """Get receipts of many transactions over JSON-RPC batch requests.
+
+    Args:
+        w3 (Web3): Configured web3 instance
+        tx_hashes (Sequence[HexBytes]): Transaction hashes
+        batch_size (int): Maximum number of requests per batch request
+
+    Returns:
+        list[TxReceipt | None]: Receipts (or `None` if not yet available) \
+        in the order of `tx_hashes`
+
+    Raises:
+        ValueError: If a batch is rejected as a whole
+    """
+    receipts: list[TxReceipt | None] = []
+
+    for start in range(0, len(tx_hashes), batch_size):
+        chunk = tx_hashes[start : start + batch_size]
+        responses = w3.provider.make_batch_request(  # type: ignore[attr-defined]
+            build_receipt_requests(chunk)
+        )
+        receipts.extend(format_receipt_responses(responses, len(chunk)))
+
+    return receipts
+
+
+async def async_batch_get_receipts(
+    w3: AsyncWeb3,
+    tx_hashes: Sequence[HexBytes],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> list[TxReceipt | None]:
+    """Get receipts of many transactions over JSON-RPC batch requests in asyncio.
+
+    Args:
+        w3 (AsyncWeb3): Configured web3 instance
+        tx_hashes (Sequence[HexBytes]): Transaction hashes
+        batch_size (int): Maximum number of requests per batch request
+
+    Returns:
+        list[TxReceipt | None]: Receipts (or `None` if not yet available) \
+        in the order of `tx_hashes`
+
+    Raises:
+        ValueError: If a batch is rejected as a whole
+    """
+    receipts: list[TxReceipt | None] = []
+
+    for start in range(0, len(tx_hashes), batch_size):
+        chunk = tx_hashes[start : start + batch_size]
+        responses = await w3.provider.make_batch_request(build_receipt_requests(chunk))
+        receipts.extend(format_receipt_responses(responses, len(chunk)))
+
+    return receipts
+
+
+def build_replay_params(transaction: Any) -> TxParams:
+    """Build call parameters to replay a transaction.
+
+    Args:
+        transaction (Any): Transaction data
+
+    Returns:
+        TxParams: Call parameters
+    """
+    return {
+        "from": transaction["from"],
+        "to": transaction["to"],
+        "data": transaction["input"],
+        "value": transaction["value"],
+        "gas": transaction["gas"],
+    }
+
+
+def get_revert_reason(w3: Web3, receipt: TxReceipt) -> str:
+    """Get the revert reason of a reverted transaction by replaying it.
+
+    Note:
+        The transaction is replayed by `eth_call` at the block it is included \
+        in, which is why the reason could differ from (or fail to reproduce) \
+        the original one.
+
+    Args:
+        w3 (Web3): Configured web3 instance
+        receipt (TxReceipt): Receipt of the reverted transaction
+
+    Returns:
+        str: Decoded revert reason
+    """
+    try:
+        transaction = w3.eth.get_transaction(receipt["transactionHash"])
+        w3.eth.call(build_replay_params(transaction), receipt["blockNumber"])
+    except Exception as e:
+        return decode_error_message(e)
+
+    return "execution reverted"
+
+
+async def async_get_revert_reason(w3: AsyncWeb3, receipt: TxReceipt) -> str:
+    """Get the revert reason of a reverted transaction by replaying it in asyncio.
+
+    Note:
+        The transaction is replayed by `eth_call` at the block it is included \
+        in, which is why the reason could differ from (or fail to reproduce) \
+        the original one.
+
+    Args:
+        w3 (AsyncWeb3): Configured web3 instance
+        receipt (TxReceipt): Receipt of the reverted transaction
+
+    Returns:
+        str: Decoded revert reason
+    """
+    try:
+        transaction = await w3.eth.get_transaction(receipt["transactionHash"])
+        await w3.eth.call(build_replay_params(transaction), receipt["blockNumber"])
+    except Exception as e:
+        return decode_error_message(e)
+
+    return "execution reverted"
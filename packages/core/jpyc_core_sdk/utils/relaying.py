@@ -0,0 +1,321 @@
+import heapq
+import math
+import time
+from collections import deque
+from collections.abc import Sequence
+from dataclasses import dataclass
+from itertools import count
+from threading import Lock
+from typing import Any, NamedTuple
+
+from hexbytes import HexBytes
+
+from .addresses import calc_checksum_address
+from .constants import DEFAULT_RELAY_QUEUE_SIZE, RELAY_LATENCY_WINDOW
+from .currencies import remove_decimals
+from .errors import RelayRequestRejected
+from .types import AuthorizationKind, RelayStage
+
+
+class _RelayRequestFields(NamedTuple):
+    kind: AuthorizationKind
+    from_: str
+    to: str
+    value: int
+    valid_after: int
+    valid_before: int
+    nonce: str
+    v: int
+    r: str
+    s: str
+
+
+class RelayRequest(_RelayRequestFields):
+    """Signed `TransferWithAuthorization` or `ReceiveWithAuthorization` to relay.
+
+    Note:
+        Unlike messages to sign, `value` is supplied as mutation functions \
+        accept it (i.e., before decimals are removed), while signatures are made over \
+        the value with decimals removed. Addresses are checksummed on creation, \
+        so that requests of the same authorization share the same key \
+        regardless of the case of `from_`.
+
+    Attributes:
+        kind (AuthorizationKind): Kind of the authorization
+        from_ (str): Payer (i.e., authorizer) address
+        to (str): Payee address
+        value (int): Amount to transfer
+        valid_after (int): Unix time when the authorization becomes valid
+        valid_before (int): Unix time when the authorization expires
+        nonce (str): Unique nonce (bytes32)
+        v (int): v of ECDSA
+        r (str): r of ECDSA
+        s (str): s of ECDSA
+    """
+
+    __slots__ = ()
+
+    def __new__(
+        cls,
+        kind: AuthorizationKind,
+        from_: str,
+        to: str,
+        value: int,
+        valid_after: int,
+        valid_before: int,
+        nonce: str,
+        v: int,
+        r: str,
+        s: str,
+    ) -> "RelayRequest":
+        return super().__new__(
+            cls,
+            kind=kind,
+            from_=calc_checksum_address(from_),
+            to=calc_checksum_address(to),
+            value=value,
+            valid_after=valid_after,
+            valid_before=valid_before,
+            nonce=nonce,
+            v=v,
+            r=r,
+            s=s,
+        )
+
+    @property
+    def key(self) -> tuple[str, bytes]:
+        """tuple[str, bytes]: Key to deduplicate requests (authorizer & nonce)."""
+        return (self.from_, bytes(HexBytes(self.nonce)))
+
+    @property
+    def func_name(self) -> str:
+        """str: Name of contract function to relay the request with."""
+        return (
+            "transferWithAuthorization"
+            if self.kind == "transfer"
+            else "receiveWithAuthorization"
+        )
+
+    def to_func_args(self) -> dict[str, Any]:
+        """Convert the request into arguments of the contract function.
+
+        Returns:
+            dict[str, Any]: Arguments of the contract function \
+            (with decimals removed)
+        """
+        return {
+            "from": self.from_,
+            "to": self.to,
+            "value": remove_decimals(self.value),
+            "validAfter": self.valid_after,
+            "validBefore": self.valid_before,
+            "nonce": self.nonce,
+            "v": self.v,
+            "r": self.r,
+            "s": self.s,
+        }
+
+
+class RelayQueue:
+    """Thread-safe priority queue of relay requests deduplicated by their keys.
+
+    Notes:
+        - Requests are popped in the order of `valid_before` (i.e., earliest \
+        deadline first), & in the order of ingestion on ties.
+        - Keys (authorizer & nonce) are remembered even after popped, until \
+        their `valid_before` passes (see `prune` method), since authorizations \
+        are either used or expired by then. Keys of requests that fail to be \
+        relayed could be forgotten earlier (see `discard` method), \
+        so that they can be retried.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_RELAY_QUEUE_SIZE) -> None:
+        """Constructor that initializes relay queue.
+
+        Args:
+            maxsize (int): Maximum number of queued requests
+        """
+        self.__lock = Lock()
+        self.__counter = count()
+        self.__heap: list[tuple[int, int, float, RelayRequest]] = []
+        self.__keys: dict[tuple[str, bytes], int] = {}
+        self.__expirations: list[tuple[int, tuple[str, bytes]]] = []
+
+        self.maxsize = maxsize
+        """int: Maximum number of queued requests"""
+
+    def __len__(self) -> int:
+        with self.__lock:
+            return len(self.__heap)
+
+    def put(self, request: RelayRequest) -> None:
+        """Enqueue a request.
+
+        Args:
+            request (RelayRequest): Request to relay
+
+        Raises:
+            RelayRequestRejected: If the request is duplicated or the queue is full
+        """
+        key = request.key
+        with self.__lock:
+            if key in self.__keys:
+                raise RelayRequestRejected("authorization is already relayed")
+            if len(self.__heap) >= self.maxsize:
+                raise RelayRequestRejected("relay queue is full")
+
+            self.__keys[key] = request.valid_before
+            heapq.heappush(self.__expirations, (request.valid_before, key))
+            heapq.heappush(
+                self.__heap,
+                (
+                    request.valid_before,
+                    next(self.__counter),
+                    time.perf_counter(),
+                    request,
+                ),
+            )
+
+    def pop(self) -> tuple[RelayRequest, float] | None:
+        """Dequeue the request with the earliest deadline.
+
+        Returns:
+            tuple[RelayRequest, float] | None: Request & its `time.perf_counter` \
+            when enqueued (None if empty)
+        """
+        with self.__lock:
+            if not self.__heap:
+                return None
+            _, _, enqueued_at, request = heapq.heappop(self.__heap)
+
+            return request, enqueued_at
+
+    def discard(self, key: tuple[str, bytes]) -> None:
+        """Forget the key of a (popped) request, so that it can be enqueued again.
+
+        Args:
+            key (tuple[str, bytes]): Key of the request
+        """
+        with self.__lock:
+            self.__keys.pop(key, None)
+
+    def prune(self, now: float) -> int:
+        """Forget keys of expired requests.
+
+        Args:
+            now (float): Current Unix time (e.g., of the latest block)
+
+        Returns:
+            int: Number of forgotten keys
+        """
+        pruned = 0
+        with self.__lock:
+            while self.__expirations and self.__expirations[0][0] <= now:
+                valid_before, key = heapq.heappop(self.__expirations)
+                # keys discarded & enqueued again expire on their own schedule
+                if self.__keys.get(key) == valid_before:
+                    del self.__keys[key]
+                    pruned += 1
+
+        return pruned
+
+
+def get_percentile(samples: Sequence[float], percentile: float) -> float:
+    """Get a percentile of sorted samples (by the nearest-rank method).
+
+    Args:
+        samples (Sequence[float]): Non-empty samples in ascending order
+        percentile (float): Percentile (in the range of (0, 100])
+
+    Returns:
+        float: Sample at the percentile
+    """
+    rank = max(math.ceil(percentile / 100 * len(samples)), 1)
+
+    return samples[rank - 1]
+
+
+@dataclass(frozen=True)
+class StageStats:
+    """Latency statistics of a relaying stage.
+
+    Attributes:
+        count (int): Number of observed latencies
+        mean (float, optional): Mean of the latest latencies (in seconds)
+        p50 (float, optional): Median of the latest latencies (in seconds)
+        p95 (float, optional): 95th percentile of the latest latencies (in seconds)
+        p99 (float, optional): 99th percentile of the latest latencies (in seconds)
+        max (float, optional): Maximum of the latest latencies (in seconds)
+    """
+
+    count: int = 0
+    mean: float | None = None
+    p50: float | None = None
+    p95: float | None = None
+    p99: float | None = None
+    max: float | None = None
+
+
+class LatencyMetrics:
+    """Thread-safe recorder of latencies per relaying stage.
+
+    Note:
+        Statistics other than counts are computed over the latest samples \
+        of each stage (i.e., a sliding window), so that they reflect \
+        the current load.
+    """
+
+    def __init__(self, window: int = RELAY_LATENCY_WINDOW) -> None:
+        """Constructor that initializes latency metrics.
+
+        Args:
+            window (int): Number of the latest latency samples kept per stage
+        """
+        self.__lock = Lock()
+        self.__counts: dict[RelayStage, int] = {}
+        self.__samples: dict[RelayStage, deque[float]] = {}
+
+        self.window = window
+        """int: Number of the latest latency samples kept per stage"""
+
+    def observe(self, stage: RelayStage, latency: float) -> None:
+        """Record a latency of a stage.
+
+        Args:
+            stage (RelayStage): Relaying stage
+            latency (float): Latency (in seconds)
+        """
+        with self.__lock:
+            self.__counts[stage] = self.__counts.get(stage, 0) + 1
+            samples = self.__samples.setdefault(stage, deque(maxlen=self.window))
+            samples.append(latency)
+
+    def get_stats(self) -> dict[RelayStage, StageStats]:
+        """Get latency statistics of every observed stage.
+
+        Returns:
+            dict[RelayStage, StageStats]: Latency statistics by stage
+        """
+        with self.__lock:
+            snapshot = {
+                stage: (self.__counts[stage], sorted(samples))
+                for stage, samples in self.__samples.items()
+            }
+
+        return {
+            stage: StageStats(
+                count=count_,
+                mean=sum(samples) / len(samples),
+                p50=get_percentile(samples, 50),
+                p95=get_percentile(samples, 95),
+                p99=get_percentile(samples, 99),
+                max=samples[-1],
+            )
+            for stage, (count_, samples) in snapshot.items()
+        }
+
+    def reset(self) -> None:
+        """Discard every recorded latency."""
+        with self.__lock:
+            self.__counts.clear()
+            self.__samples.clear()
@@ -0,0 +1,155 @@
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+from web3 import AsyncWeb3, Web3
+from web3.types import RPCEndpoint, RPCResponse
+
+from .constants import DEFAULT_BATCH_SIZE
+
+
+def build_block_requests(
+    block_numbers: Sequence[int],
+) -> list[tuple[RPCEndpoint, Any]]:
+    """Build JSON-RPC requests of `eth_getBlockByNumber` (without transactions).
+
+    Args:
+        block_numbers (Sequence[int]): Block numbers
+
+    Returns:
+        list[tuple[RPCEndpoint, Any]]: JSON-RPC requests
+    """
+    return [
+        (RPCEndpoint("eth_getBlockByNumber"), [hex(block_number), False])
+        for block_number in block_numbers
+    ]
+
+
+def format_block_hash_responses(
+    responses: list[RPCResponse] | RPCResponse, size: int
+) -> list[str | None]:
+    """Format JSON-RPC responses of a batch request into block hashes.
+
+    Args:
+        responses (list[RPCResponse] | RPCResponse): JSON-RPC responses
+        size (int): Number of requests in the batch
+
+    Returns:
+        list[str | None]: Block hashes (or `None` if not available) in order
+
+    Raises:
+        ValueError: If the batch is rejected as a whole
+    """
+    if not isinstance(responses, list):
+        raise ValueError(str(responses.get("error", responses)))
+
+    block_hashes: list[str | None] = [
+        None
+        if "error" in response or not response.get("result")
+        else response["result"]["hash"]
+        for response in responses[:size]
+    ]
+
+    return block_hashes + [None] * (size - len(block_hashes))
+
+
+def batch_get_block_hashes(
+    w3: Web3,
+    block_numbers: Sequence[int],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> dict[int, str | None]:
+    """Get canonical hashes of many blocks over JSON-RPC batch requests.
+
+    Args:
+        w3 (Web3): Configured web3 instance
+        block_numbers (Sequence[int]): Block numbers
+        batch_size (int): Maximum number of requests per batch request
+
+    Returns:
+        dict[int, str | None]: Block hashes (or `None` if not available) \
+        by block number
+
+    Raises:
+        ValueError: If a batch is rejected as a whole
+    """
+    block_hashes: dict[int, str | None] = {}
+
+    for start in range(0, len(block_numbers), batch_size):
+        chunk = block_numbers[start : start + batch_size]
+        responses = w3.provider.make_batch_request(  # type: ignore[attr-defined]
+            build_block_requests(chunk)
+        )
+        block_hashes.update(
+            zip(
+                chunk,
+                format_block_hash_responses(responses, len(chunk)),
+                strict=True,
+            )
+        )
+
+    return block_hashes
+
+
+async def async_batch_get_block_hashes(
+    w3: AsyncWeb3,
+    block_numbers: Sequence[int],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> dict[int, str | None]:
+    """Get canonical hashes of many blocks over JSON-RPC batch requests in asyncio.
+
+    Args:
+        w3 (AsyncWeb3): Configured web3 instance
+        block_numbers (Sequence[int]): Block numbers
+        batch_size (int): Maximum number of requests per batch request
+
+    Returns:
+        dict[int, str | None]: Block hashes (or `None` if not available) \
+        by block number
+
+    Raises:
+        ValueError: If a batch is rejected as a whole
+    """
+    block_hashes: dict[int, str | None] = {}
+
+    for start in range(0, len(block_numbers), batch_size):
+        chunk = block_numbers[start : start + batch_size]
+        responses = await w3.provider.make_batch_request(build_block_requests(chunk))
+        block_hashes.update(
+            zip(
+                chunk,
+                format_block_hash_responses(responses, len(chunk)),
+                strict=True,
+            )
+        )
+
+    return block_hashes
+
+
+def find_common_ancestor(
+    stored_hashes: Mapping[int, str],
+    canonical_hashes: Mapping[int, str | None],
+    confirmed_block: int,
+) -> int | None:
+    """Find the last block of synced data on the canonical chain.
+
+    Note:
+        Since block hashes commit to their ancestors, a matching block proves \
+        every preceding block canonical, while blocks after the first \
+        mismatching block (even if they match) are regarded as orphaned.
+
+    Args:
+        stored_hashes (Mapping[int, str]): Stored hashes of synced blocks
+        canonical_hashes (Mapping[int, str | None]): Canonical hashes of the \
+        same blocks
+        confirmed_block (int): Last block regarded as safe from reorganizations
+
+    Returns:
+        int | None: Last canonical block to roll back to (or `None` if \
+        every stored block is canonical)
+    """
+    ancestor = confirmed_block
+    for block_number in sorted(stored_hashes):
+        if canonical_hashes.get(block_number) != stored_hashes[block_number]:
+            return ancestor
+        ancestor = block_number
+
+    return None
@@ -0,0 +1,144 @@
+import time
+from dataclasses import dataclass
+from itertools import count
+from threading import Lock
+
+from eth_account.signers.local import LocalAccount
+from eth_typing import ChecksumAddress
+from hexbytes import HexBytes
+
+from .constants import DEFAULT_PENDING_TTL
+from .nonces import NonceManager
+from .types import SchedulingStrategy
+
+
+@dataclass(frozen=True)
+class Sender:
+    """Account that sends transactions with its own nonce stream.
+
+    Attributes:
+        account (LocalAccount): Account instance
+        nonce_manager (NonceManager): Nonce manager of `account`
+    """
+
+    account: LocalAccount
+    nonce_manager: NonceManager
+
+
+class SenderScheduler:
+    """Thread-safe scheduler that assigns transactions to senders.
+
+    Note:
+        Pending transactions of each sender are counted from its assignment \
+        until either its failure or confirmation (see `confirm` method), \
+        or regarded as dropped after `pending_ttl` (so that sent transactions \
+        are never kept forever without confirmations). Without confirmations, \
+        `least_pending` strategy assigns transactions evenly \
+        as `round_robin` strategy does.
+    """
+
+    def __init__(
+        self,
+        senders: list[Sender],
+        strategy: SchedulingStrategy = "round_robin",
+        pending_ttl: float = DEFAULT_PENDING_TTL,
+    ) -> None:
+        """Constructor that initializes sender scheduler.
+
+        Args:
+            senders (list[Sender]): Senders to schedule
+            strategy (SchedulingStrategy): Scheduling strategy
+            pending_ttl (float): Time-to-live (in seconds) of sent transactions \
+            awaiting confirmations
+
+        Raises:
+            ValueError: If `senders` is empty
+        """
+        if len(senders) == 0:
+            raise ValueError("At least one sender is required.")
+
+        self.__lock = Lock()
+        self.__counter = count()
+        self.__pending = {sender.account.address: 0 for sender in senders}
+        self.__senders_by_tx_hash: dict[HexBytes, tuple[Sender, float]] = {}
+
+        self.senders = senders
+        """list[Sender]: Senders to schedule"""
+        self.strategy = strategy
+        """SchedulingStrategy: Scheduling strategy"""
+        self.pending_ttl = pending_ttl
+        """float: Time-to-live (in seconds) of sent transactions awaiting \
+        confirmations"""
+
+    def acquire(self) -> Sender:
+        """Assign a transaction to one of the senders.
+
+        Returns:
+            Sender: Assigned sender
+        """
+        with self.__lock:
+            self.__purge_pending()
+            turn = next(self.__counter)
+            if self.strategy == "round_robin":
+                sender = self.senders[turn % len(self.senders)]
+            else:
+                # ties are broken in turn, so that senders are used evenly
+                sender = min(
+                    (
+                        self.senders[(turn + i) % len(self.senders)]
+                        for i in range(len(self.senders))
+                    ),
+                    key=lambda s: self.__pending[s.account.address],
+                )
+            self.__pending[sender.account.address] += 1
+
+            return sender
+
+    def release(self, sender: Sender, tx_hash: HexBytes | None) -> None:
+        """Record the result of an assigned transaction.
+
+        Args:
+            sender (Sender): Assigned sender
+            tx_hash (HexBytes, optional): Transaction hash, or `None` if failed
+        """
+        with self.__lock:
+            if tx_hash is None:
+                self.__pending[sender.account.address] -= 1
+            else:
+                self.__purge_pending()
+                self.__senders_by_tx_hash[HexBytes(tx_hash)] = (
+                    sender,
+                    time.monotonic() + self.pending_ttl,
+                )
+
+    def confirm(self, tx_hash: HexBytes) -> None:
+        """Mark a sent transaction as confirmed (i.e., no longer pending).
+
+        Args:
+            tx_hash (HexBytes): Transaction hash
+        """
+        with self.__lock:
+            pending = self.__senders_by_tx_hash.pop(HexBytes(tx_hash), None)
+            if pending is not None:
+                self.__pending[pending[0].account.address] -= 1
+
+    def __purge_pending(self) -> None:
+        """Discard sent transactions regarded as dropped (with the lock held)."""
+        now = time.monotonic()
+        for tx_hash in [
+            tx_hash
+            for tx_hash, (_, expires_at) in self.__senders_by_tx_hash.items()
+            if expires_at <= now
+        ]:
+            sender, _ = self.__senders_by_tx_hash.pop(tx_hash)
+            self.__pending[sender.account.address] -= 1
+
+    def get_pending_counts(self) -> dict[ChecksumAddress, int]:
+        """Get numbers of pending transactions of each sender.
+
+        Returns:
+            dict[ChecksumAddress, int]: Numbers of pending transactions by address
+        """
+        with self.__lock:
+            self.__purge_pending()
+            return dict(self.__pending)
@@ -0,0 +1,278 @@
+import asyncio
+from threading import Lock
+from typing import Any, Final
+
+import requests
+from aiohttp import ClientSession, ClientTimeout, TCPConnector
+from eth_typing import URI
+from requests.adapters import HTTPAdapter
+from web3 import AsyncHTTPProvider, HTTPProvider
+from web3._utils.empty import empty
+from web3._utils.http_session_manager import HTTPSessionManager
+
+from .constants import DEFAULT_HTTP_TIMEOUT, DEFAULT_KEEP_ALIVE, DEFAULT_POOL_SIZE
+from .rate_limits import RATE_LIMITER, RateLimiter, get_retry_after, is_throttled
+
+
+class SessionPool(HTTPSessionManager):
+    """Thread-safe pool of keep-alive HTTP sessions keyed by RPC endpoint.
+
+    Note:
+        web3.py gives every provider a session manager of its own, \
+        so that TCP/TLS connections are discarded whenever a provider is \
+        rebuilt (e.g., on `set_account`). Providers sharing this pool \
+        (see `http_provider` & `async_http_provider` methods) reuse \
+        connections instead: a `requests` session per endpoint, and an \
+        `aiohttp` session per endpoint & event loop (since it is bound to one). \
+        Requests are paced by a rate limiter learning the sustainable rate \
+        of each endpoint from throttled (i.e., 429) requests.
+    """
+
+    def __init__(
+        self,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        keep_alive: float = DEFAULT_KEEP_ALIVE,
+        timeout: float = DEFAULT_HTTP_TIMEOUT,
+        rate_limiter: RateLimiter | None = RATE_LIMITER,
+    ) -> None:
+        """Constructor that initializes session pool.
+
+        Args:
+            pool_size (int): Maximum number of connections per RPC endpoint
+            keep_alive (float): Time (in seconds) to keep idle connections alive \
+            (asyncio only; `requests` keeps them until servers close them)
+            timeout (float): Timeout (in seconds) of HTTP requests
+            rate_limiter (RateLimiter, optional): Rate limiter of requests \
+            (defaults to the process-wide `RATE_LIMITER`, disabled if None)
+        """
+        super().__init__()
+        self.__pool_lock = Lock()
+        self.__sessions: dict[URI, requests.Session] = {}
+        self.__async_sessions: dict[tuple[int, URI], ClientSession] = {}
+
+        self.pool_size = pool_size
+        """int: Maximum number of connections per RPC endpoint"""
+        self.keep_alive = keep_alive
+        """float: Time (in seconds) to keep idle connections alive"""
+        self.timeout = timeout
+        """float: Timeout (in seconds) of HTTP requests"""
+        self.rate_limiter = rate_limiter
+        """RateLimiter | None: Rate limiter of requests"""
+
+    def http_provider(self, rpc_endpoint: str, retry: bool = True) -> HTTPProvider:
+        """Build an HTTP provider sharing the pooled sessions.
+
+        Args:
+            rpc_endpoint (str): RPC endpoint
+            retry (bool): Whether to retry failed requests (as web3.py does)
+
+        Returns:
+            HTTPProvider: HTTP provider
+        """
+        provider = HTTPProvider(
+            rpc_endpoint,
+            request_kwargs={"timeout": self.timeout},
+            exception_retry_configuration=empty if retry else None,
+        )
+        provider._request_session_manager = self
+
+        return provider
+
+    def async_http_provider(
+        self, rpc_endpoint: str, retry: bool = True
+    ) -> AsyncHTTPProvider:
+        """Build an asyncio HTTP provider sharing the pooled sessions.
+
+        Args:
+            rpc_endpoint (str): RPC endpoint
+            retry (bool): Whether to retry failed requests (as web3.py does)
+
+        Returns:
+            AsyncHTTPProvider: Asyncio HTTP provider
+        """
+        provider = AsyncHTTPProvider(
+            rpc_endpoint,
+            request_kwargs={"timeout": ClientTimeout(self.timeout)},
+            exception_retry_configuration=empty if retry else None,
+        )
+        provider._request_session_manager = self
+
+        return provider
+
+    def cache_and_return_session(
+        self,
+        endpoint_uri: URI,
+        session: requests.Session | None = None,
+        request_timeout: float | None = None,
+    ) -> requests.Session:
+        """Get the pooled session of an RPC endpoint (shared among threads).
+
+        Args:
+            endpoint_uri (URI): RPC endpoint
+            session (requests.Session, optional): Session to pool if none is pooled
+            request_timeout (float, optional): Unused (i.e., sessions are never evicted)
+
+        Returns:
+            requests.Session: Pooled session
+        """
+        with self.__pool_lock:
+            pooled = self.__sessions.get(endpoint_uri)
+            if pooled is None:
+                pooled = session if session is not None else requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=1,
+                    pool_maxsize=self.pool_size,
+                )
+                pooled.mount("http://", adapter)
+                pooled.mount("https://", adapter)
+                self.__sessions[endpoint_uri] = pooled
+
+            return pooled
+
+    async def async_cache_and_return_session(
+        self,
+        endpoint_uri: URI,
+        session: ClientSession | None = None,
+        request_timeout: ClientTimeout | None = None,
+    ) -> ClientSession:
+        """Get the pooled session of an RPC endpoint for the running event loop.
+
+        Note:
+            Sessions of closed event loops are discarded.
+
+        Args:
+            endpoint_uri (URI): RPC endpoint
+            session (ClientSession, optional): Session to pool if none is pooled
+            request_timeout (ClientTimeout, optional): Unused
+
+        Returns:
+            ClientSession: Pooled session
+        """
+        loop = asyncio.get_running_loop()
+        with self.__pool_lock:
+            pooled = self.__async_sessions.get((id(loop), endpoint_uri))
+            if pooled is not None and not pooled.closed and pooled._loop is loop:
+                return pooled
+
+            self.__async_sessions = {
+                key: value
+                for key, value in self.__async_sessions.items()
+                if not value.closed and not value._loop.is_closed()
+            }
+            pooled = (
+                session
+                if session is not None
+                else ClientSession(
+                    raise_for_status=True,
+                    connector=TCPConnector(
+                        limit=self.pool_size,
+                        keepalive_timeout=self.keep_alive,
+                    ),
+                )
+            )
+            self.__async_sessions[(id(loop), endpoint_uri)] = pooled
+
+            return pooled
+
+    def make_post_request(
+        self, endpoint_uri: URI, data: bytes | dict[str, Any], **kwargs: Any
+    ) -> bytes:
+        """Make a POST request paced by the rate limiter.
+
+        Args:
+            endpoint_uri (URI): RPC endpoint
+            data (bytes | dict[str, Any]): Request body
+            **kwargs (Any): Arguments of the request
+
+        Returns:
+            bytes: Response body
+        """
+        if self.rate_limiter is None:
+            return super().make_post_request(endpoint_uri, data, **kwargs)
+
+        self.rate_limiter.wait(endpoint_uri)
+        try:
+            response = super().make_post_request(endpoint_uri, data, **kwargs)
+        except Exception as e:
+            if is_throttled(e):
+                self.rate_limiter.record_throttle(endpoint_uri, get_retry_after(e))
+            raise
+
+        self.rate_limiter.record_success(endpoint_uri)
+        return response
+
+    async def async_make_post_request(
+        self, endpoint_uri: URI, data: bytes | dict[str, Any], **kwargs: Any
+    ) -> bytes:
+        """Make a POST request paced by the rate limiter (in asyncio).
+
+        Args:
+            endpoint_uri (URI): RPC endpoint
+            data (bytes | dict[str, Any]): Request body
+            **kwargs (Any): Arguments of the request
+
+        Returns:
+            bytes: Response body
+        """
+        if self.rate_limiter is None:
+            return await super().async_make_post_request(endpoint_uri, data, **kwargs)
+
+        await self.rate_limiter.async_wait(endpoint_uri)
+        try:
+            response = await super().async_make_post_request(
+                endpoint_uri, data, **kwargs
+            )
+        except Exception as e:
+            if is_throttled(e):
+                self.rate_limiter.record_throttle(endpoint_uri, get_retry_after(e))
+            raise
+
+        self.rate_limiter.record_success(endpoint_uri)
+        return response
+
+    def get_pooled_endpoints(self) -> list[URI]:
+        """Get RPC endpoints of pooled sessions.
+
+        Returns:
+            list[URI]: RPC endpoints
+        """
+        with self.__pool_lock:
+            return list(
+                dict.fromkeys(
+                    [
+                        *self.__sessions,
+                        *(endpoint for _, endpoint in self.__async_sessions),
+                    ]
+                )
+            )
+
+    def close(self) -> None:
+        """Close the pooled sessions (of `requests`)."""
+        with self.__pool_lock:
+            sessions = list(self.__sessions.values())
+            self.__sessions.clear()
+
+        for session in sessions:
+            session.close()
+
+    async def async_close(self) -> None:
+        """Close the pooled sessions (of `aiohttp`) of the running event loop."""
+        loop = asyncio.get_running_loop()
+        with self.__pool_lock:
+            sessions = [
+                session
+                for key, session in self.__async_sessions.items()
+                if key[0] == id(loop)
+            ]
+            self.__async_sessions = {
+                key: session
+                for key, session in self.__async_sessions.items()
+                if key[0] != id(loop)
+            }
+
+        for session in sessions:
+            await session.close()
+
+
+SESSION_POOL: Final[SessionPool] = SessionPool()
+"""SessionPool: Process-wide session pool shared by SDK clients by default."""
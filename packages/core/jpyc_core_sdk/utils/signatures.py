@@ -0,0 +1,297 @@
+from collections.abc import Sequence
+from typing import Any, NamedTuple
+
+from eth_abi import encode as abi_encode
+from eth_account.signers.local import LocalAccount
+from eth_typing import Hash32
+from eth_utils import keccak
+from hexbytes import HexBytes
+
+from .constants import (
+    AUTHORIZATION_FIELD_TYPES,
+    CANCEL_AUTHORIZATION_FIELD_TYPES,
+    EIP712_PREFIX,
+    PERMIT_FIELD_TYPES,
+)
+from .metadata import TokenMetadata
+
+
+class Signature(NamedTuple):
+    """ECDSA signature in the shapes expected by mutation functions.
+
+    Note:
+        Unpack it into mutation functions (e.g., `permit(..., **signature._asdict())`).
+
+    Attributes:
+        v (int): Recovery id (i.e., uint8)
+        r (str): First half of the signature (i.e., bytes32 hex string)
+        s (str): Second half of the signature (i.e., bytes32 hex string)
+    """
+
+    v: int
+    r: str
+    s: str
+
+
+def to_bytes32_hex(value: int | bytes) -> str:
+    """Convert a value into a 0x-prefixed & zero-padded bytes32 hex string.
+
+    Args:
+        value (int | bytes): Integer or bytes
+
+    Returns:
+        str: Bytes32 hex string
+    """
+    data = value.to_bytes(32, "big") if isinstance(value, int) else bytes(value)
+
+    return f"0x{data.hex().zfill(64)}"
+
+
+def hash_struct(typehash: bytes, types: Sequence[str], values: Sequence[Any]) -> bytes:
+    """Hash an EIP-712 struct of atomic fields.
+
+    Args:
+        typehash (bytes): Typehash of the struct
+        types (Sequence[str]): ABI types of fields
+        values (Sequence[Any]): Values of fields
+
+    Returns:
+        bytes: Struct hash
+    """
+    return keccak(abi_encode(["bytes32", *types], [typehash, *values]))
+
+
+def sign_hash(account: LocalAccount, message_hash: bytes) -> Signature:
+    """Sign a message hash.
+
+    Args:
+        account (LocalAccount): Account to sign with
+        message_hash (bytes): Message hash (e.g., EIP-712 digest)
+
+    Returns:
+        Signature: Signature
+    """
+    signed = account.unsafe_sign_hash(Hash32(message_hash))
+
+    return Signature(
+        v=signed.v,
+        r=to_bytes32_hex(signed.r),
+        s=to_bytes32_hex(signed.s),
+    )
+
+
+class TypedDataSigner:
+    """Offline signer of EIP-712 typed messages of JPYC contracts.
+
+    Note:
+        The domain separator & typehashes are taken from token metadata \
+        (i.e., precomputed by the contracts), so that each signature hashes \
+        only its message struct, with no RPC. Values are signed as is \
+        (i.e., with decimals removed).
+    """
+
+    def __init__(self, metadata: TokenMetadata) -> None:
+        """Constructor that initializes typed data signer.
+
+        Args:
+            metadata (TokenMetadata): Token metadata
+        """
+        self.__prefix = EIP712_PREFIX + metadata.domain_separator
+
+        self.metadata = metadata
+        """TokenMetadata: Token metadata"""
+
+    def hash_typed_data(self, struct_hash: bytes) -> bytes:
+        """Hash a typed message of the domain.
+
+        Args:
+            struct_hash (bytes): Struct hash of the message
+
+        Returns:
+            bytes: EIP-712 digest to sign
+        """
+        return keccak(self.__prefix + struct_hash)
+
+    def hash_permit(
+        self, owner: str, spender: str, value: int, nonce: int, deadline: int
+    ) -> bytes:
+        """Hash a `Permit` message.
+
+        Args:
+            owner (str): Owner address
+            spender (str): Spender address
+            value (int): Amount of allowance (with decimals removed)
+            nonce (int): Nonce of `owner`
+            deadline (int): Unix time when the permit expires
+
+        Returns:
+            bytes: EIP-712 digest to sign
+        """
+        return self.hash_typed_data(
+            hash_struct(
+                self.metadata.permit_typehash,
+                PERMIT_FIELD_TYPES,
+                [owner, spender, value, nonce, deadline],
+            )
+        )
+
+    def hash_authorization(
+        self,
+        typehash: bytes,
+        from_: str,
+        to: str,
+        value: int,
+        valid_after: int,
+        valid_before: int,
+        nonce: str | bytes,
+    ) -> bytes:
+        """Hash a `TransferWithAuthorization` or `ReceiveWithAuthorization` message.
+
+        Args:
+            typehash (bytes): Typehash of the message
+            from_ (str): Payer address
+            to (str): Payee address
+            value (int): Amount to transfer (with decimals removed)
+            valid_after (int): Unix time when the authorization becomes valid
+            valid_before (int): Unix time when the authorization expires
+            nonce (str | bytes): Unique nonce (bytes32)
+
+        Returns:
+            bytes: EIP-712 digest to sign
+        """
+        return self.hash_typed_data(
+            hash_struct(
+                typehash,
+                AUTHORIZATION_FIELD_TYPES,
+                [from_, to, value, valid_after, valid_before, HexBytes(nonce)],
+            )
+        )
+
+    def hash_cancel_authorization(self, authorizer: str, nonce: str | bytes) -> bytes:
+        """Hash a `CancelAuthorization` message.
+
+        Args:
+            authorizer (str): Authorizer address
+            nonce (str | bytes): Nonce of the authorization (bytes32)
+
+        Returns:
+            bytes: EIP-712 digest to sign
+        """
+        return self.hash_typed_data(
+            hash_struct(
+                self.metadata.cancel_authorization_typehash,
+                CANCEL_AUTHORIZATION_FIELD_TYPES,
+                [authorizer, HexBytes(nonce)],
+            )
+        )
+
+    def sign_permit(
+        self,
+        account: LocalAccount,
+        spender: str,
+        value: int,
+        nonce: int,
+        deadline: int,
+    ) -> Signature:
+        """Sign a `Permit` message (owned by `account`).
+
+        Args:
+            account (LocalAccount): Owner account to sign with
+            spender (str): Spender address
+            value (int): Amount of allowance (with decimals removed)
+            nonce (int): Nonce of the owner
+            deadline (int): Unix time when the permit expires
+
+        Returns:
+            Signature: Signature
+        """
+        return sign_hash(
+            account,
+            self.hash_permit(account.address, spender, value, nonce, deadline),
+        )
+
+    def sign_transfer_with_authorization(
+        self,
+        account: LocalAccount,
+        to: str,
+        value: int,
+        valid_after: int,
+        valid_before: int,
+        nonce: str | bytes,
+    ) -> Signature:
+        """Sign a `TransferWithAuthorization` message (paid by `account`).
+
+        Args:
+            account (LocalAccount): Payer account to sign with
+            to (str): Payee address
+            value (int): Amount to transfer (with decimals removed)
+            valid_after (int): Unix time when the authorization becomes valid
+            valid_before (int): Unix time when the authorization expires
+            nonce (str | bytes): Unique nonce (bytes32)
+
+        Returns:
+            Signature: Signature
+        """
+        return sign_hash(
+            account,
+            self.hash_authorization(
+                self.metadata.transfer_with_authorization_typehash,
+                account.address,
+                to,
+                value,
+                valid_after,
+                valid_before,
+                nonce,
+            ),
+        )
+
+    def sign_receive_with_authorization(
+        self,
+        account: LocalAccount,
+        to: str,
+        value: int,
+        valid_after: int,
+        valid_before: int,
+        nonce: str | bytes,
+    ) -> Signature:
+        """Sign a `ReceiveWithAuthorization` message (paid by `account`).
+
+        Args:
+            account (LocalAccount): Payer account to sign with
+            to (str): Payee address (who submits the authorization)
+            value (int): Amount to transfer (with decimals removed)
+            valid_after (int): Unix time when the authorization becomes valid
+            valid_before (int): Unix time when the authorization expires
+            nonce (str | bytes): Unique nonce (bytes32)
+
+        Returns:
+            Signature: Signature
+        """
+        return sign_hash(
+            account,
+            self.hash_authorization(
+                self.metadata.receive_with_authorization_typehash,
+                account.address,
+                to,
+                value,
+                valid_after,
+                valid_before,
+                nonce,
+            ),
+        )
+
+    def sign_cancel_authorization(
+        self, account: LocalAccount, nonce: str | bytes
+    ) -> Signature:
+        """Sign a `CancelAuthorization` message (authorized by `account`).
+
+        Args:
+            account (LocalAccount): Authorizer account to sign with
+            nonce (str | bytes): Nonce of the authorization (bytes32)
+
+        Returns:
+            Signature: Signature
+        """
+        return sign_hash(
+            account, self.hash_cancel_authorization(account.address, nonce)
+        )
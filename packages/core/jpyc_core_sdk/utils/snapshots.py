@@ -0,0 +1,100 @@
+from collections.abc import Awaitable, Callable, Hashable, Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+from .errors import CallFailed
+from .types import CallKey
+
+
+@dataclass
+class Snapshot:
+    """Snapshot of contract states pinned to a block.
+
+    Note:
+        Since states at a block never change (unless the block is reorganized), \
+        results of view functions are memoized within a snapshot, \
+        and identical calls in batches are deduplicated. \
+        Failed calls (i.e., `CallFailed`) are never memoized.
+
+    Attributes:
+        block_number (int): Block number every read is pinned to
+        results (dict[CallKey, Any]): Memoized results keyed by \
+        function names & arguments
+    """
+
+    block_number: int
+    results: dict[CallKey, Any] = field(default_factory=dict)
+
+    def call(
+        self, func_name: str, args: tuple[Hashable, ...], call: Callable[[], Any]
+    ) -> Any:
+        """Call a view function unless its result is memoized.
+
+        Args:
+            func_name (str): Name of contract function
+            args (tuple[Hashable, ...]): Arguments of the call
+            call (Callable[[], Any]): Function to call it at the block
+
+        Returns:
+            Any: Result
+        """
+        key = (func_name, args)
+        if key not in self.results:
+            self.results[key] = call()
+
+        return self.results[key]
+
+    async def async_call(
+        self,
+        func_name: str,
+        args: tuple[Hashable, ...],
+        call: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """Call a view function unless its result is memoized (in asyncio).
+
+        Args:
+            func_name (str): Name of contract function
+            args (tuple[Hashable, ...]): Arguments of the call
+            call (Callable[[], Awaitable[Any]]): Function to call it at the block
+
+        Returns:
+            Any: Result
+        """
+        key = (func_name, args)
+        if key not in self.results:
+            self.results[key] = await call()
+
+        return self.results[key]
+
+    def call_many(
+        self,
+        func_name: str,
+        args_list: Sequence[tuple[Hashable, ...]],
+        call_many: Callable[[list[tuple[Hashable, ...]]], list[Any]],
+    ) -> list[Any]:
+        """Call a view function many times, skipping memoized & duplicate calls.
+
+        Args:
+            func_name (str): Name of contract function
+            args_list (Sequence[tuple[Hashable, ...]]): Arguments of each call
+            call_many (Callable[[list[tuple[Hashable, ...]]], list[Any]]): \
+            Function to call it at the block with arguments of missing calls
+
+        Returns:
+            list[Any]: Results in the order of `args_list`, \
+            `CallFailed` for each failed call
+        """
+        missing = list(
+            dict.fromkeys(
+                args for args in args_list if (func_name, args) not in self.results
+            )
+        )
+        fetched = dict(zip(missing, call_many(missing) if missing else [], strict=True))
+        for args, result in fetched.items():
+            if not isinstance(result, CallFailed):
+                self.results[(func_name, args)] = result
+
+        return [
+            fetched[args] if args in fetched else self.results[(func_name, args)]
+            for args in args_list
+        ]
@@ -1,5 +1,7 @@
-from typing import Literal, TypedDict
+from collections.abc import Hashable
+from typing import Literal, NamedTuple, TypedDict
 
+from web3.contract.async_contract import AsyncContractFunction
 from web3.contract.contract import ContractFunction
 
 ##########
@@ -21,6 +23,7 @@ class NetworkMetadata(TypedDict):
     id: int
     name: str
     rpc_endpoints: list[str]
+    confirmation_depth: int
 
 
 type ChainMetadata = dict[ChainName, dict[str, NetworkMetadata]]
@@ -35,11 +38,71 @@ type ContractVersion = Literal["2"]
 type ArtifactType = Literal["abi", "bytecode"]
 """A type that contains types of contract artifacts."""
 
+###########
+# Caching #
+###########
+
+
+class CacheInfo(NamedTuple):
+    """Statistics of a cache."""
+
+    hits: int
+    misses: int
+    currsize: int
+
+
+class ReadCacheInfo(NamedTuple):
+    """Statistics of a read cache."""
+
+    hits: int
+    misses: int
+    currsize: int
+    evictions: int
+
+
+type CallKey = tuple[str, tuple[Hashable, ...]]
+"""A type that contains keys of view function calls (names & arguments)."""
+
+type ReadCacheKey = tuple[int, str, str, tuple[Hashable, ...], int]
+"""A type that contains (chain id, contract address, function name, args, block)."""
+
+
+############
+# Relaying #
+############
+
+type RelayStage = Literal["validate", "queue", "submit", "confirm", "total"]
+"""A type that contains stages of relaying whose latencies are measured."""
+
+
+##############
+# Signatures #
+##############
+
+type AuthorizationKind = Literal["transfer", "receive"]
+"""A type that contains kinds of authorizations to sign in bulk."""
+
+
 ################
 # Transactions #
 ################
 
 
+type SchedulingStrategy = Literal["round_robin", "least_pending"]
+"""A type that contains strategies to schedule transactions across senders."""
+
+
 class TransactionArgs(TypedDict):
     contract_func: ContractFunction
     func_args: dict[str, object]
+
+
+class AsyncTransactionArgs(TypedDict):
+    contract_func: AsyncContractFunction
+    func_args: dict[str, object]
+
+
+class FeeParams(TypedDict, total=False):
+    maxFeePerGas: int
+    maxPriorityFeePerGas: int
+    gasPrice: int
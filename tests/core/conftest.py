@@ -10,6 +10,8 @@ from web3.contract.contract import (
 )
 from web3.eth import Eth
 
+from packages.core.jpyc_core_sdk.async_client import AsyncSdkClient
+from packages.core.jpyc_core_sdk.async_jpyc import AsyncJPYC
 from packages.core.jpyc_core_sdk.client import SdkClient
 from packages.core.jpyc_core_sdk.jpyc import JPYC
 
@@ -97,6 +99,39 @@ def jpyc_client_without_account(sdk_client_without_account, mocker: MockFixture)
     )
 
 
+@pytest.fixture(scope="function")
+def async_sdk_client():
+    return AsyncSdkClient(
+        chain_name="ethereum",
+        network_name="mainnet",
+        private_key=KNOWN_ACCOUNTS[0].private_key,
+    )
+
+
+@pytest.fixture(scope="function")
+def async_sdk_client_without_account():
+    return AsyncSdkClient(
+        chain_name="ethereum",
+        network_name="mainnet",
+    )
+
+
+@pytest.fixture(scope="function")
+def async_jpyc_client(async_sdk_client):
+    return AsyncJPYC(
+        client=async_sdk_client,
+        contract_address=V2_PROXY_ADDRESS,
+    )
+
+
+@pytest.fixture(scope="function")
+def async_jpyc_client_without_account(async_sdk_client_without_account):
+    return AsyncJPYC(
+        client=async_sdk_client_without_account,
+        contract_address=V2_PROXY_ADDRESS,
+    )
+
+
 @pytest.fixture(scope="function")
 def eip712_domain_separator():
     return {
@@ -137,6 +172,15 @@ def mocked_eth_chain_id(mocker: MockFixture, request):
     )
 
 
+@pytest.fixture(scope="function")
+def mocked_eth_latest_block(mocker: MockFixture):
+    return mocker.patch.object(
+        Eth,
+        "get_block",
+        return_value={"number": 100, "timestamp": int(time.time())},
+    )
+
+
 @pytest.fixture(scope="function")
 def mocked_eth_contract_constructor_transact(mocker: MockFixture):
     return mocker.patch.object(
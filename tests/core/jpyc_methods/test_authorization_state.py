@@ -0,0 +1,110 @@
+import pytest
+from eth_abi import encode
+from hexbytes import HexBytes
+from web3.eth import Eth
+
+from packages.core.jpyc_core_sdk.utils.constants import AUTHORIZATION_USED_TOPIC
+from packages.core.jpyc_core_sdk.utils.errors import (
+    InvalidBytes32,
+    InvalidChecksumAddress,
+)
+from packages.core.jpyc_core_sdk.utils.preflight import PreflightValidator
+from packages.core.jpyc_core_sdk.utils.signatures import TypedDataSigner
+
+from ..conftest import KNOWN_ACCOUNTS
+from ..utils.test_metadata import METADATA
+
+ACCOUNTS = [account.address for account in KNOWN_ACCOUNTS]
+NONCES = [f"0x{i:064x}" for i in range(2)]
+
+
+@pytest.mark.parametrize(
+    [
+        "mocked_eth_contract_functions",
+    ],
+    [
+        pytest.param(
+            {
+                "func_name": "authorizationState",
+            },
+        ),
+    ],
+    indirect=[
+        "mocked_eth_contract_functions",
+    ],
+)
+def test_authorization_state(
+    jpyc_client,
+    mocked_eth_contract_functions,
+):
+    jpyc_client.authorization_state(authorizer=ACCOUNTS[0], nonce=NONCES[0])
+
+    mocked_eth_contract_functions.assert_called_once_with(
+        ACCOUNTS[0], HexBytes(NONCES[0])
+    )
+
+
+def test_authorization_state_failures(
+    jpyc_client,
+):
+    with pytest.raises(InvalidChecksumAddress):
+        jpyc_client.authorization_state(authorizer="invalid_address", nonce=NONCES[0])
+    with pytest.raises(InvalidBytes32):
+        jpyc_client.authorization_state(authorizer=ACCOUNTS[0], nonce="0x00")
+
+
+def test_authorization_state_with_preflight_validator(mocker, jpyc_client):
+    jpyc_client.preflight_validator = PreflightValidator(TypedDataSigner(METADATA))
+    jpyc_client.preflight_validator.mark_authorization_used(ACCOUNTS[0], NONCES[0])
+    make_batch_request = mocker.patch.object(
+        jpyc_client.client.w3.provider,
+        "make_batch_request",
+        return_value=[
+            {"jsonrpc": "2.0", "id": 0, "result": f"0x{encode(['bool'], [True]).hex()}"}
+        ],
+    )
+    pairs = [(ACCOUNTS[0], NONCES[0]), (ACCOUNTS[1], NONCES[1])]
+
+    assert jpyc_client.batch_authorization_state(pairs) == [True, True]
+    # nonces known to be used are never called
+    assert len(make_batch_request.call_args.args[0]) == 1
+
+    # nonces found used are recorded
+    assert jpyc_client.batch_authorization_state(pairs) == [True, True]
+    assert jpyc_client.authorization_state(*pairs[1]) is True
+    make_batch_request.assert_called_once()
+
+    # the cache could be bypassed (e.g., after chain reorganizations)
+    make_batch_request.return_value = [
+        {"jsonrpc": "2.0", "id": i, "result": f"0x{encode(['bool'], [False]).hex()}"}
+        for i in range(2)
+    ]
+    assert jpyc_client.batch_authorization_state(pairs, use_cache=False) == [
+        False,
+        False,
+    ]
+    assert len(make_batch_request.call_args.args[0]) == 2
+
+
+def test_get_used_authorizations(mocker, jpyc_client):
+    jpyc_client.preflight_validator = PreflightValidator(TypedDataSigner(METADATA))
+    get_logs = mocker.patch.object(
+        Eth,
+        "get_logs",
+        return_value=[
+            {
+                "topics": [
+                    HexBytes(AUTHORIZATION_USED_TOPIC),
+                    HexBytes(HexBytes(ACCOUNTS[1]).rjust(32, b"\x00")),
+                    HexBytes(NONCES[1]),
+                ]
+            }
+        ],
+    )
+
+    used = jpyc_client.get_used_authorizations(from_block=100, to_block=200)
+
+    assert used == [(ACCOUNTS[1], NONCES[1])]
+    assert get_logs.call_args.args[0]["fromBlock"] == 100
+    assert get_logs.call_args.args[0]["toBlock"] == 200
+    assert jpyc_client.preflight_validator.is_authorization_used(*used[0])
@@ -0,0 +1,127 @@
+from decimal import Decimal
+
+import pytest
+from eth_abi import encode
+from pydantic import ValidationError
+
+from packages.core.jpyc_core_sdk.utils.errors import (
+    CallFailed,
+    InvalidChecksumAddress,
+)
+
+from ..conftest import KNOWN_ACCOUNTS
+
+ACCOUNTS = [account.address for account in KNOWN_ACCOUNTS]
+
+
+def encode_result(abi_type: str, value) -> str:
+    return f"0x{encode([abi_type], [value]).hex()}"
+
+
+@pytest.fixture(scope="function")
+def mocked_make_batch_request(mocker, jpyc_client, request):
+    return mocker.patch.object(
+        jpyc_client.client.w3.provider,
+        "make_batch_request",
+        return_value=[
+            {"jsonrpc": "2.0", "id": i, "result": encode_result(*result)}
+            if isinstance(result, tuple)
+            else {"jsonrpc": "2.0", "id": i, "error": {"message": result}}
+            for i, result in enumerate(request.param)
+        ],
+    )
+
+
+@pytest.mark.parametrize(
+    ["method", "args", "mocked_make_batch_request", "expected"],
+    [
+        pytest.param(
+            "batch_is_minter",
+            [ACCOUNTS[:2]],
+            [("bool", True), ("bool", False)],
+            [True, False],
+            id="is minter",
+        ),
+        pytest.param(
+            "batch_minter_allowance",
+            [ACCOUNTS[:2]],
+            [("uint256", 10**18), ("uint256", 0)],
+            [Decimal(1), Decimal(0)],
+            id="minter allowance",
+        ),
+        pytest.param(
+            "batch_balance_of",
+            [ACCOUNTS[:2]],
+            [("uint256", 10**21), ("uint256", 5 * 10**17)],
+            [Decimal(1000), Decimal("0.5")],
+            id="balance of",
+        ),
+        pytest.param(
+            "batch_allowance",
+            [[(ACCOUNTS[0], ACCOUNTS[1]), (ACCOUNTS[1], ACCOUNTS[2])]],
+            [("uint256", 10**18), ("uint256", 2 * 10**18)],
+            [Decimal(1), Decimal(2)],
+            id="allowance",
+        ),
+        pytest.param(
+            "batch_nonces",
+            [ACCOUNTS[:2]],
+            [("uint256", 0), ("uint256", 7)],
+            [0, 7],
+            id="nonces",
+        ),
+        pytest.param(
+            "batch_authorization_state",
+            [[(ACCOUNTS[0], f"0x{'00' * 32}"), (ACCOUNTS[1], f"0x{'ff' * 32}")]],
+            [("bool", False), ("bool", True)],
+            [False, True],
+            id="authorization state",
+        ),
+    ],
+    indirect=["mocked_make_batch_request"],
+)
+def test_batch_view_functions(
+    jpyc_client,
+    method,
+    args,
+    mocked_make_batch_request,
+    expected,
+):
+    results = getattr(jpyc_client, method)(*args)
+
+    mocked_make_batch_request.assert_called_once()
+    assert len(mocked_make_batch_request.call_args.args[0]) == len(expected)
+    assert results == expected
+
+
+@pytest.mark.parametrize(
+    ["mocked_make_batch_request"],
+    [
+        pytest.param(
+            [("uint256", 10**18), "execution reverted", ("uint256", 0)],
+        ),
+    ],
+    indirect=["mocked_make_batch_request"],
+)
+def test_batch_balance_of_partial_failures(
+    jpyc_client,
+    mocked_make_batch_request,
+):
+    results = jpyc_client.batch_balance_of(accounts=ACCOUNTS)
+
+    assert results[0] == Decimal(1)
+    assert isinstance(results[1], CallFailed)
+    assert results[2] == Decimal(0)
+
+
+def test_batch_view_functions_failures(
+    jpyc_client,
+):
+    with pytest.raises(InvalidChecksumAddress):
+        jpyc_client.batch_balance_of(accounts=["invalid_address"])
+    with pytest.raises(InvalidChecksumAddress):
+        jpyc_client.batch_allowance(
+            owners_and_spenders=[(ACCOUNTS[0], "invalid_address")]
+        )
+    with pytest.raises(ValidationError):
+        jpyc_client.batch_nonces(owners=ACCOUNTS, batch_size=0)
@@ -0,0 +1,19 @@
+from ..utils.test_metadata import METADATA, encode_metadata_responses
+
+
+def test_metadata(mocker, jpyc_client):
+    mocked_make_batch_request = mocker.patch.object(
+        jpyc_client.client.w3.provider,
+        "make_batch_request",
+        return_value=encode_metadata_responses(METADATA),
+    )
+
+    assert jpyc_client.metadata() == METADATA
+    assert jpyc_client.name() == "JPY Coin"
+    assert jpyc_client.symbol() == "JPYC"
+    assert jpyc_client.decimals() == 18
+    assert jpyc_client.currency() == "JPY"
+    assert jpyc_client.domain_separator() == b"\x01" * 32
+
+    # fetched once in a single batch request
+    mocked_make_batch_request.assert_called_once()
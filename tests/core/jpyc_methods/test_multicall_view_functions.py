@@ -0,0 +1,113 @@
+from decimal import Decimal
+
+import pytest
+from eth_abi import encode
+from web3.eth import Eth
+
+from packages.core.jpyc_core_sdk.utils.errors import (
+    CallFailed,
+    InvalidBytes32,
+    InvalidChecksumAddress,
+)
+
+from ..conftest import KNOWN_ACCOUNTS
+
+ACCOUNTS = [account.address for account in KNOWN_ACCOUNTS]
+
+
+@pytest.fixture(scope="function")
+def mocked_eth_call(mocker, request):
+    return mocker.patch.object(
+        Eth,
+        "call",
+        return_value=encode(
+            ["(bool,bytes)[]"],
+            [
+                [
+                    (True, encode([result[0]], [result[1]]))
+                    if isinstance(result, tuple)
+                    else (False, b"")
+                    for result in request.param
+                ]
+            ],
+        ),
+    )
+
+
+@pytest.mark.parametrize(
+    ["method", "args", "mocked_eth_call", "expected"],
+    [
+        pytest.param(
+            "multicall_balance_of",
+            [ACCOUNTS[:2]],
+            [("uint256", 10**21), ("uint256", 5 * 10**17)],
+            [Decimal(1000), Decimal("0.5")],
+            id="balance of",
+        ),
+        pytest.param(
+            "multicall_allowance",
+            [[(ACCOUNTS[0], ACCOUNTS[1]), (ACCOUNTS[1], ACCOUNTS[2])]],
+            [("uint256", 10**18), ("uint256", 2 * 10**18)],
+            [Decimal(1), Decimal(2)],
+            id="allowance",
+        ),
+        pytest.param(
+            "multicall_is_blocklisted",
+            [ACCOUNTS[:2]],
+            [("bool", True), ("bool", False)],
+            [True, False],
+            id="is blocklisted",
+        ),
+        pytest.param(
+            "multicall_authorization_state",
+            [[(ACCOUNTS[0], f"0x{'00' * 32}"), (ACCOUNTS[1], f"0x{'ff' * 32}")]],
+            [("bool", False), ("bool", True)],
+            [False, True],
+            id="authorization state",
+        ),
+    ],
+    indirect=["mocked_eth_call"],
+)
+def test_multicall_view_functions(
+    jpyc_client,
+    method,
+    args,
+    mocked_eth_call,
+    expected,
+):
+    results = getattr(jpyc_client, method)(*args)
+
+    mocked_eth_call.assert_called_once()
+    assert mocked_eth_call.call_args.args[0]["to"] == jpyc_client.multicall_address
+    assert results == expected
+
+
+@pytest.mark.parametrize(
+    ["mocked_eth_call"],
+    [
+        pytest.param([("uint256", 10**18), "reverted", ("uint256", 0)]),
+    ],
+    indirect=["mocked_eth_call"],
+)
+def test_multicall_balance_of_partial_failures(
+    jpyc_client,
+    mocked_eth_call,
+):
+    results = jpyc_client.multicall_balance_of(accounts=ACCOUNTS)
+
+    assert results[0] == Decimal(1)
+    assert isinstance(results[1], CallFailed)
+    assert results[2] == Decimal(0)
+
+
+def test_multicall_view_functions_failures(
+    jpyc_client,
+):
+    with pytest.raises(InvalidChecksumAddress):
+        jpyc_client.multicall_balance_of(accounts=["invalid_address"])
+    with pytest.raises(InvalidChecksumAddress):
+        jpyc_client.multicall_is_blocklisted(accounts=["invalid_address"])
+    with pytest.raises(InvalidBytes32):
+        jpyc_client.multicall_authorization_state(
+            authorizers_and_nonces=[(ACCOUNTS[0], "0x00")]
+        )
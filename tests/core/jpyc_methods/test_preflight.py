@@ -0,0 +1,140 @@
+import pytest
+from hexbytes import HexBytes
+from web3.eth import Eth
+
+from packages.core.jpyc_core_sdk.utils.errors import PreflightCheckFailed
+from packages.core.jpyc_core_sdk.utils.preflight import PreflightValidator
+from packages.core.jpyc_core_sdk.utils.signatures import TypedDataSigner
+
+from ..conftest import KNOWN_ACCOUNTS
+from ..utils.test_metadata import METADATA
+
+
+def test_transfer_with_authorization_preflight(
+    mocker, jpyc_client, mocked_eth_latest_block, nonce
+):
+    jpyc_client.preflight_validator = PreflightValidator(TypedDataSigner(METADATA))
+    jpyc_client.transaction_pipeline = mocker.Mock()
+    jpyc_client.transaction_pipeline.transact.return_value = b"\x01" * 32
+    signature = TypedDataSigner(METADATA).sign_transfer_with_authorization(
+        jpyc_client.client.account, KNOWN_ACCOUNTS[1].address, 10**18, 0, 2**32, nonce
+    )
+    args = {
+        "from_": KNOWN_ACCOUNTS[0].address,
+        "to": KNOWN_ACCOUNTS[1].address,
+        "value": 1,
+        "valid_after": 0,
+        "valid_before": 2**32,
+        "nonce": nonce,
+        **signature._asdict(),
+    }
+
+    jpyc_client.transfer_with_authorization(**args)
+
+    # nonces of sent transactions are rejected offline while pending
+    assert jpyc_client.preflight_validator.is_authorization_pending(
+        KNOWN_ACCOUNTS[0].address, nonce
+    )
+    with pytest.raises(PreflightCheckFailed):
+        jpyc_client.transfer_with_authorization(**args)
+    jpyc_client.transaction_pipeline.transact.assert_called_once()
+
+
+def test_transfer_with_authorization_preflight_failures(
+    jpyc_client, mocked_eth_latest_block, nonce
+):
+    jpyc_client.preflight_validator = PreflightValidator(TypedDataSigner(METADATA))
+    signature = TypedDataSigner(METADATA).sign_transfer_with_authorization(
+        jpyc_client.client.account, KNOWN_ACCOUNTS[1].address, 10**18, 0, 2**32, nonce
+    )
+
+    # rejected before simulating the transaction
+    with pytest.raises(PreflightCheckFailed, match="invalid signature"):
+        jpyc_client.transfer_with_authorization(
+            from_=KNOWN_ACCOUNTS[0].address,
+            to=KNOWN_ACCOUNTS[1].address,
+            value=2,
+            valid_after=0,
+            valid_before=2**32,
+            nonce=nonce,
+            **signature._asdict(),
+        )
+
+
+def test_transfer_with_authorization_preflight_block_timestamp(
+    jpyc_client, mocked_eth_latest_block, nonce
+):
+    jpyc_client.preflight_validator = PreflightValidator(TypedDataSigner(METADATA))
+    # the latest block is past the time window (unlike the local clock)
+    mocked_eth_latest_block.return_value = {"number": 100, "timestamp": 2**32}
+    signature = TypedDataSigner(METADATA).sign_transfer_with_authorization(
+        jpyc_client.client.account, KNOWN_ACCOUNTS[1].address, 10**18, 0, 2**32, nonce
+    )
+    args = {
+        "from_": KNOWN_ACCOUNTS[0].address,
+        "to": KNOWN_ACCOUNTS[1].address,
+        "value": 1,
+        "valid_after": 0,
+        "valid_before": 2**32,
+        "nonce": nonce,
+        **signature._asdict(),
+    }
+
+    for _ in range(2):
+        with pytest.raises(PreflightCheckFailed, match="expired"):
+            jpyc_client.transfer_with_authorization(**args)
+
+    # fetched once & cached while fresh
+    mocked_eth_latest_block.assert_called_once_with("latest")
+
+
+def test_permit_preflight(mocker, jpyc_client, mocked_eth_latest_block, valid_before):
+    jpyc_client.preflight_validator = PreflightValidator(TypedDataSigner(METADATA))
+    jpyc_client.transaction_pipeline = mocker.Mock()
+    jpyc_client.transaction_pipeline.transact.return_value = b"\x01" * 32
+    mocked_call = mocker.patch.object(
+        Eth, "call", return_value=HexBytes((3).to_bytes(32, "big"))
+    )
+    signature = TypedDataSigner(METADATA).sign_permit(
+        jpyc_client.client.account, KNOWN_ACCOUNTS[1].address, 10**18, 3, valid_before
+    )
+
+    tx_hash = jpyc_client.permit(
+        owner=KNOWN_ACCOUNTS[0].address,
+        spender=KNOWN_ACCOUNTS[1].address,
+        value=1,
+        deadline=valid_before,
+        **signature._asdict(),
+    )
+
+    # nonces of permits are fetched only if unknown
+    mocked_call.assert_called_once()
+    jpyc_client.transaction_pipeline.transact.assert_called_once()
+    validator = jpyc_client.preflight_validator
+    validator.record_receipt({"transactionHash": tx_hash, "status": 1})
+    assert validator.get_permit_nonce(KNOWN_ACCOUNTS[0].address) == 4
+
+
+def test_permit_preflight_failures(
+    mocker, jpyc_client, mocked_eth_latest_block, valid_before
+):
+    jpyc_client.preflight_validator = PreflightValidator(TypedDataSigner(METADATA))
+    mocked_call = mocker.patch.object(
+        Eth, "call", return_value=HexBytes((3).to_bytes(32, "big"))
+    )
+    signature = TypedDataSigner(METADATA).sign_permit(
+        jpyc_client.client.account, KNOWN_ACCOUNTS[1].address, 10**18, 3, valid_before
+    )
+
+    # rejected before simulating the transaction
+    with pytest.raises(PreflightCheckFailed, match="invalid signature"):
+        jpyc_client.permit(
+            owner=KNOWN_ACCOUNTS[0].address,
+            spender=KNOWN_ACCOUNTS[1].address,
+            value=2,
+            deadline=valid_before,
+            **signature._asdict(),
+        )
+
+    # fetched once again before rejecting signatures
+    assert mocked_call.call_count == 2
@@ -0,0 +1,64 @@
+from decimal import Decimal
+
+import pytest
+from web3.eth import Eth
+
+from packages.core.jpyc_core_sdk.utils.caches import ReadCache
+
+from ..conftest import KNOWN_ACCOUNTS
+
+ACCOUNTS = [account.address for account in KNOWN_ACCOUNTS]
+
+
+@pytest.fixture(scope="function")
+def mocked_balance_of(mocker, jpyc_client):
+    contract_function = mocker.MagicMock()
+    contract_function.return_value.call.return_value = 10**18
+
+    return mocker.patch.object(
+        jpyc_client.contract.functions, "balanceOf", contract_function
+    )
+
+
+@pytest.fixture(scope="function")
+def mocked_block_number(mocker):
+    return mocker.patch.object(
+        Eth, "block_number", new_callable=mocker.PropertyMock, return_value=100
+    )
+
+
+def test_read_cache(jpyc_client, mocked_balance_of, mocked_block_number):
+    jpyc_client.read_cache = ReadCache(head_ttl=60)
+
+    assert jpyc_client.balance_of(account=ACCOUNTS[0]) == Decimal(1)
+    assert jpyc_client.balance_of(account=ACCOUNTS[0]) == Decimal(1)
+
+    # reads are pinned to the latest block number, which is fetched only once
+    mocked_block_number.assert_called_once()
+    mocked_balance_of.return_value.call.assert_called_once_with(block_identifier=100)
+    assert jpyc_client.read_cache.cache_info().hits == 1
+
+
+def test_read_cache_in_snapshot(jpyc_client, mocked_balance_of):
+    jpyc_client.read_cache = ReadCache()
+
+    for _ in range(2):
+        with jpyc_client.at_block(100):
+            jpyc_client.balance_of(account=ACCOUNTS[0])
+
+    # results outlive snapshots
+    mocked_balance_of.return_value.call.assert_called_once_with(block_identifier=100)
+
+
+def test_read_cache_invalidation(
+    mocker, jpyc_client, mocked_balance_of, mocked_block_number
+):
+    jpyc_client.read_cache = ReadCache(head_ttl=60)
+    jpyc_client.transaction_pipeline = mocker.Mock()
+    jpyc_client.transaction_pipeline.transact.return_value = b"\x01" * 32
+
+    jpyc_client.balance_of(account=ACCOUNTS[0])
+    jpyc_client.transfer(to=ACCOUNTS[1], value=1)
+    jpyc_client.balance_of(account=ACCOUNTS[0])
+
+    assert mocked_balance_of.return_value.call.call_count == 2
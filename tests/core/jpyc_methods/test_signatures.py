@@ -0,0 +1,64 @@
+import pytest
+
+from packages.core.jpyc_core_sdk.utils.errors import (
+    AccountNotInitialized,
+    InvalidBytes32,
+)
+from packages.core.jpyc_core_sdk.utils.signatures import TypedDataSigner
+
+from ..conftest import KNOWN_ACCOUNTS
+from ..utils.test_metadata import METADATA
+
+
+@pytest.fixture(scope="function")
+def mocked_metadata(mocker, jpyc_client):
+    return mocker.patch.object(jpyc_client, "metadata", return_value=METADATA)
+
+
+def test_sign_transfer_with_authorization(jpyc_client, mocked_metadata, nonce):
+    signature = jpyc_client.sign_transfer_with_authorization(
+        to=KNOWN_ACCOUNTS[1].address,
+        value=1,
+        valid_after=0,
+        valid_before=2**32,
+        nonce=nonce,
+    )
+
+    # decimals are removed as in `transfer_with_authorization`
+    assert signature == TypedDataSigner(METADATA).sign_transfer_with_authorization(
+        jpyc_client.client.account, KNOWN_ACCOUNTS[1].address, 10**18, 0, 2**32, nonce
+    )
+    assert signature.v in (27, 28)
+    # metadata is fetched once per client
+    jpyc_client.sign_cancel_authorization(nonce=nonce)
+    mocked_metadata.assert_called_once()
+
+
+def test_sign_permit(mocker, jpyc_client, mocked_metadata):
+    mocked_nonces = mocker.patch.object(jpyc_client, "nonces", return_value=5)
+
+    signature = jpyc_client.sign_permit(
+        spender=KNOWN_ACCOUNTS[1].address, value=1, deadline=2**32
+    )
+
+    mocked_nonces.assert_called_once_with(owner=KNOWN_ACCOUNTS[0].address)
+    assert signature == TypedDataSigner(METADATA).sign_permit(
+        jpyc_client.client.account, KNOWN_ACCOUNTS[1].address, 10**18, 5, 2**32
+    )
+
+
+def test_bulk_signer(jpyc_client, mocked_metadata):
+    bulk_signer = jpyc_client.bulk_signer(max_workers=2, chunk_size=10)
+
+    assert bulk_signer.metadata == METADATA
+    assert bulk_signer.max_workers == 2
+    assert bulk_signer.chunk_size == 10
+
+
+def test_sign_failures(jpyc_client, jpyc_client_without_account, nonce):
+    with pytest.raises(InvalidBytes32):
+        jpyc_client.sign_cancel_authorization(nonce="0x01")
+    with pytest.raises(AccountNotInitialized):
+        jpyc_client_without_account.sign_cancel_authorization(nonce=nonce)
+    with pytest.raises(AccountNotInitialized):
+        jpyc_client_without_account.bulk_signer()
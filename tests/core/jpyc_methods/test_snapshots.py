@@ -0,0 +1,91 @@
+from decimal import Decimal
+
+import pytest
+from eth_abi import encode
+from pydantic import ValidationError
+from web3.eth import Eth
+
+from ..conftest import KNOWN_ACCOUNTS
+
+ACCOUNTS = [account.address for account in KNOWN_ACCOUNTS]
+
+
+@pytest.fixture(scope="function")
+def mocked_balance_of(mocker, jpyc_client):
+    contract_function = mocker.MagicMock()
+    contract_function.return_value.call.return_value = 10**18
+
+    return mocker.patch.object(
+        jpyc_client.contract.functions, "balanceOf", contract_function
+    )
+
+
+def test_at_block(jpyc_client, mocked_balance_of):
+    with jpyc_client.at_block(100) as snapshot:
+        assert jpyc_client.balance_of(account=ACCOUNTS[0]) == Decimal(1)
+        assert jpyc_client.balance_of(account=ACCOUNTS[0]) == Decimal(1)
+
+    assert snapshot.block_number == 100
+    # reads are pinned to the block & memoized
+    mocked_balance_of.return_value.call.assert_called_once_with(block_identifier=100)
+
+    jpyc_client.balance_of(account=ACCOUNTS[0])
+    mocked_balance_of.return_value.call.assert_called_with()
+
+
+def test_at_block_failures(jpyc_client):
+    with pytest.raises(ValidationError):
+        with jpyc_client.at_block(-1):
+            pass
+
+
+def test_nested_at_block(jpyc_client, mocked_balance_of):
+    with jpyc_client.at_block(100):
+        with jpyc_client.at_block(99):
+            jpyc_client.balance_of(account=ACCOUNTS[0])
+        jpyc_client.balance_of(account=ACCOUNTS[0])
+
+    assert [
+        call.kwargs for call in mocked_balance_of.return_value.call.call_args_list
+    ] == [{"block_identifier": 99}, {"block_identifier": 100}]
+
+
+def test_snapshot(mocker, jpyc_client, mocked_balance_of):
+    mocker.patch.object(
+        Eth, "block_number", new_callable=mocker.PropertyMock, return_value=123
+    )
+
+    with jpyc_client.snapshot() as snapshot:
+        jpyc_client.balance_of(account=ACCOUNTS[0])
+
+    assert snapshot.block_number == 123
+    mocked_balance_of.return_value.call.assert_called_once_with(block_identifier=123)
+
+
+def test_batch_balance_of_in_snapshot(mocker, jpyc_client):
+    mocked_make_batch_request = mocker.patch.object(
+        jpyc_client.client.w3.provider,
+        "make_batch_request",
+        return_value=[
+            {
+                "jsonrpc": "2.0",
+                "id": i,
+                "result": f"0x{encode(['uint256'], [value]).hex()}",
+            }
+            for i, value in enumerate([10**18, 2 * 10**18])
+        ],
+    )
+
+    with jpyc_client.at_block(100):
+        balances = jpyc_client.batch_balance_of(
+            accounts=[ACCOUNTS[0], ACCOUNTS[1], ACCOUNTS[0]]
+        )
+        # memoized within the snapshot
+        assert jpyc_client.batch_balance_of(accounts=ACCOUNTS[:2]) == balances[:2]
+
+    assert balances == [Decimal(1), Decimal(2), Decimal(1)]
+    mocked_make_batch_request.assert_called_once()
+    # duplicate calls are deduplicated, and pinned to the block
+    requests = mocked_make_batch_request.call_args.args[0]
+    assert len(requests) == 2
+    assert all(params[1] == hex(100) for _, params in requests)
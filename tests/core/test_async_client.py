@@ -0,0 +1,206 @@
+import asyncio
+
+from eth_account.signers.local import LocalAccount
+import pytest
+from web3 import AsyncWeb3
+from web3._utils.empty import empty
+
+from packages.core.jpyc_core_sdk.async_client import AsyncSdkClient
+from packages.core.jpyc_core_sdk.utils.errors import (
+    AccountNotInitialized,
+    ChainIdMismatch,
+    InvalidBytes32,
+    InvalidRpcEndpoint,
+    NetworkNotSupported,
+)
+from packages.core.jpyc_core_sdk.utils.providers import AsyncFailoverHTTPProvider
+
+from .conftest import KNOWN_ACCOUNTS
+
+
+@pytest.mark.parametrize(
+    [
+        "rpc_endpoint",
+        "private_key",
+        "address",
+    ],
+    [
+        pytest.param(
+            None,
+            None,
+            None,
+            id="valid default network; without account",
+        ),
+        pytest.param(
+            "http://127.0.0.1:8545/",
+            None,
+            None,
+            id="valid custom network; without account",
+        ),
+        pytest.param(
+            None,
+            KNOWN_ACCOUNTS[0].private_key,
+            KNOWN_ACCOUNTS[0].address,
+            id="valid network; with account",
+        ),
+    ],
+)
+def test_constructor(
+    rpc_endpoint,
+    private_key,
+    address,
+):
+    client = AsyncSdkClient(
+        chain_name="ethereum",
+        network_name="mainnet",
+        rpc_endpoint=rpc_endpoint,
+        private_key=private_key,
+    )
+
+    assert isinstance(client.w3, AsyncWeb3)
+    if private_key is None:
+        assert client.account is None
+        assert client.w3.eth.default_account == empty
+    else:
+        assert isinstance(client.account, LocalAccount)
+        assert client.w3.eth.default_account == address
+
+
+@pytest.mark.parametrize(
+    [
+        "chain_name",
+        "network_name",
+        "rpc_endpoint",
+        "private_key",
+        "exception_class",
+    ],
+    [
+        pytest.param(
+            "localhost",
+            "mainnet",
+            None,
+            None,
+            NetworkNotSupported,
+            id="invalid network configuration",
+        ),
+        pytest.param(
+            "ethereum",
+            "mainnet",
+            "invalid_uri",
+            None,
+            InvalidRpcEndpoint,
+            id="invalid rpc_endpoint",
+        ),
+        pytest.param(
+            "ethereum",
+            "mainnet",
+            None,
+            "invalid_private_key",
+            InvalidBytes32,
+            id="invalid private_key",
+        ),
+    ],
+)
+def test_constructor_failures(
+    chain_name,
+    network_name,
+    rpc_endpoint,
+    private_key,
+    exception_class,
+):
+    with pytest.raises(exception_class):
+        AsyncSdkClient(
+            chain_name=chain_name,
+            network_name=network_name,
+            rpc_endpoint=rpc_endpoint,
+            private_key=private_key,
+        )
+
+
+def test_set_default_provider(async_sdk_client):
+    async_sdk_client.set_default_provider(
+        chain_name="polygon",
+        network_name="amoy",
+    )
+
+    assert async_sdk_client.w3.provider.endpoint_uri == (
+        "https://rpc-amoy.polygon.technology"
+    )
+    assert async_sdk_client.w3.eth.default_account == KNOWN_ACCOUNTS[0].address
+    assert asyncio.run(async_sdk_client.get_chain_id()) == 80002
+
+
+def test_set_custom_provider(async_sdk_client, mocker):
+    mocked_chain_id = mocker.patch(
+        "web3.eth.async_eth.AsyncEth.chain_id",
+        new_callable=mocker.PropertyMock,
+        side_effect=lambda: asyncio.sleep(0, result=31337),
+    )
+
+    async_sdk_client.set_custom_provider(rpc_endpoint="http://127.0.0.1:8545/")
+
+    assert async_sdk_client.w3.provider.endpoint_uri == "http://127.0.0.1:8545/"
+    assert asyncio.run(async_sdk_client.get_chain_id()) == 31337
+    assert asyncio.run(async_sdk_client.get_chain_id()) == 31337
+    mocked_chain_id.assert_called_once()
+
+
+@pytest.mark.parametrize(
+    ["chain_id", "verified"],
+    [
+        pytest.param(137, True, id="same network"),
+        pytest.param(1, False, id="another network"),
+    ],
+)
+def test_get_chain_id_verified(mocker, chain_id, verified):
+    mocked_chain_id = mocker.patch(
+        "web3.eth.async_eth.AsyncEth.chain_id",
+        new_callable=mocker.PropertyMock,
+        side_effect=lambda: asyncio.sleep(0, result=chain_id),
+    )
+    client = AsyncSdkClient(
+        chain_name="polygon",
+        network_name="mainnet",
+        rpc_endpoint="http://127.0.0.1:8545/",
+    )
+
+    if verified:
+        assert asyncio.run(client.get_chain_id()) == 137
+        assert asyncio.run(client.get_chain_id()) == 137
+    else:
+        with pytest.raises(ChainIdMismatch):
+            asyncio.run(client.get_chain_id())
+    mocked_chain_id.assert_called_once()
+
+
+def test_set_failover_provider(async_sdk_client):
+    rpc_endpoints = ["http://127.0.0.1:8545/", "http://localhost:8545/"]
+
+    async_sdk_client.set_failover_provider(rpc_endpoints=rpc_endpoints)
+    async_sdk_client.set_account(private_key=KNOWN_ACCOUNTS[1].private_key)
+
+    assert isinstance(async_sdk_client.w3.provider, AsyncFailoverHTTPProvider)
+    assert async_sdk_client.w3.provider.endpoints == rpc_endpoints
+    assert async_sdk_client.rpc_endpoints == rpc_endpoints
+    assert async_sdk_client.w3.eth.default_account == KNOWN_ACCOUNTS[1].address
+
+
+def test_set_account(async_sdk_client):
+    account = async_sdk_client.set_account(
+        private_key=KNOWN_ACCOUNTS[1].private_key,
+    )
+
+    assert account.address == KNOWN_ACCOUNTS[1].address
+    assert async_sdk_client.w3.eth.default_account == KNOWN_ACCOUNTS[1].address
+    assert async_sdk_client.nonce_manager.address == KNOWN_ACCOUNTS[1].address
+
+    async_sdk_client.set_account(private_key=None)
+
+    assert async_sdk_client.account is None
+    assert async_sdk_client.w3.eth.default_account == empty
+    assert async_sdk_client.nonce_manager is None
+
+
+def test_get_account_address_failures(async_sdk_client_without_account):
+    with pytest.raises(AccountNotInitialized):
+        async_sdk_client_without_account.get_account_address()
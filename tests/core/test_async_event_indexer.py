@@ -0,0 +1,52 @@
+import asyncio
+
+from web3 import Web3
+
+from packages.core.jpyc_core_sdk.async_event_indexer import AsyncEventIndexer
+from packages.core.jpyc_core_sdk.utils.event_store import EventStore
+
+from .conftest import KNOWN_ACCOUNTS
+from .test_event_indexer import LATEST_BLOCK, Chain
+
+
+def test_sync(async_jpyc_client, mocker):
+    chain = Chain()
+    w3 = async_jpyc_client.client.w3
+    mocker.patch.object(
+        w3.eth, "get_block", mocker.AsyncMock(side_effect=chain.get_block)
+    )
+    mocker.patch.object(
+        w3.eth, "get_logs", mocker.AsyncMock(side_effect=chain.get_logs)
+    )
+    mocker.patch(
+        "web3.eth.async_eth.AsyncEth.block_number",
+        new_callable=mocker.PropertyMock,
+        side_effect=lambda: asyncio.sleep(0, result=LATEST_BLOCK),
+    )
+    mocker.patch.object(
+        w3.provider,
+        "make_batch_request",
+        mocker.AsyncMock(side_effect=chain.make_batch_request),
+    )
+    indexer = AsyncEventIndexer(
+        jpyc=async_jpyc_client, store=EventStore(), batch_size=8
+    )
+    save = mocker.spy(indexer.store, "save")
+
+    async def run() -> tuple[int, int, int]:
+        count = await indexer.sync(from_block=1, to_block=50)
+        # blocks are fetched only for the head (i.e., never per batch)
+        w3.eth.get_block.assert_awaited_once_with(50)
+        # cursors are saved along with their block hashes
+        assert all(
+            call.args[4] == Web3.to_hex(chain.get_block_hash(call.args[3]))
+            for call in save.call_args_list
+        )
+        chain.fork_block = 45
+        # clamped to the latest block
+        replayed = await indexer.sync(to_block=LATEST_BLOCK + 10)
+        transfers = await indexer.get_transfers(KNOWN_ACCOUNTS[0].address)
+
+        return count, replayed, len(transfers)
+
+    assert asyncio.run(run()) == (50, LATEST_BLOCK - 45, LATEST_BLOCK)
@@ -0,0 +1,28 @@
+import asyncio
+
+from packages.core.jpyc_core_sdk.async_event_scanner import AsyncEventScanner
+from packages.core.jpyc_core_sdk.utils.events import BlockRangeSizer
+
+from .test_event_scanner import get_logs
+
+
+def test_scan(async_jpyc_client, mocker):
+    mocker.patch.object(
+        async_jpyc_client.client.w3.eth,
+        "get_logs",
+        mocker.AsyncMock(side_effect=get_logs),
+    )
+    scanner = AsyncEventScanner(
+        jpyc=async_jpyc_client,
+        event_names=["Transfer"],
+        max_workers=2,
+        sizer=BlockRangeSizer(chunk_size=4),
+    )
+
+    async def run() -> list[int]:
+        return [
+            event["blockNumber"]
+            async for event in scanner.scan(from_block=1, to_block=100)
+        ]
+
+    assert asyncio.run(run()) == list(range(1, 101))
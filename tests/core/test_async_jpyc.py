@@ -0,0 +1,320 @@
+import asyncio
+from decimal import Decimal
+
+import pytest
+from web3.contract.async_contract import AsyncContract
+
+from packages.core.jpyc_core_sdk.async_jpyc import AsyncJPYC
+from packages.core.jpyc_core_sdk.utils.errors import (
+    AccountNotInitialized,
+    InvalidChecksumAddress,
+    InvalidUint256,
+    NetworkNotSupported,
+    PreflightCheckFailed,
+    TransactionFailed,
+    TransactionSimulationFailed,
+)
+from packages.core.jpyc_core_sdk.utils.preflight import PreflightValidator
+from packages.core.jpyc_core_sdk.utils.signatures import TypedDataSigner
+
+from .conftest import KNOWN_ACCOUNTS, V2_PROXY_ADDRESS
+from .utils.test_metadata import METADATA, encode_metadata_responses
+
+
+@pytest.fixture(scope="function")
+def mocked_async_contract_function(mocker, async_jpyc_client, request):
+    contract_function = mocker.MagicMock()
+    contract_function.return_value.call = mocker.AsyncMock(
+        **request.param.get("call", {"return_value": None})
+    )
+    contract_function.return_value.transact = mocker.AsyncMock(
+        **request.param.get("transact", {"return_value": "0x"})
+    )
+
+    return mocker.patch.object(
+        async_jpyc_client.contract.functions,
+        request.param["func_name"],
+        contract_function,
+    )
+
+
+def test_constructor(async_sdk_client):
+    jpyc = AsyncJPYC(client=async_sdk_client)
+
+    assert jpyc.client == async_sdk_client
+    assert isinstance(jpyc.contract, AsyncContract)
+    assert jpyc.contract.address == V2_PROXY_ADDRESS
+    assert jpyc.contract is AsyncJPYC(client=async_sdk_client).contract
+
+
+def test_deploy_failures(async_sdk_client):
+    with pytest.raises(NetworkNotSupported):
+        asyncio.run(AsyncJPYC.deploy(client=async_sdk_client))
+
+
+@pytest.mark.parametrize(
+    ["mocked_async_contract_function"],
+    [
+        pytest.param(
+            {
+                "func_name": "balanceOf",
+                "call": {"return_value": 1000 * 10**18},
+            },
+        ),
+    ],
+    indirect=["mocked_async_contract_function"],
+)
+def test_balance_of(
+    async_jpyc_client,
+    mocked_async_contract_function,
+):
+    account = KNOWN_ACCOUNTS[0].address
+
+    balance = asyncio.run(async_jpyc_client.balance_of(account=account))
+
+    assert balance == Decimal(1000)
+    mocked_async_contract_function.assert_called_once_with(account)
+
+
+@pytest.mark.parametrize(
+    ["mocked_async_contract_function"],
+    [
+        pytest.param(
+            {
+                "func_name": "balanceOf",
+                "call": {"return_value": 1000 * 10**18},
+            },
+        ),
+    ],
+    indirect=["mocked_async_contract_function"],
+)
+def test_snapshot(
+    mocker,
+    async_jpyc_client,
+    mocked_async_contract_function,
+):
+    mocker.patch(
+        "web3.eth.async_eth.AsyncEth.block_number",
+        new_callable=mocker.PropertyMock,
+        side_effect=lambda: asyncio.sleep(0, result=123),
+    )
+    account = KNOWN_ACCOUNTS[0].address
+
+    async def read_in_snapshot():
+        async with async_jpyc_client.snapshot():
+            # tasks created within the snapshot are pinned as well
+            return await asyncio.gather(
+                *(async_jpyc_client.balance_of(account=account) for _ in range(2))
+            )
+
+    assert asyncio.run(read_in_snapshot()) == [Decimal(1000)] * 2
+    mocked_async_contract_function.return_value.call.assert_awaited_with(
+        block_identifier=123
+    )
+
+
+def test_metadata(mocker, async_jpyc_client):
+    mocked_make_batch_request = mocker.patch.object(
+        async_jpyc_client.client.w3.provider,
+        "make_batch_request",
+        new_callable=mocker.AsyncMock,
+        return_value=encode_metadata_responses(METADATA),
+    )
+
+    async def read_metadata():
+        return await asyncio.gather(
+            async_jpyc_client.name(),
+            async_jpyc_client.decimals(),
+            async_jpyc_client.domain_separator(),
+        )
+
+    assert asyncio.run(read_metadata()) == ["JPY Coin", 18, b"\x01" * 32]
+    # concurrent reads share a single batch request
+    mocked_make_batch_request.assert_awaited_once()
+
+
+def test_sign_cancel_authorization(mocker, async_jpyc_client, nonce):
+    mocker.patch.object(
+        async_jpyc_client,
+        "metadata",
+        new_callable=mocker.AsyncMock,
+        return_value=METADATA,
+    )
+
+    signature = asyncio.run(async_jpyc_client.sign_cancel_authorization(nonce=nonce))
+
+    assert signature == TypedDataSigner(METADATA).sign_cancel_authorization(
+        async_jpyc_client.client.account, nonce
+    )
+
+
+def test_authorization_state_with_preflight_validator(async_jpyc_client, nonce):
+    validator = PreflightValidator(TypedDataSigner(METADATA))
+    validator.mark_authorization_used(KNOWN_ACCOUNTS[0].address, nonce)
+    async_jpyc_client.preflight_validator = validator
+
+    # nonces known to be used are answered without RPC
+    assert asyncio.run(
+        async_jpyc_client.authorization_state(
+            authorizer=KNOWN_ACCOUNTS[0].address, nonce=nonce
+        )
+    )
+
+
+@pytest.mark.parametrize(
+    ["mocked_async_contract_function"],
+    [
+        pytest.param(
+            {"func_name": "authorizationState", "call": {"return_value": False}},
+        ),
+    ],
+    indirect=["mocked_async_contract_function"],
+)
+def test_authorization_state_without_cache(
+    async_jpyc_client, mocked_async_contract_function, nonce
+):
+    validator = PreflightValidator(TypedDataSigner(METADATA))
+    validator.mark_authorization_used(KNOWN_ACCOUNTS[0].address, nonce)
+    async_jpyc_client.preflight_validator = validator
+
+    # the cache could be bypassed (e.g., after chain reorganizations)
+    assert not asyncio.run(
+        async_jpyc_client.authorization_state(
+            authorizer=KNOWN_ACCOUNTS[0].address, nonce=nonce, use_cache=False
+        )
+    )
+    mocked_async_contract_function.assert_called_once()
+
+
+@pytest.mark.parametrize(
+    ["mocked_async_contract_function"],
+    [
+        pytest.param(
+            {"func_name": "nonces", "call": {"return_value": 3}},
+        ),
+    ],
+    indirect=["mocked_async_contract_function"],
+)
+def test_permit_with_preflight_validator(
+    mocker, async_jpyc_client, mocked_async_contract_function, valid_before
+):
+    get_block = mocker.patch(
+        "web3.eth.async_eth.AsyncEth.get_block",
+        new=mocker.AsyncMock(return_value={"number": 100, "timestamp": 2**32}),
+    )
+    async_jpyc_client.preflight_validator = PreflightValidator(
+        TypedDataSigner(METADATA)
+    )
+    async_jpyc_client.transaction_pipeline = mocker.AsyncMock()
+    signature = TypedDataSigner(METADATA).sign_permit(
+        async_jpyc_client.client.account,
+        KNOWN_ACCOUNTS[1].address,
+        10**18,
+        3,
+        valid_before,
+    )
+
+    # the latest block is past the deadline (unlike the local clock)
+    with pytest.raises(PreflightCheckFailed, match="expired"):
+        asyncio.run(
+            async_jpyc_client.permit(
+                owner=KNOWN_ACCOUNTS[0].address,
+                spender=KNOWN_ACCOUNTS[1].address,
+                value=1,
+                deadline=valid_before,
+                **signature._asdict(),
+            )
+        )
+
+    get_block.assert_awaited_once_with("latest")
+    # nonces of permits are fetched before checking signatures
+    mocked_async_contract_function.assert_called_with(KNOWN_ACCOUNTS[0].address)
+    assert (
+        async_jpyc_client.preflight_validator.get_permit_nonce(
+            KNOWN_ACCOUNTS[0].address
+        )
+        == 3
+    )
+    async_jpyc_client.transaction_pipeline.transact.assert_not_called()
+
+
+def test_balance_of_failures(async_jpyc_client):
+    with pytest.raises(InvalidChecksumAddress):
+        asyncio.run(async_jpyc_client.balance_of(account="invalid_address"))
+
+
+@pytest.mark.parametrize(
+    ["mocked_async_contract_function"],
+    [
+        pytest.param(
+            {"func_name": "transfer"},
+        ),
+    ],
+    indirect=["mocked_async_contract_function"],
+)
+def test_transfer(
+    async_jpyc_client,
+    mocked_async_contract_function,
+):
+    to = KNOWN_ACCOUNTS[1].address
+    value = 10000
+
+    tx_hash = asyncio.run(async_jpyc_client.transfer(to=to, value=value))
+
+    assert tx_hash == "0x"
+    assert mocked_async_contract_function.call_count == 2
+    mocked_async_contract_function.assert_called_with(
+        to=to,
+        value=value * 10**18,
+    )
+    mocked_async_contract_function.return_value.call.assert_awaited_once()
+    mocked_async_contract_function.return_value.transact.assert_awaited_once()
+
+
+@pytest.mark.parametrize(
+    [
+        "mocked_async_contract_function",
+        "exception_class",
+    ],
+    [
+        pytest.param(
+            {
+                "func_name": "transfer",
+                "call": {"side_effect": ValueError("execution reverted")},
+            },
+            TransactionSimulationFailed,
+            id="simulation failure",
+        ),
+        pytest.param(
+            {
+                "func_name": "transfer",
+                "transact": {"side_effect": ValueError("nonce too low")},
+            },
+            TransactionFailed,
+            id="transaction failure",
+        ),
+    ],
+    indirect=["mocked_async_contract_function"],
+)
+def test_transfer_transaction_failures(
+    async_jpyc_client,
+    mocked_async_contract_function,
+    exception_class,
+):
+    with pytest.raises(exception_class):
+        asyncio.run(async_jpyc_client.transfer(to=KNOWN_ACCOUNTS[1].address, value=1))
+
+
+def test_transfer_failures(async_jpyc_client):
+    with pytest.raises(InvalidUint256):
+        asyncio.run(async_jpyc_client.transfer(to=KNOWN_ACCOUNTS[1].address, value=-1))
+
+
+def test_transfer_account_not_initialized(async_jpyc_client_without_account):
+    with pytest.raises(AccountNotInitialized):
+        asyncio.run(
+            async_jpyc_client_without_account.transfer(
+                to=KNOWN_ACCOUNTS[1].address,
+                value=1000,
+            )
+        )
@@ -0,0 +1,51 @@
+import asyncio
+
+from hexbytes import HexBytes
+from web3 import AsyncHTTPProvider
+from web3.eth import AsyncEth
+
+from packages.core.jpyc_core_sdk.async_receipt_tracker import AsyncReceiptTracker
+
+TX_HASHES = [HexBytes(bytes([i]) * 32) for i in range(3)]
+
+
+def raw_receipt(tx_hash: HexBytes) -> dict:
+    return {
+        "transactionHash": tx_hash.to_0x_hex(),
+        "blockNumber": "0x1",
+        "status": "0x1",
+    }
+
+
+def test_wait(async_sdk_client, mocker):
+    block_number = mocker.AsyncMock(side_effect=[1, 1, 2, 2])
+    mocker.patch.object(
+        AsyncEth,
+        "block_number",
+        new_callable=mocker.PropertyMock,
+        side_effect=lambda: block_number(),
+    )
+    make_batch_request = mocker.patch.object(
+        AsyncHTTPProvider,
+        "make_batch_request",
+        mocker.AsyncMock(
+            side_effect=[
+                [
+                    {"id": 0, "result": raw_receipt(TX_HASHES[0])},
+                    {"id": 1, "result": None},
+                    {"id": 2, "result": None},
+                ],
+                [
+                    {"id": 0, "result": raw_receipt(TX_HASHES[1])},
+                    {"id": 1, "result": raw_receipt(TX_HASHES[2])},
+                ],
+            ]
+        ),
+    )
+    tracker = AsyncReceiptTracker(client=async_sdk_client, poll_interval=0.01)
+
+    receipts = asyncio.run(tracker.wait(TX_HASHES, timeout=5))
+
+    assert [receipt["transactionHash"] for receipt in receipts] == TX_HASHES
+    # outstanding transactions are polled in a single batch request per new block
+    assert make_batch_request.call_count == 2
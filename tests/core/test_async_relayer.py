@@ -0,0 +1,86 @@
+import asyncio
+
+import pytest
+from hexbytes import HexBytes
+
+from packages.core.jpyc_core_sdk.async_relayer import AsyncRelayer
+from packages.core.jpyc_core_sdk.utils.errors import (
+    RelayRequestRejected,
+    TransactionSimulationFailed,
+)
+
+from .test_relayer import TX_HASH, relay_request
+
+
+@pytest.fixture(scope="function")
+def relayer(async_jpyc_client, mocker):
+    async_jpyc_client.transaction_pipeline = mocker.Mock()
+    async_jpyc_client.transaction_pipeline.transact = mocker.AsyncMock(
+        return_value=TX_HASH
+    )
+
+    return AsyncRelayer(jpyc=async_jpyc_client, max_workers=4)
+
+
+def test_async_relayer_requires_transaction_pipeline(async_jpyc_client):
+    with pytest.raises(ValueError):
+        AsyncRelayer(jpyc=async_jpyc_client)
+
+
+def test_submit(relayer):
+    async def run() -> list[HexBytes]:
+        relayer.start()
+        futures = [relayer.submit(relay_request(i)) for i in range(20)]
+        tx_hashes = await asyncio.wait_for(asyncio.gather(*futures), timeout=5)
+        await relayer.stop()
+
+        return tx_hashes
+
+    assert asyncio.run(run()) == [TX_HASH] * 20
+    assert relayer.jpyc.transaction_pipeline.transact.await_count == 20
+    stats = relayer.get_stats()
+    for stage in ("validate", "queue", "submit", "total"):
+        assert stats[stage].count == 20
+
+
+def test_submit_failed(relayer):
+    relayer.jpyc.transaction_pipeline.transact.side_effect = [
+        TransactionSimulationFailed("reverted"),
+        TX_HASH,
+    ]
+
+    async def run() -> HexBytes:
+        relayer.start()
+        with pytest.raises(TransactionSimulationFailed):
+            await relayer.submit(relay_request(1))
+        # failed requests can be retried
+        tx_hash = await relayer.submit(relay_request(1))
+        await relayer.stop()
+
+        return tx_hash
+
+    assert asyncio.run(run()) == TX_HASH
+
+
+def test_submit_rejected(relayer):
+    async def run() -> None:
+        relayer.submit(relay_request(1))
+        with pytest.raises(RelayRequestRejected, match="already relayed"):
+            relayer.submit(relay_request(1))
+        await relayer.stop()
+
+    asyncio.run(run())
+
+
+def test_stop(relayer):
+    async def run() -> list[asyncio.Future[HexBytes]]:
+        futures = [relayer.submit(relay_request(i)) for i in range(3)]
+        await relayer.stop()
+
+        return futures
+
+    futures = asyncio.run(run())
+
+    assert all(future.cancelled() for future in futures)
+    assert len(relayer.queue) == 0
+    relayer.jpyc.transaction_pipeline.transact.assert_not_called()
@@ -0,0 +1,70 @@
+import asyncio
+
+import pytest
+from hexbytes import HexBytes
+from web3 import Account
+from web3.eth import AsyncEth
+
+from packages.core.jpyc_core_sdk.async_jpyc import AsyncJPYC
+from packages.core.jpyc_core_sdk.async_sender_pool import AsyncSenderPool
+from packages.core.jpyc_core_sdk.utils.fees import FeeManager
+
+from .conftest import KNOWN_ACCOUNTS, V2_PROXY_ADDRESS
+
+TX_HASH = HexBytes(b"\x01" * 32)
+SENDERS = KNOWN_ACCOUNTS[:2]
+
+
+@pytest.fixture(scope="function")
+def mocked_async_eth(mocker):
+    mocker.patch.object(
+        FeeManager,
+        "async_get_fees",
+        mocker.AsyncMock(
+            return_value={"maxFeePerGas": 21, "maxPriorityFeePerGas": 1},
+        ),
+    )
+
+    class MockedAsyncEth:
+        estimate_gas = mocker.patch.object(
+            AsyncEth, "estimate_gas", mocker.AsyncMock(return_value=50_000)
+        )
+        get_transaction_count = mocker.patch.object(
+            AsyncEth, "get_transaction_count", mocker.AsyncMock(return_value=7)
+        )
+        send_raw_transaction = mocker.patch.object(
+            AsyncEth, "send_raw_transaction", mocker.AsyncMock(return_value=TX_HASH)
+        )
+
+    return MockedAsyncEth
+
+
+def test_transact_concurrently(async_sdk_client_without_account, mocked_async_eth):
+    sender_pool = AsyncSenderPool(
+        client=async_sdk_client_without_account,
+        private_keys=[account.private_key for account in SENDERS],
+        strategy="least_pending",
+    )
+    jpyc = AsyncJPYC(
+        client=async_sdk_client_without_account,
+        contract_address=V2_PROXY_ADDRESS,
+        transaction_pipeline=sender_pool,
+    )
+
+    async def transfer_concurrently():
+        return await asyncio.gather(
+            *(
+                jpyc.transfer(to=KNOWN_ACCOUNTS[2].address, value=value)
+                for value in range(len(SENDERS) * 4)
+            )
+        )
+
+    assert asyncio.run(transfer_concurrently()) == [TX_HASH] * len(SENDERS) * 4
+
+    senders = [
+        Account.recover_transaction(call.args[0])
+        for call in mocked_async_eth.send_raw_transaction.call_args_list
+    ]
+    assert {address: senders.count(address) for address in set(senders)} == {
+        account.address: 4 for account in SENDERS
+    }
@@ -0,0 +1,188 @@
+import asyncio
+
+import pytest
+from eth_account.typed_transactions import TypedTransaction
+from hexbytes import HexBytes
+from web3 import Web3
+from web3.eth import AsyncEth
+from web3.exceptions import ContractLogicError, TransactionNotFound
+
+from packages.core.jpyc_core_sdk.async_jpyc import AsyncJPYC
+from packages.core.jpyc_core_sdk.async_transaction_pipeline import (
+    AsyncTransactionPipeline,
+)
+from packages.core.jpyc_core_sdk.utils.errors import (
+    TransactionFailed,
+    TransactionSimulationFailed,
+)
+from packages.core.jpyc_core_sdk.utils.fees import FeeManager
+
+from .conftest import KNOWN_ACCOUNTS, V2_PROXY_ADDRESS
+
+TX_HASH = HexBytes(b"\x01" * 32)
+
+
+@pytest.fixture(scope="function")
+def mocked_async_eth(mocker):
+    mocker.patch.object(
+        FeeManager,
+        "async_get_fees",
+        mocker.AsyncMock(
+            return_value={"maxFeePerGas": 21, "maxPriorityFeePerGas": 1},
+        ),
+    )
+
+    class MockedAsyncEth:
+        estimate_gas = mocker.patch.object(
+            AsyncEth, "estimate_gas", mocker.AsyncMock(return_value=50_000)
+        )
+        get_transaction_count = mocker.patch.object(
+            AsyncEth, "get_transaction_count", mocker.AsyncMock(return_value=7)
+        )
+        send_raw_transaction = mocker.patch.object(
+            AsyncEth, "send_raw_transaction", mocker.AsyncMock(return_value=TX_HASH)
+        )
+        get_transaction = mocker.patch.object(
+            AsyncEth,
+            "get_transaction",
+            mocker.AsyncMock(side_effect=TransactionNotFound("not found")),
+        )
+
+    return MockedAsyncEth
+
+
+@pytest.fixture(scope="function")
+def async_jpyc_client_with_pipeline(async_sdk_client):
+    return AsyncJPYC(
+        client=async_sdk_client,
+        contract_address=V2_PROXY_ADDRESS,
+        transaction_pipeline=AsyncTransactionPipeline(client=async_sdk_client),
+    )
+
+
+def get_sent_nonces(send_raw_transaction) -> list[int]:
+    return [
+        TypedTransaction.from_bytes(call.args[0]).as_dict()["nonce"]
+        for call in send_raw_transaction.call_args_list
+    ]
+
+
+def test_transact(async_jpyc_client_with_pipeline, mocked_async_eth):
+    async def transfer_concurrently():
+        return await asyncio.gather(
+            *(
+                async_jpyc_client_with_pipeline.transfer(
+                    to=KNOWN_ACCOUNTS[1].address, value=1
+                )
+                for _ in range(20)
+            )
+        )
+
+    tx_hashes = asyncio.run(transfer_concurrently())
+
+    assert tx_hashes == [TX_HASH] * 20
+    assert mocked_async_eth.estimate_gas.call_count == 20
+    assert sorted(get_sent_nonces(mocked_async_eth.send_raw_transaction)) == list(
+        range(7, 27)
+    )
+
+
+def test_transact_simulation_failures(
+    async_jpyc_client_with_pipeline, mocked_async_eth
+):
+    mocked_async_eth.estimate_gas.side_effect = ContractLogicError(
+        "execution reverted: FiatToken: transfer amount exceeds balance"
+    )
+
+    with pytest.raises(TransactionSimulationFailed):
+        asyncio.run(
+            async_jpyc_client_with_pipeline.transfer(
+                to=KNOWN_ACCOUNTS[1].address, value=1
+            )
+        )
+
+    mocked_async_eth.send_raw_transaction.assert_not_called()
+
+
+def test_transact_nonce_errors(async_jpyc_client_with_pipeline, mocked_async_eth):
+    mocked_async_eth.get_transaction_count.side_effect = [7, 9]
+    mocked_async_eth.send_raw_transaction.side_effect = [
+        ValueError("nonce too low"),
+        TX_HASH,
+        ValueError("insufficient funds"),
+    ]
+
+    async def transfer():
+        return await async_jpyc_client_with_pipeline.transfer(
+            to=KNOWN_ACCOUNTS[1].address, value=1
+        )
+
+    assert asyncio.run(transfer()) == TX_HASH
+    with pytest.raises(TransactionFailed):
+        asyncio.run(transfer())
+
+    assert get_sent_nonces(mocked_async_eth.send_raw_transaction) == [7, 9, 10]
+    # the nonce of the failed transaction is released
+    nonce_manager = async_jpyc_client_with_pipeline.client.nonce_manager
+    assert (
+        asyncio.run(
+            nonce_manager.async_reserve(async_jpyc_client_with_pipeline.client.w3)
+        )
+        == 10
+    )
+
+
+def test_transact_already_known(async_jpyc_client_with_pipeline, mocked_async_eth):
+    mocked_async_eth.send_raw_transaction.side_effect = ValueError("already known")
+
+    tx_hash = asyncio.run(
+        async_jpyc_client_with_pipeline.transfer(to=KNOWN_ACCOUNTS[1].address, value=1)
+    )
+
+    # regarded as sent (i.e., never resent with another nonce)
+    raw_transaction = mocked_async_eth.send_raw_transaction.call_args.args[0]
+    assert tx_hash == Web3.keccak(raw_transaction)
+    assert get_sent_nonces(mocked_async_eth.send_raw_transaction) == [7]
+
+
+@pytest.mark.parametrize(
+    ["lookup_side_effect", "broadcast", "next_nonce"],
+    [
+        pytest.param(None, True, 8, id="found"),
+        pytest.param(TransactionNotFound("not found"), False, 7, id="not found"),
+        pytest.param(TimeoutError(), False, 8, id="unknown"),
+    ],
+)
+def test_transact_ambiguous_failures(
+    async_jpyc_client_with_pipeline,
+    mocked_async_eth,
+    lookup_side_effect,
+    broadcast,
+    next_nonce,
+):
+    mocked_async_eth.send_raw_transaction.side_effect = TimeoutError()
+    mocked_async_eth.get_transaction.side_effect = lookup_side_effect
+    mocked_async_eth.get_transaction.return_value = {"nonce": 7}
+
+    async def transfer():
+        return await async_jpyc_client_with_pipeline.transfer(
+            to=KNOWN_ACCOUNTS[1].address, value=1
+        )
+
+    if broadcast:
+        tx_hash = asyncio.run(transfer())
+        raw_transaction = mocked_async_eth.send_raw_transaction.call_args.args[0]
+        assert tx_hash == Web3.keccak(raw_transaction)
+    else:
+        with pytest.raises(TransactionFailed):
+            asyncio.run(transfer())
+
+    assert get_sent_nonces(mocked_async_eth.send_raw_transaction) == [7]
+    # released only if surely not broadcast
+    nonce_manager = async_jpyc_client_with_pipeline.client.nonce_manager
+    assert (
+        asyncio.run(
+            nonce_manager.async_reserve(async_jpyc_client_with_pipeline.client.w3)
+        )
+        == next_nonce
+    )
@@ -3,15 +3,22 @@ from pydantic import ValidationError
 import pytest
 from web3 import Web3
 from web3._utils.empty import empty
+from web3.eth import Eth
 
 from packages.core.jpyc_core_sdk.client import SdkClient
-from packages.core.jpyc_core_sdk.utils.chains import get_default_rpc_endpoint
+from packages.core.jpyc_core_sdk.utils.chains import (
+    get_default_rpc_endpoint,
+    get_default_rpc_endpoints,
+)
 from packages.core.jpyc_core_sdk.utils.errors import (
     AccountNotInitialized,
+    ChainIdMismatch,
     InvalidBytes32,
     InvalidRpcEndpoint,
     NetworkNotSupported,
 )
+from packages.core.jpyc_core_sdk.utils.providers import FailoverHTTPProvider
+from packages.core.jpyc_core_sdk.utils.sessions import SESSION_POOL, SessionPool
 
 from .conftest import KNOWN_ACCOUNTS
 
@@ -210,6 +217,39 @@ def test_set_custom_provider_failures(sdk_client):
         )
 
 
+def test_set_failover_provider(sdk_client, mocker):
+    mocked_chain_id = mocker.patch.object(
+        Eth, "chain_id", new_callable=mocker.PropertyMock, return_value=1
+    )
+    rpc_endpoint = "https://astar.public.blastapi.io"
+
+    sdk_client.set_failover_provider(
+        chain_name="ethereum",
+        network_name="mainnet",
+        rpc_endpoints=[rpc_endpoint],
+    )
+    sdk_client.set_account(private_key=KNOWN_ACCOUNTS[1].private_key)
+
+    endpoints = [*get_default_rpc_endpoints("ethereum", "mainnet"), rpc_endpoint]
+    assert isinstance(sdk_client.w3.provider, FailoverHTTPProvider)
+    assert sdk_client.w3.provider.endpoints == endpoints
+    assert sdk_client.rpc_endpoints == endpoints
+    assert sdk_client.rpc_endpoint == endpoints[0]
+    assert sdk_client.get_chain_id() == 1
+    # custom endpoints are verified once
+    mocked_chain_id.assert_called_once()
+    assert sdk_client.w3.eth.default_account == KNOWN_ACCOUNTS[1].address
+
+
+def test_set_failover_provider_failures(sdk_client):
+    with pytest.raises(ValueError):
+        sdk_client.set_failover_provider()
+    with pytest.raises(NetworkNotSupported):
+        sdk_client.set_failover_provider(chain_name="ethereum", network_name="x")
+    with pytest.raises(InvalidRpcEndpoint):
+        sdk_client.set_failover_provider(rpc_endpoints=["invalid_uri"])
+
+
 @pytest.mark.parametrize(
     [
         "private_key",
@@ -242,9 +282,53 @@ def test_set_account(
     if account is not None:
         assert account.address == address
         assert sdk_client.w3.eth.default_account == address
+        assert sdk_client.nonce_manager.address == address
     else:
         assert account is None
         assert sdk_client.w3.eth.default_account == empty
+        assert sdk_client.nonce_manager is None
+
+
+def test_nonce_manager_after_provider_changes(sdk_client, mocker):
+    mocked_get_transaction_count = mocker.patch.object(
+        Eth, "get_transaction_count", return_value=5
+    )
+    nonce_manager = sdk_client.nonce_manager
+
+    assert nonce_manager.reserve(sdk_client.w3) == 5
+    assert nonce_manager.reserve(sdk_client.w3) == 6
+
+    sdk_client.set_custom_provider(rpc_endpoint="http://127.0.0.1:8545/")
+
+    assert sdk_client.nonce_manager is nonce_manager
+    assert nonce_manager.reserve(sdk_client.w3) == 5
+    assert mocked_get_transaction_count.call_count == 2
+
+
+def test_session_pool_after_reconfigurations(sdk_client):
+    endpoint_uri = sdk_client.w3.provider.endpoint_uri
+    session = sdk_client.session_pool.cache_and_return_session(endpoint_uri)
+
+    assert sdk_client.session_pool is SESSION_POOL
+
+    sdk_client.set_account(private_key=KNOWN_ACCOUNTS[1].private_key)
+    sdk_client.set_default_provider(chain_name="ethereum", network_name="mainnet")
+
+    # connections are reused by rebuilt providers
+    assert sdk_client.w3.provider._request_session_manager is SESSION_POOL
+    assert SESSION_POOL.cache_and_return_session(endpoint_uri) is session
+
+
+def test_session_pool_of_custom_pool():
+    session_pool = SessionPool(pool_size=5)
+    client = SdkClient(
+        chain_name="ethereum",
+        network_name="mainnet",
+        session_pool=session_pool,
+    )
+
+    assert client.session_pool is session_pool
+    assert client.w3.provider._request_session_manager is session_pool
 
 
 def test_set_account_failures(sdk_client):
@@ -254,6 +338,129 @@ def test_set_account_failures(sdk_client):
         )
 
 
+@pytest.mark.parametrize(
+    [
+        "chain_name",
+        "network_name",
+        "rpc_endpoint",
+        "chain_id",
+        "mocked_eth_chain_id",
+    ],
+    [
+        pytest.param(
+            "polygon",
+            "amoy",
+            None,
+            80002,
+            {"chain_id": 1},
+            id="default network",
+        ),
+    ],
+    indirect=[
+        "mocked_eth_chain_id",
+    ],
+)
+def test_get_chain_id(
+    chain_name,
+    network_name,
+    rpc_endpoint,
+    chain_id,
+    mocked_eth_chain_id,
+):
+    client = SdkClient(
+        chain_name=chain_name,
+        network_name=network_name,
+        rpc_endpoint=rpc_endpoint,
+    )
+
+    assert client.get_chain_id() == chain_id
+    mocked_eth_chain_id.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    [
+        "mocked_eth_chain_id",
+    ],
+    [
+        pytest.param(
+            {"chain_id": 31337},
+            id="custom rpc_endpoint only",
+        ),
+    ],
+    indirect=[
+        "mocked_eth_chain_id",
+    ],
+)
+def test_get_chain_id_from_provider(mocked_eth_chain_id):
+    client = SdkClient(rpc_endpoint="http://127.0.0.1:8545/")
+
+    assert client.get_chain_id() == 31337
+    assert client.get_chain_id() == 31337
+    mocked_eth_chain_id.assert_called_once()
+
+
+@pytest.mark.parametrize(
+    [
+        "mocked_eth_chain_id",
+    ],
+    [
+        pytest.param(
+            {"chain_id": 137},
+            id="custom rpc_endpoint with known network",
+        ),
+    ],
+    indirect=[
+        "mocked_eth_chain_id",
+    ],
+)
+def test_get_chain_id_verified(mocked_eth_chain_id):
+    client = SdkClient(
+        chain_name="polygon",
+        network_name="mainnet",
+        rpc_endpoint="http://127.0.0.1:8545/",
+    )
+    mocked_eth_chain_id.assert_not_called()
+
+    assert client.get_chain_id() == 137
+    assert client.get_chain_id() == 137
+    mocked_eth_chain_id.assert_called_once()
+
+
+@pytest.mark.parametrize(
+    [
+        "mocked_eth_chain_id",
+    ],
+    [
+        pytest.param(
+            {"chain_id": 1},
+            id="custom rpc_endpoint with another network",
+        ),
+    ],
+    indirect=[
+        "mocked_eth_chain_id",
+    ],
+)
+def test_get_chain_id_mismatch(mocked_eth_chain_id):
+    client = SdkClient(
+        chain_name="polygon",
+        network_name="mainnet",
+        rpc_endpoint="http://127.0.0.1:8545/",
+    )
+
+    with pytest.raises(ChainIdMismatch):
+        client.get_chain_id()
+
+
+def test_get_chain_id_after_provider_changes(sdk_client):
+    sdk_client.set_default_provider(
+        chain_name="avalanche",
+        network_name="fuji",
+    )
+
+    assert sdk_client.rpc_endpoint == "https://api.avax-test.network/ext/bc/C/rpc"
+    assert sdk_client.get_chain_id() == 43113
+
+
 def test_get_account_address(sdk_client):
     address = sdk_client.get_account_address()
 
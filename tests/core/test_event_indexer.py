@@ -0,0 +1,151 @@
+import pytest
+from hexbytes import HexBytes
+from web3 import Web3
+from web3.eth import Eth
+from web3.exceptions import BlockNotFound
+
+from packages.core.jpyc_core_sdk.event_indexer import EventIndexer
+from packages.core.jpyc_core_sdk.utils.event_store import EventStore
+
+from .conftest import KNOWN_ACCOUNTS, V2_PROXY_ADDRESS
+from .test_event_scanner import get_logs
+
+LATEST_BLOCK = 60
+
+
+class Chain:
+    """Mocked chain whose blocks after `fork_block` could be replaced."""
+
+    def __init__(self) -> None:
+        self.fork_block: int | None = None
+
+    def get_block_hash(self, block_number: int) -> HexBytes:
+        forked = self.fork_block is not None and block_number > self.fork_block
+        return HexBytes((block_number + forked * 2**128).to_bytes(32, "big"))
+
+    def get_block(self, block_identifier):
+        block_number = (
+            LATEST_BLOCK if block_identifier == "latest" else block_identifier
+        )
+        if block_number > LATEST_BLOCK:
+            raise BlockNotFound(f"Block with id: '{block_number}' not found.")
+        return {"number": block_number, "hash": self.get_block_hash(block_number)}
+
+    def get_logs(self, filter_params):
+        return [
+            {**log, "blockHash": self.get_block_hash(log["blockNumber"])}
+            for log in get_logs(filter_params)
+        ]
+
+    def make_batch_request(self, requests):
+        return [
+            {
+                "id": i,
+                "result": {
+                    "hash": Web3.to_hex(self.get_block_hash(int(params[0], 16)))
+                },
+            }
+            for i, (_, params) in enumerate(requests)
+        ]
+
+
+@pytest.fixture(scope="function")
+def chain(jpyc_client, mocker):
+    chain = Chain()
+    w3 = jpyc_client.client.w3
+    mocker.patch.object(w3.eth, "get_block", mocker.Mock(side_effect=chain.get_block))
+    mocker.patch.object(
+        Eth, "block_number", new_callable=mocker.PropertyMock, return_value=LATEST_BLOCK
+    )
+    mocker.patch.object(w3.eth, "get_logs", mocker.Mock(side_effect=chain.get_logs))
+    mocker.patch.object(
+        w3.provider,
+        "make_batch_request",
+        mocker.Mock(side_effect=chain.make_batch_request),
+    )
+
+    return chain
+
+
+@pytest.fixture(scope="function")
+def indexer(jpyc_client, chain):
+    return EventIndexer(
+        jpyc=jpyc_client, store=EventStore(), batch_size=8, confirmation_depth=20
+    )
+
+
+def test_sync(indexer, chain, mocker):
+    save = mocker.spy(indexer.store, "save")
+
+    assert indexer.sync(from_block=1, to_block=50) == 50
+
+    assert indexer.store.get_cursor(1, V2_PROXY_ADDRESS) == 50
+    # written in batches at boundaries of blocks
+    assert save.call_count > 1
+    assert [len(call.args[2]) for call in save.call_args_list[:-1]] == [8] * (
+        save.call_count - 1
+    )
+    assert [event.block_number for event in indexer.get_events()] == list(range(1, 51))
+    # blocks are fetched only for the head (i.e., never per batch)
+    indexer.jpyc.client.w3.eth.get_block.assert_called_once_with(50)
+    # cursors are saved along with their block hashes
+    assert all(
+        call.args[4] == Web3.to_hex(chain.get_block_hash(call.args[3]))
+        for call in save.call_args_list
+    )
+
+
+def test_sync_beyond_head(indexer):
+    # clamped to the latest block
+    assert indexer.sync(from_block=1, to_block=LATEST_BLOCK + 10) == LATEST_BLOCK
+
+    assert indexer.store.get_cursor(1, V2_PROXY_ADDRESS) == LATEST_BLOCK
+
+
+def test_sync_resumes(indexer):
+    indexer.sync(from_block=1, to_block=50)
+    get_logs_ = indexer.jpyc.client.w3.eth.get_logs
+    get_logs_.reset_mock()
+
+    assert indexer.sync(from_block=1) == LATEST_BLOCK - 50
+    assert get_logs_.call_args_list[0].args[0]["fromBlock"] == 51
+    # already synced
+    assert indexer.sync() == 0
+
+
+def test_sync_reorg(indexer, chain):
+    indexer.sync(from_block=1, to_block=50)
+    chain.fork_block = 45
+
+    # orphaned blocks are rolled back & replayed
+    assert indexer.sync() == LATEST_BLOCK - 45
+
+    events = indexer.get_events()
+    assert [event.block_number for event in events] == list(range(1, LATEST_BLOCK + 1))
+    assert all(
+        event.block_hash == Web3.to_hex(chain.get_block_hash(event.block_number))
+        for event in events
+    )
+
+
+def test_sync_reorg_beyond_confirmation_depth(indexer, chain):
+    indexer.sync(from_block=1, to_block=50)
+    # blocks deeper than the confirmation depth are not verified
+    chain.fork_block = 10
+
+    indexer.sync()
+
+    verified = indexer.jpyc.client.w3.provider.make_batch_request.call_args.args[0]
+    assert min(int(params[0], 16) for _, params in verified) == 31
+    assert [event.block_number for event in indexer.get_events()] == list(
+        range(1, LATEST_BLOCK + 1)
+    )
+
+
+def test_get_transfers(indexer):
+    indexer.sync(from_block=1, to_block=5)
+
+    transfers = indexer.get_transfers(KNOWN_ACCOUNTS[1].address)
+
+    assert len(transfers) == 5
+    assert indexer.get_transfers(KNOWN_ACCOUNTS[2].address) == []
@@ -0,0 +1,62 @@
+import pytest
+
+from packages.core.jpyc_core_sdk.event_scanner import EventScanner
+from packages.core.jpyc_core_sdk.utils.events import BlockRangeSizer
+
+from .utils.test_events import transfer_log
+
+MAX_RESULTS = 10
+
+
+def get_logs(filter_params):
+    from_block, to_block = filter_params["fromBlock"], filter_params["toBlock"]
+    if to_block - from_block + 1 > MAX_RESULTS:
+        raise ValueError({"message": f"query returned more than {MAX_RESULTS} results"})
+
+    return [
+        transfer_log(block_number) for block_number in range(from_block, to_block + 1)
+    ]
+
+
+@pytest.fixture(scope="function")
+def scanner(jpyc_client, mocker):
+    mocker.patch.object(
+        jpyc_client.client.w3.eth, "get_logs", mocker.Mock(side_effect=get_logs)
+    )
+
+    return EventScanner(
+        jpyc=jpyc_client,
+        event_names=["Transfer"],
+        max_workers=2,
+        sizer=BlockRangeSizer(chunk_size=4),
+    )
+
+
+def test_scan(scanner):
+    events = list(scanner.scan(from_block=1, to_block=100))
+
+    assert [event["blockNumber"] for event in events] == list(range(1, 101))
+    # ranges grow on successes & shrink on too many results
+    assert scanner.sizer.get_chunk_size() <= MAX_RESULTS * 2
+    assert scanner.jpyc.client.w3.eth.get_logs.call_count < 100
+
+
+def test_scan_stops_halfway(scanner):
+    events = scanner.scan(from_block=1, to_block=100)
+
+    assert next(events)["blockNumber"] == 1
+    events.close()
+
+
+def test_scan_failed(scanner):
+    scanner.jpyc.client.w3.eth.get_logs.side_effect = ValueError("execution reverted")
+
+    with pytest.raises(ValueError, match="execution reverted"):
+        list(scanner.scan(from_block=1, to_block=100))
+
+
+def test_get_logs_split(scanner):
+    logs = scanner.get_logs(1, 25)
+
+    assert [log["blockNumber"] for log in logs] == list(range(1, 26))
+    assert scanner.sizer.get_chunk_size() < 25
@@ -5,6 +5,8 @@ from packages.core.jpyc_core_sdk.jpyc import JPYC
 
 from .conftest import V2_PROXY_ADDRESS
 
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+
 
 @pytest.mark.parametrize(
     [
@@ -39,11 +41,12 @@ def test_constructor(
         contract_address=address,
     )
 
-    mocked_eth_chain_id.assert_called_once()
+    mocked_eth_chain_id.assert_not_called()
 
     assert jpyc.client == sdk_client
     assert isinstance(jpyc.contract, Contract)
     assert jpyc.contract.address == address
+    assert jpyc.multicall_address == MULTICALL3_ADDRESS
 
 
 @pytest.mark.parametrize(
@@ -71,7 +74,7 @@ def test_constructor_localhost(
         contract_address=address,
     )
 
-    mocked_eth_chain_id.assert_called_once()
+    mocked_eth_chain_id.assert_not_called()
 
     assert jpyc.client == sdk_client_localhost
     assert isinstance(jpyc.contract, Contract)
@@ -104,13 +107,105 @@ def test_constructor_localhost_with_deployment(
 ):
     jpyc = JPYC(
         client=sdk_client_localhost,
+        deploy_to_localhost=True,
     )
 
-    mocked_eth_chain_id.assert_called_once()
-    mocked_eth_contract_constructor_transact.assert_called_once()
-    mocked_eth_wait_for_transaction_receipt.assert_called_once()
+    mocked_eth_chain_id.assert_not_called()
+    # JPYC & Multicall3 contracts
+    assert mocked_eth_contract_constructor_transact.call_count == 2
+    assert mocked_eth_wait_for_transaction_receipt.call_count == 2
     mocked_eth_contract_functions_transact.assert_called_once()
 
     assert jpyc.client == sdk_client_localhost
     assert isinstance(jpyc.contract, Contract)
     assert jpyc.contract.address == V2_PROXY_ADDRESS
+    assert jpyc.multicall_address == V2_PROXY_ADDRESS
+
+
+@pytest.mark.parametrize(
+    [
+        "mocked_eth_chain_id",
+        "mocked_eth_wait_for_transaction_receipt",
+    ],
+    [
+        pytest.param(
+            {"chain_id": 31337},
+            {"address": V2_PROXY_ADDRESS},
+            id="custom multicall address",
+        ),
+    ],
+    indirect=[
+        "mocked_eth_chain_id",
+        "mocked_eth_wait_for_transaction_receipt",
+    ],
+)
+def test_constructor_localhost_with_deployment_and_multicall_address(
+    sdk_client_localhost,
+    mocked_eth_chain_id,
+    mocked_eth_contract_constructor_transact,
+    mocked_eth_wait_for_transaction_receipt,
+    mocked_eth_contract_functions_transact,
+):
+    jpyc = JPYC(
+        client=sdk_client_localhost,
+        deploy_to_localhost=True,
+        multicall_address=MULTICALL3_ADDRESS,
+    )
+
+    mocked_eth_contract_constructor_transact.assert_called_once()
+    mocked_eth_wait_for_transaction_receipt.assert_called_once()
+
+    assert jpyc.multicall_address == MULTICALL3_ADDRESS
+
+
+@pytest.mark.parametrize(
+    [
+        "mocked_eth_chain_id",
+    ],
+    [
+        pytest.param(
+            {"chain_id": 1},
+            id="same client",
+        ),
+    ],
+    indirect=[
+        "mocked_eth_chain_id",
+    ],
+)
+def test_constructor_reuses_contract(
+    sdk_client,
+    mocked_eth_chain_id,
+):
+    jpyc_0 = JPYC(client=sdk_client)
+    jpyc_1 = JPYC(client=sdk_client)
+
+    assert jpyc_0.contract is jpyc_1.contract
+
+
+@pytest.mark.parametrize(
+    [
+        "mocked_eth_chain_id",
+    ],
+    [
+        pytest.param(
+            {"chain_id": 31337},
+            id="localhost without opt-in",
+        ),
+    ],
+    indirect=[
+        "mocked_eth_chain_id",
+    ],
+)
+def test_constructor_localhost_without_deployment(
+    sdk_client_localhost,
+    mocked_eth_chain_id,
+    mocked_eth_contract_constructor_transact,
+):
+    jpyc = JPYC(
+        client=sdk_client_localhost,
+    )
+
+    mocked_eth_chain_id.assert_not_called()
+    mocked_eth_contract_constructor_transact.assert_not_called()
+
+    assert jpyc.contract.address == V2_PROXY_ADDRESS
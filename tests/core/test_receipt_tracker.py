@@ -0,0 +1,193 @@
+import time
+from threading import Lock, current_thread, main_thread
+
+import pytest
+from hexbytes import HexBytes
+from web3 import HTTPProvider
+from web3.eth import Eth
+from web3.exceptions import ContractLogicError
+
+from packages.core.jpyc_core_sdk.receipt_tracker import ReceiptTracker
+from packages.core.jpyc_core_sdk.utils.errors import TransactionFailed
+
+from .conftest import KNOWN_ACCOUNTS, V2_PROXY_ADDRESS
+
+TX_HASHES = [HexBytes(bytes([i]) * 32) for i in range(3)]
+
+
+def raw_receipt(tx_hash: HexBytes, status: int = 1) -> dict:
+    return {
+        "transactionHash": tx_hash.to_0x_hex(),
+        "blockNumber": "0x1",
+        "status": hex(status),
+    }
+
+
+def respond_with(receipts: dict[str, dict]):
+    def make_batch_request(requests):
+        return [
+            {"id": i, "result": receipts.get(params[0])}
+            for i, (_, params) in enumerate(requests)
+        ]
+
+    return make_batch_request
+
+
+@pytest.fixture(scope="function")
+def tracker(sdk_client, mocker):
+    mocker.patch.object(
+        Eth, "block_number", new_callable=mocker.PropertyMock, return_value=1
+    )
+    tracker = ReceiptTracker(client=sdk_client, poll_interval=0.01)
+    yield tracker
+    tracker.stop()
+
+
+def test_wait(tracker, mocker):
+    make_batch_request = mocker.patch.object(
+        HTTPProvider,
+        "make_batch_request",
+        side_effect=respond_with(
+            {tx_hash.to_0x_hex(): raw_receipt(tx_hash) for tx_hash in TX_HASHES}
+        ),
+    )
+
+    receipts = tracker.wait(TX_HASHES, timeout=5)
+
+    assert [receipt["transactionHash"] for receipt in receipts] == TX_HASHES
+    # receipts are polled in a single batch request
+    assert make_batch_request.call_count == 1
+    assert len(make_batch_request.call_args.args[0]) == len(TX_HASHES)
+
+
+def test_wait_per_new_block(tracker, mocker):
+    block_number = mocker.patch.object(
+        Eth, "block_number", new_callable=mocker.PropertyMock, return_value=1
+    )
+    make_batch_request = mocker.patch.object(
+        HTTPProvider,
+        "make_batch_request",
+        side_effect=respond_with({}),
+    )
+    future = tracker.track(TX_HASHES[0])
+
+    with pytest.raises(TimeoutError):
+        tracker.wait([TX_HASHES[0]], timeout=0.1)
+    # outstanding transactions are not polled again until a new block
+    assert make_batch_request.call_count == 1
+
+    make_batch_request.side_effect = respond_with(
+        {TX_HASHES[0].to_0x_hex(): raw_receipt(TX_HASHES[0])}
+    )
+    block_number.return_value = 2
+
+    assert future.result(timeout=5)["transactionHash"] == TX_HASHES[0]
+    assert make_batch_request.call_count == 2
+
+
+def test_track_with_callback(tracker, mocker):
+    mocker.patch.object(
+        HTTPProvider,
+        "make_batch_request",
+        side_effect=respond_with({TX_HASHES[0].to_0x_hex(): raw_receipt(TX_HASHES[0])}),
+    )
+    callback = mocker.Mock()
+
+    future = tracker.track(TX_HASHES[0], callback=callback)
+    future.result(timeout=5)
+
+    callback.assert_called_once_with(future)
+
+
+def test_track_while_exiting(sdk_client, mocker):
+    mocker.patch.object(
+        Eth, "block_number", new_callable=mocker.PropertyMock, return_value=1
+    )
+    mocker.patch.object(
+        HTTPProvider,
+        "make_batch_request",
+        side_effect=respond_with(
+            {tx_hash.to_0x_hex(): raw_receipt(tx_hash) for tx_hash in TX_HASHES}
+        ),
+    )
+    futures = []
+
+    class HookedLock:
+        """Lock that tracks another transaction once the worker finds no futures."""
+
+        def __init__(self):
+            self.lock = Lock()
+
+        def __enter__(self):
+            self.lock.acquire()
+
+        def __exit__(self, *args):
+            self.lock.release()
+            if (
+                current_thread() is not main_thread()
+                and len(futures) == 1
+                and futures[0].done()
+            ):
+                futures.append(None)
+                futures[1] = tracker.track(TX_HASHES[1])
+
+    mocker.patch(
+        "packages.core.jpyc_core_sdk.receipt_tracker.Lock", side_effect=HookedLock
+    )
+    tracker = ReceiptTracker(client=sdk_client, poll_interval=0.01)
+    futures.append(tracker.track(TX_HASHES[0]))
+
+    futures[0].result(timeout=5)
+    # tracked right after the worker found no futures (i.e., while exiting)
+    try:
+        for _ in range(500):
+            if len(futures) == 2 and futures[1] is not None:
+                break
+            time.sleep(0.01)
+        assert futures[1].result(timeout=5)["transactionHash"] == TX_HASHES[1]
+    finally:
+        tracker.stop()
+
+
+def test_wait_reverted(tracker, mocker):
+    mocker.patch.object(
+        HTTPProvider,
+        "make_batch_request",
+        side_effect=respond_with(
+            {TX_HASHES[0].to_0x_hex(): raw_receipt(TX_HASHES[0], status=0)}
+        ),
+    )
+    mocker.patch.object(
+        Eth,
+        "get_transaction",
+        return_value={
+            "from": KNOWN_ACCOUNTS[0].address,
+            "to": V2_PROXY_ADDRESS,
+            "input": HexBytes("0xa9059cbb"),
+            "value": 0,
+            "gas": 50_000,
+        },
+    )
+    mocker.patch.object(
+        Eth,
+        "call",
+        side_effect=ContractLogicError(
+            "execution reverted: FiatToken: transfer amount exceeds balance"
+        ),
+    )
+
+    with pytest.raises(TransactionFailed) as e:
+        tracker.wait([TX_HASHES[0]], timeout=5)
+
+    assert "FiatToken: transfer amount exceeds balance" in str(e.value)
+
+
+def test_stop(tracker, mocker):
+    mocker.patch.object(
+        HTTPProvider, "make_batch_request", side_effect=respond_with({})
+    )
+    future = tracker.track(TX_HASHES[0])
+
+    tracker.stop()
+
+    assert future.cancelled()
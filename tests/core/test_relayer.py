@@ -0,0 +1,187 @@
+import time
+from concurrent.futures import Future
+from threading import Event
+
+import pytest
+from hexbytes import HexBytes
+from web3 import Account
+
+from packages.core.jpyc_core_sdk.relayer import Relayer
+from packages.core.jpyc_core_sdk.utils.errors import (
+    PreflightCheckFailed,
+    RelayRequestRejected,
+    TransactionFailed,
+    TransactionSimulationFailed,
+)
+from packages.core.jpyc_core_sdk.utils.preflight import PreflightValidator
+from packages.core.jpyc_core_sdk.utils.relaying import RelayRequest
+from packages.core.jpyc_core_sdk.utils.signatures import TypedDataSigner
+
+from .conftest import KNOWN_ACCOUNTS
+from .utils.test_metadata import METADATA
+
+TX_HASH = HexBytes(b"\x01" * 32)
+PAYER = Account.from_key(KNOWN_ACCOUNTS[0].private_key)
+
+
+def relay_request(nonce: int, valid_before: int = 2**32) -> RelayRequest:
+    nonce_ = f"0x{nonce:064x}"
+    signature = TypedDataSigner(METADATA).sign_transfer_with_authorization(
+        PAYER, KNOWN_ACCOUNTS[1].address, 10**18, 0, valid_before, nonce_
+    )
+
+    return RelayRequest(
+        kind="transfer",
+        from_=KNOWN_ACCOUNTS[0].address,
+        to=KNOWN_ACCOUNTS[1].address,
+        value=1,
+        valid_after=0,
+        valid_before=valid_before,
+        nonce=nonce_,
+        **signature._asdict(),
+    )
+
+
+@pytest.fixture(scope="function")
+def relayer(jpyc_client, mocker):
+    jpyc_client.transaction_pipeline = mocker.Mock()
+    jpyc_client.transaction_pipeline.transact.return_value = TX_HASH
+    relayer = Relayer(jpyc=jpyc_client, max_workers=4)
+    yield relayer
+    relayer.stop()
+
+
+def test_relayer_requires_transaction_pipeline(jpyc_client):
+    with pytest.raises(ValueError):
+        Relayer(jpyc=jpyc_client)
+
+
+def test_submit(relayer):
+    relayer.start()
+
+    futures = [relayer.submit(relay_request(i)) for i in range(20)]
+
+    assert [future.result(timeout=5) for future in futures] == [TX_HASH] * 20
+    transact = relayer.jpyc.transaction_pipeline.transact
+    assert transact.call_count == 20
+    contract_func, func_args = transact.call_args.args
+    assert contract_func.fn_name == "transferWithAuthorization"
+    assert func_args["value"] == 10**18
+
+    stats = relayer.get_stats()
+    for stage in ("validate", "queue", "submit", "total"):
+        assert stats[stage].count == 20
+    # receipts are not tracked
+    assert "confirm" not in stats
+
+
+def test_submit_in_order_of_deadlines(relayer):
+    deadlines = [2**32 - i for i in range(5)]
+    for i, valid_before in enumerate(deadlines):
+        relayer.submit(relay_request(i, valid_before=valid_before))
+
+    relayer.max_workers = 1
+    relayer.start()
+    deadline = time.monotonic() + 5
+    transact = relayer.jpyc.transaction_pipeline.transact
+    while transact.call_count < len(deadlines) and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    relayed = [call.args[1]["validBefore"] for call in transact.call_args_list]
+    assert relayed == sorted(deadlines)
+
+
+def test_submit_rejected(relayer):
+    relayer.submit(relay_request(1))
+
+    with pytest.raises(RelayRequestRejected, match="already relayed"):
+        relayer.submit(relay_request(1))
+    with pytest.raises(RelayRequestRejected, match="expired"):
+        relayer.submit(relay_request(2, valid_before=int(time.time()) - 1))
+
+
+def test_submit_preflight(relayer):
+    relayer.jpyc.preflight_validator = PreflightValidator(TypedDataSigner(METADATA))
+
+    with pytest.raises(PreflightCheckFailed, match="invalid signature"):
+        relayer.submit(relay_request(1)._replace(value=2))
+    # rejected requests are not remembered
+    relayer.submit(relay_request(1))
+
+
+def test_submit_failed(relayer):
+    relayer.jpyc.transaction_pipeline.transact.side_effect = [
+        TransactionSimulationFailed("reverted"),
+        TX_HASH,
+    ]
+    relayer.start()
+
+    with pytest.raises(TransactionSimulationFailed):
+        relayer.submit(relay_request(1)).result(timeout=5)
+    # failed requests can be retried
+    assert relayer.submit(relay_request(1)).result(timeout=5) == TX_HASH
+
+
+def test_stop(relayer):
+    futures = [relayer.submit(relay_request(i)) for i in range(3)]
+
+    relayer.stop()
+
+    assert all(future.cancelled() for future in futures)
+    assert len(relayer.queue) == 0
+    relayer.jpyc.transaction_pipeline.transact.assert_not_called()
+    # cancelled requests can be submitted again
+    relayer.submit(relay_request(0))
+
+
+def test_confirm(relayer, mocker):
+    receipt_tracker = mocker.Mock()
+    relayer.receipt_tracker = receipt_tracker
+    confirmed = Event()
+    receipt_tracker.track.side_effect = lambda tx_hash, callback: (
+        callback(Future()),
+        confirmed.set(),
+    )
+    relayer.start()
+
+    relayer.submit(relay_request(1)).result(timeout=5)
+
+    assert confirmed.wait(timeout=5)
+    receipt_tracker.track.assert_called_once()
+    assert relayer.get_stats()["confirm"].count == 1
+
+
+@pytest.mark.parametrize(
+    ["error", "used"],
+    [
+        pytest.param(None, True, id="succeeded"),
+        pytest.param(TransactionFailed("reverted"), False, id="reverted"),
+    ],
+)
+def test_confirm_preflight(relayer, mocker, mocked_eth_latest_block, error, used):
+    validator = PreflightValidator(TypedDataSigner(METADATA))
+    relayer.jpyc.preflight_validator = validator
+    receipt_tracker = mocker.Mock()
+    relayer.receipt_tracker = receipt_tracker
+    confirmed = Event()
+    receipt: Future = Future()
+
+    def track(tx_hash, callback):
+        # nonces of sent transactions are pending until their receipts
+        assert validator.is_authorization_pending(PAYER.address, request.nonce)
+        if error is None:
+            receipt.set_result({"transactionHash": tx_hash, "status": 1})
+        else:
+            receipt.set_exception(error)
+        callback(receipt)
+        confirmed.set()
+
+    receipt_tracker.track.side_effect = track
+    request = relay_request(1)
+    relayer.start()
+
+    relayer.submit(request).result(timeout=5)
+
+    assert confirmed.wait(timeout=5)
+    assert not validator.is_authorization_pending(PAYER.address, request.nonce)
+    assert validator.is_authorization_used(PAYER.address, request.nonce) is used
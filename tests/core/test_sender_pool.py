@@ -0,0 +1,137 @@
+import pytest
+from eth_account.typed_transactions import TypedTransaction
+from hexbytes import HexBytes
+from web3 import Account
+from web3.eth import Eth
+
+from packages.core.jpyc_core_sdk.jpyc import JPYC
+from packages.core.jpyc_core_sdk.sender_pool import SenderPool
+from packages.core.jpyc_core_sdk.utils.errors import (
+    InvalidBytes32,
+    TransactionFailed,
+)
+from packages.core.jpyc_core_sdk.utils.fees import FeeManager
+
+from .conftest import KNOWN_ACCOUNTS, V2_PROXY_ADDRESS
+
+TX_HASH = HexBytes(b"\x01" * 32)
+SENDERS = KNOWN_ACCOUNTS[:2]
+
+
+@pytest.fixture(scope="function")
+def mocked_eth(mocker):
+    mocker.patch.object(
+        FeeManager,
+        "get_fees",
+        return_value={"maxFeePerGas": 21, "maxPriorityFeePerGas": 1},
+    )
+
+    class MockedEth:
+        estimate_gas = mocker.patch.object(Eth, "estimate_gas", return_value=50_000)
+        get_transaction_count = mocker.patch.object(
+            Eth, "get_transaction_count", return_value=7
+        )
+        send_raw_transaction = mocker.patch.object(
+            Eth, "send_raw_transaction", return_value=TX_HASH
+        )
+
+    return MockedEth
+
+
+def get_sent_transactions(send_raw_transaction) -> list[tuple[str, int]]:
+    return [
+        (
+            Account.recover_transaction(call.args[0]),
+            TypedTransaction.from_bytes(call.args[0]).as_dict()["nonce"],
+        )
+        for call in send_raw_transaction.call_args_list
+    ]
+
+
+def test_constructor(sdk_client_without_account):
+    sender_pool = SenderPool(
+        client=sdk_client_without_account,
+        private_keys=[account.private_key for account in SENDERS],
+    )
+
+    assert sender_pool.get_addresses() == [account.address for account in SENDERS]
+    assert sender_pool.scheduler.strategy == "round_robin"
+
+
+def test_constructor_with_invalid_private_keys(sdk_client_without_account):
+    with pytest.raises(InvalidBytes32):
+        SenderPool(client=sdk_client_without_account, private_keys=["0x1234"])
+
+
+def test_constructor_without_private_keys(sdk_client_without_account):
+    with pytest.raises(ValueError):
+        SenderPool(client=sdk_client_without_account, private_keys=[])
+
+
+def test_transact(sdk_client_without_account, mocked_eth):
+    jpyc = JPYC(
+        client=sdk_client_without_account,
+        contract_address=V2_PROXY_ADDRESS,
+        transaction_pipeline=SenderPool(
+            client=sdk_client_without_account,
+            private_keys=[account.private_key for account in SENDERS],
+        ),
+    )
+
+    for value in range(len(SENDERS) * 2):
+        assert jpyc.transfer(to=KNOWN_ACCOUNTS[2].address, value=value) == TX_HASH
+
+    # transactions are sent in round-robin, each sender with its own nonces
+    assert get_sent_transactions(mocked_eth.send_raw_transaction) == [
+        (account.address, nonce) for nonce in (7, 8) for account in SENDERS
+    ]
+    assert mocked_eth.get_transaction_count.call_count == len(SENDERS)
+
+
+def test_transact_least_pending(sdk_client_without_account, mocked_eth):
+    sender_pool = SenderPool(
+        client=sdk_client_without_account,
+        private_keys=[account.private_key for account in SENDERS],
+        strategy="least_pending",
+    )
+    jpyc = JPYC(
+        client=sdk_client_without_account,
+        contract_address=V2_PROXY_ADDRESS,
+        transaction_pipeline=sender_pool,
+    )
+
+    mocked_eth.send_raw_transaction.side_effect = [
+        HexBytes(bytes([i]) * 32) for i in range(len(SENDERS))
+    ]
+    for value in range(len(SENDERS)):
+        jpyc.transfer(to=KNOWN_ACCOUNTS[2].address, value=value)
+    assert set(sender_pool.scheduler.get_pending_counts().values()) == {1}
+
+    # the next transaction goes to the sender whose transaction is confirmed
+    sender_pool.confirm(HexBytes(bytes([1]) * 32))
+    mocked_eth.send_raw_transaction.side_effect = None
+    jpyc.transfer(to=KNOWN_ACCOUNTS[2].address, value=1)
+
+    assert get_sent_transactions(mocked_eth.send_raw_transaction)[-1] == (
+        SENDERS[1].address,
+        8,
+    )
+
+
+def test_transact_failures(sdk_client_without_account, mocked_eth):
+    sender_pool = SenderPool(
+        client=sdk_client_without_account,
+        private_keys=[account.private_key for account in SENDERS],
+    )
+    jpyc = JPYC(
+        client=sdk_client_without_account,
+        contract_address=V2_PROXY_ADDRESS,
+        transaction_pipeline=sender_pool,
+    )
+    mocked_eth.send_raw_transaction.side_effect = ValueError("insufficient funds")
+
+    with pytest.raises(TransactionFailed):
+        jpyc.transfer(to=KNOWN_ACCOUNTS[2].address, value=1)
+
+    # failed transactions are no longer pending
+    assert set(sender_pool.scheduler.get_pending_counts().values()) == {0}
@@ -0,0 +1,203 @@
+import pytest
+import requests
+from eth_account.typed_transactions import TypedTransaction
+from hexbytes import HexBytes
+from web3 import Web3
+from web3.eth import Eth
+from web3.exceptions import ContractLogicError, TransactionNotFound
+
+from packages.core.jpyc_core_sdk.jpyc import JPYC
+from packages.core.jpyc_core_sdk.transaction_pipeline import TransactionPipeline
+from packages.core.jpyc_core_sdk.utils.errors import (
+    AccountNotInitialized,
+    TransactionFailed,
+    TransactionSimulationFailed,
+)
+
+from .conftest import KNOWN_ACCOUNTS, V2_PROXY_ADDRESS
+
+TX_HASH = HexBytes(b"\x01" * 32)
+
+
+@pytest.fixture(scope="function")
+def mocked_eth(mocker):
+    mocker.patch.object(
+        Eth,
+        "get_block",
+        return_value={"baseFeePerGas": 10},
+    )
+    mocker.patch.object(
+        Eth,
+        "max_priority_fee",
+        new_callable=mocker.PropertyMock,
+        return_value=1,
+    )
+
+    class MockedEth:
+        estimate_gas = mocker.patch.object(Eth, "estimate_gas", return_value=50_000)
+        get_transaction_count = mocker.patch.object(
+            Eth, "get_transaction_count", return_value=7
+        )
+        send_raw_transaction = mocker.patch.object(
+            Eth, "send_raw_transaction", return_value=TX_HASH
+        )
+        get_transaction = mocker.patch.object(
+            Eth, "get_transaction", side_effect=TransactionNotFound("not found")
+        )
+
+    return MockedEth
+
+
+@pytest.fixture(scope="function")
+def jpyc_client_with_pipeline(sdk_client):
+    return JPYC(
+        client=sdk_client,
+        contract_address=V2_PROXY_ADDRESS,
+        transaction_pipeline=TransactionPipeline(client=sdk_client),
+    )
+
+
+def test_transact(jpyc_client_with_pipeline, mocked_eth):
+    tx_hash_0 = jpyc_client_with_pipeline.transfer(
+        to=KNOWN_ACCOUNTS[1].address, value=1
+    )
+    tx_hash_1 = jpyc_client_with_pipeline.transfer(
+        to=KNOWN_ACCOUNTS[1].address, value=2
+    )
+
+    assert tx_hash_0 == tx_hash_1 == TX_HASH
+    assert mocked_eth.estimate_gas.call_count == 2
+    mocked_eth.get_transaction_count.assert_called_once_with(
+        KNOWN_ACCOUNTS[0].address, "pending"
+    )
+    assert mocked_eth.send_raw_transaction.call_count == 2
+
+
+def test_transact_after_provider_changes(jpyc_client_with_pipeline, mocked_eth, mocker):
+    mocker.patch.object(
+        Eth, "chain_id", new_callable=mocker.PropertyMock, return_value=1
+    )
+    client = jpyc_client_with_pipeline.client
+    jpyc_client_with_pipeline.transfer(to=KNOWN_ACCOUNTS[1].address, value=1)
+    jpyc_client_with_pipeline.transfer(to=KNOWN_ACCOUNTS[1].address, value=1)
+    assert Eth.get_block.call_count == 1
+
+    # cached fees are discarded along with the provider
+    client.set_custom_provider(rpc_endpoint="http://localhost:8545/")
+    jpyc_client_with_pipeline.transfer(to=KNOWN_ACCOUNTS[1].address, value=1)
+
+    assert Eth.get_block.call_count == 2
+
+
+def test_transact_simulation_failures(jpyc_client_with_pipeline, mocked_eth):
+    mocked_eth.estimate_gas.side_effect = ContractLogicError(
+        "execution reverted: Blocklistable: account is blocklisted"
+    )
+
+    with pytest.raises(TransactionSimulationFailed) as e:
+        jpyc_client_with_pipeline.transfer(to=KNOWN_ACCOUNTS[1].address, value=1)
+
+    assert "Blocklistable: account is blocklisted" in str(e.value)
+    mocked_eth.get_transaction_count.assert_not_called()
+    mocked_eth.send_raw_transaction.assert_not_called()
+
+
+def test_transact_failures(jpyc_client_with_pipeline, mocked_eth):
+    mocked_eth.send_raw_transaction.side_effect = ValueError("insufficient funds")
+
+    with pytest.raises(TransactionFailed):
+        jpyc_client_with_pipeline.transfer(to=KNOWN_ACCOUNTS[1].address, value=1)
+
+    # the nonce of the failed transaction is released
+    nonce_manager = jpyc_client_with_pipeline.client.nonce_manager
+    assert nonce_manager.reserve(jpyc_client_with_pipeline.client.w3) == 7
+
+
+def test_transact_nonce_errors(jpyc_client_with_pipeline, mocked_eth):
+    mocked_eth.get_transaction_count.side_effect = [7, 9]
+    mocked_eth.send_raw_transaction.side_effect = [
+        ValueError("nonce too low: next nonce 9, tx nonce 7"),
+        TX_HASH,
+    ]
+
+    tx_hash = jpyc_client_with_pipeline.transfer(to=KNOWN_ACCOUNTS[1].address, value=1)
+
+    assert tx_hash == TX_HASH
+    assert mocked_eth.get_transaction_count.call_count == 2
+    assert mocked_eth.send_raw_transaction.call_count == 2
+
+    nonce_manager = jpyc_client_with_pipeline.client.nonce_manager
+    assert nonce_manager.reserve(jpyc_client_with_pipeline.client.w3) == 10
+
+
+def test_transact_nonce_errors_exhausted(jpyc_client_with_pipeline, mocked_eth):
+    mocked_eth.send_raw_transaction.side_effect = ValueError(
+        "replacement transaction underpriced"
+    )
+
+    with pytest.raises(TransactionFailed):
+        jpyc_client_with_pipeline.transfer(to=KNOWN_ACCOUNTS[1].address, value=1)
+
+    assert mocked_eth.send_raw_transaction.call_count == 2
+
+
+def test_transact_already_known(jpyc_client_with_pipeline, mocked_eth):
+    mocked_eth.send_raw_transaction.side_effect = ValueError("already known")
+
+    tx_hash = jpyc_client_with_pipeline.transfer(to=KNOWN_ACCOUNTS[1].address, value=1)
+
+    # regarded as sent (i.e., never resent with another nonce)
+    raw_transaction = mocked_eth.send_raw_transaction.call_args.args[0]
+    assert tx_hash == Web3.keccak(raw_transaction)
+    assert mocked_eth.send_raw_transaction.call_count == 1
+    nonce_manager = jpyc_client_with_pipeline.client.nonce_manager
+    assert nonce_manager.reserve(jpyc_client_with_pipeline.client.w3) == 8
+
+
+def test_transact_ambiguous_failures_broadcast(jpyc_client_with_pipeline, mocked_eth):
+    mocked_eth.send_raw_transaction.side_effect = requests.ReadTimeout()
+    mocked_eth.get_transaction.side_effect = None
+    mocked_eth.get_transaction.return_value = {"nonce": 7}
+
+    tx_hash = jpyc_client_with_pipeline.transfer(to=KNOWN_ACCOUNTS[1].address, value=1)
+
+    raw_transaction = mocked_eth.send_raw_transaction.call_args.args[0]
+    assert tx_hash == Web3.keccak(raw_transaction)
+    mocked_eth.get_transaction.assert_called_once_with(tx_hash)
+    # the nonce is consumed by the broadcast transaction
+    nonce_manager = jpyc_client_with_pipeline.client.nonce_manager
+    assert nonce_manager.reserve(jpyc_client_with_pipeline.client.w3) == 8
+
+
+@pytest.mark.parametrize(
+    ["lookup_error", "next_nonce"],
+    [
+        pytest.param(TransactionNotFound("not found"), 7, id="not found"),
+        pytest.param(requests.ConnectionError(), 8, id="unknown"),
+    ],
+)
+def test_transact_ambiguous_failures(
+    jpyc_client_with_pipeline, mocked_eth, lookup_error, next_nonce
+):
+    mocked_eth.send_raw_transaction.side_effect = requests.ReadTimeout()
+    mocked_eth.get_transaction.side_effect = lookup_error
+
+    with pytest.raises(TransactionFailed):
+        jpyc_client_with_pipeline.transfer(to=KNOWN_ACCOUNTS[1].address, value=1)
+
+    raw_transaction = mocked_eth.send_raw_transaction.call_args.args[0]
+    assert TypedTransaction.from_bytes(raw_transaction).as_dict()["nonce"] == 7
+    # released only if surely not broadcast
+    nonce_manager = jpyc_client_with_pipeline.client.nonce_manager
+    assert nonce_manager.reserve(jpyc_client_with_pipeline.client.w3) == next_nonce
+
+
+def test_transact_account_not_initialized(sdk_client_without_account, mocked_eth):
+    pipeline = TransactionPipeline(client=sdk_client_without_account)
+    jpyc = JPYC(client=sdk_client_without_account, contract_address=V2_PROXY_ADDRESS)
+
+    with pytest.raises(AccountNotInitialized):
+        pipeline.transact(
+            jpyc.contract.functions.transfer,
+            {"to": KNOWN_ACCOUNTS[1].address, "value": 1},
+        )
@@ -1,7 +1,13 @@
+import copy
+import json
+from collections.abc import Mapping
+
 import pytest
 
 from packages.core.jpyc_core_sdk.utils.artifacts import (
+    ArtifactsRegistry,
     get_artifacts,
+    load_artifacts,
     resolve_artifacts_file_path,
 )
 
@@ -34,3 +40,46 @@ def test_get_artifacts(artifact_type, return_type):
 
     artifact = get_artifacts(file_path=path, artifact_type=artifact_type)
     assert type(artifact) is return_type
+
+
+def test_get_artifacts_copies():
+    path = resolve_artifacts_file_path(contract_version="2")
+
+    abi = get_artifacts(file_path=path, artifact_type="abi")
+    assert json.loads(json.dumps(abi)) == copy.deepcopy(abi)
+
+    # copies never leak mutations into the registry's cache
+    abi[0]["type"] = "mutated"
+    assert get_artifacts(file_path=path, artifact_type="abi")[0]["type"] != "mutated"
+
+
+def test_load_artifacts():
+    artifacts = load_artifacts(contract_version="2")
+
+    assert artifacts is load_artifacts(contract_version="2")
+    assert all(isinstance(element, Mapping) for element in artifacts.abi)
+
+
+def test_load_artifacts_immutability():
+    artifacts = load_artifacts(contract_version="2")
+
+    with pytest.raises(TypeError):
+        artifacts.abi[0]["type"] = "function"
+    with pytest.raises(TypeError):
+        artifacts.abi[0]["inputs"][0] = {}
+
+
+def test_artifacts_registry_cache_info():
+    registry = ArtifactsRegistry()
+
+    registry.get(contract_version="2")
+    registry.get(contract_version="2")
+    registry.load(resolve_artifacts_file_path(contract_version="2"))
+
+    cache_info = registry.cache_info()
+    assert cache_info.hits == 2
+    assert cache_info.misses == 1
+    assert cache_info.currsize == 1
+
+    registry.cache_clear()
+    assert registry.cache_info() == (0, 0, 0)
@@ -0,0 +1,74 @@
+from decimal import Decimal
+
+import pytest
+from eth_account import Account
+
+from packages.core.jpyc_core_sdk.utils.bulk_signing import (
+    AuthorizationMessage,
+    BulkSigner,
+    SigningStats,
+    sign_authorizations,
+)
+from packages.core.jpyc_core_sdk.utils.currencies import remove_decimals
+from packages.core.jpyc_core_sdk.utils.signatures import TypedDataSigner
+
+from ..conftest import KNOWN_ACCOUNTS
+from .test_metadata import METADATA
+
+ACCOUNT = Account.from_key(KNOWN_ACCOUNTS[0].private_key)
+MESSAGES = [
+    AuthorizationMessage(
+        to=KNOWN_ACCOUNTS[i % 3].address,
+        value=Decimal(i) / 2,
+        valid_after=0,
+        valid_before=2**32,
+        nonce=f"0x{i:064x}",
+    )
+    for i in range(10)
+]
+
+
+def test_sign_transfers_with_authorization():
+    bulk_signer = BulkSigner(
+        metadata=METADATA,
+        private_key=bytes(ACCOUNT.key),
+        max_workers=2,
+        chunk_size=3,
+    )
+    signer = TypedDataSigner(METADATA)
+
+    # streamed in the order of messages (even from iterators) with decimals removed
+    assert list(bulk_signer.sign_transfers_with_authorization(iter(MESSAGES))) == [
+        signer.sign_transfer_with_authorization(
+            ACCOUNT, message.to, remove_decimals(message.value), *message[2:]
+        )
+        for message in MESSAGES
+    ]
+    assert bulk_signer.get_stats().signatures == len(MESSAGES)
+    assert bulk_signer.get_stats().signatures_per_second > 0
+
+
+def test_sign_receives_with_authorization():
+    bulk_signer = BulkSigner(
+        metadata=METADATA, private_key=bytes(ACCOUNT.key), max_workers=1
+    )
+    signer = TypedDataSigner(METADATA)
+
+    assert list(bulk_signer.sign_receives_with_authorization(MESSAGES[:2])) == [
+        signer.sign_receive_with_authorization(
+            ACCOUNT, message.to, remove_decimals(message.value), *message[2:]
+        )
+        for message in MESSAGES[:2]
+    ]
+    assert list(bulk_signer.sign_receives_with_authorization([])) == []
+
+
+def test_signing_stats():
+    assert SigningStats().signatures_per_second == 0
+    assert SigningStats(signatures=10, elapsed=2.0).signatures_per_second == 5
+
+
+def test_sign_authorizations_without_initialized_worker():
+    # i.e., outside of worker processes initialized by bulk signers
+    with pytest.raises(RuntimeError, match="not initialized"):
+        sign_authorizations("transfer", MESSAGES[:1])
@@ -0,0 +1,128 @@
+import asyncio
+
+from packages.core.jpyc_core_sdk.utils.caches import ReadCache
+from packages.core.jpyc_core_sdk.utils.types import ReadCacheInfo
+
+CONTRACT_ADDRESS = "0x431D5dfF03120AFA4bDf332c61A6e1766eF37BDB"
+
+
+def test_get_or_call(mocker):
+    read_cache = ReadCache()
+    read_cache.set_head(1, 100)
+    call = mocker.Mock(return_value=1)
+    key = (1, CONTRACT_ADDRESS, "totalSupply", (), 100)
+
+    assert read_cache.get_or_call(key, call) == 1
+    assert read_cache.get_or_call(key, call) == 1
+
+    call.assert_called_once()
+    assert read_cache.cache_info() == ReadCacheInfo(
+        hits=1, misses=1, currsize=1, evictions=0
+    )
+
+
+def test_async_get_or_call(mocker):
+    read_cache = ReadCache()
+    call = mocker.AsyncMock(return_value=1)
+    key = (1, CONTRACT_ADDRESS, "totalSupply", (), 100)
+
+    async def call_twice():
+        return [await read_cache.async_get_or_call(key, call) for _ in range(2)]
+
+    assert asyncio.run(call_twice()) == [1, 1]
+    call.assert_awaited_once()
+
+
+def test_eviction():
+    read_cache = ReadCache(maxsize=2)
+    keys = [(1, CONTRACT_ADDRESS, "balanceOf", (f"0x0{i}",), 100) for i in range(3)]
+    read_cache.put(keys[0], 0)
+    read_cache.put(keys[1], 1)
+    # recently used results are kept
+    read_cache.get(keys[0])
+    read_cache.put(keys[2], 2)
+
+    assert read_cache.get(keys[1]) == (False, None)
+    assert read_cache.get(keys[0]) == (True, 0)
+    assert read_cache.cache_info().evictions == 1
+    assert read_cache.cache_info().currsize == 2
+
+
+def test_set_head():
+    read_cache = ReadCache(finality_depth=10)
+    read_cache.set_head(1, 100)
+    finalized = (1, CONTRACT_ADDRESS, "totalSupply", (), 90)
+    latest = (1, CONTRACT_ADDRESS, "totalSupply", (), 100)
+    finalized_later = (1, CONTRACT_ADDRESS, "totalSupply", (), 95)
+    other_chain = (137, CONTRACT_ADDRESS, "totalSupply", (), 100)
+    for key in [finalized, latest, finalized_later, other_chain]:
+        read_cache.put(key, key[4])
+
+    # outdated heads are ignored
+    read_cache.set_head(1, 99)
+    assert read_cache.get(latest) == (True, 100)
+
+    read_cache.set_head(1, 105)
+
+    assert read_cache.get(finalized) == (True, 90)
+    assert read_cache.get(finalized_later) == (True, 95)
+    assert read_cache.get(latest) == (False, None)
+    assert read_cache.get(other_chain) == (True, 100)
+
+
+def test_set_head_per_chain_confirmation_depth():
+    read_cache = ReadCache()
+    # confirmation depths of 128 on Polygon & 1 on Avalanche
+    polygon = (137, CONTRACT_ADDRESS, "totalSupply", (), 90)
+    avalanche = (43114, CONTRACT_ADDRESS, "totalSupply", (), 90)
+    for key in [polygon, avalanche]:
+        read_cache.set_head(key[0], 91)
+        read_cache.put(key, key[4])
+
+    read_cache.set_head(137, 100)
+    read_cache.set_head(43114, 100)
+
+    assert read_cache.get(polygon) == (False, None)
+    assert read_cache.get(avalanche) == (True, 90)
+
+
+def test_get_head(mocker):
+    mocked_monotonic = mocker.patch(
+        "packages.core.jpyc_core_sdk.utils.caches.time.monotonic", return_value=0.0
+    )
+    read_cache = ReadCache(head_ttl=1.0)
+
+    assert read_cache.get_head(1) is None
+
+    read_cache.set_head(1, 100)
+    assert read_cache.get_head(1) == 100
+
+    mocked_monotonic.return_value = 1.5
+    assert read_cache.get_head(1) is None
+
+
+def test_invalidate():
+    read_cache = ReadCache(finality_depth=10)
+    read_cache.set_head(1, 100)
+    finalized = (1, CONTRACT_ADDRESS, "totalSupply", (), 90)
+    latest = (1, CONTRACT_ADDRESS, "totalSupply", (), 100)
+    other_contract = (1, "0x01", "totalSupply", (), 100)
+    for key in [finalized, latest, other_contract]:
+        read_cache.put(key, key[4])
+
+    assert read_cache.invalidate(chain_id=1, contract_address=CONTRACT_ADDRESS) == 1
+    assert read_cache.get(finalized) == (True, 90)
+    assert read_cache.get(latest) == (False, None)
+    assert read_cache.get(other_contract) == (True, 100)
+
+
+def test_cache_clear():
+    read_cache = ReadCache()
+    read_cache.set_head(1, 100)
+    read_cache.put((1, CONTRACT_ADDRESS, "totalSupply", (), 100), 1)
+    read_cache.cache_clear()
+
+    assert read_cache.get_head(1) is None
+    assert read_cache.cache_info() == ReadCacheInfo(
+        hits=0, misses=0, currsize=0, evictions=0
+    )
@@ -0,0 +1,128 @@
+import pytest
+from eth_abi import encode
+from web3 import HTTPProvider, Web3
+
+from packages.core.jpyc_core_sdk.utils.calls import (
+    batch_call,
+    get_view_function,
+    to_block_param,
+)
+from packages.core.jpyc_core_sdk.utils.errors import CallFailed
+
+from ..conftest import KNOWN_ACCOUNTS, V2_PROXY_ADDRESS
+
+
+def encode_result(value: int) -> str:
+    return f"0x{encode(['uint256'], [value]).hex()}"
+
+
+@pytest.fixture(scope="function")
+def w3():
+    return Web3(HTTPProvider("http://127.0.0.1:8545/"))
+
+
+def test_get_view_function():
+    function = get_view_function(contract_version="2", name="balanceOf")
+
+    assert function is get_view_function(contract_version="2", name="balanceOf")
+    assert function.selector.hex() == "70a08231"
+    assert function.input_types == ("address",)
+    assert function.output_types == ("uint256",)
+    assert function.decode(bytes.fromhex(encode_result(1)[2:])) == 1
+
+
+def test_get_view_function_failures():
+    with pytest.raises(ValueError):
+        get_view_function(contract_version="2", name="unknownFunction")
+
+
+@pytest.mark.parametrize(
+    ["block_identifier", "param"],
+    [
+        pytest.param("latest", "latest", id="tag"),
+        pytest.param(16, "0x10", id="number"),
+        pytest.param(b"\x01" * 32, f"0x{'01' * 32}", id="hash"),
+    ],
+)
+def test_to_block_param(block_identifier, param):
+    assert to_block_param(block_identifier) == param
+
+
+def test_batch_call(w3, mocker):
+    mocked_make_batch_request = mocker.patch.object(
+        w3.provider,
+        "make_batch_request",
+        side_effect=[
+            [
+                {"jsonrpc": "2.0", "id": 0, "result": encode_result(1)},
+                {
+                    "jsonrpc": "2.0",
+                    "id": 1,
+                    "error": {"code": 3, "message": "execution reverted"},
+                },
+            ],
+            [
+                {"jsonrpc": "2.0", "id": 2, "result": encode_result(3)},
+            ],
+        ],
+    )
+    function = get_view_function(contract_version="2", name="balanceOf")
+
+    results = batch_call(
+        w3=w3,
+        contract_address=V2_PROXY_ADDRESS,
+        function=function,
+        args_list=[(account.address,) for account in KNOWN_ACCOUNTS],
+        batch_size=2,
+    )
+
+    assert mocked_make_batch_request.call_count == 2
+    first_batch = mocked_make_batch_request.call_args_list[0].args[0]
+    assert len(first_batch) == 2
+    assert first_batch[0][0] == "eth_call"
+    assert first_batch[0][1][0]["to"] == V2_PROXY_ADDRESS
+    assert first_batch[0][1][0]["data"] == function.encode((KNOWN_ACCOUNTS[0].address,))
+    assert first_batch[0][1][1] == "latest"
+
+    assert results[0] == 1
+    assert isinstance(results[1], CallFailed)
+    assert results[2] == 3
+
+
+def test_batch_call_whole_batch_failures(w3, mocker):
+    mocker.patch.object(
+        w3.provider,
+        "make_batch_request",
+        side_effect=[
+            {"jsonrpc": "2.0", "id": None, "error": {"message": "batch too large"}},
+            ConnectionError("connection refused"),
+        ],
+    )
+
+    results = batch_call(
+        w3=w3,
+        contract_address=V2_PROXY_ADDRESS,
+        function=get_view_function(contract_version="2", name="nonces"),
+        args_list=[(account.address,) for account in KNOWN_ACCOUNTS],
+        batch_size=2,
+    )
+
+    assert len(results) == 3
+    assert all(isinstance(result, CallFailed) for result in results)
+    assert "batch too large" in str(results[0])
+    assert "connection refused" in str(results[2])
+
+
+def test_batch_call_empty(w3, mocker):
+    mocked_make_batch_request = mocker.patch.object(w3.provider, "make_batch_request")
+
+    assert (
+        batch_call(
+            w3=w3,
+            contract_address=V2_PROXY_ADDRESS,
+            function=get_view_function(contract_version="2", name="nonces"),
+            args_list=[],
+        )
+        == []
+    )
+    mocked_make_batch_request.assert_not_called()
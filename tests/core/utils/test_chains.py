@@ -2,9 +2,12 @@ import pytest
 
 from packages.core.jpyc_core_sdk.utils.chains import (
     enumerate_supported_networks,
+    get_chain_id,
+    get_confirmation_depth,
     get_default_rpc_endpoint,
     is_supported_network,
 )
+from packages.core.jpyc_core_sdk.utils.constants import DEFAULT_FINALITY_DEPTH
 from packages.core.jpyc_core_sdk.utils.errors import (
     NetworkNotSupported,
 )
@@ -85,3 +88,28 @@ def test_get_default_rpc_endpoint_failures():
             chain_name="ethereum",
             network_name="goerli",
         )
+
+
+def test_get_chain_id():
+    assert get_chain_id(chain_name="localhost", network_name="devnet") == 31337
+
+
+def test_get_chain_id_failures():
+    with pytest.raises(NetworkNotSupported):
+        get_chain_id(
+            chain_name="ethereum",
+            network_name="goerli",
+        )
+
+
+@pytest.mark.parametrize(
+    "chain_id, expected",
+    [
+        (137, 128),
+        (43114, 1),
+        # not supported by the SDK
+        (8453, DEFAULT_FINALITY_DEPTH),
+    ],
+)
+def test_get_confirmation_depth(chain_id, expected):
+    assert get_confirmation_depth(chain_id) == expected
@@ -0,0 +1,114 @@
+import gc
+import weakref
+
+from hexbytes import HexBytes
+from web3 import HTTPProvider, Web3
+from web3.contract.contract import Contract
+from web3.eth import Eth
+
+from packages.core.jpyc_core_sdk.client import SdkClient
+from packages.core.jpyc_core_sdk.utils.contracts import ContractFactory
+
+from ..conftest import KNOWN_ACCOUNTS, V2_PROXY_ADDRESS
+
+OTHER_ADDRESS = "0xC8CD2BE653759aed7B0996315821AAe71e1FEAdF"
+
+
+def test_get_contract():
+    factory = ContractFactory()
+    w3 = Web3(HTTPProvider("http://127.0.0.1:8545/"))
+
+    contract = factory.get_contract(
+        w3=w3,
+        chain_id=1,
+        contract_address=V2_PROXY_ADDRESS,
+    )
+
+    assert isinstance(contract, Contract)
+    assert contract.address == V2_PROXY_ADDRESS
+    assert contract is factory.get_contract(
+        w3=w3,
+        chain_id=1,
+        contract_address=V2_PROXY_ADDRESS,
+    )
+    assert factory.cache_info() == (1, 1, 1)
+
+
+def test_get_contract_different_keys():
+    factory = ContractFactory()
+    w3 = Web3(HTTPProvider("http://127.0.0.1:8545/"))
+    other_w3 = Web3(HTTPProvider("http://127.0.0.1:8545/"))
+
+    contract = factory.get_contract(
+        w3=w3, chain_id=1, contract_address=V2_PROXY_ADDRESS
+    )
+
+    assert contract is not factory.get_contract(
+        w3=other_w3, chain_id=1, contract_address=V2_PROXY_ADDRESS
+    )
+    assert contract is not factory.get_contract(
+        w3=w3, chain_id=137, contract_address=V2_PROXY_ADDRESS
+    )
+    assert contract is not factory.get_contract(
+        w3=w3, chain_id=1, contract_address=OTHER_ADDRESS
+    )
+    assert factory.cache_info() == (0, 4, 4)
+
+
+def test_get_contract_eviction():
+    factory = ContractFactory(maxsize=1)
+    w3 = Web3(HTTPProvider("http://127.0.0.1:8545/"))
+
+    factory.get_contract(w3=w3, chain_id=1, contract_address=V2_PROXY_ADDRESS)
+    factory.get_contract(w3=w3, chain_id=1, contract_address=OTHER_ADDRESS)
+    factory.get_contract(w3=w3, chain_id=1, contract_address=V2_PROXY_ADDRESS)
+
+    assert factory.cache_info() == (0, 3, 1)
+
+    factory.cache_clear()
+    assert factory.cache_info() == (0, 0, 0)
+
+
+def test_get_contract_eviction_per_web3_instance():
+    factory = ContractFactory(maxsize=1)
+    w3 = Web3(HTTPProvider("http://127.0.0.1:8545/"))
+    other_w3 = Web3(HTTPProvider("http://127.0.0.1:8545/"))
+
+    factory.get_contract(w3=w3, chain_id=1, contract_address=V2_PROXY_ADDRESS)
+    factory.get_contract(w3=other_w3, chain_id=1, contract_address=V2_PROXY_ADDRESS)
+
+    # bounded per web3 instance
+    assert factory.cache_info() == (0, 2, 2)
+
+
+def test_get_contract_garbage_collected():
+    factory = ContractFactory()
+    w3 = Web3(HTTPProvider("http://127.0.0.1:8545/"))
+    w3_ref = weakref.ref(w3)
+
+    contract = factory.get_contract(
+        w3=w3, chain_id=1, contract_address=V2_PROXY_ADDRESS
+    )
+    assert contract.w3.eth.default_account == w3.eth.default_account
+    del w3, contract
+    gc.collect()
+
+    # cached contracts never keep web3 instances alive
+    assert w3_ref() is None
+    assert factory.cache_info().currsize == 0
+
+
+def test_get_contract_after_web3_replaced(mocker):
+    mocker.patch.object(Eth, "call", return_value=HexBytes((100).to_bytes(32, "big")))
+    factory = ContractFactory()
+    client = SdkClient(chain_name="ethereum", network_name="mainnet")
+    contract = factory.get_contract(
+        w3=client.w3, chain_id=1, contract_address=V2_PROXY_ADDRESS
+    )
+
+    # the web3 instance of the client is replaced
+    client.set_account(private_key=KNOWN_ACCOUNTS[1].private_key)
+    gc.collect()
+
+    # cached contracts keep their web3 instances alive while used
+    assert contract.functions.totalSupply().call() == 100
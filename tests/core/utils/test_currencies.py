@@ -1,3 +1,4 @@
+import asyncio
 from decimal import Decimal
 
 import pytest
@@ -46,3 +47,11 @@ def test_remove_decimals(value, response):
 def test_restore_decimals(value, response):
     off_chain_value = restore_decimals(func=lambda v: v)(value)
     assert off_chain_value == response
+
+
+def test_restore_decimals_async():
+    async def get_value(v):
+        return v
+
+    off_chain_value = asyncio.run(restore_decimals(func=get_value)(10**18))
+    assert off_chain_value == 1
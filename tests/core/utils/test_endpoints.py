@@ -0,0 +1,98 @@
+import pytest
+import requests
+from aiohttp import ClientResponseError
+
+from packages.core.jpyc_core_sdk.utils.endpoints import (
+    EndpointMonitor,
+    EndpointStats,
+    is_failover_error,
+)
+
+ENDPOINTS = ["http://a.example", "http://b.example", "http://c.example"]
+
+
+def http_error(status: int) -> requests.HTTPError:
+    response = requests.Response()
+    response.status_code = status
+    return requests.HTTPError(response=response)
+
+
+@pytest.mark.parametrize(
+    "error, expected",
+    [
+        (http_error(503), True),
+        (http_error(429), True),
+        (http_error(408), True),
+        (http_error(400), False),
+        (requests.ConnectionError(), True),
+        (requests.Timeout(), True),
+        (TimeoutError(), True),
+        (ClientResponseError(None, (), status=502), True),  # type: ignore[arg-type]
+        (ClientResponseError(None, (), status=404), False),  # type: ignore[arg-type]
+        (ValueError(), False),
+    ],
+)
+def test_is_failover_error(error, expected):
+    assert is_failover_error(error) is expected
+
+
+def test_record_success():
+    monitor = EndpointMonitor(smoothing=0.5)
+
+    monitor.record_success(ENDPOINTS[0], 1.0)
+    monitor.record_success(ENDPOINTS[0], 3.0)
+
+    assert monitor.get_stats(ENDPOINTS[0]) == EndpointStats(latency=2.0, successes=2)
+    assert monitor.get_stats(ENDPOINTS[1]) == EndpointStats()
+
+
+def test_record_failure():
+    monitor = EndpointMonitor(cooldown=100, max_cooldown=150)
+
+    monitor.record_failure(ENDPOINTS[0])
+    first = monitor.get_stats(ENDPOINTS[0]).unhealthy_until
+    monitor.record_failure(ENDPOINTS[0])
+    second = monitor.get_stats(ENDPOINTS[0]).unhealthy_until
+
+    assert not monitor.is_healthy(ENDPOINTS[0])
+    assert monitor.get_stats(ENDPOINTS[0]).failures == 2
+    # cooldowns double on consecutive failures (up to the maximum)
+    assert second - first == pytest.approx(50, abs=1)
+
+    monitor.record_success(ENDPOINTS[0], 1.0)
+    assert monitor.is_healthy(ENDPOINTS[0])
+    assert monitor.get_stats(ENDPOINTS[0]).failures == 0
+
+
+def test_rank():
+    monitor = EndpointMonitor(cooldown=100)
+    monitor.record_success(ENDPOINTS[0], 2.0)
+    monitor.record_success(ENDPOINTS[1], 1.0)
+
+    assert monitor.rank(ENDPOINTS) == [ENDPOINTS[2], ENDPOINTS[1], ENDPOINTS[0]]
+
+    monitor.record_failure(ENDPOINTS[1])
+    monitor.record_failure(ENDPOINTS[2])
+    monitor.record_failure(ENDPOINTS[2])
+
+    assert monitor.rank(ENDPOINTS) == [ENDPOINTS[0], ENDPOINTS[1], ENDPOINTS[2]]
+
+    monitor.reset()
+    assert monitor.rank(ENDPOINTS) == ENDPOINTS
+
+
+def test_get_latency_percentile():
+    monitor = EndpointMonitor(window=20)
+
+    for latency in range(1, 10):
+        monitor.record_success(ENDPOINTS[0], latency)
+    # too few samples to estimate percentiles
+    assert monitor.get_latency_percentile(ENDPOINTS[0], 50) is None
+
+    for latency in range(10, 31):
+        monitor.record_success(ENDPOINTS[0], latency)
+
+    # only the latest 20 samples (i.e., 11 to 30) are kept
+    assert monitor.get_latency_percentile(ENDPOINTS[0], 50) == 20
+    assert monitor.get_latency_percentile(ENDPOINTS[0], 95) == 29
+    assert monitor.get_latency_percentile(ENDPOINTS[0], 100) == 30
@@ -0,0 +1,87 @@
+import pytest
+
+from packages.core.jpyc_core_sdk.utils.event_store import EventStore
+from packages.core.jpyc_core_sdk.utils.events import EventDecoder
+
+from ..conftest import KNOWN_ACCOUNTS, V2_PROXY_ADDRESS
+from .test_events import transfer_log
+
+
+@pytest.fixture(scope="function")
+def events(jpyc_client):
+    decoder = EventDecoder(jpyc_client.contract, ["Transfer"])
+
+    return [decoder.decode(transfer_log(i, value=2**255)) for i in range(1, 6)]
+
+
+def test_save(tmp_path, events):
+    store = EventStore(tmp_path / "events.db")
+    assert store.get_cursor(1, V2_PROXY_ADDRESS) is None
+
+    store.save(1, V2_PROXY_ADDRESS, events, 10)
+    # writing the same events twice is idempotent
+    store.save(1, V2_PROXY_ADDRESS, events[:2], 10)
+    store.close()
+
+    # persisted across connections
+    store = EventStore(tmp_path / "events.db")
+    assert store.get_cursor(1, V2_PROXY_ADDRESS) == 10
+    assert store.get_cursor(137, V2_PROXY_ADDRESS) is None
+    stored = store.get_events(1, V2_PROXY_ADDRESS)
+    assert [event.block_number for event in stored] == [1, 2, 3, 4, 5]
+    assert stored[0].event == "Transfer"
+    assert stored[0].from_ == KNOWN_ACCOUNTS[0].address
+    assert stored[0].to == KNOWN_ACCOUNTS[1].address
+    assert stored[0].value == 2**255
+    assert stored[0].args["value"] == 2**255
+    store.close()
+
+
+@pytest.mark.parametrize(
+    "kwargs, expected",
+    [
+        ({"address": KNOWN_ACCOUNTS[0].address.lower()}, [1, 2, 3, 4, 5]),
+        ({"address": KNOWN_ACCOUNTS[2].address}, []),
+        ({"event_names": ["Approval"]}, []),
+        ({"from_block": 2, "to_block": 4}, [2, 3, 4]),
+        ({"address": KNOWN_ACCOUNTS[1].address, "limit": 2}, [1, 2]),
+    ],
+)
+def test_get_events(events, kwargs, expected):
+    store = EventStore()
+    store.save(1, V2_PROXY_ADDRESS, events, 5)
+
+    stored = store.get_events(1, V2_PROXY_ADDRESS, **kwargs)
+
+    assert [event.block_number for event in stored] == expected
+
+
+def test_rollback(events):
+    store = EventStore()
+    store.save(1, V2_PROXY_ADDRESS, events[:3], 3)
+    store.save(1, V2_PROXY_ADDRESS, events[3:], 10, block_hash="0x10")
+
+    assert store.get_block_hashes(1, V2_PROXY_ADDRESS, 3) == {
+        3: "0x" + "03".rjust(64, "0"),
+        4: "0x" + "04".rjust(64, "0"),
+        5: "0x" + "05".rjust(64, "0"),
+        10: "0x10",
+    }
+    assert store.rollback(1, V2_PROXY_ADDRESS, 3) == 2
+    assert store.get_cursor(1, V2_PROXY_ADDRESS) == 3
+    assert [event.block_number for event in store.get_events(1, V2_PROXY_ADDRESS)] == [
+        1,
+        2,
+        3,
+    ]
+    assert 10 not in store.get_block_hashes(1, V2_PROXY_ADDRESS, 0)
+
+
+def test_prune_blocks():
+    store = EventStore()
+    store.save(1, V2_PROXY_ADDRESS, [], 10, block_hash="0x10")
+    store.save(1, V2_PROXY_ADDRESS, [], 20, block_hash="0x20")
+
+    store.prune_blocks(1, V2_PROXY_ADDRESS, 15)
+
+    assert store.get_block_hashes(1, V2_PROXY_ADDRESS, 0) == {20: "0x20"}
@@ -0,0 +1,119 @@
+import pytest
+import requests
+from hexbytes import HexBytes
+from web3 import Web3
+
+from packages.core.jpyc_core_sdk.utils.constants import (
+    AUTHORIZATION_CANCELED_TOPIC,
+    AUTHORIZATION_USED_TOPIC,
+    MAX_LOG_CHUNK_SIZE,
+)
+from packages.core.jpyc_core_sdk.utils.events import (
+    BlockRangeSizer,
+    EventDecoder,
+    build_authorization_filter,
+    build_event_filter,
+    decode_authorization_log,
+    is_range_error,
+)
+
+from ..conftest import KNOWN_ACCOUNTS, V2_PROXY_ADDRESS
+
+TRANSFER_TOPIC = Web3.keccak(text="Transfer(address,address,uint256)")
+
+
+def transfer_log(block_number: int, value: int = 1) -> dict:
+    return {
+        "address": V2_PROXY_ADDRESS,
+        "blockHash": HexBytes(block_number.to_bytes(32, "big")),
+        "blockNumber": block_number,
+        "logIndex": 0,
+        "transactionHash": HexBytes(b"\x01" * 32),
+        "transactionIndex": 0,
+        "data": HexBytes(value.to_bytes(32, "big")),
+        "topics": [
+            TRANSFER_TOPIC,
+            HexBytes(HexBytes(KNOWN_ACCOUNTS[0].address).rjust(32, b"\x00")),
+            HexBytes(HexBytes(KNOWN_ACCOUNTS[1].address).rjust(32, b"\x00")),
+        ],
+    }
+
+
+def test_build_event_filter():
+    filter_params = build_event_filter(V2_PROXY_ADDRESS, ["0x01", "0x02"], 1, 10)
+
+    assert filter_params == {
+        "address": V2_PROXY_ADDRESS,
+        "fromBlock": 1,
+        "toBlock": 10,
+        "topics": [["0x01", "0x02"]],
+    }
+
+
+def test_build_authorization_filter():
+    filter_params = build_authorization_filter(V2_PROXY_ADDRESS, 1, "latest")
+
+    assert filter_params == {
+        "address": V2_PROXY_ADDRESS,
+        "fromBlock": 1,
+        "toBlock": "latest",
+        "topics": [[AUTHORIZATION_USED_TOPIC, AUTHORIZATION_CANCELED_TOPIC]],
+    }
+
+
+def test_decode_authorization_log():
+    nonce = f"0x{'ab' * 32}"
+    log = {
+        "topics": [
+            HexBytes(AUTHORIZATION_CANCELED_TOPIC),
+            HexBytes(HexBytes(KNOWN_ACCOUNTS[0].address).rjust(32, b"\x00")),
+            HexBytes(nonce),
+        ]
+    }
+
+    assert decode_authorization_log(log) == (KNOWN_ACCOUNTS[0].address, nonce)
+
+
+@pytest.mark.parametrize(
+    "error, expected",
+    [
+        (ValueError({"message": "query returned more than 10000 results"}), True),
+        (ValueError({"message": "Block range is too large"}), True),
+        (requests.ReadTimeout(), True),
+        (ValueError({"message": "execution reverted"}), False),
+    ],
+)
+def test_is_range_error(error, expected):
+    assert is_range_error(error) is expected
+
+
+def test_block_range_sizer():
+    sizer = BlockRangeSizer(chunk_size=100, min_chunk_size=10)
+
+    sizer.record_success(100)
+    assert sizer.get_chunk_size() == 200
+    # failures of stale (i.e., larger) ranges shrink ranges only once
+    sizer.record_failure(200)
+    sizer.record_failure(200)
+    assert sizer.get_chunk_size() == 100
+    sizer.record_failure(12)
+    assert sizer.get_chunk_size() == 10
+    sizer.record_success(MAX_LOG_CHUNK_SIZE)
+    assert sizer.get_chunk_size() == MAX_LOG_CHUNK_SIZE
+
+
+def test_event_decoder(jpyc_client):
+    decoder = EventDecoder(jpyc_client.contract, ["Transfer"])
+
+    event = decoder.decode(transfer_log(5, value=10**18))
+
+    assert decoder.get_topics() == [Web3.to_hex(TRANSFER_TOPIC)]
+    assert event["event"] == "Transfer"
+    assert event["blockNumber"] == 5
+    assert event["args"]["value"] == 10**18
+    assert event["args"]["to"] == KNOWN_ACCOUNTS[1].address
+
+
+def test_event_decoder_unknown_event(jpyc_client):
+    with pytest.raises(ValueError, match="Unknown events"):
+        EventDecoder(jpyc_client.contract, ["Transferred"])
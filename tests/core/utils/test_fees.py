@@ -0,0 +1,72 @@
+from web3 import HTTPProvider, Web3
+from web3.eth import Eth
+
+from packages.core.jpyc_core_sdk.utils.fees import FeeManager
+
+
+def test_get_fees(mocker):
+    w3 = Web3(HTTPProvider("http://127.0.0.1:8545/"))
+    mocked_get_block = mocker.patch.object(
+        Eth, "get_block", return_value={"baseFeePerGas": 10}
+    )
+    mocker.patch.object(
+        Eth, "max_priority_fee", new_callable=mocker.PropertyMock, return_value=1
+    )
+    fee_manager = FeeManager()
+
+    assert fee_manager.get_fees(w3, 1) == {
+        "maxFeePerGas": 21,
+        "maxPriorityFeePerGas": 1,
+    }
+    assert fee_manager.get_fees(w3, 1) == {
+        "maxFeePerGas": 21,
+        "maxPriorityFeePerGas": 1,
+    }
+    mocked_get_block.assert_called_once()
+
+    fee_manager.invalidate()
+    fee_manager.get_fees(w3, 1)
+    assert mocked_get_block.call_count == 2
+
+
+def test_get_fees_legacy(mocker):
+    w3 = Web3(HTTPProvider("http://127.0.0.1:8545/"))
+    mocker.patch.object(Eth, "get_block", return_value={})
+    mocker.patch.object(
+        Eth, "gas_price", new_callable=mocker.PropertyMock, return_value=5
+    )
+
+    assert FeeManager(ttl=0).get_fees(w3, 1) == {"gasPrice": 5}
+
+
+def test_get_fees_per_chain(mocker):
+    w3 = Web3(HTTPProvider("http://127.0.0.1:8545/"))
+    mocked_get_block = mocker.patch.object(
+        Eth, "get_block", side_effect=[{"baseFeePerGas": 10}, {"baseFeePerGas": 50}]
+    )
+    mocker.patch.object(
+        Eth, "max_priority_fee", new_callable=mocker.PropertyMock, return_value=1
+    )
+    fee_manager = FeeManager()
+
+    # cached per chain id
+    assert fee_manager.get_fees(w3, 1) == {
+        "maxFeePerGas": 21,
+        "maxPriorityFeePerGas": 1,
+    }
+    assert fee_manager.get_fees(w3, 137) == {
+        "maxFeePerGas": 101,
+        "maxPriorityFeePerGas": 1,
+    }
+    assert fee_manager.get_fees(w3, 1) == {
+        "maxFeePerGas": 21,
+        "maxPriorityFeePerGas": 1,
+    }
+    assert mocked_get_block.call_count == 2
+
+    fee_manager.invalidate(137)
+    assert fee_manager.get_fees(w3, 1) == {
+        "maxFeePerGas": 21,
+        "maxPriorityFeePerGas": 1,
+    }
+    assert mocked_get_block.call_count == 2
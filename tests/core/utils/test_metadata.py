@@ -0,0 +1,124 @@
+import asyncio
+
+import pytest
+from eth_abi import encode
+
+from packages.core.jpyc_core_sdk.utils.constants import TOKEN_METADATA_FUNCTIONS
+from packages.core.jpyc_core_sdk.utils.errors import CallFailed
+from packages.core.jpyc_core_sdk.utils.metadata import (
+    TokenMetadata,
+    async_fetch_token_metadata,
+    build_metadata_requests,
+    decode_metadata_responses,
+    fetch_token_metadata,
+)
+
+CONTRACT_ADDRESS = "0x431D5dfF03120AFA4bDf332c61A6e1766eF37BDB"
+METADATA = TokenMetadata(
+    name="JPY Coin",
+    symbol="JPYC",
+    decimals=18,
+    currency="JPY",
+    domain_separator=b"\x01" * 32,
+    permit_typehash=b"\x02" * 32,
+    transfer_with_authorization_typehash=b"\x03" * 32,
+    receive_with_authorization_typehash=b"\x04" * 32,
+    cancel_authorization_typehash=b"\x05" * 32,
+)
+OUTPUT_TYPES = ["string", "string", "uint8", "string"] + ["bytes32"] * 5
+
+
+def encode_metadata_responses(metadata: TokenMetadata) -> list[dict]:
+    values = [getattr(metadata, name) for name in metadata.__dataclass_fields__]
+
+    return [
+        {"jsonrpc": "2.0", "id": i, "result": f"0x{encode([type_], [value]).hex()}"}
+        for i, (type_, value) in enumerate(zip(OUTPUT_TYPES, values, strict=True))
+    ]
+
+
+def test_build_metadata_requests():
+    requests = build_metadata_requests(CONTRACT_ADDRESS, "2")
+
+    assert len(requests) == len(TOKEN_METADATA_FUNCTIONS)
+    assert all(method == "eth_call" for method, _ in requests)
+    assert all(params[0]["to"] == CONTRACT_ADDRESS for _, params in requests)
+
+
+def test_decode_metadata_responses():
+    responses = encode_metadata_responses(METADATA)
+
+    assert decode_metadata_responses(responses, "2") == METADATA
+
+
+@pytest.mark.parametrize(
+    "responses",
+    [
+        pytest.param(
+            {"jsonrpc": "2.0", "id": None, "error": {"code": -32600}},
+            id="rejected batch",
+        ),
+        pytest.param(
+            encode_metadata_responses(METADATA)[:-1],
+            id="missing response",
+        ),
+        pytest.param(
+            [{"jsonrpc": "2.0", "id": 0, "error": {"code": -32000}}]
+            + encode_metadata_responses(METADATA)[1:],
+            id="failed call",
+        ),
+    ],
+)
+def test_decode_metadata_responses_failures(responses):
+    with pytest.raises(CallFailed):
+        decode_metadata_responses(responses, "2")
+
+
+@pytest.mark.parametrize(
+    "batch_response",
+    [
+        pytest.param(
+            {"return_value": {"jsonrpc": "2.0", "id": None, "error": {"code": -32600}}},
+            id="rejected batch",
+        ),
+        pytest.param(
+            {"side_effect": ValueError("batch requests are not supported")},
+            id="failed batch",
+        ),
+    ],
+)
+def test_fetch_token_metadata_without_batches(mocker, batch_response):
+    w3 = mocker.Mock()
+    w3.provider.make_batch_request = mocker.Mock(**batch_response)
+    w3.provider.make_request.side_effect = encode_metadata_responses(METADATA)
+
+    # falls back to individual calls
+    assert fetch_token_metadata(w3, CONTRACT_ADDRESS, "2") == METADATA
+    assert w3.provider.make_request.call_count == len(TOKEN_METADATA_FUNCTIONS)
+
+
+@pytest.mark.parametrize(
+    "batch_response",
+    [
+        pytest.param(
+            {"return_value": {"jsonrpc": "2.0", "id": None, "error": {"code": -32600}}},
+            id="rejected batch",
+        ),
+        pytest.param(
+            {"side_effect": ValueError("batch requests are not supported")},
+            id="failed batch",
+        ),
+    ],
+)
+def test_async_fetch_token_metadata_without_batches(mocker, batch_response):
+    w3 = mocker.Mock()
+    w3.provider.make_batch_request = mocker.AsyncMock(**batch_response)
+    w3.provider.make_request = mocker.AsyncMock(
+        side_effect=encode_metadata_responses(METADATA)
+    )
+
+    # falls back to concurrent calls
+    metadata = asyncio.run(async_fetch_token_metadata(w3, CONTRACT_ADDRESS, "2"))
+
+    assert metadata == METADATA
+    assert w3.provider.make_request.await_count == len(TOKEN_METADATA_FUNCTIONS)
@@ -0,0 +1,127 @@
+import pytest
+from eth_abi import encode
+from web3 import HTTPProvider, Web3
+from web3.eth import Eth
+
+from packages.core.jpyc_core_sdk.utils.calls import get_view_function
+from packages.core.jpyc_core_sdk.utils.errors import CallFailed
+from packages.core.jpyc_core_sdk.utils.multicall import (
+    Call,
+    aggregate3,
+    chunk_calls,
+    get_aggregate3_function,
+)
+
+from ..conftest import KNOWN_ACCOUNTS, V2_PROXY_ADDRESS
+
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+ERROR_DATA = bytes.fromhex("08c379a0") + encode(["string"], ["Blocklistable: blocked"])
+
+
+def encode_results(results: list[tuple[bool, bytes]]) -> bytes:
+    return encode(["(bool,bytes)[]"], [results])
+
+
+@pytest.fixture(scope="function")
+def w3():
+    return Web3(HTTPProvider("http://127.0.0.1:8545/"))
+
+
+@pytest.fixture(scope="function")
+def balance_of_calls():
+    function = get_view_function(contract_version="2", name="balanceOf")
+
+    return [
+        Call(V2_PROXY_ADDRESS, function, (account.address,))
+        for account in KNOWN_ACCOUNTS
+    ]
+
+
+def test_get_aggregate3_function():
+    function = get_aggregate3_function()
+
+    assert function is get_aggregate3_function()
+    assert function.selector.hex() == "82ad56cb"
+    assert function.input_types == ("(address,bool,bytes)[]",)
+    assert function.output_types == ("(bool,bytes)[]",)
+
+
+@pytest.mark.parametrize(
+    ["calldata_list", "max_calldata_size", "gas_limit", "chunks"],
+    [
+        pytest.param([b"\x00" * 36] * 3, 65_536, 10_000_000, [range(3)], id="fit"),
+        pytest.param(
+            [b"\x00" * 36] * 3,
+            4 + 32 * 2 + 224 * 2,
+            10_000_000,
+            [range(2), range(2, 3)],
+            id="calldata size",
+        ),
+        pytest.param(
+            [b"\x00" * 36] * 3,
+            65_536,
+            50_000,
+            [range(2), range(2, 3)],
+            id="gas limit",
+        ),
+        pytest.param(
+            [b"\x00" * 1_000], 100, 10_000_000, [range(1)], id="oversized call"
+        ),
+        pytest.param([], 65_536, 10_000_000, [], id="empty"),
+    ],
+)
+def test_chunk_calls(calldata_list, max_calldata_size, gas_limit, chunks):
+    assert (
+        list(
+            chunk_calls(
+                calldata_list=calldata_list,
+                max_calldata_size=max_calldata_size,
+                gas_limit=gas_limit,
+            )
+        )
+        == chunks
+    )
+
+
+def test_aggregate3(w3, mocker, balance_of_calls):
+    mocked_eth_call = mocker.patch.object(
+        Eth,
+        "call",
+        return_value=encode_results(
+            [
+                (True, encode(["uint256"], [1])),
+                (False, ERROR_DATA),
+                (True, encode(["uint256"], [3])),
+            ]
+        ),
+    )
+
+    results = aggregate3(w3=w3, calls=balance_of_calls)
+
+    mocked_eth_call.assert_called_once()
+    transaction, block_identifier = mocked_eth_call.call_args.args
+    assert transaction["to"] == MULTICALL3_ADDRESS
+    assert transaction["data"].startswith("0x82ad56cb")
+    assert block_identifier == "latest"
+
+    assert results[0] == 1
+    assert isinstance(results[1], CallFailed)
+    assert "Blocklistable: blocked" in str(results[1])
+    assert results[2] == 3
+
+
+def test_aggregate3_chunks(w3, mocker, balance_of_calls):
+    mocked_eth_call = mocker.patch.object(
+        Eth,
+        "call",
+        side_effect=[
+            encode_results([(True, encode(["uint256"], [i])) for i in range(2)]),
+            ValueError("execution reverted"),
+        ],
+    )
+
+    results = aggregate3(w3=w3, calls=balance_of_calls, gas_limit=50_000)
+
+    assert mocked_eth_call.call_count == 2
+    assert results[:2] == [0, 1]
+    assert isinstance(results[2], CallFailed)
@@ -0,0 +1,119 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from web3 import AsyncHTTPProvider, AsyncWeb3, HTTPProvider, Web3
+from web3.eth import AsyncEth, Eth
+
+from packages.core.jpyc_core_sdk.utils.nonces import (
+    NonceManager,
+    is_known_transaction_error,
+    is_nonce_error,
+)
+
+from ..conftest import KNOWN_ACCOUNTS
+
+
+@pytest.fixture(scope="function")
+def w3():
+    return Web3(HTTPProvider("http://127.0.0.1:8545/"))
+
+
+def test_reserve(w3, mocker):
+    mocked_get_transaction_count = mocker.patch.object(
+        Eth, "get_transaction_count", return_value=3
+    )
+    nonce_manager = NonceManager(KNOWN_ACCOUNTS[0].address)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        nonces = list(executor.map(lambda _: nonce_manager.reserve(w3), range(100)))
+
+    assert sorted(nonces) == list(range(3, 103))
+    mocked_get_transaction_count.assert_called_once()
+
+    nonce_manager.reset()
+    assert nonce_manager.reserve(w3) == 3
+
+
+def test_async_reserve(mocker):
+    w3 = AsyncWeb3(AsyncHTTPProvider("http://127.0.0.1:8545/"))
+    mocker.patch.object(
+        AsyncEth, "get_transaction_count", mocker.AsyncMock(return_value=3)
+    )
+    nonce_manager = NonceManager(KNOWN_ACCOUNTS[0].address)
+
+    async def reserve_concurrently():
+        return await asyncio.gather(
+            *(nonce_manager.async_reserve(w3) for _ in range(100))
+        )
+
+    assert sorted(asyncio.run(reserve_concurrently())) == list(range(3, 103))
+
+
+def test_release(w3, mocker):
+    mocker.patch.object(Eth, "get_transaction_count", return_value=0)
+    nonce_manager = NonceManager(KNOWN_ACCOUNTS[0].address)
+    nonces = [nonce_manager.reserve(w3) for _ in range(5)]
+
+    nonce_manager.release(nonces[1])
+    nonce_manager.release(nonces[1])
+    nonce_manager.release(nonces[3])
+
+    # gaps are filled in ascending order before the next nonce
+    assert [nonce_manager.reserve(w3) for _ in range(3)] == [1, 3, 5]
+
+    # releasing the latest nonces rewinds the next nonce
+    nonce_manager.release(5)
+    nonce_manager.release(4)
+    assert nonce_manager.reserve(w3) == 4
+
+
+def test_resync(w3, mocker):
+    mocker.patch.object(Eth, "get_transaction_count", side_effect=[0, 10, 2])
+    nonce_manager = NonceManager(KNOWN_ACCOUNTS[0].address)
+    nonces = [nonce_manager.reserve(w3) for _ in range(5)]
+    nonce_manager.release(nonces[2])
+
+    assert nonce_manager.resync(w3) == 10
+    assert nonce_manager.reserve(w3) == 10
+
+    # nonces reserved locally are never handed out again
+    assert nonce_manager.resync(w3) == 11
+
+
+def test_resync_without_reservations(w3, mocker):
+    mocker.patch.object(Eth, "get_transaction_count", side_effect=[0, 2])
+    nonce_manager = NonceManager(KNOWN_ACCOUNTS[0].address)
+    nonces = [nonce_manager.reserve(w3) for _ in range(5)]
+    for nonce in nonces:
+        nonce_manager.commit(nonce)
+
+    # gaps of dropped (or replaced) transactions are closed
+    assert nonce_manager.resync(w3) == 2
+    assert nonce_manager.reserve(w3) == 2
+
+
+@pytest.mark.parametrize(
+    ["message", "response"],
+    [
+        pytest.param("nonce too low: next nonce 9, tx nonce 7", True, id="too low"),
+        pytest.param("Replacement transaction underpriced", True, id="underpriced"),
+        # the same transaction is already in the mempool (i.e., not stale)
+        pytest.param("already known", False, id="known"),
+        pytest.param("insufficient funds for gas * price + value", False, id="funds"),
+    ],
+)
+def test_is_nonce_error(message, response):
+    assert is_nonce_error(ValueError(message)) is response
+
+
+@pytest.mark.parametrize(
+    ["message", "response"],
+    [
+        pytest.param("already known", True, id="known"),
+        pytest.param("Known transaction: 0x01", True, id="known transaction"),
+        pytest.param("nonce too low", False, id="too low"),
+    ],
+)
+def test_is_known_transaction_error(message, response):
+    assert is_known_transaction_error(ValueError(message)) is response
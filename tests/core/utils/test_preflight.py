@@ -0,0 +1,236 @@
+import pytest
+from eth_account import Account
+from hexbytes import HexBytes
+
+from packages.core.jpyc_core_sdk.utils.constants import SECP256K1N_HALF
+from packages.core.jpyc_core_sdk.utils.errors import PreflightCheckFailed
+from packages.core.jpyc_core_sdk.utils.preflight import (
+    PreflightValidator,
+    recover_signer,
+)
+from packages.core.jpyc_core_sdk.utils.signatures import (
+    TypedDataSigner,
+    to_bytes32_hex,
+)
+
+from ..conftest import KNOWN_ACCOUNTS
+from .test_metadata import METADATA
+
+ACCOUNT = Account.from_key(KNOWN_ACCOUNTS[0].private_key)
+TO = KNOWN_ACCOUNTS[1].address
+NONCE = f"0x{'ab' * 32}"
+TX_HASH = HexBytes(b"\x01" * 32)
+SIGNER = TypedDataSigner(METADATA)
+
+
+@pytest.fixture(scope="function")
+def validator():
+    validator = PreflightValidator(SIGNER)
+    validator.set_block_timestamp(1000)
+
+    return validator
+
+
+def build_func_args(**overrides) -> dict:
+    args = {"value": 10**18, "valid_after": 0, "valid_before": 2000, "nonce": NONCE}
+    args.update(overrides)
+    signature = SIGNER.sign_transfer_with_authorization(ACCOUNT, TO, **args)
+
+    return {
+        "from": ACCOUNT.address,
+        "to": TO,
+        "value": args["value"],
+        "validAfter": args["valid_after"],
+        "validBefore": args["valid_before"],
+        "nonce": args["nonce"],
+        **signature._asdict(),
+    }
+
+
+def test_recover_signer():
+    message_hash = b"\x01" * 32
+    signature = ACCOUNT.unsafe_sign_hash(message_hash)
+
+    assert (
+        recover_signer(
+            message_hash,
+            signature.v,
+            to_bytes32_hex(signature.r),
+            to_bytes32_hex(signature.s),
+        )
+        == ACCOUNT.address
+    )
+
+
+@pytest.mark.parametrize(
+    ["v", "s"],
+    [
+        pytest.param(27, to_bytes32_hex(SECP256K1N_HALF + 1), id="high s"),
+        pytest.param(1, to_bytes32_hex(1), id="invalid v"),
+    ],
+)
+def test_recover_signer_failures(v, s):
+    with pytest.raises(PreflightCheckFailed):
+        recover_signer(b"\x01" * 32, v, to_bytes32_hex(1), s)
+
+
+def test_get_block_timestamp(mocker):
+    mocked_monotonic = mocker.patch(
+        "packages.core.jpyc_core_sdk.utils.preflight.time.monotonic",
+        return_value=10.0,
+    )
+    validator = PreflightValidator(SIGNER)
+    validator.set_block_timestamp(1000)
+    mocked_monotonic.return_value = 12.5
+
+    # extrapolated by the elapsed time
+    assert validator.get_block_timestamp() == 1002.5
+
+
+def test_is_block_timestamp_outdated(mocker):
+    mocked_monotonic = mocker.patch(
+        "packages.core.jpyc_core_sdk.utils.preflight.time.monotonic",
+        return_value=10.0,
+    )
+    validator = PreflightValidator(SIGNER, block_timestamp_ttl=5.0)
+    assert validator.is_block_timestamp_outdated()
+
+    validator.set_block_timestamp(1000)
+    mocked_monotonic.return_value = 14.0
+    assert not validator.is_block_timestamp_outdated()
+
+    mocked_monotonic.return_value = 15.0
+    assert validator.is_block_timestamp_outdated()
+
+
+def test_check_transfer_with_authorization(validator):
+    func_args = build_func_args()
+
+    validator.check("transferWithAuthorization", func_args)
+    validator.record(TX_HASH, "transferWithAuthorization", func_args)
+
+    # pending until the receipt is recorded
+    assert not validator.is_authorization_used(ACCOUNT.address, NONCE)
+    with pytest.raises(PreflightCheckFailed, match="pending"):
+        validator.check("transferWithAuthorization", func_args)
+
+    validator.record_receipt({"transactionHash": TX_HASH, "status": 1})
+
+    assert not validator.is_authorization_pending(ACCOUNT.address, NONCE)
+    with pytest.raises(PreflightCheckFailed, match="used or canceled"):
+        validator.check("transferWithAuthorization", func_args)
+
+
+@pytest.mark.parametrize(
+    "discard",
+    [
+        pytest.param(
+            lambda validator: validator.record_receipt(
+                {"transactionHash": TX_HASH, "status": 0}
+            ),
+            id="reverted",
+        ),
+        pytest.param(lambda validator: validator.discard(TX_HASH), id="discarded"),
+    ],
+)
+def test_check_transfer_with_authorization_not_mined(validator, discard):
+    func_args = build_func_args()
+    validator.record(TX_HASH, "transferWithAuthorization", func_args)
+
+    discard(validator)
+
+    assert not validator.is_authorization_used(ACCOUNT.address, NONCE)
+    validator.check("transferWithAuthorization", func_args)
+
+
+def test_check_transfer_with_authorization_dropped(mocker):
+    mocked_monotonic = mocker.patch(
+        "packages.core.jpyc_core_sdk.utils.preflight.time.monotonic",
+        return_value=10.0,
+    )
+    validator = PreflightValidator(SIGNER, pending_ttl=60)
+    validator.set_block_timestamp(1000)
+    func_args = build_func_args()
+    validator.record(TX_HASH, "transferWithAuthorization", func_args)
+
+    assert validator.is_authorization_pending(ACCOUNT.address, NONCE)
+
+    # regarded as dropped after the time-to-live
+    mocked_monotonic.return_value = 70.0
+    assert not validator.is_authorization_pending(ACCOUNT.address, NONCE)
+
+
+@pytest.mark.parametrize(
+    ["func_args", "message"],
+    [
+        pytest.param(
+            build_func_args(valid_after=1500), "not yet valid", id="not yet valid"
+        ),
+        pytest.param(build_func_args(valid_before=500), "expired", id="expired"),
+        pytest.param(
+            {**build_func_args(), "value": 1}, "invalid signature", id="tampered"
+        ),
+    ],
+)
+def test_check_transfer_with_authorization_failures(validator, func_args, message):
+    with pytest.raises(PreflightCheckFailed, match=message):
+        validator.check("transferWithAuthorization", func_args)
+
+
+def test_check_receive_with_authorization(validator):
+    signature = SIGNER.sign_receive_with_authorization(
+        ACCOUNT, TO, 10**18, 0, 2000, NONCE
+    )
+    func_args = {
+        **build_func_args(),
+        **signature._asdict(),
+    }
+
+    validator.check("receiveWithAuthorization", func_args, caller=TO)
+    with pytest.raises(PreflightCheckFailed, match="payee"):
+        validator.check("receiveWithAuthorization", func_args, caller=ACCOUNT.address)
+
+
+def test_check_cancel_authorization(validator):
+    signature = SIGNER.sign_cancel_authorization(ACCOUNT, NONCE)
+    func_args = {"authorizer": ACCOUNT.address, "nonce": NONCE, **signature._asdict()}
+
+    validator.check("cancelAuthorization", func_args)
+    validator.record(TX_HASH, "cancelAuthorization", func_args)
+    validator.record_receipt({"transactionHash": TX_HASH, "status": 1})
+
+    assert validator.is_authorization_used(ACCOUNT.address, NONCE)
+    with pytest.raises(PreflightCheckFailed, match="used or canceled"):
+        validator.check("cancelAuthorization", func_args)
+
+
+def test_check_permit(validator):
+    signature = SIGNER.sign_permit(ACCOUNT, TO, 10**18, 0, 2000)
+    func_args = {
+        "owner": ACCOUNT.address,
+        "spender": TO,
+        "value": 10**18,
+        "deadline": 2000,
+        **signature._asdict(),
+    }
+
+    # signatures are unchecked while nonces are unknown
+    validator.check("permit", {**func_args, "value": 1})
+
+    validator.set_permit_nonce(ACCOUNT.address, 0)
+    validator.check("permit", func_args)
+    validator.record(TX_HASH, "permit", func_args)
+
+    assert validator.get_permit_nonce(ACCOUNT.address) == 0
+
+    validator.record_receipt({"transactionHash": TX_HASH, "status": 1})
+
+    assert validator.get_permit_nonce(ACCOUNT.address) == 1
+    with pytest.raises(PreflightCheckFailed, match="invalid signature"):
+        validator.check("permit", func_args)
+    with pytest.raises(PreflightCheckFailed, match="expired"):
+        validator.check("permit", {**func_args, "deadline": 500})
+
+
+def test_check_other_functions(validator):
+    validator.check("transfer", {"to": TO, "value": 1})
@@ -0,0 +1,323 @@
+import asyncio
+import time
+
+import pytest
+import requests
+from web3 import AsyncHTTPProvider, HTTPProvider, Web3
+
+from packages.core.jpyc_core_sdk.utils.endpoints import EndpointMonitor
+from packages.core.jpyc_core_sdk.utils.providers import (
+    AsyncFailoverHTTPProvider,
+    FailoverHTTPProvider,
+    is_hedgeable,
+    is_resent_duplicate,
+)
+from packages.core.jpyc_core_sdk.utils.sessions import SessionPool
+
+ENDPOINTS = ["http://a.example", "http://b.example"]
+RAW_TX = "0x" + "ab" * 32
+TX_HASH = Web3.keccak(hexstr=RAW_TX).to_0x_hex()
+
+
+def http_error(status: int) -> requests.HTTPError:
+    response = requests.Response()
+    response.status_code = status
+    return requests.HTTPError(response=response)
+
+
+def respond(failures: dict, found: bool = False):
+    def make_request(provider, method, params):
+        error = failures.get(provider.endpoint_uri)
+        if error is not None:
+            raise error
+        if method == "eth_getTransactionByHash":
+            return {"jsonrpc": "2.0", "id": 1, "result": {} if found else None}
+        if method == "eth_sendRawTransaction" and provider.endpoint_uri != ENDPOINTS[0]:
+            return {
+                "jsonrpc": "2.0",
+                "id": 1,
+                "error": {"code": -32000, "message": "already known"},
+            }
+        return {"jsonrpc": "2.0", "id": 1, "result": provider.endpoint_uri}
+
+    return make_request
+
+
+def test_constructor():
+    with pytest.raises(ValueError):
+        FailoverHTTPProvider([])
+
+    provider = FailoverHTTPProvider([*ENDPOINTS, ENDPOINTS[0]])
+
+    assert provider.endpoints == ENDPOINTS
+
+
+def test_is_resent_duplicate():
+    error = {
+        "jsonrpc": "2.0",
+        "id": 1,
+        "error": {"code": -32000, "message": "nonce too low"},
+    }
+
+    assert is_resent_duplicate("eth_sendRawTransaction", error)  # type: ignore[arg-type]
+    assert not is_resent_duplicate("eth_call", error)  # type: ignore[arg-type]
+    assert not is_resent_duplicate(
+        "eth_sendRawTransaction",  # type: ignore[arg-type]
+        {"jsonrpc": "2.0", "id": 1, "result": TX_HASH},
+    )
+
+
+@pytest.mark.parametrize(
+    "error", [http_error(503), http_error(429), requests.Timeout()]
+)
+def test_make_request_failover(mocker, error):
+    monitor = EndpointMonitor()
+    provider = FailoverHTTPProvider(ENDPOINTS, SessionPool(), monitor)
+    mocker.patch.object(
+        HTTPProvider,
+        "make_request",
+        autospec=True,
+        side_effect=respond({ENDPOINTS[0]: error}),
+    )
+
+    assert provider.make_request("eth_chainId", [])["result"] == ENDPOINTS[1]  # type: ignore[arg-type]
+    assert not monitor.is_healthy(ENDPOINTS[0])
+    # unhealthy endpoints are avoided afterwards
+    assert monitor.rank(ENDPOINTS) == [ENDPOINTS[1], ENDPOINTS[0]]
+
+
+def test_make_request_without_failover(mocker):
+    monitor = EndpointMonitor()
+    provider = FailoverHTTPProvider(ENDPOINTS, SessionPool(), monitor)
+    mocker.patch.object(
+        HTTPProvider,
+        "make_request",
+        autospec=True,
+        side_effect=respond({ENDPOINTS[0]: http_error(400)}),
+    )
+
+    with pytest.raises(requests.HTTPError):
+        provider.make_request("eth_chainId", [])  # type: ignore[arg-type]
+    assert monitor.is_healthy(ENDPOINTS[1])
+
+
+def test_make_request_of_every_endpoint_failing(mocker):
+    provider = FailoverHTTPProvider(ENDPOINTS, SessionPool(), EndpointMonitor())
+    mocker.patch.object(
+        HTTPProvider,
+        "make_request",
+        autospec=True,
+        side_effect=respond({e: requests.Timeout() for e in ENDPOINTS}),
+    )
+
+    with pytest.raises(requests.Timeout):
+        provider.make_request("eth_chainId", [])  # type: ignore[arg-type]
+
+
+@pytest.mark.parametrize("found", [True, False])
+def test_make_request_of_resent_transaction(mocker, found):
+    provider = FailoverHTTPProvider(ENDPOINTS, SessionPool(), EndpointMonitor())
+    mocker.patch.object(
+        HTTPProvider,
+        "make_request",
+        autospec=True,
+        side_effect=respond({ENDPOINTS[0]: requests.Timeout()}, found=found),
+    )
+
+    response = provider.make_request("eth_sendRawTransaction", [RAW_TX])  # type: ignore[arg-type]
+
+    if found:
+        assert response["result"] == TX_HASH
+    else:
+        assert "error" in response
+
+
+def test_check_health(mocker):
+    monitor = EndpointMonitor()
+    provider = FailoverHTTPProvider(ENDPOINTS, SessionPool(), monitor)
+    mocker.patch.object(
+        HTTPProvider,
+        "make_request",
+        autospec=True,
+        side_effect=respond({ENDPOINTS[1]: requests.ConnectionError()}),
+    )
+
+    assert provider.check_health() == {ENDPOINTS[0]: True, ENDPOINTS[1]: False}
+    assert monitor.get_stats(ENDPOINTS[0]).latency is not None
+    assert not monitor.is_healthy(ENDPOINTS[1])
+
+
+def async_respond(failures: dict, found: bool = False):
+    make_request = respond(failures, found)
+
+    async def async_make_request(provider, method, params):
+        return make_request(provider, method, params)
+
+    return async_make_request
+
+
+def test_async_make_request_failover(mocker):
+    monitor = EndpointMonitor()
+    provider = AsyncFailoverHTTPProvider(ENDPOINTS, SessionPool(), monitor)
+    mocker.patch.object(
+        AsyncHTTPProvider,
+        "make_request",
+        autospec=True,
+        side_effect=async_respond({ENDPOINTS[0]: TimeoutError()}),
+    )
+
+    response = asyncio.run(provider.make_request("eth_chainId", []))  # type: ignore[arg-type]
+
+    assert response["result"] == ENDPOINTS[1]
+    assert not monitor.is_healthy(ENDPOINTS[0])
+
+
+def test_async_make_request_of_resent_transaction(mocker):
+    provider = AsyncFailoverHTTPProvider(ENDPOINTS, SessionPool(), EndpointMonitor())
+    mocker.patch.object(
+        AsyncHTTPProvider,
+        "make_request",
+        autospec=True,
+        side_effect=async_respond({ENDPOINTS[0]: TimeoutError()}, found=True),
+    )
+
+    response = asyncio.run(
+        provider.make_request("eth_sendRawTransaction", [RAW_TX])  # type: ignore[arg-type]
+    )
+
+    assert response["result"] == TX_HASH
+
+
+def test_async_check_health(mocker):
+    provider = AsyncFailoverHTTPProvider(ENDPOINTS, SessionPool(), EndpointMonitor())
+    mocker.patch.object(
+        AsyncHTTPProvider,
+        "make_request",
+        autospec=True,
+        side_effect=async_respond({ENDPOINTS[0]: TimeoutError()}),
+    )
+
+    assert asyncio.run(provider.check_health()) == {
+        ENDPOINTS[0]: False,
+        ENDPOINTS[1]: True,
+    }
+
+
+def sampled_monitor() -> EndpointMonitor:
+    monitor = EndpointMonitor()
+    for _ in range(10):
+        monitor.record_success(ENDPOINTS[0], 0.05)
+        monitor.record_success(ENDPOINTS[1], 0.06)
+
+    return monitor
+
+
+def slow_respond(delay: float):
+    def make_request(provider, method, params):
+        if provider.endpoint_uri == ENDPOINTS[0]:
+            time.sleep(delay)
+        return {"jsonrpc": "2.0", "id": 1, "result": provider.endpoint_uri}
+
+    return make_request
+
+
+def test_is_hedgeable():
+    assert is_hedgeable(["eth_call", "eth_getBalance"])  # type: ignore[list-item]
+    assert not is_hedgeable(["eth_call", "eth_sendRawTransaction"])  # type: ignore[list-item]
+    assert not is_hedgeable([])
+
+
+@pytest.mark.parametrize("hedge_percentile", [0, 100.1])
+def test_constructor_failures_of_hedge_percentile(hedge_percentile):
+    with pytest.raises(ValueError):
+        FailoverHTTPProvider(ENDPOINTS, hedge_percentile=hedge_percentile)
+
+
+@pytest.mark.parametrize(
+    "method, hedge_percentile, expected",
+    [
+        pytest.param("eth_call", 95, ENDPOINTS[1], id="hedge reads"),
+        pytest.param("eth_call", None, ENDPOINTS[0], id="hedging disabled"),
+        pytest.param(
+            "eth_sendRawTransaction", 95, ENDPOINTS[0], id="never hedge mutations"
+        ),
+    ],
+)
+def test_make_request_hedging(mocker, method, hedge_percentile, expected):
+    provider = FailoverHTTPProvider(
+        ENDPOINTS, SessionPool(), sampled_monitor(), hedge_percentile
+    )
+    mocked_make_request = mocker.patch.object(
+        HTTPProvider, "make_request", autospec=True, side_effect=slow_respond(0.2)
+    )
+
+    assert provider.make_request(method, [RAW_TX])["result"] == expected
+    assert mocked_make_request.call_count == (2 if expected == ENDPOINTS[1] else 1)
+
+
+def test_make_request_hedging_without_delay(mocker):
+    provider = FailoverHTTPProvider(ENDPOINTS, SessionPool(), sampled_monitor(), 95)
+    mocked_make_request = mocker.patch.object(
+        HTTPProvider, "make_request", autospec=True, side_effect=slow_respond(0)
+    )
+
+    assert provider.make_request("eth_call", [])["result"] == ENDPOINTS[0]  # type: ignore[arg-type]
+    mocked_make_request.assert_called_once()
+
+
+def test_make_request_hedging_of_failures(mocker):
+    provider = FailoverHTTPProvider(ENDPOINTS, SessionPool(), sampled_monitor(), 95)
+    mocker.patch.object(
+        HTTPProvider,
+        "make_request",
+        autospec=True,
+        side_effect=respond({ENDPOINTS[0]: requests.Timeout()}),
+    )
+
+    assert provider.make_request("eth_call", [])["result"] == ENDPOINTS[1]  # type: ignore[arg-type]
+
+
+def test_make_batch_request_hedging(mocker):
+    provider = FailoverHTTPProvider(ENDPOINTS, SessionPool(), sampled_monitor(), 95)
+
+    def make_batch_request(provider, batch_requests):
+        if provider.endpoint_uri == ENDPOINTS[0]:
+            time.sleep(0.2)
+        return [{"jsonrpc": "2.0", "id": 1, "result": provider.endpoint_uri}]
+
+    mocker.patch.object(
+        HTTPProvider,
+        "make_batch_request",
+        autospec=True,
+        side_effect=make_batch_request,
+    )
+
+    assert provider.make_batch_request([("eth_call", [])]) == [  # type: ignore[list-item]
+        {"jsonrpc": "2.0", "id": 1, "result": ENDPOINTS[1]}
+    ]
+
+
+def test_async_make_request_hedging(mocker):
+    provider = AsyncFailoverHTTPProvider(
+        ENDPOINTS, SessionPool(), sampled_monitor(), 95
+    )
+    cancelled = []
+
+    async def make_request(provider, method, params):
+        if provider.endpoint_uri == ENDPOINTS[0]:
+            try:
+                await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                cancelled.append(provider.endpoint_uri)
+                raise
+        return {"jsonrpc": "2.0", "id": 1, "result": provider.endpoint_uri}
+
+    mocker.patch.object(
+        AsyncHTTPProvider, "make_request", autospec=True, side_effect=make_request
+    )
+
+    response = asyncio.run(provider.make_request("eth_call", []))  # type: ignore[arg-type]
+
+    assert response["result"] == ENDPOINTS[1]
+    # the slower request is cancelled
+    assert cancelled == [ENDPOINTS[0]]
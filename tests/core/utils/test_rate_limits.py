@@ -0,0 +1,97 @@
+from datetime import UTC, datetime, timedelta
+from email.utils import format_datetime
+
+import pytest
+import requests
+
+from packages.core.jpyc_core_sdk.utils.rate_limits import (
+    RateLimiter,
+    get_retry_after,
+    is_throttled,
+    parse_retry_after,
+)
+
+ENDPOINT = "https://ethereum-rpc.publicnode.com"
+
+
+def http_error(status: int, retry_after: str | None = None) -> requests.HTTPError:
+    response = requests.Response()
+    response.status_code = status
+    if retry_after is not None:
+        response.headers["Retry-After"] = retry_after
+    return requests.HTTPError(response=response)
+
+
+def test_is_throttled():
+    assert is_throttled(http_error(429))
+    assert not is_throttled(http_error(503))
+    assert not is_throttled(ValueError())
+
+
+def test_parse_retry_after():
+    retry_at = datetime.now(UTC) + timedelta(seconds=30)
+
+    assert parse_retry_after("3") == 3
+    assert parse_retry_after("-1") == 0
+    assert 28 < parse_retry_after(format_datetime(retry_at, usegmt=True)) <= 30  # type: ignore[operator]
+    assert parse_retry_after("invalid") is None
+    assert parse_retry_after(None) is None
+
+
+def test_get_retry_after():
+    assert get_retry_after(http_error(429, "5")) == 5
+    assert get_retry_after(http_error(429)) is None
+    assert get_retry_after(ValueError()) is None
+
+
+def test_reserve_of_unthrottled_endpoint():
+    rate_limiter = RateLimiter()
+
+    # endpoints are unlimited until throttled
+    assert all(rate_limiter.reserve(ENDPOINT) == 0 for _ in range(100))
+
+
+def test_record_throttle():
+    rate_limiter = RateLimiter(window=10)
+    for _ in range(100):
+        rate_limiter.reserve(ENDPOINT)
+
+    rate_limiter.record_throttle(ENDPOINT)
+    # requests in flight when throttled decrease the rate only once
+    rate_limiter.record_throttle(ENDPOINT)
+
+    limit = rate_limiter.get_rate_limit(ENDPOINT)
+    # half of the observed rate (100 requests / 10 seconds)
+    assert limit.rate == pytest.approx(5)
+    assert limit.throttles == 2
+    # requests are paced at the rate
+    delays = [rate_limiter.reserve(ENDPOINT) for _ in range(5)]
+    assert delays == pytest.approx([0.2, 0.4, 0.6, 0.8, 1.0], abs=0.01)
+
+
+def test_record_throttle_with_retry_after():
+    rate_limiter = RateLimiter(min_rate=10)
+
+    rate_limiter.record_throttle(ENDPOINT, retry_after=3)
+
+    assert rate_limiter.get_rate_limit(ENDPOINT).rate == 10
+    assert rate_limiter.reserve(ENDPOINT) == pytest.approx(3.1, abs=0.01)
+
+
+def test_record_success():
+    rate_limiter = RateLimiter(increase=2, max_rate=11)
+    rate_limiter.record_success(ENDPOINT)
+    assert rate_limiter.get_rate_limit(ENDPOINT).rate is None
+
+    rate_limiter.record_throttle(ENDPOINT)
+    rate_limiter.record_success(ENDPOINT)
+    rate_limiter.record_success(ENDPOINT)
+
+    # grows additively from the minimum rate (up to the maximum)
+    assert rate_limiter.get_rate_limit(ENDPOINT).rate == pytest.approx(1 + 2 + 2 / 3)
+    for _ in range(100):
+        rate_limiter.record_success(ENDPOINT)
+    assert rate_limiter.get_rate_limit(ENDPOINT).rate == 11
+
+    rate_limiter.reset()
+    assert rate_limiter.get_rate_limit(ENDPOINT).rate is None
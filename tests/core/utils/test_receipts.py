@@ -0,0 +1,135 @@
+import asyncio
+
+import pytest
+from hexbytes import HexBytes
+from web3 import AsyncHTTPProvider, HTTPProvider
+from web3.eth import AsyncEth, Eth
+from web3.exceptions import ContractLogicError
+
+from packages.core.jpyc_core_sdk.utils.receipts import (
+    async_batch_get_receipts,
+    async_get_revert_reason,
+    batch_get_receipts,
+    format_receipt_response,
+    get_revert_reason,
+    is_reverted,
+)
+
+TX_HASHES = [HexBytes(bytes([i]) * 32) for i in range(3)]
+TRANSACTION = {
+    "from": "0xf39Fd6e51aad88F6F4ce6aB8827279cffFb92266",
+    "to": "0x431D5dfF03120AFA4bDf332c61A6e1766eF37BDB",
+    "input": HexBytes("0xa9059cbb"),
+    "value": 0,
+    "gas": 50_000,
+}
+
+
+def raw_receipt(tx_hash: HexBytes, status: int = 1) -> dict:
+    return {
+        "transactionHash": tx_hash.to_0x_hex(),
+        "blockNumber": "0x1",
+        "status": hex(status),
+    }
+
+
+def test_format_receipt_response():
+    receipt = format_receipt_response(
+        {"jsonrpc": "2.0", "id": 0, "result": raw_receipt(TX_HASHES[0])}
+    )
+
+    assert receipt == {
+        "transactionHash": TX_HASHES[0],
+        "blockNumber": 1,
+        "status": 1,
+    }
+    assert not is_reverted(receipt)
+    assert format_receipt_response({"jsonrpc": "2.0", "id": 0, "result": None}) is None
+    assert format_receipt_response({"id": 0, "error": {"message": "error"}}) is None
+
+
+def test_batch_get_receipts(sdk_client, mocker):
+    make_batch_request = mocker.patch.object(
+        HTTPProvider,
+        "make_batch_request",
+        side_effect=[
+            [
+                {"id": 0, "result": raw_receipt(TX_HASHES[0])},
+                {"id": 1, "result": None},
+            ],
+            [{"id": 2, "result": raw_receipt(TX_HASHES[2], status=0)}],
+        ],
+    )
+
+    receipts = batch_get_receipts(sdk_client.w3, TX_HASHES, batch_size=2)
+
+    assert make_batch_request.call_count == 2
+    assert make_batch_request.call_args_list[0].args[0] == [
+        ("eth_getTransactionReceipt", [TX_HASHES[0].to_0x_hex()]),
+        ("eth_getTransactionReceipt", [TX_HASHES[1].to_0x_hex()]),
+    ]
+    assert receipts[0]["transactionHash"] == TX_HASHES[0]
+    assert receipts[1] is None
+    assert is_reverted(receipts[2])
+
+
+def test_batch_get_receipts_rejected(sdk_client, mocker):
+    mocker.patch.object(
+        HTTPProvider,
+        "make_batch_request",
+        return_value={"id": None, "error": {"message": "batch too large"}},
+    )
+
+    with pytest.raises(ValueError):
+        batch_get_receipts(sdk_client.w3, TX_HASHES)
+
+
+def test_async_batch_get_receipts(async_sdk_client, mocker):
+    mocker.patch.object(
+        AsyncHTTPProvider,
+        "make_batch_request",
+        mocker.AsyncMock(return_value=[{"id": 0, "result": raw_receipt(TX_HASHES[0])}]),
+    )
+
+    receipts = asyncio.run(async_batch_get_receipts(async_sdk_client.w3, TX_HASHES[:2]))
+
+    # missing responses are regarded as not yet available
+    assert receipts[0]["transactionHash"] == TX_HASHES[0]
+    assert receipts[1] is None
+
+
+def test_get_revert_reason(sdk_client, mocker):
+    mocker.patch.object(Eth, "get_transaction", return_value=TRANSACTION)
+    call = mocker.patch.object(
+        Eth,
+        "call",
+        side_effect=ContractLogicError("execution reverted: FiatToken: paused"),
+    )
+    receipt = format_receipt_response({"result": raw_receipt(TX_HASHES[0], 0)})
+
+    assert get_revert_reason(sdk_client.w3, receipt) == (
+        "execution reverted: FiatToken: paused"
+    )
+    assert call.call_args.args[1] == 1
+
+    # reverts that are not reproduced
+    call.side_effect = None
+    assert get_revert_reason(sdk_client.w3, receipt) == "execution reverted"
+
+
+def test_async_get_revert_reason(async_sdk_client, mocker):
+    mocker.patch.object(
+        AsyncEth, "get_transaction", mocker.AsyncMock(return_value=TRANSACTION)
+    )
+    mocker.patch.object(
+        AsyncEth,
+        "call",
+        mocker.AsyncMock(
+            side_effect=ContractLogicError("execution reverted: FiatToken: paused")
+        ),
+    )
+    receipt = format_receipt_response({"result": raw_receipt(TX_HASHES[0], 0)})
+
+    assert asyncio.run(async_get_revert_reason(async_sdk_client.w3, receipt)) == (
+        "execution reverted: FiatToken: paused"
+    )
@@ -0,0 +1,134 @@
+import pytest
+
+from packages.core.jpyc_core_sdk.utils.errors import RelayRequestRejected
+from packages.core.jpyc_core_sdk.utils.relaying import (
+    LatencyMetrics,
+    RelayQueue,
+    RelayRequest,
+    StageStats,
+    get_percentile,
+)
+
+from ..conftest import KNOWN_ACCOUNTS
+
+
+def relay_request(nonce: int, valid_before: int = 2**32) -> RelayRequest:
+    return RelayRequest(
+        kind="transfer",
+        from_=KNOWN_ACCOUNTS[0].address,
+        to=KNOWN_ACCOUNTS[1].address,
+        value=1,
+        valid_after=0,
+        valid_before=valid_before,
+        nonce=f"0x{nonce:064x}",
+        v=27,
+        r=f"0x{1:064x}",
+        s=f"0x{2:064x}",
+    )
+
+
+def test_relay_request():
+    request = relay_request(1)
+
+    assert request.key == (KNOWN_ACCOUNTS[0].address, (1).to_bytes(32, "big"))
+    assert request.func_name == "transferWithAuthorization"
+    assert request._replace(kind="receive").func_name == "receiveWithAuthorization"
+    # values are supplied with decimals, but relayed with decimals removed
+    assert request.to_func_args()["value"] == 10**18
+    assert request.to_func_args()["validBefore"] == 2**32
+
+
+def test_relay_request_checksummed():
+    request = relay_request(1)._replace(
+        from_=KNOWN_ACCOUNTS[0].address.lower(), to=KNOWN_ACCOUNTS[1].address.lower()
+    )
+    request = RelayRequest(*request)
+
+    # keys are shared regardless of the case of addresses
+    assert request.key == relay_request(1).key
+    assert request.to_func_args()["from"] == KNOWN_ACCOUNTS[0].address
+    assert request.to_func_args()["to"] == KNOWN_ACCOUNTS[1].address
+
+
+def test_relay_queue_order():
+    queue = RelayQueue()
+    queue.put(relay_request(1, valid_before=300))
+    queue.put(relay_request(2, valid_before=100))
+    queue.put(relay_request(3, valid_before=300))
+
+    popped = []
+    while (entry := queue.pop()) is not None:
+        popped.append(entry[0].nonce)
+
+    # earliest deadline first, & in the order of ingestion on ties
+    assert popped == [relay_request(i).nonce for i in (2, 1, 3)]
+    assert len(queue) == 0
+
+
+def test_relay_queue_deduplication():
+    queue = RelayQueue()
+    queue.put(relay_request(1))
+
+    with pytest.raises(RelayRequestRejected, match="already relayed"):
+        queue.put(relay_request(1)._replace(value=2))
+    # keys are remembered even after popped
+    queue.pop()
+    with pytest.raises(RelayRequestRejected, match="already relayed"):
+        queue.put(relay_request(1))
+
+    queue.discard(relay_request(1).key)
+    queue.put(relay_request(1))
+    assert len(queue) == 1
+
+
+def test_relay_queue_full():
+    queue = RelayQueue(maxsize=1)
+    queue.put(relay_request(1))
+
+    with pytest.raises(RelayRequestRejected, match="full"):
+        queue.put(relay_request(2))
+
+
+def test_relay_queue_prune():
+    queue = RelayQueue()
+    queue.put(relay_request(1, valid_before=100))
+    queue.put(relay_request(2, valid_before=200))
+    queue.pop()
+    queue.pop()
+
+    assert queue.prune(now=150) == 1
+    queue.put(relay_request(1, valid_before=300))
+    with pytest.raises(RelayRequestRejected):
+        queue.put(relay_request(2, valid_before=300))
+
+    # keys enqueued again expire on their own schedule
+    queue.discard(relay_request(2).key)
+    queue.put(relay_request(2, valid_before=400))
+    assert queue.prune(now=250) == 0
+    assert queue.prune(now=400) == 2
+
+
+def test_get_percentile():
+    samples = [float(i) for i in range(1, 101)]
+
+    assert get_percentile(samples, 50) == 50.0
+    assert get_percentile(samples, 99) == 99.0
+    assert get_percentile(samples, 100) == 100.0
+    assert get_percentile([1.0], 1) == 1.0
+
+
+def test_latency_metrics():
+    metrics = LatencyMetrics(window=3)
+    for latency in (4.0, 1.0, 2.0, 3.0):
+        metrics.observe("submit", latency)
+
+    stats = metrics.get_stats()
+
+    assert list(stats) == ["submit"]
+    # counts are cumulative, while the others reflect the latest samples only
+    assert stats["submit"] == StageStats(
+        count=4, mean=2.0, p50=2.0, p95=3.0, p99=3.0, max=3.0
+    )
+
+    metrics.reset()
+    assert metrics.get_stats() == {}
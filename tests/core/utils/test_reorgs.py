@@ -0,0 +1,71 @@
+import asyncio
+
+import pytest
+from web3 import AsyncHTTPProvider, HTTPProvider
+
+from packages.core.jpyc_core_sdk.utils.reorgs import (
+    async_batch_get_block_hashes,
+    batch_get_block_hashes,
+    find_common_ancestor,
+)
+
+
+def test_batch_get_block_hashes(sdk_client, mocker):
+    make_batch_request = mocker.patch.object(
+        HTTPProvider,
+        "make_batch_request",
+        side_effect=[
+            [{"id": 0, "result": {"hash": "0x01"}}, {"id": 1, "result": None}],
+            [{"id": 2, "error": {"message": "unknown block"}}],
+        ],
+    )
+
+    block_hashes = batch_get_block_hashes(sdk_client.w3, [1, 2, 3], batch_size=2)
+
+    assert make_batch_request.call_args_list[0].args[0] == [
+        ("eth_getBlockByNumber", ["0x1", False]),
+        ("eth_getBlockByNumber", ["0x2", False]),
+    ]
+    assert block_hashes == {1: "0x01", 2: None, 3: None}
+
+
+def test_batch_get_block_hashes_rejected(sdk_client, mocker):
+    mocker.patch.object(
+        HTTPProvider,
+        "make_batch_request",
+        return_value={"id": None, "error": {"message": "batch too large"}},
+    )
+
+    with pytest.raises(ValueError):
+        batch_get_block_hashes(sdk_client.w3, [1])
+
+
+def test_async_batch_get_block_hashes(async_sdk_client, mocker):
+    mocker.patch.object(
+        AsyncHTTPProvider,
+        "make_batch_request",
+        mocker.AsyncMock(return_value=[{"id": 0, "result": {"hash": "0x01"}}]),
+    )
+
+    block_hashes = asyncio.run(
+        async_batch_get_block_hashes(async_sdk_client.w3, [1, 2])
+    )
+
+    # missing responses are regarded as not available
+    assert block_hashes == {1: "0x01", 2: None}
+
+
+@pytest.mark.parametrize(
+    "canonical_hashes, expected",
+    [
+        ({10: "0x10", 12: "0x12", 15: "0x15"}, None),
+        ({10: "0x10", 12: "0x12", 15: "0xff"}, 12),
+        # blocks after the first orphaned block are rolled back, even if matched
+        ({10: "0x10", 12: "0xff", 15: "0x15"}, 10),
+        ({10: None, 12: "0x12", 15: "0x15"}, 5),
+    ],
+)
+def test_find_common_ancestor(canonical_hashes, expected):
+    stored_hashes = {10: "0x10", 12: "0x12", 15: "0x15"}
+
+    assert find_common_ancestor(stored_hashes, canonical_hashes, 5) == expected
@@ -0,0 +1,88 @@
+from threading import Thread
+
+import pytest
+from hexbytes import HexBytes
+from web3 import Account
+
+from packages.core.jpyc_core_sdk.utils.nonces import NonceManager
+from packages.core.jpyc_core_sdk.utils.senders import Sender, SenderScheduler
+
+from ..conftest import KNOWN_ACCOUNTS
+
+
+@pytest.fixture(scope="function")
+def senders():
+    accounts = [Account.from_key(account.private_key) for account in KNOWN_ACCOUNTS]
+
+    return [
+        Sender(account=account, nonce_manager=NonceManager(account.address))
+        for account in accounts
+    ]
+
+
+def test_constructor_without_senders():
+    with pytest.raises(ValueError):
+        SenderScheduler(senders=[])
+
+
+def test_acquire_round_robin(senders):
+    scheduler = SenderScheduler(senders=senders)
+
+    assert [scheduler.acquire() for _ in range(len(senders) * 2)] == senders * 2
+
+
+def test_acquire_least_pending(senders):
+    scheduler = SenderScheduler(senders=senders, strategy="least_pending")
+
+    # every sender gets a transaction before any gets another
+    acquired = [scheduler.acquire() for _ in range(len(senders))]
+    assert sorted(s.account.address for s in acquired) == sorted(
+        s.account.address for s in senders
+    )
+
+    # transactions go to the sender whose pending transactions are confirmed
+    scheduler.release(acquired[1], HexBytes(b"\x01" * 32))
+    scheduler.confirm(HexBytes(b"\x01" * 32))
+    assert scheduler.acquire() == acquired[1]
+
+    # failed transactions are no longer pending
+    scheduler.release(acquired[2], None)
+    assert scheduler.acquire() == acquired[2]
+
+
+def test_acquire_in_threads(senders):
+    scheduler = SenderScheduler(senders=senders, strategy="least_pending")
+
+    threads = [Thread(target=scheduler.acquire) for _ in range(len(senders) * 10)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert set(scheduler.get_pending_counts().values()) == {10}
+
+
+def test_confirm_unknown_transaction(senders):
+    scheduler = SenderScheduler(senders=senders)
+    scheduler.acquire()
+
+    scheduler.confirm(HexBytes(b"\x01" * 32))
+
+    assert scheduler.get_pending_counts()[senders[0].account.address] == 1
+
+
+def test_release_without_confirmations(senders, mocker):
+    mocked_monotonic = mocker.patch(
+        "packages.core.jpyc_core_sdk.utils.senders.time.monotonic",
+        return_value=10.0,
+    )
+    scheduler = SenderScheduler(senders=senders, pending_ttl=60.0)
+    sender = scheduler.acquire()
+    scheduler.release(sender, HexBytes(b"\x01" * 32))
+    assert scheduler.get_pending_counts()[sender.account.address] == 1
+
+    # regarded as dropped (i.e., never kept forever) without confirmations
+    mocked_monotonic.return_value = 70.0
+    assert scheduler.get_pending_counts()[sender.account.address] == 0
+    scheduler.confirm(HexBytes(b"\x01" * 32))
+    assert scheduler.get_pending_counts()[sender.account.address] == 0
@@ -0,0 +1,152 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import requests
+from aiohttp import ClientResponseError, ClientTimeout
+from web3 import AsyncHTTPProvider, HTTPProvider
+from web3._utils.http_session_manager import HTTPSessionManager
+from web3.types import RPCEndpoint
+
+from packages.core.jpyc_core_sdk.utils.rate_limits import RateLimiter
+from packages.core.jpyc_core_sdk.utils.sessions import SessionPool
+
+ENDPOINTS = ["https://ethereum-rpc.publicnode.com", "https://polygon-rpc.com"]
+
+
+def test_cache_and_return_session():
+    session_pool = SessionPool(pool_size=5)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        sessions = list(
+            executor.map(
+                lambda _: session_pool.cache_and_return_session(ENDPOINTS[0]),
+                range(8),
+            )
+        )
+
+    # a session is shared among threads per endpoint
+    assert all(session is sessions[0] for session in sessions)
+    assert session_pool.cache_and_return_session(ENDPOINTS[1]) is not sessions[0]
+    assert sessions[0].get_adapter(ENDPOINTS[0])._pool_maxsize == 5
+    assert session_pool.get_pooled_endpoints() == ENDPOINTS
+
+    session_pool.close()
+    assert session_pool.get_pooled_endpoints() == []
+
+
+def test_http_provider():
+    session_pool = SessionPool(timeout=5)
+
+    provider = session_pool.http_provider(ENDPOINTS[0])
+    async_provider = session_pool.async_http_provider(ENDPOINTS[0])
+
+    assert provider._request_session_manager is session_pool
+    assert dict(provider.get_request_kwargs())["timeout"] == 5
+    assert async_provider._request_session_manager is session_pool
+    assert dict(async_provider.get_request_kwargs())["timeout"] == ClientTimeout(5)
+
+
+def test_http_provider_uses_session_pool(mocker):
+    # fails loudly if web3 stops routing requests via `_request_session_manager`
+    assert hasattr(HTTPProvider(ENDPOINTS[0]), "_request_session_manager")
+    assert hasattr(AsyncHTTPProvider(ENDPOINTS[0]), "_request_session_manager")
+    session_pool = SessionPool()
+    response = requests.Response()
+    response.status_code = 200
+    response._content = b'{"jsonrpc": "2.0", "id": 0, "result": "0x1"}'
+    post = mocker.patch.object(requests.Session, "post", return_value=response)
+
+    provider = session_pool.http_provider(ENDPOINTS[0])
+    assert provider.make_request(RPCEndpoint("eth_chainId"), [])["result"] == "0x1"
+
+    post.assert_called_once()
+    assert session_pool.get_pooled_endpoints() == [ENDPOINTS[0]]
+
+
+def test_async_cache_and_return_session():
+    session_pool = SessionPool(pool_size=5, keep_alive=10)
+
+    async def get_sessions():
+        sessions = await asyncio.gather(
+            *(
+                session_pool.async_cache_and_return_session(ENDPOINTS[0])
+                for _ in range(4)
+            )
+        )
+        return sessions
+
+    sessions = asyncio.run(get_sessions())
+    assert all(session is sessions[0] for session in sessions)
+    assert sessions[0].connector.limit == 5
+
+    # sessions are bound to event loops
+    async def get_session_and_close():
+        session = await session_pool.async_cache_and_return_session(ENDPOINTS[0])
+        await session_pool.async_close()
+        return session
+
+    session = asyncio.run(get_session_and_close())
+    assert session is not sessions[0]
+    assert session.closed
+    assert session_pool.get_pooled_endpoints() == []
+
+
+def throttled_error() -> requests.HTTPError:
+    response = requests.Response()
+    response.status_code = 429
+    response.headers["Retry-After"] = "2"
+    return requests.HTTPError(response=response)
+
+
+def test_make_post_request_of_rate_limiter(mocker):
+    rate_limiter = RateLimiter()
+    session_pool = SessionPool(rate_limiter=rate_limiter)
+    mocked_wait = mocker.patch.object(rate_limiter, "wait")
+    mocker.patch.object(
+        HTTPSessionManager,
+        "make_post_request",
+        side_effect=[b"{}", throttled_error()],
+    )
+
+    assert session_pool.make_post_request(ENDPOINTS[0], b"{}") == b"{}"
+    assert rate_limiter.get_rate_limit(ENDPOINTS[0]).rate is None
+    with pytest.raises(requests.HTTPError):
+        session_pool.make_post_request(ENDPOINTS[0], b"{}")
+
+    # every request is paced, and the rate is learned from throttled requests
+    assert mocked_wait.call_count == 2
+    assert rate_limiter.get_rate_limit(ENDPOINTS[0]).throttles == 1
+    assert rate_limiter.get_rate_limit(ENDPOINTS[0]).rate is not None
+    assert rate_limiter.reserve(ENDPOINTS[0]) > 1
+
+
+def test_make_post_request_without_rate_limiter(mocker):
+    session_pool = SessionPool(rate_limiter=None)
+    mocker.patch.object(
+        HTTPSessionManager, "make_post_request", side_effect=throttled_error()
+    )
+
+    with pytest.raises(requests.HTTPError):
+        session_pool.make_post_request(ENDPOINTS[0], b"{}")
+
+
+def test_async_make_post_request_of_rate_limiter(mocker):
+    rate_limiter = RateLimiter()
+    session_pool = SessionPool(rate_limiter=rate_limiter)
+    mocker.patch.object(
+        HTTPSessionManager,
+        "async_make_post_request",
+        side_effect=ClientResponseError(
+            None,  # type: ignore[arg-type]
+            (),
+            status=429,
+            headers={"Retry-After": "2"},  # type: ignore[arg-type]
+        ),
+    )
+
+    with pytest.raises(ClientResponseError):
+        asyncio.run(session_pool.async_make_post_request(ENDPOINTS[0], b"{}"))
+
+    assert rate_limiter.get_rate_limit(ENDPOINTS[0]).throttles == 1
+    assert rate_limiter.reserve(ENDPOINTS[0]) > 1
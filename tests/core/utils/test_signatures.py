@@ -0,0 +1,178 @@
+import pytest
+from eth_account import Account
+from eth_account.messages import encode_typed_data
+from eth_utils import keccak
+
+from packages.core.jpyc_core_sdk.utils.metadata import TokenMetadata
+from packages.core.jpyc_core_sdk.utils.signatures import (
+    Signature,
+    TypedDataSigner,
+    to_bytes32_hex,
+)
+
+from ..conftest import KNOWN_ACCOUNTS
+
+ACCOUNT = Account.from_key(KNOWN_ACCOUNTS[0].private_key)
+NONCE = f"0x{'ab' * 32}"
+MESSAGE_TYPES = {
+    "Permit": [
+        {"name": "owner", "type": "address"},
+        {"name": "spender", "type": "address"},
+        {"name": "value", "type": "uint256"},
+        {"name": "nonce", "type": "uint256"},
+        {"name": "deadline", "type": "uint256"},
+    ],
+    "TransferWithAuthorization": [
+        {"name": "from", "type": "address"},
+        {"name": "to", "type": "address"},
+        {"name": "value", "type": "uint256"},
+        {"name": "validAfter", "type": "uint256"},
+        {"name": "validBefore", "type": "uint256"},
+        {"name": "nonce", "type": "bytes32"},
+    ],
+    "ReceiveWithAuthorization": [
+        {"name": "from", "type": "address"},
+        {"name": "to", "type": "address"},
+        {"name": "value", "type": "uint256"},
+        {"name": "validAfter", "type": "uint256"},
+        {"name": "validBefore", "type": "uint256"},
+        {"name": "nonce", "type": "bytes32"},
+    ],
+    "CancelAuthorization": [
+        {"name": "authorizer", "type": "address"},
+        {"name": "nonce", "type": "bytes32"},
+    ],
+}
+
+
+def hash_type(primary_type: str) -> bytes:
+    fields = ",".join(
+        f"{field['type']} {field['name']}" for field in MESSAGE_TYPES[primary_type]
+    )
+
+    return keccak(text=f"{primary_type}({fields})")
+
+
+def build_full_message(
+    domain: dict, eip712_domain_types: list, primary_type: str, message: dict
+) -> dict:
+    return {
+        "domain": domain,
+        "types": {
+            "EIP712Domain": eip712_domain_types,
+            primary_type: MESSAGE_TYPES[primary_type],
+        },
+        "primaryType": primary_type,
+        "message": message,
+    }
+
+
+@pytest.fixture(scope="function")
+def typed_data_signer(eip712_domain_separator, eip712_domain_types):
+    domain_separator = encode_typed_data(
+        full_message=build_full_message(
+            eip712_domain_separator,
+            eip712_domain_types,
+            "CancelAuthorization",
+            {"authorizer": ACCOUNT.address, "nonce": NONCE},
+        )
+    ).header
+
+    return TypedDataSigner(
+        TokenMetadata(
+            name="JPY Coin",
+            symbol="JPYC",
+            decimals=18,
+            currency="JPY",
+            domain_separator=domain_separator,
+            permit_typehash=hash_type("Permit"),
+            transfer_with_authorization_typehash=hash_type("TransferWithAuthorization"),
+            receive_with_authorization_typehash=hash_type("ReceiveWithAuthorization"),
+            cancel_authorization_typehash=hash_type("CancelAuthorization"),
+        )
+    )
+
+
+def sign_typed_data(full_message: dict) -> Signature:
+    signed = Account.sign_typed_data(ACCOUNT.key, full_message=full_message)
+
+    return Signature(v=signed.v, r=to_bytes32_hex(signed.r), s=to_bytes32_hex(signed.s))
+
+
+def test_to_bytes32_hex():
+    assert to_bytes32_hex(1) == f"0x{'00' * 31}01"
+    assert to_bytes32_hex(b"\x01") == f"0x{'00' * 31}01"
+
+
+def test_sign_permit(typed_data_signer, eip712_domain_separator, eip712_domain_types):
+    spender = KNOWN_ACCOUNTS[1].address
+    message = {
+        "owner": ACCOUNT.address,
+        "spender": spender,
+        "value": 10**18,
+        "nonce": 3,
+        "deadline": 2**32,
+    }
+
+    assert typed_data_signer.sign_permit(
+        ACCOUNT, spender, 10**18, 3, 2**32
+    ) == sign_typed_data(
+        build_full_message(
+            eip712_domain_separator, eip712_domain_types, "Permit", message
+        )
+    )
+
+
+@pytest.mark.parametrize(
+    ["primary_type", "method"],
+    [
+        pytest.param(
+            "TransferWithAuthorization",
+            "sign_transfer_with_authorization",
+            id="transfer",
+        ),
+        pytest.param(
+            "ReceiveWithAuthorization",
+            "sign_receive_with_authorization",
+            id="receive",
+        ),
+    ],
+)
+def test_sign_authorization(
+    typed_data_signer,
+    eip712_domain_separator,
+    eip712_domain_types,
+    primary_type,
+    method,
+):
+    to = KNOWN_ACCOUNTS[2].address
+    message = {
+        "from": ACCOUNT.address,
+        "to": to,
+        "value": 10**18,
+        "validAfter": 0,
+        "validBefore": 2**32,
+        "nonce": NONCE,
+    }
+
+    assert getattr(typed_data_signer, method)(
+        ACCOUNT, to, 10**18, 0, 2**32, NONCE
+    ) == sign_typed_data(
+        build_full_message(
+            eip712_domain_separator, eip712_domain_types, primary_type, message
+        )
+    )
+
+
+def test_sign_cancel_authorization(
+    typed_data_signer, eip712_domain_separator, eip712_domain_types
+):
+    message = {"authorizer": ACCOUNT.address, "nonce": NONCE}
+
+    assert typed_data_signer.sign_cancel_authorization(
+        ACCOUNT, NONCE
+    ) == sign_typed_data(
+        build_full_message(
+            eip712_domain_separator, eip712_domain_types, "CancelAuthorization", message
+        )
+    )
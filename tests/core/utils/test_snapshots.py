@@ -0,0 +1,47 @@
+import asyncio
+
+from packages.core.jpyc_core_sdk.utils.errors import CallFailed
+from packages.core.jpyc_core_sdk.utils.snapshots import Snapshot
+
+
+def test_call(mocker):
+    snapshot = Snapshot(block_number=100)
+    call = mocker.Mock(return_value=1)
+
+    assert snapshot.call("balanceOf", ("0x01",), call) == 1
+    assert snapshot.call("balanceOf", ("0x01",), call) == 1
+
+    call.assert_called_once()
+    assert snapshot.results == {("balanceOf", ("0x01",)): 1}
+
+
+def test_async_call(mocker):
+    snapshot = Snapshot(block_number=100)
+    call = mocker.AsyncMock(return_value=1)
+
+    async def call_twice():
+        return [await snapshot.async_call("totalSupply", (), call) for _ in range(2)]
+
+    assert asyncio.run(call_twice()) == [1, 1]
+    call.assert_awaited_once()
+
+
+def test_call_many(mocker):
+    snapshot = Snapshot(block_number=100)
+    snapshot.results[("balanceOf", ("0x01",))] = 1
+    failed = CallFailed("execution reverted")
+    call_many = mocker.Mock(return_value=[2, failed])
+
+    results = snapshot.call_many(
+        "balanceOf", [("0x01",), ("0x02",), ("0x03",), ("0x02",)], call_many
+    )
+
+    # memoized & duplicate calls are skipped
+    assert results == [1, 2, failed, 2]
+    call_many.assert_called_once_with([("0x02",), ("0x03",)])
+    # failed calls are never memoized
+    assert ("balanceOf", ("0x03",)) not in snapshot.results
+
+    call_many.reset_mock()
+    assert snapshot.call_many("balanceOf", [("0x01",), ("0x02",)], call_many) == [1, 2]
+    call_many.assert_not_called()